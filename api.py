@@ -36,6 +36,8 @@ from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, Redirect
 from pydantic import BaseModel
 
 from db_helper import db_helper
+from async_db import db_execute, run_db, init_async_db, shutdown_async_db
+from response_cache import cached_endpoint, start_listener, stop_listener
 from auth_discord import router as discord_auth_router
 from auth_admin import router as admin_auth_router
 from auth_premium import (
@@ -127,9 +129,17 @@ app.middleware("http")(premium_middleware)
 @app.on_event("startup")
 async def startup_event():
     """Bootstrap DB tables required for auth and payments."""
-    ensure_users_table()
-    ensure_dashboard_tokens_table()
-    ensure_stripe_events_table()
+    init_async_db()
+    await run_db(ensure_users_table)
+    await run_db(ensure_dashboard_tokens_table)
+    await run_db(ensure_stripe_events_table)
+    start_listener()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    stop_listener()
+    shutdown_async_db()
 
 # Include Discord OAuth router
 app.include_router(discord_auth_router)
@@ -549,6 +559,12 @@ async def health_check():
 async def debug_env():
     """Shows which critical env vars are SET (true/false) — no values exposed."""
     import os, time
+    from monte_carlo_simulator import get_market_cache_stats
+    from http_transport import get_http_stats
+    from db_helper import get_sql_cache_stats
+    from async_db import get_async_db_stats
+    from db_connection import get_pool_stats
+    from response_cache import get_response_cache_stats
     keys = [
         "DATABASE_URL", "THE_ODDS_API_KEY", "API_FOOTBALL_KEY",
         "DISCORD_RESULTS_WEBHOOK", "DISCORD_WEBHOOK_URL",
@@ -566,6 +582,12 @@ async def debug_env():
         "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "service": os.getenv("RAILWAY_SERVICE_NAME", "unknown"),
         "env_vars": {k: var_info(k) for k in keys},
+        "market_cache": get_market_cache_stats(),
+        "http": get_http_stats(),
+        "sql_cache": get_sql_cache_stats(),
+        "async_db": get_async_db_stats(),
+        "db_pool": get_pool_stats(),
+        "response_cache": get_response_cache_stats(),
     }
 
 
@@ -588,7 +610,7 @@ async def get_today_matches():
     - Confidence scores (where available)
     """
     try:
-        matches_data = get_today_matches_with_ai_data()
+        matches_data = await run_db(get_today_matches_with_ai_data)
         
         matches = []
         for m in matches_data:
@@ -633,7 +655,7 @@ async def get_match_details(match_id: str):
     Returns 404 if match not found.
     """
     try:
-        match_data = get_match_ai_details(match_id)
+        match_data = await run_db(get_match_ai_details, match_id)
         
         if not match_data:
             raise HTTPException(
@@ -666,7 +688,7 @@ async def get_bookmaker_odds(match_id: str):
     - Each selection includes: market, selection, odds_by_bookmaker, best_odds, avg_odds, fair_odds
     """
     try:
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT 
                 match_id, home_team, away_team, league, match_date, kickoff_time,
                 market, selection, odds, model_prob,
@@ -873,7 +895,7 @@ async def get_match_scout(match_id: str):
         #       15=trust_level 16=tier 17=disagreement 18=profile_boost_score
         #       19=open_odds 20=close_odds 21=clv_pct 22=analysis
         #       23=odds_by_bookmaker 24=odds_source 25=best_odds_bookmaker 26=best_odds_value
-        opp_rows = db_helper.execute("""
+        opp_rows = await db_execute("""
             SELECT match_id, home_team, away_team, league, match_date, kickoff_time,
                    market, selection, odds, edge_percentage, confidence,
                    model_prob, calibrated_prob, sim_probability, ev_sim,
@@ -956,7 +978,7 @@ async def get_match_scout(match_id: str):
             })
 
         # ── 2. Training data for this match ──────────────────────
-        td = db_helper.execute("""
+        td = await db_execute("""
             SELECT home_form_goals_scored, home_form_goals_conceded,
                    home_form_clean_sheets, home_form_ppg,
                    home_form_wins, home_form_draws, home_form_losses,
@@ -1055,14 +1077,14 @@ async def get_match_scout(match_id: str):
                         _btts_val  = (_h2h.get("btts_rate") or 0) / 100 if _h2h.get("btts_rate") is not None else None
                         _o25_val   = (_h2h.get("over25_rate") or 0) / 100 if _h2h.get("over25_rate") is not None else None
                         # Check if a row already exists for this match
-                        _existing_row = db_helper.execute("""
+                        _existing_row = await db_execute("""
                             SELECT id, home_form_wins FROM training_data
                             WHERE home_team = %s AND away_team = %s AND match_date = %s
                             ORDER BY created_at DESC LIMIT 1
                         """, (home_team, away_team, match_date or None), fetch='one')
                         if _existing_row and _existing_row[1] is None:
                             # Row exists but has no form — UPDATE it with SofaScore data
-                            db_helper.execute("""
+                            await db_execute("""
                                 UPDATE training_data SET
                                     home_form_goals_scored=%s, home_form_goals_conceded=%s,
                                     home_form_clean_sheets=%s, home_form_ppg=%s,
@@ -1089,7 +1111,7 @@ async def get_match_scout(match_id: str):
                             logger.info(f"✅ Updated training_data form/H2H for {home_team} vs {away_team} (id={_existing_row[0]})")
                         elif not _existing_row:
                             # No row at all — INSERT a new one
-                            db_helper.execute("""
+                            await db_execute("""
                                 INSERT INTO training_data
                                     (home_team, away_team, league, match_date,
                                      home_form_goals_scored, home_form_goals_conceded,
@@ -1167,14 +1189,14 @@ async def get_decision(match_id: str):
         # Integer pick_id → look up its match_id first
         _resolved_id = match_id
         if match_id.lstrip('-').isdigit():
-            _id_row = db_helper.execute(
+            _id_row = await db_execute(
                 "SELECT match_id FROM football_opportunities WHERE id = %s LIMIT 1",
                 (int(match_id),), fetch='one'
             )
             if _id_row and _id_row[0]:
                 _resolved_id = _id_row[0]
 
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT
                 id, match_id, home_team, away_team, league,
                 market, selection, odds, edge_percentage, confidence,
@@ -1295,7 +1317,7 @@ async def get_today_best_odds():
         today = datetime.utcnow().date()
         tomorrow = today + timedelta(days=1)
         
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT 
                 match_id, home_team, away_team, league, kickoff_time,
                 market, selection, odds, model_prob, edge_percentage,
@@ -1354,6 +1376,7 @@ async def get_today_best_odds():
 
 
 @app.get("/api/performance", tags=["Analytics"])
+@cached_endpoint("performance", topics=("results",))
 async def get_performance_summary():
     """
     Get overall platform performance summary.
@@ -1361,7 +1384,7 @@ async def get_performance_summary():
     Returns ROI, win rate, and profit by product type.
     """
     try:
-        result = db_helper.execute("""
+        result = await db_execute("""
             SELECT 
                 product,
                 COUNT(*) as total_bets,
@@ -1434,6 +1457,7 @@ class CLVStatsResponse(BaseModel):
     generated_at: str
 
 @app.get("/api/clv_stats", tags=["Analytics"])
+@cached_endpoint("clv_stats", topics=("clv", "results"))
 async def get_clv_stats_endpoint():
     """
     Get Closing Line Value (CLV) statistics.
@@ -1441,7 +1465,7 @@ async def get_clv_stats_endpoint():
     """
     try:
         from clv_service import get_clv_stats
-        stats = get_clv_stats()
+        stats = await run_db(get_clv_stats)
         return JSONResponse(stats)
         
     except Exception as e:
@@ -1457,7 +1481,7 @@ async def get_clv_breakdown():
     """
     try:
         # Market breakdown — only sharp captures (exclude api_football, soft, line-moved)
-        market_rows = db_helper.execute("""
+        market_rows = await db_execute("""
             SELECT
                 market,
                 COUNT(*)                                                                        AS total,
@@ -1487,7 +1511,7 @@ async def get_clv_breakdown():
         """, fetch='all') or []
 
         # Timing breakdown (hours before KO when pick was created)
-        timing_rows = db_helper.execute("""
+        timing_rows = await db_execute("""
             SELECT
                 CASE
                     WHEN (open_ts - kickoff_epoch) / 3600.0 < -12 THEN '>12h before KO'
@@ -1517,7 +1541,7 @@ async def get_clv_breakdown():
         """, fetch='all') or []
 
         # Steam stats
-        steam_rows = db_helper.execute("""
+        steam_rows = await db_execute("""
             SELECT
                 steam_flag,
                 COUNT(*)                                AS n,
@@ -1580,7 +1604,7 @@ async def get_upcoming_injuries(hours: int = 48):
         from api_football_client import APIFootballClient
         af_client = APIFootballClient()
         poller = ProactiveInjuryPoller(af_client, db_helper)
-        summary = poller.get_upcoming_injury_summary(hours_ahead=hours)
+        summary = await run_db(poller.get_upcoming_injury_summary, hours_ahead=hours)
         stats = poller.get_stats()
         return JSONResponse({
             "matches": summary,
@@ -1606,7 +1630,7 @@ async def get_match_injuries(home: str, away: str):
         from api_football_client import APIFootballClient
         af_client = APIFootballClient()
         poller = ProactiveInjuryPoller(af_client, db_helper)
-        report = poller.get_injuries_for_match(home, away)
+        report = await run_db(poller.get_injuries_for_match, home, away)
         return JSONResponse(report)
     except Exception as e:
         logger.error(f"Error in get_match_injuries: {e}")
@@ -1617,8 +1641,7 @@ async def get_match_injuries(home: str, away: str):
 async def get_hockey_stats():
     """Hockey stats from learning_bets for the Railway dashboard."""
     try:
-        db = db_helper
-        summary = db.execute("""
+        summary = await db_execute("""
             SELECT sport_key,
                 COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
                 COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
@@ -1631,7 +1654,7 @@ async def get_hockey_stats():
             GROUP BY sport_key ORDER BY settled DESC
         """, fetch='all')
 
-        by_market = db.execute("""
+        by_market = await db_execute("""
             SELECT market,
                 COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
                 COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
@@ -1642,7 +1665,7 @@ async def get_hockey_stats():
             GROUP BY market ORDER BY settled DESC
         """, fetch='all')
 
-        totals = db.execute("""
+        totals = await db_execute("""
             SELECT COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
                    COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
                    COUNT(*) FILTER (WHERE status = 'pending') AS pending,
@@ -1650,7 +1673,7 @@ async def get_hockey_stats():
             FROM learning_bets WHERE sport_category = 'HOCKEY'
         """, fetch='one')
 
-        upcoming = db.execute("""
+        upcoming = await db_execute("""
             SELECT home_team, away_team, league, market, selection, line, odds,
                    TO_CHAR(commence_time AT TIME ZONE 'Europe/Stockholm', 'YYYY-MM-DD HH24:MI') AS ko
             FROM learning_bets
@@ -1706,10 +1729,9 @@ async def get_hockey_stats():
 async def get_nba_stats():
     """NBA game-level stats (Moneyline, Totals, AH) from learning_bets for the Railway dashboard."""
     try:
-        db = db_helper
         MARKET_LABELS = {'h2h': 'Moneyline', 'totals': 'Totals (O/U)', 'spreads': 'AH / Spread'}
 
-        by_market = db.execute("""
+        by_market = await db_execute("""
             SELECT market,
                 COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
                 COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
@@ -1722,7 +1744,7 @@ async def get_nba_stats():
             GROUP BY market ORDER BY settled DESC
         """, fetch='all')
 
-        totals_row = db.execute("""
+        totals_row = await db_execute("""
             SELECT COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
                    COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
                    COUNT(*) FILTER (WHERE status = 'pending') AS pending,
@@ -1730,7 +1752,7 @@ async def get_nba_stats():
             FROM learning_bets WHERE sport_category = 'NBA'
         """, fetch='one')
 
-        upcoming = db.execute("""
+        upcoming = await db_execute("""
             SELECT home_team, away_team, league, market, selection, line, odds,
                    TO_CHAR(commence_time AT TIME ZONE 'Europe/Stockholm', 'YYYY-MM-DD HH24:MI') AS ko
             FROM learning_bets
@@ -1791,7 +1813,7 @@ async def get_daily_units(days: int = 30):
     """
     try:
         from daily_units_service import get_daily_units as fetch_daily_units
-        result = fetch_daily_units(days_back=days)
+        result = await run_db(fetch_daily_units, days_back=days)
         result['generated_at'] = datetime.utcnow().isoformat() + "Z"
         return result
         
@@ -1823,7 +1845,7 @@ async def get_recent_bets(limit: int = 50, product: Optional[str] = None):
             ORDER BY timestamp DESC
             LIMIT %s
         """
-        rows = db_helper.execute(query, (limit,), fetch='all') or []
+        rows = await db_execute(query, (limit,), fetch='all') or []
         
         bets = []
         for row in rows:
@@ -2109,6 +2131,7 @@ class DailyCardResponse(BaseModel):
     syndicate_engines: Optional[SyndicateEngineStatus] = None
 
 @app.get("/api/daily_card", response_model=DailyCardResponse)
+@cached_endpoint("daily_card", topics=("picks", "results"), ttl=60)
 async def get_daily_card():
     """
     Get the complete daily betting card with all products.
@@ -2144,7 +2167,7 @@ async def get_daily_card():
             LIMIT 50
         """
         
-        vs_rows = db_helper.execute(value_singles_query, (f"{today}%",)) or []
+        vs_rows = await db_execute(value_singles_query, (f"{today}%",)) or []
         value_singles = []
         for row in vs_rows:
             value_singles.append({
@@ -2250,7 +2273,7 @@ async def get_market_stats():
             ORDER BY profit_units DESC
         """
         
-        rows = db_helper.execute(query) or []
+        rows = await db_execute(query) or []
         
         stats = []
         for row in rows:
@@ -2474,7 +2497,7 @@ async def get_live_learning_progress():
         from live_learning_tracker import get_live_learning_tracker
         
         tracker = get_live_learning_tracker()
-        progress = tracker.get_learning_progress()
+        progress = await run_db(tracker.get_learning_progress)
         
         return progress
         
@@ -2523,7 +2546,7 @@ async def get_live_learning_picks(
         query += " ORDER BY timestamp DESC LIMIT %s"
         params.append(limit)
         
-        rows = db_helper.execute(query, tuple(params)) or []
+        rows = await db_execute(query, tuple(params)) or []
         
         picks = []
         for row in rows:
@@ -2620,7 +2643,7 @@ async def send_discord_stats_endpoint():
     try:
         from discord_roi_webhook import send_discord_stats, get_roi_stats
         
-        stats = get_roi_stats()
+        stats = await run_db(get_roi_stats)
         success = send_discord_stats("📊 Manual stats update requested")
         
         return {
@@ -2708,6 +2731,7 @@ def _compute_pgr_score(db_val, ev_pct, model_prob, confidence=0.0) -> float | No
 
 
 @app.get("/api/picks/today")
+@cached_endpoint("picks_today", topics=("picks", "results", "clv"), ttl=60)
 async def get_today_picks():
     """
     Get picks (PROD + VALUE_OPP) for the next 48h — today + tomorrow.
@@ -2726,7 +2750,7 @@ async def get_today_picks():
         now_epoch = int(now_utc.timestamp())
         cutoff_epoch = now_epoch - 14400  # 4 hours after kickoff → move to history
 
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT * FROM (
                 SELECT DISTINCT ON (home_team, away_team, market, selection)
                     id, home_team, away_team, market, selection, odds,
@@ -2913,7 +2937,7 @@ async def get_today_picks():
                     ["(%s,%s,%s)"] * len(_uniq_matches)
                 )
                 _flat = [v for tup in _uniq_matches for v in tup]
-                _td_rows = db_helper.execute(f"""
+                _td_rows = await db_execute(f"""
                     SELECT home_team, away_team, match_date,
                            home_form_goals_scored, home_form_goals_conceded,
                            home_form_clean_sheets, home_form_ppg,
@@ -3065,7 +3089,7 @@ async def get_scanner_daily_stats():
         today_str = now_utc.strftime('%Y-%m-%d')
         cutoff_epoch = int(now_utc.timestamp()) - 14400  # 4h grace
 
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT COUNT(*) AS total,
                    SUM(CASE WHEN clv_tier = 'SHARP' THEN 1 ELSE 0 END) AS sharp_count,
                    SUM(CASE WHEN clv_tier = 'VOLUME' THEN 1 ELSE 0 END) AS volume_count
@@ -3103,7 +3127,7 @@ async def get_signal_stats(days: int = 7):
         cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%d')
         today_str = datetime.utcnow().strftime('%Y-%m-%d')
 
-        by_date = db_helper.execute("""
+        by_date = await db_execute("""
             SELECT
                 match_date::text,
                 COUNT(*) AS total,
@@ -3118,7 +3142,7 @@ async def get_signal_stats(days: int = 7):
             ORDER BY match_date DESC
         """, (cutoff_date,), fetch='all') or []
 
-        by_market = db_helper.execute("""
+        by_market = await db_execute("""
             SELECT
                 COALESCE(market, 'Unknown') AS market,
                 COUNT(*) AS total,
@@ -3132,7 +3156,7 @@ async def get_signal_stats(days: int = 7):
             ORDER BY total DESC
         """, (cutoff_date,), fetch='all') or []
 
-        by_league = db_helper.execute("""
+        by_league = await db_execute("""
             SELECT
                 COALESCE(league, 'Unknown') AS league,
                 COUNT(*) AS total,
@@ -3147,7 +3171,7 @@ async def get_signal_stats(days: int = 7):
             LIMIT 15
         """, (cutoff_date,), fetch='all') or []
 
-        gate_row = db_helper.execute("""
+        gate_row = await db_execute("""
             SELECT
                 COUNT(CASE WHEN edge_percentage < 12 AND market = 'Value Single' THEN 1 END),
                 COUNT(CASE WHEN market = 'Value Single'
@@ -3214,7 +3238,7 @@ async def get_analysis_today():
         today_str = day_start.strftime('%Y-%m-%d')
         cutoff_ep = int((now_utc.timestamp())) - 4 * 3600
 
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT id, home_team, away_team, selection, market,
                    odds, edge_percentage, confidence, league,
                    kickoff_time, match_date, model_prob, kickoff_epoch
@@ -3297,7 +3321,7 @@ async def get_confirmed_clv_picks():
         now_epoch   = int(now_utc.timestamp())
         cutoff_epoch = now_epoch - 14400  # 4h post-KO cutoff for upcoming picks
 
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT
                 id, home_team, away_team, market, selection, odds,
                 edge_percentage, confidence, outcome, profit_loss,
@@ -3444,7 +3468,7 @@ async def get_picks_history(days: int = 90):
         now_epoch_h = int(datetime.utcnow().timestamp())
         cutoff_epoch_h = now_epoch_h - 14400  # 4h past kickoff
 
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT id, home_team, away_team, market, selection, odds,
                    edge_percentage, confidence, outcome, profit_loss,
                    odds_by_bookmaker, best_odds_value, best_odds_bookmaker,
@@ -3603,7 +3627,7 @@ async def get_learning_history(sport: str = "HOCKEY", days: int = 90):
         sport_upper = sport.upper()
         safe_days = min(int(days), 730)
 
-        rows = db_helper.execute(f"""
+        rows = await db_execute(f"""
             SELECT id, home_team, away_team, league, market, selection, line,
                    odds, outcome, profit_loss, status,
                    TO_CHAR(COALESCE(settled_at, commence_time)::date, 'YYYY-MM-DD') AS match_date,
@@ -3662,6 +3686,7 @@ async def get_learning_history(sport: str = "HOCKEY", days: int = 90):
 
 
 @app.get("/api/stats/summary")
+@cached_endpoint("stats_summary", topics=("results",))
 async def get_stats_summary(days: int = 90):
     """
     Unified performance stats from football_opportunities.
@@ -3693,7 +3718,7 @@ async def get_stats_summary(days: int = 90):
                 "roi":      round(total_pl / settled * 100, 1) if settled > 0 else 0,
             }
 
-        all_time_row = db_helper.execute(f"""
+        all_time_row = await db_execute(f"""
             SELECT COUNT(*),
                    COUNT(CASE WHEN UPPER(outcome) IN ('WON','WIN')   THEN 1 END),
                    COUNT(CASE WHEN UPPER(outcome) IN ('LOST','LOSS') THEN 1 END),
@@ -3705,7 +3730,7 @@ async def get_stats_summary(days: int = 90):
             WHERE {BASE_FILTER}
         """, fetch='one')
 
-        period_row = db_helper.execute(f"""
+        period_row = await db_execute(f"""
             SELECT COUNT(*),
                    COUNT(CASE WHEN UPPER(outcome) IN ('WON','WIN')   THEN 1 END),
                    COUNT(CASE WHEN UPPER(outcome) IN ('LOST','LOSS') THEN 1 END),
@@ -3733,6 +3758,7 @@ async def get_stats_summary(days: int = 90):
 
 
 @app.get("/api/stats/roi")
+@cached_endpoint("stats_roi", topics=("results",))
 async def get_roi_stats_endpoint():
     """
     Get current ROI and performance statistics.
@@ -3741,7 +3767,7 @@ async def get_roi_stats_endpoint():
     try:
         from discord_roi_webhook import get_roi_stats
         
-        stats = get_roi_stats()
+        stats = await run_db(get_roi_stats)
         stats["timestamp"] = datetime.utcnow().isoformat()
         
         return stats
@@ -3832,7 +3858,7 @@ async def get_pending_manual_review(market: Optional[str] = None, limit: int = 5
         from flashscore_stats_scraper import ManualResultsManager
         
         manager = ManualResultsManager()
-        pending = manager.get_pending_manual_review(market=market, limit=limit)
+        pending = await run_db(manager.get_pending_manual_review, market=market, limit=limit)
         
         return {
             "count": len(pending),
@@ -3855,7 +3881,7 @@ async def get_verification_metrics(days: int = 7):
         from flashscore_stats_scraper import VerificationMetrics
         
         metrics = VerificationMetrics()
-        rates = metrics.get_success_rates(days=days)
+        rates = await run_db(metrics.get_success_rates, days=days)
         
         return {
             "period_days": days,
@@ -3920,7 +3946,7 @@ async def get_league_rankings(
     window: str = "all_time"
 ):
     try:
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT dimension_key, dimension_label, total_bets, wins, losses,
                    roi_pct, hit_rate, avg_clv, profit_units, avg_odds, score
             FROM learning_stats
@@ -3946,7 +3972,7 @@ async def get_market_rankings(
     window: str = "all_time"
 ):
     try:
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT dimension_key, dimension_label, total_bets, wins, losses,
                    roi_pct, hit_rate, avg_clv, profit_units, avg_odds, score
             FROM learning_stats
@@ -3973,7 +3999,7 @@ async def get_league_market_combos(
     min_bets: int = 10
 ):
     try:
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT dimension_key, dimension_label, total_bets, wins, losses,
                    roi_pct, hit_rate, avg_clv, profit_units, avg_odds, score
             FROM learning_stats
@@ -4002,7 +4028,7 @@ async def get_league_market_combos(
 @app.get("/api/learning/promotion_status", tags=["Self-Learning"])
 async def get_promotion_status(sport: str = "football"):
     try:
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT league_id, league_name, market_type, status, total_bets,
                    roi_pct, avg_clv, profit_units, manual_override,
                    promotion_reason, last_promotion_change, updated_at
@@ -4034,7 +4060,7 @@ async def get_promotion_status(sport: str = "football"):
 @app.get("/api/learning/global_stats", tags=["Self-Learning"])
 async def get_global_learning_stats():
     try:
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT sport, window_type, total_bets, wins, losses,
                    roi_pct, hit_rate, avg_clv, profit_units, avg_odds, score
             FROM learning_stats
@@ -4136,7 +4162,7 @@ async def stripe_portal(request: Request):
     if not customer_id:
         discord_id = get_discord_id(request)
         if discord_id:
-            row = db_helper.execute(
+            row = await db_execute(
                 "SELECT stripe_customer_id FROM pgr_users WHERE discord_user_id = %s",
                 (discord_id,), fetch='one'
             )
@@ -4307,7 +4333,7 @@ async def public_value_spots():
     try:
         # Try upcoming kickoffs first (next 24h) with solid edge
         now_epoch = int(__import__("time").time())
-        rows = db_helper.execute("""
+        rows = await db_execute("""
             SELECT home_team, away_team, league, market, selection,
                    odds, edge_percentage, model_prob, kickoff_epoch
             FROM football_opportunities
@@ -4321,7 +4347,7 @@ async def public_value_spots():
 
         # Fallback: recent picks from last 48h, lower edge bar
         if not rows:
-            rows = db_helper.execute("""
+            rows = await db_execute("""
                 SELECT home_team, away_team, league, market, selection,
                        odds, edge_percentage, model_prob, kickoff_epoch
                 FROM football_opportunities
@@ -4944,7 +4970,7 @@ async def v2_clv_proof(days: int = 30, sharp_only: bool = True):
             sharp_filter = f" AND ({ors}) AND COALESCE(soft_anchored, true) = false"
 
         # ── 1. Summary ──
-        rows = db_helper.execute(f"""
+        rows = await db_execute(f"""
             SELECT clv_pct
             FROM football_opportunities
             WHERE clv_pct IS NOT NULL
@@ -4976,7 +5002,7 @@ async def v2_clv_proof(days: int = 30, sharp_only: bool = True):
             out['distribution'] = buckets
 
         # ── 2. Per market ──
-        mkt_rows = db_helper.execute(f"""
+        mkt_rows = await db_execute(f"""
             SELECT market, AVG(clv_pct), COUNT(*),
                    SUM(CASE WHEN clv_pct > 0 THEN 1 ELSE 0 END)
             FROM football_opportunities
@@ -4996,7 +5022,7 @@ async def v2_clv_proof(days: int = 30, sharp_only: bool = True):
         } for r in mkt_rows]
 
         # ── 3. Per league ──
-        lg_rows = db_helper.execute(f"""
+        lg_rows = await db_execute(f"""
             SELECT league, AVG(clv_pct), COUNT(*),
                    SUM(CASE WHEN clv_pct > 0 THEN 1 ELSE 0 END)
             FROM football_opportunities
@@ -5016,7 +5042,7 @@ async def v2_clv_proof(days: int = 30, sharp_only: bool = True):
         } for r in lg_rows]
 
         # ── 4. Recent captures ──
-        rec_rows = db_helper.execute(f"""
+        rec_rows = await db_execute(f"""
             SELECT id, home_team, away_team, market, selection,
                    open_odds, close_odds, clv_pct, clv_source_book, match_date, league
             FROM football_opportunities
@@ -5130,10 +5156,8 @@ async def admin_data(request: Request, x_admin_key: Optional[str] = Header(None)
     if not is_admin_session(request) and not key_ok:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    db = db_helper
-
     # Overall summary
-    summary = db.execute("""
+    summary = await db_execute("""
         SELECT
             COUNT(*) FILTER (WHERE outcome IN ('won','lost','void')) AS settled,
             COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
@@ -5146,7 +5170,7 @@ async def admin_data(request: Request, x_admin_key: Optional[str] = Header(None)
     """, fetch='one')
 
     # By market
-    by_market = db.execute("""
+    by_market = await db_execute("""
         SELECT market,
             COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
             COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
@@ -5158,7 +5182,7 @@ async def admin_data(request: Request, x_admin_key: Optional[str] = Header(None)
     """, fetch='all')
 
     # By league (top 15)
-    by_league = db.execute("""
+    by_league = await db_execute("""
         SELECT league,
             COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
             COUNT(*) FILTER (WHERE outcome = 'won') AS wins,
@@ -5170,7 +5194,7 @@ async def admin_data(request: Request, x_admin_key: Optional[str] = Header(None)
     """, fetch='all')
 
     # Daily profit last 30 days
-    daily = db.execute("""
+    daily = await db_execute("""
         SELECT
             DATE(COALESCE(kickoff_utc::timestamptz, TO_TIMESTAMP("timestamp"))) AS day,
             COUNT(*) FILTER (WHERE outcome IN ('won','lost')) AS settled,
@@ -5183,7 +5207,7 @@ async def admin_data(request: Request, x_admin_key: Optional[str] = Header(None)
     """, fetch='all')
 
     # Recent picks (last 100 settled)
-    recent = db.execute("""
+    recent = await db_execute("""
         SELECT
             id, home_team, away_team, league, market, selection, odds,
             outcome, profit_loss,
@@ -5198,7 +5222,7 @@ async def admin_data(request: Request, x_admin_key: Optional[str] = Header(None)
     """, fetch='all')
 
     # Pending picks
-    pending_picks = db.execute("""
+    pending_picks = await db_execute("""
         SELECT id, home_team, away_team, league, market, selection, odds,
                ROUND(edge_percentage::numeric,1) AS edge,
                TO_CHAR(COALESCE(kickoff_utc::timestamptz, TO_TIMESTAMP("timestamp")), 'YYYY-MM-DD HH24:MI') AS ko
@@ -5210,7 +5234,7 @@ async def admin_data(request: Request, x_admin_key: Optional[str] = Header(None)
     """, fetch='all')
 
     # Last verification run (latest settled_timestamp)
-    last_verify = db.execute("""
+    last_verify = await db_execute("""
         SELECT MAX(settled_timestamp) FROM football_opportunities WHERE mode='PROD'
     """, fetch='one')
 
@@ -5406,11 +5430,14 @@ async def push_clear_all(request: Request, x_admin_key: Optional[str] = Header(N
     key_ok    = x_admin_key and (x_admin_key == admin_pw or x_admin_key == admin_key)
     if not is_admin_session(request) and not key_ok:
         raise HTTPException(status_code=401, detail="Unauthorized")
-    try:
+    def _clear_all_subscriptions():
         from db_connection import DatabaseConnection
         with DatabaseConnection.get_cursor() as cur:
             cur.execute("DELETE FROM push_subscriptions")
-            deleted = cur.rowcount
+            return cur.rowcount
+
+    try:
+        deleted = await run_db(_clear_all_subscriptions)
         logger.info(f"push/clear-all: deleted {deleted} subscriptions")
         return {"ok": True, "deleted": deleted, "message": "All subscriptions cleared. Users must re-subscribe."}
     except Exception as e:
@@ -5443,7 +5470,6 @@ async def analytics_data(request: Request, days: int = 90):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     days = max(7, min(days, 365))
-    db = db_helper
 
     def _safe(val, fmt=None):
         if val is None: return None
@@ -5454,7 +5480,7 @@ async def analytics_data(request: Request, days: int = 90):
             return None
 
     # ── Market split ─────────────────────────────────────────────────────────
-    mkt_rows = db.execute("""
+    mkt_rows = await db_execute("""
         SELECT
             COALESCE(market_category,'CORE') AS cat,
             market,
@@ -5480,7 +5506,7 @@ async def analytics_data(request: Request, days: int = 90):
                               'hr': hr, 'roi': roi, 'avg_clv': avg_clv, 'profit': profit})
 
     # ── League split ──────────────────────────────────────────────────────────
-    lg_rows = db.execute("""
+    lg_rows = await db_execute("""
         SELECT
             league,
             COALESCE(market_category,'CORE') AS cat,
@@ -5507,7 +5533,7 @@ async def analytics_data(request: Request, days: int = 90):
                               'hr': hr, 'roi': roi, 'avg_clv': avg_clv, 'profit': profit})
 
     # ── Odds bucket split ─────────────────────────────────────────────────────
-    bkt_rows = db.execute("""
+    bkt_rows = await db_execute("""
         SELECT
             CASE WHEN odds < 1.60 THEN '< 1.60'
                  WHEN odds < 1.80 THEN '1.60-1.79'
@@ -5541,7 +5567,7 @@ async def analytics_data(request: Request, days: int = 90):
                               'hr': hr, 'roi': roi, 'avg_clv': avg_clv, 'profit': profit, 'avg_odds': avg_odds})
 
     # ── Timing / drift ────────────────────────────────────────────────────────
-    drift_rows = db.execute("""
+    drift_rows = await db_execute("""
         SELECT
             COALESCE(market_category,'CORE') AS cat,
             market,
@@ -5574,7 +5600,7 @@ async def analytics_data(request: Request, days: int = 90):
     # Compare CLV between: A (instant entry) vs B (20-min delayed entry)
     # CLV for each: (close_implied - entry_implied) / entry_implied * 100
     # close_implied = 1/close_odds, entry_implied = 1/entry_odds
-    ab_raw = db.execute("""
+    ab_raw = await db_execute("""
         SELECT
             ab_version,
             COUNT(*) FILTER (WHERE close_odds IS NOT NULL AND entry_odds IS NOT NULL) AS n_settled,
@@ -5612,7 +5638,7 @@ async def analytics_data(request: Request, days: int = 90):
         })
 
     # Per-market A/B breakdown (when enough data)
-    ab_market_raw = db.execute("""
+    ab_market_raw = await db_execute("""
         SELECT
             ab_version,
             market,
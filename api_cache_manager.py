@@ -3,16 +3,310 @@ Persistent API Cache Manager
 Shares cache across all workflows via PostgreSQL to prevent quota exhaustion
 """
 
+import atexit
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime, timedelta, date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
+
+import psycopg2
+
 from db_helper import db_helper
+from db_connection import DatabaseConnection, resolve_database_url
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# ── Single-flight registry ───────────────────────────────────────────────────
+# Shared by every APICacheManager in the process so concurrent workflows
+# asking for the same cache_key wait on one upstream fetch.
+class _InFlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_inflight: Dict[str, _InFlightCall] = {}
+_inflight_lock = threading.Lock()
+_single_flight_stats = {
+    "leader_fetches": 0,      # this process performed the upstream call
+    "coalesced": 0,           # waited on another thread's in-flight call
+    "cross_process_hits": 0,  # another process filled the cache while we waited on the lock
+    "lock_timeouts": 0,       # gave up waiting for another process and fetched anyway
+}
+
+
+def get_single_flight_stats() -> Dict[str, int]:
+    """Counters for in-process and cross-process request coalescing"""
+    with _inflight_lock:
+        stats = dict(_single_flight_stats)
+        stats["in_flight"] = len(_inflight)
+    return stats
+
+
+def _bump(stat: str) -> None:
+    with _inflight_lock:
+        _single_flight_stats[stat] += 1
+
+
+# Cross-process single-flight uses session advisory locks on one dedicated
+# autocommit connection per process (not a pool slot): the lock is held for the
+# whole upstream fetch, which itself needs pool connections for cache/quota writes.
+_lock_conn = None
+_lock_conn_mutex = threading.Lock()
+
+
+def _discard_lock_connection() -> None:
+    """Close the advisory-lock session (caller holds _lock_conn_mutex); its locks go with it."""
+    global _lock_conn
+    if _lock_conn is not None:
+        try:
+            _lock_conn.close()
+        except Exception:
+            pass
+    _lock_conn = None
+
+
+def _advisory_lock_call(function: str, lock_id: int) -> bool:
+    """Run pg_try_advisory_lock / pg_advisory_unlock on the dedicated lock session"""
+    global _lock_conn
+    with _lock_conn_mutex:
+        if _lock_conn is None or _lock_conn.closed:
+            _lock_conn = psycopg2.connect(
+                resolve_database_url(),
+                keepalives=1, keepalives_idle=30, keepalives_interval=10, keepalives_count=3,
+            )
+            _lock_conn.autocommit = True
+        try:
+            with _lock_conn.cursor() as cursor:
+                cursor.execute(f"SELECT {function}(%s)", (lock_id,))
+                return bool(cursor.fetchone()[0])
+        except psycopg2.Error:
+            _discard_lock_connection()
+            raise
+
+
+# ── L1 in-process cache ──────────────────────────────────────────────────────
+# Sits in front of the <api>_cache tables. Hits never touch Postgres: hit
+# counts are accumulated here and flushed in batches, and expired rows are
+# purged by a background thread rather than on every lookup.
+L1_MAX_ENTRIES = int(os.getenv('API_CACHE_L1_MAX_ENTRIES', '5000'))
+L1_MAX_BYTES = int(float(os.getenv('API_CACHE_L1_MAX_MB', '64')) * 1024 * 1024)
+# Re-validate against Postgres after this long so other processes' writes are seen
+L1_MAX_AGE_SECONDS = int(os.getenv('API_CACHE_L1_MAX_AGE_SECONDS', '300'))
+MAINTENANCE_INTERVAL_SECONDS = 60
+EXPIRY_PURGE_INTERVAL_SECONDS = 300
+
+# (cache_table, cache_key) -> (expires_at, l1_deadline, payload_json)
+_l1: "OrderedDict[tuple, tuple]" = OrderedDict()
+_l1_bytes = 0
+_l1_lock = threading.Lock()
+_l1_stats = {"hits": 0, "misses": 0, "evictions": 0, "db_hits": 0, "hit_flushes": 0, "expiry_purges": 0}
+_pending_hits: Dict[str, Counter] = defaultdict(Counter)
+_known_tables: set = set()
+_maintenance_thread: Optional[threading.Thread] = None
+
+
+def _l1_get(table: str, cache_key: str) -> Optional[str]:
+    global _l1_bytes
+    key = (table, cache_key)
+    now = time.time()
+    with _l1_lock:
+        entry = _l1.get(key)
+        if entry is None:
+            _l1_stats["misses"] += 1
+            return None
+        expires_at, l1_deadline, payload = entry
+        if now >= l1_deadline or datetime.now() >= expires_at:
+            del _l1[key]
+            _l1_bytes -= len(payload)
+            _l1_stats["misses"] += 1
+            return None
+        _l1.move_to_end(key)
+        _l1_stats["hits"] += 1
+        _pending_hits[table][cache_key] += 1
+        return payload
+
+
+def _l1_put(table: str, cache_key: str, payload: str, expires_at: datetime) -> None:
+    global _l1_bytes
+    size = len(payload)
+    if size > L1_MAX_BYTES:
+        return
+    key = (table, cache_key)
+    with _l1_lock:
+        old = _l1.pop(key, None)
+        if old is not None:
+            _l1_bytes -= len(old[2])
+        _l1[key] = (expires_at, time.time() + L1_MAX_AGE_SECONDS, payload)
+        _l1_bytes += size
+        while _l1 and (len(_l1) > L1_MAX_ENTRIES or _l1_bytes > L1_MAX_BYTES):
+            _, evicted = _l1.popitem(last=False)
+            _l1_bytes -= len(evicted[2])
+            _l1_stats["evictions"] += 1
+
+
+def get_l1_cache_stats() -> Dict[str, Any]:
+    """L1 hit/miss counters, size and pending (unflushed) hit counts"""
+    with _l1_lock:
+        stats = dict(_l1_stats)
+        stats["entries"] = len(_l1)
+        stats["bytes"] = _l1_bytes
+        stats["pending_hit_keys"] = sum(len(c) for c in _pending_hits.values())
+    stats["max_entries"] = L1_MAX_ENTRIES
+    stats["max_bytes"] = L1_MAX_BYTES
+    return stats
+
+
+def flush_pending_hits() -> int:
+    """Write accumulated hit counts to Postgres, one UPDATE per cache table"""
+    with _l1_lock:
+        pending = {table: counts for table, counts in _pending_hits.items() if counts}
+        _pending_hits.clear()
+
+    flushed = 0
+    for table, counts in pending.items():
+        rows = list(counts.items())
+        values_sql = ", ".join(["(%s, %s)"] * len(rows))
+        params = [v for row in rows for v in row]
+        try:
+            db_helper.execute(f'''
+                UPDATE {table} AS t
+                SET hit_count = t.hit_count + v.hits
+                FROM (VALUES {values_sql}) AS v(cache_key, hits)
+                WHERE t.cache_key = v.cache_key
+            ''', params, fetch=None)
+            flushed += len(rows)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not flush cache hit counts for {table}: {e}")
+            # Requeue so the next flush retries them (merged with hits counted meanwhile)
+            with _l1_lock:
+                _pending_hits[table].update(counts)
+    if flushed:
+        with _l1_lock:
+            _l1_stats["hit_flushes"] += 1
+    return flushed
+
+
+def purge_expired_entries() -> None:
+    """Batched expiry: drop expired rows from every known cache table and from L1"""
+    global _l1_bytes
+    for table in list(_known_tables):
+        try:
+            db_helper.execute(f'''
+                DELETE FROM {table}
+                WHERE expires_at < CURRENT_TIMESTAMP
+            ''', fetch=None)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not purge expired rows from {table}: {e}")
+
+    now_ts, now_dt = time.time(), datetime.now()
+    with _l1_lock:
+        stale = [k for k, (expires_at, deadline, _) in _l1.items() if now_ts >= deadline or now_dt >= expires_at]
+        for k in stale:
+            _l1_bytes -= len(_l1.pop(k)[2])
+        _l1_stats["expiry_purges"] += 1
+
+
+def _maintenance_loop() -> None:
+    last_purge = 0.0
+    while True:
+        time.sleep(MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            flush_pending_hits()
+            reconcile_quota_buckets()
+            if time.time() - last_purge >= EXPIRY_PURGE_INTERVAL_SECONDS:
+                purge_expired_entries()
+                last_purge = time.time()
+        except Exception as e:
+            logger.warning(f"⚠️ API cache maintenance error: {e}")
+
+
+# ── Local quota buckets ──────────────────────────────────────────────────────
+# Each process reserves quota from api_request_counter in blocks and spends
+# it locally, so an upstream call costs no DB statements until the block
+# runs out. Unused tokens are handed back when idle, on day rollover and at
+# exit, so the shared daily limit stays exact across processes.
+# The quota day is always the process-local date.today(): it is written to
+# last_reset_date explicitly rather than via CURRENT_DATE, so a DB session in
+# another timezone cannot make every reservation look like a new day.
+QUOTA_BLOCK_SIZE = int(os.getenv('API_QUOTA_BLOCK_SIZE', '50'))
+QUOTA_IDLE_RELEASE_SECONDS = 300
+
+
+class _QuotaBucket:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.day: Optional[date] = None
+        self.tokens = 0             # reserved in the DB but not yet spent
+        self.next_count = 0         # request_count value the next spent token represents
+        self.quota_limit = 0
+        self.last_activity = 0.0
+
+
+_quota_buckets: Dict[str, _QuotaBucket] = {}
+_quota_buckets_lock = threading.Lock()
+
+
+def _get_quota_bucket(api_name: str) -> _QuotaBucket:
+    with _quota_buckets_lock:
+        bucket = _quota_buckets.get(api_name)
+        if bucket is None:
+            bucket = _quota_buckets[api_name] = _QuotaBucket()
+        return bucket
+
+
+def _release_quota_tokens(api_name: str, bucket: _QuotaBucket) -> None:
+    """Return unspent tokens to api_request_counter (caller holds bucket.lock)"""
+    if bucket.tokens <= 0 or bucket.day is None:
+        bucket.tokens = 0
+        return
+    try:
+        db_helper.execute('''
+            UPDATE api_request_counter
+            SET request_count = GREATEST(0, request_count - %s)
+            WHERE api_name = %s AND last_reset_date = %s
+        ''', (bucket.tokens, api_name, bucket.day), fetch=None)
+        logger.debug(f"🔁 Released {bucket.tokens} unused {api_name} quota tokens")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not release {api_name} quota tokens: {e}")
+    bucket.tokens = 0
+
+
+def reconcile_quota_buckets(force: bool = False) -> None:
+    """Hand back idle (or, with force, all) reserved-but-unspent quota tokens"""
+    now = time.time()
+    today = date.today()
+    with _quota_buckets_lock:
+        buckets = list(_quota_buckets.items())
+    for api_name, bucket in buckets:
+        with bucket.lock:
+            stale_day = bucket.day is not None and bucket.day != today
+            idle = now - bucket.last_activity >= QUOTA_IDLE_RELEASE_SECONDS
+            if stale_day or force or idle:
+                # Scoped to bucket.day, so this is a no-op once the row has rolled over
+                _release_quota_tokens(api_name, bucket)
+
+
+def _ensure_maintenance_thread(table: str) -> None:
+    global _maintenance_thread
+    with _l1_lock:
+        _known_tables.add(table)
+        if _maintenance_thread is not None:
+            return
+        _maintenance_thread = threading.Thread(target=_maintenance_loop, name="api-cache-maintenance", daemon=True)
+        _maintenance_thread.start()
+    atexit.register(flush_pending_hits)
+    atexit.register(reconcile_quota_buckets, True)
+
+
 class APICacheManager:
     """Manages persistent API cache and request quota across all workflows"""
     
@@ -29,6 +323,7 @@ class APICacheManager:
         self.cache_table = f"{api_name}_cache"
         
         self._ensure_quota_initialized()
+        _ensure_maintenance_thread(self.cache_table)
     
     def _ensure_quota_initialized(self):
         """Ensure this API has a quota counter entry"""
@@ -53,68 +348,209 @@ class APICacheManager:
                 logger.info(f"🔄 New day detected - resetting {self.api_name} quota counter")
                 db_helper.execute('''
                     UPDATE api_request_counter
-                    SET request_count = 0, last_reset_date = CURRENT_DATE
+                    SET request_count = 0, last_reset_date = %s
                     WHERE api_name = %s
-                ''', (self.api_name,), fetch=None)
+                ''', (today, self.api_name), fetch=None)
     
+    def _reserve_quota_block(self, bucket: _QuotaBucket) -> int:
+        """
+        Atomically reserve up to QUOTA_BLOCK_SIZE requests from the shared counter
+        (caller holds bucket.lock). Handles the daily reset in the same transaction.
+
+        Returns:
+            int: Number of tokens granted (0 when the daily quota is exhausted)
+        """
+        today = date.today()
+        with DatabaseConnection.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT request_count, quota_limit, last_reset_date
+                    FROM api_request_counter
+                    WHERE api_name = %s
+                    FOR UPDATE
+                ''', (self.api_name,))
+                row = cursor.fetchone()
+                if not row:
+                    return 0
+                request_count, quota_limit, last_reset = row
+                if last_reset != today:
+                    logger.info(f"🔄 New day detected - resetting {self.api_name} quota counter")
+                    request_count = 0
+                granted = max(0, min(QUOTA_BLOCK_SIZE, quota_limit - request_count))
+                cursor.execute('''
+                    UPDATE api_request_counter
+                    SET request_count = %s,
+                        last_reset_date = %s,
+                        last_request_time = CURRENT_TIMESTAMP
+                    WHERE api_name = %s
+                ''', (request_count + granted, today, self.api_name))
+
+        bucket.day = today
+        bucket.tokens = granted
+        bucket.next_count = request_count + 1
+        bucket.quota_limit = quota_limit
+        return granted
+
+    def _ensure_tokens(self, bucket: _QuotaBucket) -> bool:
+        """Make sure the bucket holds at least one token for today (caller holds bucket.lock)"""
+        if bucket.day is not None and bucket.day != date.today():
+            # Hand back the old day's leftovers; a no-op if the row already rolled over
+            _release_quota_tokens(self.api_name, bucket)
+        if bucket.tokens > 0:
+            return True
+        return self._reserve_quota_block(bucket) > 0
+
     def check_quota_available(self) -> bool:
         """
         Check if we have quota available for another request
         
+        Served from the process-local token bucket; only touches the DB
+        when a new block has to be reserved.
+        
         Returns:
             bool: True if quota available, False if exhausted
         """
-        self._reset_if_new_day()
-        
-        result = db_helper.execute('''
-            SELECT request_count, quota_limit FROM api_request_counter
-            WHERE api_name = %s
-        ''', (self.api_name,), fetch='one')
-        
-        if not result:
-            return True
-        
-        request_count, quota_limit = result
-        return request_count < quota_limit
+        bucket = _get_quota_bucket(self.api_name)
+        with bucket.lock:
+            bucket.last_activity = time.time()
+            return self._ensure_tokens(bucket)
     
     # Budget threshold at which a warning is emitted (fraction of quota_limit)
     BUDGET_WARNING_THRESHOLD = 5000
 
     def increment_request_count(self):
-        """Increment the request counter after making an API call"""
-        db_helper.execute('''
-            UPDATE api_request_counter
-            SET request_count = request_count + 1,
-                last_request_time = CURRENT_TIMESTAMP
-            WHERE api_name = %s
-        ''', (self.api_name,), fetch=None)
-        
-        result = db_helper.execute('''
-            SELECT request_count, quota_limit FROM api_request_counter
-            WHERE api_name = %s
-        ''', (self.api_name,), fetch='one')
+        """Spend one reserved quota token after making an API call"""
+        bucket = _get_quota_bucket(self.api_name)
+        with bucket.lock:
+            bucket.last_activity = time.time()
+            if not self._ensure_tokens(bucket):
+                # Call already happened with no quota left - still record it
+                db_helper.execute('''
+                    UPDATE api_request_counter
+                    SET request_count = request_count + 1,
+                        last_request_time = CURRENT_TIMESTAMP
+                    WHERE api_name = %s
+                ''', (self.api_name,), fetch=None)
+                bucket.next_count += 1
+                return
+            bucket.tokens -= 1
+            request_count = bucket.next_count
+            quota_limit = bucket.quota_limit
+            bucket.next_count += 1
         
-        if result:
-            request_count, quota_limit = result
-            if request_count % 10 == 0:
-                logger.info(f"📊 {self.api_name}: {request_count}/{quota_limit} requests today")
-            # Budget warning when crossing the 5000-request threshold
-            if request_count >= self.BUDGET_WARNING_THRESHOLD and (request_count - 1) < self.BUDGET_WARNING_THRESHOLD:
-                logger.warning(
-                    f"⚠️ API BUDGET WARNING: {self.api_name} has used {request_count}/{quota_limit} requests today "
-                    f"({request_count/quota_limit*100:.0f}%). Approaching daily limit — cache will be prioritised."
-                )
-            elif request_count > self.BUDGET_WARNING_THRESHOLD and request_count % 100 == 0:
-                remaining = quota_limit - request_count
-                logger.warning(
-                    f"⚠️ API BUDGET HIGH: {self.api_name} {request_count}/{quota_limit} requests today. "
-                    f"{remaining} remaining."
-                )
+        if request_count % 10 == 0:
+            logger.info(f"📊 {self.api_name}: {request_count}/{quota_limit} requests today")
+        # Budget warning when crossing the 5000-request threshold
+        if request_count >= self.BUDGET_WARNING_THRESHOLD and (request_count - 1) < self.BUDGET_WARNING_THRESHOLD:
+            logger.warning(
+                f"⚠️ API BUDGET WARNING: {self.api_name} has used {request_count}/{quota_limit} requests today "
+                f"({request_count/quota_limit*100:.0f}%). Approaching daily limit — cache will be prioritised."
+            )
+        elif request_count > self.BUDGET_WARNING_THRESHOLD and request_count % 100 == 0:
+            remaining = quota_limit - request_count
+            logger.warning(
+                f"⚠️ API BUDGET HIGH: {self.api_name} {request_count}/{quota_limit} requests today. "
+                f"{remaining} remaining."
+            )
     
+    # How long to wait for another process holding the advisory lock on a key
+    SINGLE_FLIGHT_WAIT_SECONDS = 20
+    SINGLE_FLIGHT_POLL_SECONDS = 0.25
+
+    def _advisory_lock_id(self, cache_key: str) -> int:
+        """Stable signed 64-bit advisory lock id for (api_name, cache_key)"""
+        digest = hashlib.blake2b(f"{self.api_name}:{cache_key}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+    def single_flight(self, cache_key: str, endpoint: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch() at most once per cache_key at a time, across threads and processes.
+
+        Concurrent callers in this process wait for the first caller's result.
+        Across processes, the leader holds a Postgres advisory lock on the key;
+        other processes wait for it and then read the freshly cached row instead
+        of calling upstream. fetch() is expected to cache its own response.
+
+        Args:
+            cache_key: Cache key of the request being made
+            endpoint: API endpoint (for logging)
+            fetch: Performs the live request and caches it; returns the data
+
+        Returns:
+            The fetched (or freshly cached) response data
+        """
+        flight_key = f"{self.api_name}:{cache_key}"
+        with _inflight_lock:
+            call = _inflight.get(flight_key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                _inflight[flight_key] = call
+
+        if not is_leader:
+            _bump("coalesced")
+            logger.debug(f"🔗 COALESCED: {endpoint} ({cache_key[:30]}...)")
+            if call.done.wait(timeout=self.SINGLE_FLIGHT_WAIT_SECONDS):
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            return self.get_cached_response(cache_key, endpoint)
+
+        try:
+            call.result = self._fetch_under_advisory_lock(cache_key, endpoint, fetch)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            call.done.set()
+            with _inflight_lock:
+                _inflight.pop(flight_key, None)
+
+    def _fetch_under_advisory_lock(self, cache_key: str, endpoint: str, fetch: Callable[[], Any]) -> Any:
+        """Hold a session advisory lock on the key while fetching (falls back to a plain fetch)"""
+        lock_id = self._advisory_lock_id(cache_key)
+
+        def run_fetch():
+            _bump("leader_fetches")
+            return fetch()
+
+        try:
+            deadline = time.time() + self.SINGLE_FLIGHT_WAIT_SECONDS
+            waited = False
+            while not _advisory_lock_call("pg_try_advisory_lock", lock_id):
+                if time.time() >= deadline:
+                    _bump("lock_timeouts")
+                    logger.warning(f"⏳ Advisory lock wait timed out for {endpoint} ({cache_key[:30]}...)")
+                    return run_fetch()
+                waited = True
+                time.sleep(self.SINGLE_FLIGHT_POLL_SECONDS)
+        except psycopg2.Error as e:
+            logger.warning(f"⚠️ Advisory lock unavailable ({e}) - fetching without cross-process coalescing")
+            return run_fetch()
+
+        try:
+            if waited:
+                cached = self.get_cached_response(cache_key, endpoint)
+                if cached is not None:
+                    _bump("cross_process_hits")
+                    return cached
+            return run_fetch()
+        finally:
+            try:
+                _advisory_lock_call("pg_advisory_unlock", lock_id)
+            except psycopg2.Error as e:
+                # The failed session was closed, which releases its locks
+                logger.warning(f"⚠️ Could not release advisory lock: {e}")
+
     def get_cached_response(self, cache_key: str, endpoint: str) -> Optional[Dict]:
         """
         Get cached API response if available and not expired
         
+        Checks the in-process L1 first; on an L1 miss reads Postgres and
+        promotes the row into L1. Hit counts are flushed in batches and
+        expired rows are purged by the background maintenance thread.
+        
         Args:
             cache_key: Unique cache key for this request
             endpoint: API endpoint (for logging)
@@ -122,13 +558,11 @@ class APICacheManager:
         Returns:
             Cached response data or None if not found/expired
         """
-        # Clean expired cache entries first
-        db_helper.execute(f'''
-            DELETE FROM {self.cache_table}
-            WHERE expires_at < CURRENT_TIMESTAMP
-        ''', fetch=None)
+        payload = _l1_get(self.cache_table, cache_key)
+        if payload is not None:
+            logger.debug(f"📦 L1 CACHE HIT: {endpoint} ({cache_key[:30]}...)")
+            return json.loads(payload)
         
-        # Try to get cached response
         result = db_helper.execute(f'''
             SELECT response_data, expires_at FROM {self.cache_table}
             WHERE cache_key = %s
@@ -142,21 +576,24 @@ class APICacheManager:
                 expires_at = datetime.fromisoformat(expires_at)
             
             if datetime.now() < expires_at:
-                # Update hit count
-                db_helper.execute(f'''
-                    UPDATE {self.cache_table}
-                    SET hit_count = hit_count + 1
-                    WHERE cache_key = %s
-                ''', (cache_key,), fetch=None)
+                if not isinstance(response_data, str):
+                    response_data = json.dumps(response_data)
+                _l1_put(self.cache_table, cache_key, response_data, expires_at)
+                with _l1_lock:
+                    _l1_stats["db_hits"] += 1
+                    _pending_hits[self.cache_table][cache_key] += 1
                 
                 logger.info(f"📦 CACHE HIT: {endpoint} ({cache_key[:30]}...)")
                 return json.loads(response_data)
         
         return None
     
+    # Tables whose cached_at column has been ensured in this process
+    _cached_at_ensured: set = set()
+    
     def cache_response(self, cache_key: str, endpoint: str, response_data: Any, ttl_hours: int = 24):
         """
-        Cache an API response
+        Cache an API response (written through to both Postgres and L1)
         
         Args:
             cache_key: Unique cache key
@@ -170,15 +607,18 @@ class APICacheManager:
             return
         
         expires_at = datetime.now() + timedelta(hours=ttl_hours)
+        payload = json.dumps(response_data)
         
         # Ensure the cache table has a cached_at column (added Mar 2026 for freshness checks)
-        try:
-            db_helper.execute(f'''
-                ALTER TABLE {self.cache_table}
-                ADD COLUMN IF NOT EXISTS cached_at TIMESTAMP DEFAULT NOW()
-            ''', fetch=None)
-        except Exception:
-            pass  # Column may already exist or table not created yet — handled below
+        if self.cache_table not in APICacheManager._cached_at_ensured:
+            try:
+                db_helper.execute(f'''
+                    ALTER TABLE {self.cache_table}
+                    ADD COLUMN IF NOT EXISTS cached_at TIMESTAMP DEFAULT NOW()
+                ''', fetch=None)
+                APICacheManager._cached_at_ensured.add(self.cache_table)
+            except Exception:
+                pass  # Column may already exist or table not created yet — handled below
         
         db_helper.execute(f'''
             INSERT INTO {self.cache_table} (cache_key, response_data, api_endpoint, expires_at, cached_at)
@@ -188,7 +628,8 @@ class APICacheManager:
                 expires_at = EXCLUDED.expires_at,
                 cached_at = NOW(),
                 hit_count = 0
-        ''', (cache_key, json.dumps(response_data), endpoint, expires_at), fetch=None)
+        ''', (cache_key, payload, endpoint, expires_at), fetch=None)
+        _l1_put(self.cache_table, cache_key, payload, expires_at)
         
         logger.info(f"💾 CACHED: {endpoint} ({cache_key[:30]}...) expires in {ttl_hours}h")
     
@@ -244,11 +685,13 @@ class APICacheManager:
         
         if result:
             request_count, quota_limit, last_reset, last_request = result
+            bucket = _get_quota_bucket(self.api_name)
             return {
                 'api_name': self.api_name,
                 'request_count': request_count,
                 'quota_limit': quota_limit,
                 'remaining': quota_limit - request_count,
+                'reserved_unspent': bucket.tokens,  # held by this process's quota block
                 'last_reset_date': str(last_reset),
                 'last_request_time': str(last_request) if last_request else None
             }
@@ -5,7 +5,7 @@ Handles injuries, lineups, statistics, and match validation
 
 import os
 import re
-import requests
+from http_transport import http_get
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -68,11 +68,19 @@ class APIFootballClient:
         if cached is not None:
             return cached
         
+        # Single-flight: concurrent callers (threads or other workflows) share one upstream call
+        return self.cache_manager.single_flight(
+            cache_key, endpoint,
+            lambda: self._fetch_live(endpoint, params, cache_key, ttl_hours)
+        )
+    
+    def _fetch_live(self, endpoint: str, params: dict, cache_key: str, ttl_hours: int) -> Optional[Dict]:
+        """Live API call + cache write (only called by the single-flight leader)"""
         self._rate_limit()
         
         try:
             url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
+            response = http_get(url, headers=self.headers, params=params, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -377,7 +385,7 @@ class APIFootballClient:
             url = f"{self.base_url}/fixtures/lineups"
             params = {'fixture': fixture_id}
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
+            response = http_get(url, headers=self.headers, params=params, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1016,7 +1024,7 @@ class APIFootballClient:
             self._rate_limit()
             try:
                 url = f"{self.base_url}/odds"
-                response = requests.get(url, headers=self.headers, params=params, timeout=15)
+                response = http_get(url, headers=self.headers, params=params, timeout=15)
                 if response.status_code == 200:
                     live_data = response.json().get('response', [])
                     if live_data:
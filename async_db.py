@@ -0,0 +1,138 @@
+"""
+Async Database Access
+Keeps blocking psycopg2 work off the API event loop.
+
+- Queries from async endpoints run on a dedicated, bounded thread pool
+  (API_DB_CONCURRENCY workers), so one slow query can't stall /api/health
+- The API process sizes the shared connection pool to its worker count; the
+  scheduler/worker processes keep their own pools and limits
+- Queue wait / run time metrics (get_async_db_stats)
+
+Usage:
+    from async_db import db_execute, run_db
+
+    rows = await db_execute("SELECT ... WHERE id = %s", (pick_id,), fetch='all')
+    stats = await run_db(get_clv_stats)          # any blocking DB-backed call
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from db_connection import DatabaseConnection, POOL_ROLE_SIZES
+from db_helper import db_helper
+
+logger = logging.getLogger(__name__)
+
+# Worker threads that may hold a DB connection at once for API requests.
+API_DB_CONCURRENCY = int(os.getenv('API_DB_CONCURRENCY', '8'))
+# Connections reserved beyond the workers for code still using get_cursor directly
+# (startup table checks, auth middleware, plain `def` endpoints).
+API_DB_POOL_HEADROOM = int(os.getenv('API_DB_POOL_HEADROOM', '4'))
+LATENCY_WINDOW = 500  # recent samples kept for percentiles
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats = {"submitted": 0, "completed": 0, "errors": 0, "in_flight": 0, "max_in_flight": 0}
+_wait_samples: deque = deque(maxlen=LATENCY_WINDOW)
+_run_samples: deque = deque(maxlen=LATENCY_WINDOW)
+
+
+def init_async_db(max_workers: Optional[int] = None) -> None:
+    """
+    Create the API's DB executor and size the connection pool to match.
+    Call once at API startup, before anything else opens the pool.
+    """
+    global _executor, API_DB_CONCURRENCY
+    with _executor_lock:
+        if _executor is not None:
+            return
+        if max_workers:
+            API_DB_CONCURRENCY = max_workers
+        DatabaseConnection.configure('api')
+        _, role_max = POOL_ROLE_SIZES['api']
+        DatabaseConnection.initialize_pool(maxconn=max(role_max, API_DB_CONCURRENCY + API_DB_POOL_HEADROOM))
+        _executor = ThreadPoolExecutor(max_workers=API_DB_CONCURRENCY, thread_name_prefix="api-db")
+        logger.info(f"✅ Async DB executor ready ({API_DB_CONCURRENCY} workers)")
+
+
+def shutdown_async_db() -> None:
+    """Stop the executor (waits for running queries)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    if _executor is None:
+        init_async_db()
+    return _executor
+
+
+def _timed(fn: Callable, submitted_at: float) -> Any:
+    started = time.perf_counter()
+    with _stats_lock:
+        _wait_samples.append(started - submitted_at)
+        _stats["in_flight"] += 1
+        _stats["max_in_flight"] = max(_stats["max_in_flight"], _stats["in_flight"])
+    failed = False
+    try:
+        return fn()
+    except Exception:
+        failed = True
+        raise
+    finally:
+        with _stats_lock:
+            _run_samples.append(time.perf_counter() - started)
+            _stats["in_flight"] -= 1
+            _stats["completed"] += 1
+            if failed:
+                _stats["errors"] += 1
+
+
+async def run_db(fn: Callable, *args, **kwargs) -> Any:
+    """Run a blocking DB-backed callable on the API DB executor and await its result."""
+    with _stats_lock:
+        _stats["submitted"] += 1
+    call = functools.partial(fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _timed, call, time.perf_counter())
+
+
+async def db_execute(query, params=None, fetch=None):
+    """Awaitable db_helper.execute (same arguments and return value)."""
+    return await run_db(db_helper.execute, query, params, fetch)
+
+
+def _percentiles_ms(samples) -> Dict[str, float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    return {
+        "avg_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+    }
+
+
+def get_async_db_stats() -> Dict[str, Any]:
+    """Executor size, queue depth and wait/run latency for API DB calls."""
+    with _stats_lock:
+        stats = dict(_stats)
+        wait = _percentiles_ms(_wait_samples)
+        run = _percentiles_ms(_run_samples)
+    stats["workers"] = API_DB_CONCURRENCY
+    stats["queued"] = max(0, stats["submitted"] - stats["completed"] - stats["in_flight"])
+    stats["wait"] = wait
+    stats["run"] = run
+    return stats
@@ -21,6 +21,7 @@ from datetime import date, datetime
 
 import psycopg2
 import psycopg2.extras
+from db_connection import DatabaseConnection
 
 
 # ---------- Datamodell ----------
@@ -45,7 +46,7 @@ def get_db_connection():
     db_url = os.getenv("DATABASE_URL")
     if not db_url:
         raise RuntimeError("DATABASE_URL saknas i environment vars.")
-    return psycopg2.connect(db_url)
+    return DatabaseConnection.checkout('backtest')
 
 
 def compute_payout_profit(stake: float, odds: float, outcome: str) -> Tuple[float, float]:
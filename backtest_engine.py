@@ -11,14 +11,13 @@ Purpose: Risk and stability analysis for potential public launch
 ================================================================================
 """
 
-import os
 import json
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
-import psycopg2
 from psycopg2.extras import RealDictCursor
+from db_connection import DatabaseConnection
 
 BACKTEST_LABEL = "⚠️ BACKTEST ONLY - NOT LIVE RESULTS ⚠️"
 
@@ -36,8 +35,8 @@ BACKTEST_END = '2026-01-27'
 
 
 def get_db_connection():
-    """Get database connection."""
-    return psycopg2.connect(os.environ['DATABASE_URL'])
+    """Get a pooled database connection (close() returns it to the pool)."""
+    return DatabaseConnection.checkout('backtest_engine')
 
 
 def fetch_historical_bets() -> pd.DataFrame:
@@ -81,6 +80,186 @@ def fetch_historical_bets() -> pd.DataFrame:
     return df
 
 
+class DayReplay:
+    """
+    Bets sorted once by (day, EV desc) with each day's running P&L precomputed.
+
+    Under a daily cap C and stop-loss S the bets placed on a day are always a prefix
+    of that day's EV ranking: its length is min(C, bets that day, first bet whose
+    running total reaches S). So a whole grid of (cap, stop-loss) scenarios is
+    replayed as 2-D array operations instead of one pandas loop per scenario.
+    """
+
+    def __init__(
+        self,
+        bets_df: pd.DataFrame,
+        min_ev: Optional[float] = None,
+        markets: Optional[List[str]] = None,
+    ):
+        df = bets_df
+        if markets is not None:
+            df = df[df['market_type'].isin(list(markets))]
+        if min_ev is not None:
+            df = df[pd.to_numeric(df['ev'], errors='coerce') >= min_ev]
+        self.min_ev = min_ev
+        self.markets = list(markets) if markets is not None else None
+
+        days = pd.to_datetime(df['bet_date']).to_numpy()
+        ev = pd.to_numeric(df['ev'], errors='coerce').to_numpy(dtype=float)
+        order = np.lexsort((-ev, days))   # day ascending, EV descending (missing EV last)
+
+        self.ids = df['id'].to_numpy()[order]
+        self.won = df['won'].to_numpy(dtype=bool)[order]
+        odds = df['odds'].to_numpy(dtype=float)[order]
+        self.profit = np.where(self.won, odds - 1, -1.0)
+        market_type = df['market_type'].to_numpy()[order]
+        self.market_masks = {m: market_type == m for m in MARKETS_INCLUDED}
+
+        days = days[order]
+        n = len(days)
+        self.n_bets = n
+        if n:
+            self.day_starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        else:
+            self.day_starts = np.zeros(0, dtype=np.int64)
+        self.day_sizes = np.diff(np.r_[self.day_starts, n]).astype(np.int64)
+        self.day_labels = [str(pd.Timestamp(days[i]).date()) for i in self.day_starts]
+        self.day_of = np.repeat(np.arange(len(self.day_starts)), self.day_sizes)
+        self.pos = np.arange(n) - np.repeat(self.day_starts, self.day_sizes)
+
+        # Running P&L within each day if every bet were placed (sequential, like the live loop)
+        self.day_cum = np.empty(n)
+        for start, size in zip(self.day_starts, self.day_sizes):
+            self.day_cum[start:start + size] = np.cumsum(self.profit[start:start + size])
+        self._stop_cache: Dict[Optional[float], np.ndarray] = {}
+
+    def _stop_lengths(self, stop_loss: Optional[float]) -> np.ndarray:
+        """Per day: bets placed before the stop-loss halts the day (ignoring the cap)."""
+        if stop_loss not in self._stop_cache:
+            if stop_loss is None or not self.n_bets:
+                lengths = self.day_sizes.copy()
+            elif stop_loss >= 0:
+                lengths = np.zeros_like(self.day_sizes)   # 0u already counts as stopped
+            else:
+                hit = np.where(self.day_cum <= stop_loss, self.pos + 1, self.n_bets + 1)
+                lengths = np.minimum(np.minimum.reduceat(hit, self.day_starts), self.day_sizes)
+            self._stop_cache[stop_loss] = lengths
+        return self._stop_cache[stop_loss]
+
+    def run(
+        self,
+        scenarios: List[Tuple[int, Optional[float]]],
+        include_curves: bool = True,
+        chunk_cells: int = 4_000_000,
+    ) -> List[Dict]:
+        """Results dicts (run_backtest_scenario format) for (daily_cap, stop_loss) pairs."""
+        out: List[Dict] = []
+        chunk = max(1, chunk_cells // max(self.n_bets, 1))
+        for lo in range(0, len(scenarios), chunk):
+            out.extend(self._run_chunk(scenarios[lo:lo + chunk], include_curves))
+        return out
+
+    def _run_chunk(self, scenarios: List[Tuple[int, Optional[float]]], include_curves: bool) -> List[Dict]:
+        n_days = len(self.day_starts)
+        caps = np.array([cap for cap, _ in scenarios], dtype=np.int64)
+        placed_per_day = np.stack([
+            np.minimum(self._stop_lengths(stop), cap) for cap, stop in scenarios
+        ]) if n_days else np.zeros((len(scenarios), 0), dtype=np.int64)
+
+        placed = self.pos[None, :] < placed_per_day[:, self.day_of]          # (S, n)
+        pnl = np.where(placed, self.profit[None, :], 0.0)
+        equity = np.cumsum(pnl, axis=1)
+        if self.n_bets:
+            peak = np.maximum(np.maximum.accumulate(equity, axis=1), 0.0)
+            max_dd = (peak - equity).max(axis=1)
+            total = equity[:, -1]
+        else:
+            max_dd = total = np.zeros(len(scenarios))
+
+        last = self.day_starts[None, :] + placed_per_day - 1
+        daily = np.where(placed_per_day > 0, self.day_cum[np.maximum(last, 0)], 0.0) if n_days else \
+            np.zeros((len(scenarios), 0))
+        skipped = self.day_sizes[None, :] - placed_per_day
+        capped = placed_per_day >= caps[:, None]
+        skipped_volume = np.where(capped, skipped, 0).sum(axis=1)
+        skipped_stoploss = np.where(capped, 0, skipped).sum(axis=1)
+        bets_won = (placed & self.won[None, :]).sum(axis=1)
+
+        market_cols = {}
+        for market, mask in self.market_masks.items():
+            in_market = placed & mask[None, :]
+            market_cols[market] = (
+                in_market.sum(axis=1),
+                (in_market & self.won[None, :]).sum(axis=1),
+                np.cumsum(np.where(in_market, pnl, 0.0), axis=1)[:, -1] if self.n_bets else np.zeros(len(scenarios)),
+            )
+
+        results = []
+        for i, (cap, stop) in enumerate(scenarios):
+            results.append(self._result(
+                cap, stop, i, placed, equity, float(total[i]), float(max_dd[i]), daily[i],
+                int(placed_per_day[i].sum()), int(bets_won[i]),
+                int(skipped_volume[i]), int(skipped_stoploss[i]), market_cols, include_curves,
+            ))
+        return results
+
+    def _result(self, cap, stop, i, placed, equity, total_units, max_dd, daily, bets_placed, bets_won,
+                skipped_volume, skipped_stoploss, market_cols, include_curves) -> Dict:
+        results = {
+            'daily_cap': cap,
+            'stop_loss': stop,
+            'bets_placed': bets_placed,
+            'bets_won': bets_won,
+            'bets_lost': bets_placed - bets_won,
+            'total_units': round(total_units, 2),
+            'daily_pnl': {label: round(float(units), 2) for label, units in zip(self.day_labels, daily)},
+            'equity_curve': [],
+            'max_drawdown_units': round(max_dd, 2),
+            'max_drawdown_pct': round(100 * max_dd / (INITIAL_BANKROLL_SEK / 100), 2) if max_dd > 0 else 0,
+            'worst_day_units': round(float(min(0.0, daily.min())) if len(daily) else 0.0, 2),
+            'days_worse_than_5': int((daily < -5).sum()),
+            'days_worse_than_10': int((daily < -10).sum()),
+            'days_worse_than_15': int((daily < -15).sum()),
+            'market_stats': {},
+            'skipped_volume': skipped_volume,
+            'skipped_stoploss': skipped_stoploss,
+        }
+        if self.min_ev is not None:
+            results['min_ev'] = self.min_ev
+        if self.markets is not None:
+            results['markets'] = self.markets
+
+        if include_curves:
+            results['equity_curve'] = [
+                {
+                    'date': self.day_labels[self.day_of[j]],
+                    'cumulative_units': round(float(equity[i, j]), 2),
+                    'bet_id': int(self.ids[j]),
+                }
+                for j in np.flatnonzero(placed[i])
+            ]
+
+        final_bankroll = INITIAL_BANKROLL_SEK + (total_units * 100)
+        results['final_bankroll_sek'] = round(final_bankroll, 2)
+        results['roi_pct'] = round(100 * (final_bankroll - INITIAL_BANKROLL_SEK) / INITIAL_BANKROLL_SEK, 2)
+        results['hit_rate'] = round(100 * bets_won / bets_placed, 1) if bets_placed > 0 else 0.0
+
+        daily_pnls = list(results['daily_pnl'].values())
+        results['avg_daily_pnl'] = round(np.mean(daily_pnls), 2) if daily_pnls else 0.0
+        results['trading_days'] = len(daily_pnls)
+
+        for market, (bets, won, units) in market_cols.items():
+            bets, won = int(bets[i]), int(won[i])
+            stats = {'bets': bets, 'won': won, 'units': float(units[i])}
+            if bets > 0:
+                stats['hit_rate'] = round(100 * won / bets, 1)
+                stats['units'] = round(stats['units'], 2)
+            else:
+                stats['hit_rate'] = 0.0
+            results['market_stats'][market] = stats
+        return results
+
+
 def run_backtest_scenario(
     bets_df: pd.DataFrame,
     daily_cap: int,
@@ -90,126 +269,28 @@ def run_backtest_scenario(
     Run a single backtest scenario with specified parameters.
     Uses FLAT STAKING: 1 unit = 1% of initial bankroll (constant).
     """
-    
-    results = {
-        'daily_cap': daily_cap,
-        'stop_loss': daily_stop_loss,
-        'bets_placed': 0,
-        'bets_won': 0,
-        'bets_lost': 0,
-        'total_units': 0.0,
-        'daily_pnl': {},
-        'equity_curve': [],
-        'max_drawdown_units': 0.0,
-        'max_drawdown_pct': 0.0,
-        'worst_day_units': 0.0,
-        'days_worse_than_5': 0,
-        'days_worse_than_10': 0,
-        'days_worse_than_15': 0,
-        'market_stats': {},
-        'skipped_volume': 0,
-        'skipped_stoploss': 0
-    }
-    
-    cumulative_units = 0.0
-    peak_units = 0.0
-    max_dd = 0.0
-    
-    for market in MARKETS_INCLUDED:
-        results['market_stats'][market] = {'bets': 0, 'won': 0, 'units': 0.0}
-    
-    dates = sorted(bets_df['bet_date'].unique())
-    
-    for date in dates:
-        day_bets = bets_df[bets_df['bet_date'] == date].copy()
-        day_bets = day_bets.sort_values('ev', ascending=False)
-        
-        daily_units = 0.0
-        daily_count = 0
-        stop_triggered = False
-        
-        for _, bet in day_bets.iterrows():
-            if daily_count >= daily_cap:
-                results['skipped_volume'] += 1
-                continue
-            
-            if daily_stop_loss is not None and daily_units <= daily_stop_loss:
-                stop_triggered = True
-                results['skipped_stoploss'] += 1
-                continue
-            
-            stake_units = 1.0
-            
-            if bet['won']:
-                profit = stake_units * (bet['odds'] - 1)
-                results['bets_won'] += 1
-            else:
-                profit = -stake_units
-                results['bets_lost'] += 1
-            
-            daily_units += profit
-            cumulative_units += profit
-            results['bets_placed'] += 1
-            daily_count += 1
-            
-            market = bet['market_type']
-            if market in results['market_stats']:
-                results['market_stats'][market]['bets'] += 1
-                results['market_stats'][market]['units'] += profit
-                if bet['won']:
-                    results['market_stats'][market]['won'] += 1
-            
-            results['equity_curve'].append({
-                'date': str(date.date()),
-                'cumulative_units': round(cumulative_units, 2),
-                'bet_id': bet['id']
-            })
-            
-            if cumulative_units > peak_units:
-                peak_units = cumulative_units
-            dd = peak_units - cumulative_units
-            if dd > max_dd:
-                max_dd = dd
-        
-        date_str = str(date.date())
-        results['daily_pnl'][date_str] = round(daily_units, 2)
-        
-        if daily_units < results['worst_day_units']:
-            results['worst_day_units'] = daily_units
-        
-        if daily_units < -5:
-            results['days_worse_than_5'] += 1
-        if daily_units < -10:
-            results['days_worse_than_10'] += 1
-        if daily_units < -15:
-            results['days_worse_than_15'] += 1
-    
-    results['total_units'] = round(cumulative_units, 2)
-    results['max_drawdown_units'] = round(max_dd, 2)
-    results['max_drawdown_pct'] = round(100 * max_dd / (INITIAL_BANKROLL_SEK / 100), 2) if max_dd > 0 else 0
-    results['worst_day_units'] = round(results['worst_day_units'], 2)
-    
-    final_bankroll = INITIAL_BANKROLL_SEK + (cumulative_units * 100)
-    results['final_bankroll_sek'] = round(final_bankroll, 2)
-    results['roi_pct'] = round(100 * (final_bankroll - INITIAL_BANKROLL_SEK) / INITIAL_BANKROLL_SEK, 2)
-    
-    if results['bets_placed'] > 0:
-        results['hit_rate'] = round(100 * results['bets_won'] / results['bets_placed'], 1)
-    else:
-        results['hit_rate'] = 0.0
-    
-    daily_pnls = list(results['daily_pnl'].values())
-    results['avg_daily_pnl'] = round(np.mean(daily_pnls), 2) if daily_pnls else 0.0
-    results['trading_days'] = len(daily_pnls)
-    
-    for market, stats in results['market_stats'].items():
-        if stats['bets'] > 0:
-            stats['hit_rate'] = round(100 * stats['won'] / stats['bets'], 1)
-            stats['units'] = round(stats['units'], 2)
-        else:
-            stats['hit_rate'] = 0.0
-    
-    return results
+    return DayReplay(bets_df).run([(daily_cap, daily_stop_loss)])[0]
+
+
+def run_backtest_grid(
+    bets_df: pd.DataFrame,
+    daily_caps: List[int],
+    stop_losses: List[Optional[float]],
+    min_evs: List[Optional[float]] = (None,),
+    market_sets: List[Optional[List[str]]] = (None,),
+    include_curves: bool = False,
+) -> List[Dict]:
+    """
+    Every (market set, min EV, daily cap, stop-loss) combination. Bets are filtered
+    and sorted once per (market set, min EV); caps and stop-losses are replayed together.
+    """
+    all_scenarios = []
+    pairs = [(cap, stop) for cap in daily_caps for stop in stop_losses]
+    for markets in market_sets:
+        for min_ev in min_evs:
+            replay = DayReplay(bets_df, min_ev=min_ev, markets=markets)
+            all_scenarios.extend(replay.run(pairs, include_curves=include_curves))
+    return all_scenarios
 
 
 def generate_report(all_scenarios: List[Dict]) -> str:
@@ -393,17 +474,12 @@ def run_full_backtest():
     print(f"Markets: {bets_df['market_type'].value_counts().to_dict()}")
     print()
     
-    all_scenarios = []
+    all_scenarios = run_backtest_grid(bets_df, VOLUME_CAPS, STOP_LOSS_LEVELS, include_curves=True)
     
-    for cap in VOLUME_CAPS:
-        for stop_loss in STOP_LOSS_LEVELS:
-            sl_str = f"{stop_loss}u" if stop_loss else "None"
-            print(f"Running scenario: Cap {cap}/day, Stop-Loss {sl_str}...")
-            
-            result = run_backtest_scenario(bets_df, cap, stop_loss)
-            all_scenarios.append(result)
-            
-            print(f"  → {result['total_units']:+.1f}u | {result['bets_placed']} bets | {result['hit_rate']:.1f}% hit")
+    for result in all_scenarios:
+        sl_str = f"{result['stop_loss']}u" if result['stop_loss'] else "None"
+        print(f"Scenario: Cap {result['daily_cap']}/day, Stop-Loss {sl_str}")
+        print(f"  → {result['total_units']:+.1f}u | {result['bets_placed']} bets | {result['hit_rate']:.1f}% hit")
     
     print()
     print("Generating report...")
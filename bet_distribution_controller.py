@@ -10,8 +10,8 @@ import hashlib
 import requests
 from datetime import datetime, date
 from typing import Optional, Dict, List, Tuple
-import psycopg2
 from psycopg2.extras import RealDictCursor
+from db_connection import DatabaseConnection
 import logging
 from collections import defaultdict
 
@@ -108,21 +108,8 @@ def get_league_webhook(league: str) -> Tuple[Optional[str], str]:
 
 
 def get_db_connection():
-    """Get database connection."""
-    import time
-    for attempt in range(3):
-        try:
-            conn = psycopg2.connect(
-                os.getenv('DATABASE_URL'),
-                connect_timeout=10,
-                options='-c statement_timeout=30000'
-            )
-            return conn
-        except Exception as e:
-            if attempt < 2:
-                time.sleep(2)
-            else:
-                raise e
+    """Get a pooled database connection (close() returns it to the pool)."""
+    return DatabaseConnection.checkout('bet_distribution', statement_timeout_ms=30000)
 
 
 LEAGUE_TO_SPORT_KEY = {
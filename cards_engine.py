@@ -40,9 +40,10 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
-import numpy as np
 from scipy import stats
 
+from count_distribution import CountDistribution
+
 from multimarket_config import (
     PRODUCT_CONFIGS,
     get_market_label,
@@ -465,7 +466,8 @@ class CardsEngine:
         home_stats: Dict,
         away_stats: Dict,
         factors: Optional[CardFactors] = None
-    ) -> Dict[str, np.ndarray]:
+    ) -> Dict[str, CountDistribution]:
+        """Exact per-fixture PMFs: Poisson yellows plus a Bernoulli red per team."""
         home_cards_mean = home_stats.get("cards_pg", DEFAULT_DISCIPLINE_STATS["cards_pg"])
         away_cards_mean = away_stats.get("cards_pg", DEFAULT_DISCIPLINE_STATS["cards_pg"])
         
@@ -480,52 +482,46 @@ class CardsEngine:
             adj_home_cards = home_cards_mean
             adj_away_cards = away_cards_mean
         
-        home_yellows = np.random.poisson(adj_home_cards * 0.95, self.num_sims)
-        away_yellows = np.random.poisson(adj_away_cards * 0.95, self.num_sims)
-        
         red_prob_base = 0.05
         if factors and factors.rivalry_index > 1.1:
             red_prob_base *= factors.rivalry_index
+        red_prob = min(0.15, red_prob_base)
         
-        home_reds = np.random.binomial(1, min(0.15, red_prob_base), self.num_sims)
-        away_reds = np.random.binomial(1, min(0.15, red_prob_base), self.num_sims)
+        home_yellows = CountDistribution.poisson(adj_home_cards * 0.95)
+        away_yellows = CountDistribution.poisson(adj_away_cards * 0.95)
+        home_reds = CountDistribution.bernoulli(red_prob)
+        away_reds = CountDistribution.bernoulli(red_prob)
         
         home_cards = home_yellows + home_reds
         away_cards = away_yellows + away_reds
-        total_cards = home_cards + away_cards
         
-        home_booking_pts = (home_yellows * BOOKING_POINTS["yellow"] + 
-                           home_reds * BOOKING_POINTS["red"])
-        away_booking_pts = (away_yellows * BOOKING_POINTS["yellow"] + 
-                           away_reds * BOOKING_POINTS["red"])
-        total_booking_pts = home_booking_pts + away_booking_pts
+        home_booking_pts = (home_yellows.scale(BOOKING_POINTS["yellow"]) +
+                            home_reds.scale(BOOKING_POINTS["red"]))
+        away_booking_pts = (away_yellows.scale(BOOKING_POINTS["yellow"]) +
+                            away_reds.scale(BOOKING_POINTS["red"]))
         
         return {
             "home_cards": home_cards,
             "away_cards": away_cards,
-            "total_cards": total_cards,
+            "total_cards": home_cards + away_cards,
             "home_yellows": home_yellows,
             "away_yellows": away_yellows,
             "home_reds": home_reds,
             "away_reds": away_reds,
             "home_booking_pts": home_booking_pts,
             "away_booking_pts": away_booking_pts,
-            "total_booking_pts": total_booking_pts,
+            "total_booking_pts": home_booking_pts + away_booking_pts,
         }
     
     def calculate_over_under_probs(
         self,
-        simulations: np.ndarray,
+        distribution: CountDistribution,
         line: float
     ) -> Dict[str, float]:
-        over_prob = np.mean(simulations > line)
-        under_prob = np.mean(simulations < line)
-        push_prob = np.mean(simulations == line)
-        
         return {
-            "over": float(over_prob),
-            "under": float(under_prob),
-            "push": float(push_prob),
+            "over": distribution.prob_over(line),
+            "under": distribution.prob_under(line),
+            "push": distribution.prob_push(line),
         }
     
     def calculate_ev(self, model_prob: float, book_odds: float) -> float:
@@ -678,10 +674,10 @@ class CardsEngine:
                             "sim_key": sim_key,
                             "direction": direction,
                             "factors": factors.to_dict(),
-                            "mean_value": float(np.mean(sims[sim_key])),
-                            "std_value": float(np.std(sims[sim_key])),
-                            "avg_total_cards": float(np.mean(sims["total_cards"])),
-                            "avg_booking_pts": float(np.mean(sims["total_booking_pts"])),
+                            "mean_value": sims[sim_key].mean(),
+                            "std_value": sims[sim_key].std(),
+                            "avg_total_cards": sims["total_cards"].mean(),
+                            "avg_booking_pts": sims["total_booking_pts"].mean(),
                             "referee_name": _ref_name,
                             "referee_style": _ref_style,
                             "referee_cards_pm": round(_ref_cpm, 1),
@@ -205,6 +205,9 @@ class CentralRouter:
         """Apply drift analysis and filter candidates."""
         filtered = []
         
+        # One query for every candidate's snapshots; lookups below stay in memory
+        self.drift_tracker.load_index(c.fixture_id for c in candidates)
+        
         for candidate in candidates:
             drift_info = self.drift_tracker.get_drift_analysis(
                 fixture_id=candidate.fixture_id,
@@ -16,11 +16,14 @@ import os
 import re
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import requests
+from http_transport import http_get
 
 from db_helper import db_helper
+from response_cache import notify_data_changed
+from team_resolver import get_team_resolver, ratio
 from real_odds_api import RealOddsAPI
 from proof_poster import post_clv_proof
 
@@ -250,6 +253,27 @@ def _extract_line(text: str) -> Optional[float]:
     return float(match.group(1)) if match else None
 
 
+@lru_cache(maxsize=4096)
+def _norm_team(s: str) -> str:
+    return (s.lower()
+            .replace('fc ', '').replace(' fc', '')
+            .replace('afc ', '').replace(' afc', '')
+            .replace('sc ', '').replace(' sc', '')
+            .replace('ö', 'o').replace('ü', 'u').replace('ä', 'a')
+            .replace('ø', 'o').replace('å', 'a').replace('é', 'e')
+            .replace('-', ' ').strip())
+
+
+def _team_similarity(a: str, b: str) -> float:
+    return ratio(_norm_team(a), _norm_team(b))
+
+
+def _word_overlap(a: str, b: str) -> bool:
+    common = set(_norm_team(a).split()) & set(_norm_team(b).split())
+    # At least 1 meaningful word (len>2) must overlap
+    return any(len(w) > 2 for w in common)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main service
 # ─────────────────────────────────────────────────────────────────────────────
@@ -264,6 +288,10 @@ class CLVService:
         except Exception as exc:
             logger.warning("⚠️  CLVService: RealOddsAPI init failed: %s", exc)
             self.odds_api = None
+        # Per-cycle odds snapshots: (kind, sport, market[, ts]) -> events.
+        # None outside run_cycle, so ad-hoc fetches always go to the API.
+        self._snapshots: Optional[Dict[tuple, Any]] = None
+        self._snapshot_stats = {'fetches': 0, 'reused': 0}
 
     # ── Candidate selection ───────────────────────────────────────────────────
 
@@ -328,6 +356,54 @@ class CLVService:
             logger.error("❌ CLV: get_candidates error: %s", exc)
             return []
 
+    # ── Per-cycle odds snapshots ──────────────────────────────────────────────
+
+    def _snapshot(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """Load an event list once per cycle; every bet on that sport/market reuses it."""
+        if self._snapshots is None:
+            return loader()
+        if key in self._snapshots:
+            self._snapshot_stats['reused'] += 1
+            return self._snapshots[key]
+        value = loader()
+        self._snapshots[key] = value
+        self._snapshot_stats['fetches'] += 1
+        return value
+
+    def _live_events(self, sport: str, mtype: str) -> List[Dict]:
+        return self._snapshot(
+            ('live', sport, mtype),
+            lambda: self.odds_api.get_live_odds(sport, regions=['eu', 'uk'], markets=[mtype]),
+        )
+
+    def _historical_events(self, sport: str, mtype: str, snap_ts: int, api_key: str) -> List[Dict]:
+        """Events in the historical snapshot at snap_ts ([] when unavailable)."""
+        def load() -> List[Dict]:
+            snap_iso = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(snap_ts))
+            try:
+                resp = http_get(
+                    f'https://api.the-odds-api.com/v4/historical/sports/{sport}/odds',
+                    params={
+                        'apiKey':      api_key,
+                        'date':        snap_iso,
+                        'regions':     'eu,uk',
+                        'markets':     mtype,
+                        'bookmakers':  'pinnacle,betfair_ex_eu,betfair,bet365,nordicbet,unibet',
+                        'oddsFormat':  'decimal',
+                    },
+                    timeout=12,
+                )
+            except Exception as exc:
+                logger.debug("CLV historical: request error: %s", exc)
+                return []
+
+            if resp.status_code != 200:
+                logger.debug("CLV historical: HTTP %d for %s", resp.status_code, sport)
+                return []
+            return resp.json().get('data', [])
+
+        return self._snapshot(('hist', sport, mtype, snap_ts), load)
+
     # ── Closing-odds fetch ────────────────────────────────────────────────────
 
     def fetch_closing_odds(self, bet: Dict) -> Optional[Dict]:
@@ -395,9 +471,7 @@ class CLVService:
 
         # ── 2. Live endpoint (fallback / pre-match real-time) ─────────────────
         try:
-            odds_data = self.odds_api.get_live_odds(
-                sport, regions=['eu', 'uk'], markets=[mtype]
-            )
+            odds_data = self._live_events(sport, mtype)
         except Exception as exc:
             logger.error("CLV: odds API error: %s", exc)
             return None
@@ -480,30 +554,7 @@ class CLVService:
         for ts_offset in [0, -3600]:
             snap_ts  = ko_epoch + ts_offset
             snap_iso = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(snap_ts))
-
-            try:
-                resp = requests.get(
-                    f'https://api.the-odds-api.com/v4/historical/sports/{sport}/odds',
-                    params={
-                        'apiKey':      api_key,
-                        'date':        snap_iso,
-                        'regions':     'eu,uk',
-                        'markets':     mtype,
-                        'bookmakers':  'pinnacle,betfair_ex_eu,betfair,bet365,nordicbet,unibet',
-                        'oddsFormat':  'decimal',
-                    },
-                    timeout=12,
-                )
-            except Exception as exc:
-                logger.debug("CLV historical: request error: %s", exc)
-                continue
-
-            if resp.status_code != 200:
-                logger.debug("CLV historical: HTTP %d for %s", resp.status_code, sport)
-                continue
-
-            payload = resp.json()
-            events  = payload.get('data', [])
+            events   = self._historical_events(sport, mtype, snap_ts, api_key)
             if not events:
                 continue
 
@@ -545,36 +596,17 @@ class CLVService:
         return None
 
     def _teams_match(self, event: Dict, home: str, away: str) -> bool:
-        from difflib import SequenceMatcher
-
-        def _norm(s: str) -> str:
-            return (s.lower()
-                    .replace('fc ', '').replace(' fc', '')
-                    .replace('afc ', '').replace(' afc', '')
-                    .replace('sc ', '').replace(' sc', '')
-                    .replace('ö', 'o').replace('ü', 'u').replace('ä', 'a')
-                    .replace('ø', 'o').replace('å', 'a').replace('é', 'e')
-                    .replace('-', ' ').strip())
-
-        def _sim(a: str, b: str) -> float:
-            return SequenceMatcher(None, _norm(a), _norm(b)).ratio()
-
-        def _word_overlap(a: str, b: str) -> bool:
-            wa = set(_norm(a).split())
-            wb = set(_norm(b).split())
-            common = wa & wb
-            # At least 1 meaningful word (len>2) must overlap
-            return any(len(w) > 2 for w in common)
-
         eh = event.get('home_team', '')
         ea = event.get('away_team', '')
         # Exact match
         if eh.lower() == home.lower() and ea.lower() == away.lower():
             return True
+        # Known aliases of the same club (shared resolver index)
+        resolver = get_team_resolver()
+        h_same = resolver.canonical(home) == resolver.canonical(eh)
+        a_same = resolver.canonical(away) == resolver.canonical(ea)
         # Fuzzy: both teams must score >= 0.75 similarity
-        h_score = _sim(home, eh)
-        a_score = _sim(away, ea)
-        if h_score >= 0.75 and a_score >= 0.75:
+        if (h_same or _team_similarity(home, eh) >= 0.75) and (a_same or _team_similarity(away, ea) >= 0.75):
             return True
         # Word-overlap fallback (catches "Man Utd" vs "Manchester United")
         if _word_overlap(home, eh) and _word_overlap(away, ea):
@@ -905,9 +937,9 @@ class CLVService:
 
     # ── DB update ────────────────────────────────────────────────────────────
 
-    def save_clv(self, bet: Dict, close_result: Dict) -> bool:
-        """Persist close_odds, close_ts, clv_pct, clv_status, clv_source_book.
-        Also emits the full debug block for this CLV calculation.
+    def _prepare_clv(self, bet: Dict, close_result: Dict) -> Optional[Dict]:
+        """Compute clv_pct / status / steam flag and emit the full debug block.
+        Returns None when CLV cannot be computed.
         """
         bet_id    = bet['id']
         open_odds = bet['open_odds']
@@ -934,7 +966,7 @@ class CLVService:
                 status = 'soft'
         except ValueError as exc:
             logger.warning("CLV calc error for bet %d: %s", bet_id, exc)
-            return False
+            return None
 
         # Steam flag: positive CLV > 3% = "early" (we were ahead of market move)
         #             negative CLV < -3% = "late" (missed the move, market already moved)
@@ -992,104 +1024,166 @@ class CLVService:
             "╚══════════════════════════════════════════════════════════════"
         )
 
-        try:
-            # Only post to Discord on FIRST capture — check if close_odds already set
-            already_captured = db_helper.execute(
-                "SELECT close_ts FROM football_opportunities WHERE id = %s",
-                (bet_id,), fetch='one'
-            )
-            first_capture = not (already_captured and already_captured[0])
+        return {
+            'clv':          clv,
+            'status':       status,
+            'steam_flag':   steam_flag,
+            'mins_to_ko':   mins_to_ko_at_close,
+        }
 
-            db_helper.execute("""
-                UPDATE football_opportunities
-                SET close_odds      = %s,
-                    close_ts        = %s,
-                    clv_pct         = %s,
-                    clv_status      = %s,
-                    clv_source_book = %s,
-                    steam_flag      = %s,
-                    clv_version     = 'v2'
-                WHERE id = %s
-            """, (close_odds, close_ts, clv, status, close_book, steam_flag, bet_id))
+    def save_clv(self, bet: Dict, close_result: Dict) -> bool:
+        """Persist close_odds, close_ts, clv_pct, clv_status, clv_source_book.
+        Also emits the full debug block for this CLV calculation.
+        """
+        return self.save_clv_batch([(bet, close_result)]) == 1
 
-            if not first_capture:
-                logger.debug(
-                    "CLV: bet=%d already captured — skip Discord post", bet_id
-                )
-            else:
-                # Post proof-of-work to Discord (fire-and-forget, never blocks)
-                try:
-                    post_clv_proof(bet, close_odds, clv, close_book,
-                                   mins_to_close=mins_to_ko_at_close)
-                except Exception as _pe:
-                    logger.debug("proof_poster non-fatal: %s", _pe)
+    def save_clv_batch(self, results: List[Tuple[Dict, Dict]]) -> int:
+        """
+        Persist many CLV captures with one lookup and one UPDATE.
 
-                # Per-pick CLV capture — posts ALL picks to DISCORD_RESULTS_WEBHOOK (no threshold)
-                try:
-                    from proof_poster import post_clv_capture
-                    post_clv_capture(bet, close_odds, clv, close_book,
-                                     mins_to_close=mins_to_ko_at_close)
-                except Exception as _ce:
-                    logger.debug("clv_capture non-fatal: %s", _ce)
-
-            # 🔔 Push notification for significant CLV moves — first alert only
-            if steam_flag in ('early', 'late'):
-                try:
-                    # Only fire if not already pushed for this pick
-                    _push_row = db_helper.execute(
-                        "SELECT push_sent FROM football_opportunities WHERE id=%s",
-                        (bet_id,)
-                    )
-                    _already_pushed = _push_row and _push_row[0][0]
-                    if not _already_pushed:
-                        import threading
-                        from push_service import PushService
-                        match_str = f"{bet.get('home_team', '?')} vs {bet.get('away_team', '?')}"
-                        sel = bet.get('selection', bet.get('market', '?'))
-                        clv_sign = f"+{clv:.1f}" if clv >= 0 else f"{clv:.1f}"
-                        if steam_flag == 'early':
-                            title = "⚡ CLV Confirmed"
-                            body  = (
-                                f"{match_str}\n"
-                                f"{sel} — {clv_sign}% vs close\n"
-                                f"Market moved our way"
-                            )
-                        else:
-                            title = "⚠️ Early Drop Alert"
-                            body  = (
-                                f"{match_str}\n"
-                                f"{sel} — {clv_sign}% CLV\n"
-                                f"Odds drifted against entry"
-                            )
-                        def _fire_clv(t=title, b=body, bid=bet_id):
-                            try:
-                                result = PushService().send_to_all(t, b, url="/")
-                                if result.get('sent', 0) > 0:
-                                    db_helper.execute(
-                                        "UPDATE football_opportunities SET push_sent=TRUE WHERE id=%s",
-                                        (bid,)
-                                    )
-                            except Exception as _e:
-                                logger.debug("CLV push non-fatal: %s", _e)
-                        threading.Thread(target=_fire_clv, daemon=True).start()
-                except Exception as _pe:
-                    logger.debug("CLV push setup non-fatal: %s", _pe)
+        Args:
+            results: [(bet, close_result), ...] as produced by fetch_closing_odds
 
-            return True
+        Returns:
+            Number of bets written
+        """
+        prepared = []
+        for bet, close_result in results:
+            row = self._prepare_clv(bet, close_result)
+            if row is not None:
+                prepared.append((bet, close_result, row))
+        if not prepared:
+            return 0
 
+        bet_ids = [bet['id'] for bet, _, _ in prepared]
+        try:
+            # Only post to Discord on FIRST capture — check which already have close_ts
+            existing = db_helper.execute(
+                "SELECT id, close_ts, push_sent FROM football_opportunities WHERE id = ANY(%s)",
+                (bet_ids,), fetch='all'
+            ) or []
+            previous = {row[0]: (row[1], row[2]) for row in existing}
+
+            values_sql = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(prepared))
+            params: List[Any] = []
+            for bet, close_result, row in prepared:
+                params.extend((
+                    bet['id'], close_result['odds'], close_result['ts'],
+                    row['clv'], row['status'], close_result['bookmaker'], row['steam_flag'],
+                ))
+
+            db_helper.execute(f"""
+                UPDATE football_opportunities AS f
+                SET close_odds      = v.close_odds,
+                    close_ts        = v.close_ts,
+                    clv_pct         = v.clv_pct,
+                    clv_status      = v.clv_status,
+                    clv_source_book = v.clv_source_book,
+                    steam_flag      = v.steam_flag,
+                    clv_version     = 'v2'
+                FROM (VALUES {values_sql})
+                     AS v(id, close_odds, close_ts, clv_pct, clv_status, clv_source_book, steam_flag)
+                WHERE f.id = v.id
+            """, tuple(params))
         except Exception as exc:
-            logger.error("❌ CLV: DB update error for bet %d: %s", bet_id, exc)
-            return False
+            logger.error("❌ CLV: DB update error for %d bet(s) %s: %s", len(bet_ids), bet_ids, exc)
+            return 0
+        notify_data_changed('clv')
+
+        for bet, close_result, row in prepared:
+            close_ts, push_sent = previous.get(bet['id'], (None, None))
+            self._after_clv_saved(
+                bet, close_result, row,
+                first_capture=not close_ts,
+                already_pushed=bool(push_sent),
+            )
+        return len(prepared)
+
+    def _after_clv_saved(
+        self, bet: Dict, close_result: Dict, prepared: Dict,
+        first_capture: bool, already_pushed: bool
+    ) -> None:
+        """Discord proof posts (first capture only) and CLV push alerts."""
+        bet_id      = bet['id']
+        close_odds  = close_result['odds']
+        close_book  = close_result['bookmaker']
+        clv         = prepared['clv']
+        steam_flag  = prepared['steam_flag']
+        mins_to_ko_at_close = prepared['mins_to_ko']
+
+        if not first_capture:
+            logger.debug(
+                "CLV: bet=%d already captured — skip Discord post", bet_id
+            )
+        else:
+            # Post proof-of-work to Discord (fire-and-forget, never blocks)
+            try:
+                post_clv_proof(bet, close_odds, clv, close_book,
+                               mins_to_close=mins_to_ko_at_close)
+            except Exception as _pe:
+                logger.debug("proof_poster non-fatal: %s", _pe)
+
+            # Per-pick CLV capture — posts ALL picks to DISCORD_RESULTS_WEBHOOK (no threshold)
+            try:
+                from proof_poster import post_clv_capture
+                post_clv_capture(bet, close_odds, clv, close_book,
+                                 mins_to_close=mins_to_ko_at_close)
+            except Exception as _ce:
+                logger.debug("clv_capture non-fatal: %s", _ce)
+
+        # 🔔 Push notification for significant CLV moves — first alert only
+        if steam_flag in ('early', 'late'):
+            try:
+                # Only fire if not already pushed for this pick
+                if not already_pushed:
+                    import threading
+                    from push_service import PushService
+                    match_str = f"{bet.get('home_team', '?')} vs {bet.get('away_team', '?')}"
+                    sel = bet.get('selection', bet.get('market', '?'))
+                    clv_sign = f"+{clv:.1f}" if clv >= 0 else f"{clv:.1f}"
+                    if steam_flag == 'early':
+                        title = "⚡ CLV Confirmed"
+                        body  = (
+                            f"{match_str}\n"
+                            f"{sel} — {clv_sign}% vs close\n"
+                            f"Market moved our way"
+                        )
+                    else:
+                        title = "⚠️ Early Drop Alert"
+                        body  = (
+                            f"{match_str}\n"
+                            f"{sel} — {clv_sign}% CLV\n"
+                            f"Odds drifted against entry"
+                        )
+                    def _fire_clv(t=title, b=body, bid=bet_id):
+                        try:
+                            result = PushService().send_to_all(t, b, url="/")
+                            if result.get('sent', 0) > 0:
+                                db_helper.execute(
+                                    "UPDATE football_opportunities SET push_sent=TRUE WHERE id=%s",
+                                    (bid,)
+                                )
+                        except Exception as _e:
+                            logger.debug("CLV push non-fatal: %s", _e)
+                    threading.Thread(target=_fire_clv, daemon=True).start()
+            except Exception as _pe:
+                logger.debug("CLV push setup non-fatal: %s", _pe)
 
     def mark_clv_na(self, bet_id: int, reason: str) -> None:
         """Mark a bet as CLV=na (could not capture closing odds)."""
+        self.mark_clv_na_batch([bet_id], reason)
+
+    def mark_clv_na_batch(self, bet_ids: List[int], reason: str) -> None:
+        """Mark several bets as CLV=na in one UPDATE."""
+        if not bet_ids:
+            return
         try:
             db_helper.execute("""
                 UPDATE football_opportunities
                 SET clv_status = 'na'
-                WHERE id = %s AND close_odds IS NULL
-            """, (bet_id,))
-            logger.debug("CLV: bet %d marked na — %s", bet_id, reason)
+                WHERE id = ANY(%s) AND close_odds IS NULL
+            """, (list(bet_ids),))
+            logger.debug("CLV: bet(s) %s marked na — %s", bet_ids, reason)
         except Exception:
             pass
 
@@ -1195,6 +1289,8 @@ class CLVService:
             'skipped':    0,    # unsupported market/league — not an error
             'na':         0,
             'avg_clv':    None,
+            'odds_fetches': 0,  # event lists pulled from the Odds API this cycle
+            'odds_reused':  0,  # bets resolved from an already-fetched snapshot
             'timestamp':  datetime.now(timezone.utc).isoformat(),
         }
 
@@ -1211,9 +1307,11 @@ class CLVService:
         clv_vals: List[float] = []
         now = _now()
 
+        # Group Odds API bets by (sport key, market) → event so each event list is
+        # fetched once per cycle and every bet resolves from the in-memory snapshot.
+        groups: Dict[tuple, List[Dict]] = {}
         for bet in candidates:
             bet_id    = bet['id']
-            open_odds = bet['open_odds']
             mins_to_ko = bet['seconds_to_ko'] // 60
 
             if mins_to_ko > CAPTURE_WINDOW_MIN:
@@ -1248,56 +1346,82 @@ class CLVService:
                     stats['skipped'] += 1
                 continue
 
-            close_result = self.fetch_closing_odds(bet)
-
-            if close_result:
-                ok = self.save_clv(bet, close_result)
-                if ok:
-                    stats['updated'] += 1
-                    try:
-                        clv_vals.append(_clv_pct(open_odds, close_result['odds']))
-                    except ValueError:
-                        pass
-                else:
-                    stats['failed'] += 1
-            else:
-                logger.info(
-                    "CLV: ⚪ NO MATCH  bet=%d  %s vs %s | "
-                    "market='%s' → api_type='%s' | sport='%s' | %+d min to KO",
-                    bet_id, bet['home_team'], bet['away_team'],
-                    db_market, mtype, sport, mins_to_ko
-                )
-                if mins_to_ko < CAPTURE_WINDOW_PAST:
-                    self.mark_clv_na(bet_id, "no match found in API after kickoff")
-                    stats['na'] += 1
-                else:
-                    stats['failed'] += 1
+            groups.setdefault((sport, mtype), []).append(bet)
+
+        self._snapshots = {}
+        self._snapshot_stats = {'fetches': 0, 'reused': 0}
+        try:
+            captured: List[tuple] = []
+            na_ids: List[int] = []
+            for (sport, mtype), bets in groups.items():
+                bets.sort(key=lambda b: (b['kickoff_epoch'], b['home_team'], b['away_team']))
+                for bet in bets:
+                    close_result = self.fetch_closing_odds(bet)
+                    if close_result:
+                        captured.append((bet, close_result))
+                        continue
 
-        if clv_vals:
-            stats['avg_clv'] = round(sum(clv_vals) / len(clv_vals), 2)
+                    mins_to_ko = bet['seconds_to_ko'] // 60
+                    logger.info(
+                        "CLV: ⚪ NO MATCH  bet=%d  %s vs %s | "
+                        "market='%s' → api_type='%s' | sport='%s' | %+d min to KO",
+                        bet['id'], bet['home_team'], bet['away_team'],
+                        bet.get('market', '?'), mtype, sport, mins_to_ko
+                    )
+                    if mins_to_ko < CAPTURE_WINDOW_PAST:
+                        na_ids.append(bet['id'])
+                    else:
+                        stats['failed'] += 1
+
+            if captured:
+                written = self.save_clv_batch(captured)
+                stats['updated'] += written
+                stats['failed'] += len(captured) - written
+                if written:
+                    for bet, close_result in captured:
+                        try:
+                            clv_vals.append(_clv_pct(bet['open_odds'], close_result['odds']))
+                        except ValueError:
+                            pass
+
+            if na_ids:
+                self.mark_clv_na_batch(na_ids, "no match found in API after kickoff")
+                stats['na'] += len(na_ids)
+
+            if clv_vals:
+                stats['avg_clv'] = round(sum(clv_vals) / len(clv_vals), 2)
 
-        logger.info(
-            "📊 CLV cycle done — candidates=%d updated=%d skipped=%d failed=%d na=%d avg_clv=%s",
-            stats['candidates'], stats['updated'], stats['skipped'],
-            stats['failed'], stats['na'],
-            f"{stats['avg_clv']:+.2f}%" if stats['avg_clv'] is not None else "—"
-        )
+            logger.info(
+                "📊 CLV cycle done — candidates=%d updated=%d skipped=%d failed=%d na=%d avg_clv=%s",
+                stats['candidates'], stats['updated'], stats['skipped'],
+                stats['failed'], stats['na'],
+                f"{stats['avg_clv']:+.2f}%" if stats['avg_clv'] is not None else "—"
+            )
 
-        # ── 5-minute drift capture (runs every cycle) ─────────────────────────
-        try:
-            drift_updated = self.capture_early_drift()
-            if drift_updated:
-                logger.info("📊 5-min drift: captured %d pick(s)", drift_updated)
-        except Exception as drift_exc:
-            logger.warning("5-min drift capture failed: %s", drift_exc)
+            # ── 5-minute drift capture (runs every cycle) ─────────────────────────
+            try:
+                drift_updated = self.capture_early_drift()
+                if drift_updated:
+                    logger.info("📊 5-min drift: captured %d pick(s)", drift_updated)
+            except Exception as drift_exc:
+                logger.warning("5-min drift capture failed: %s", drift_exc)
 
-        # ── A/B Version B — delayed entry capture (runs every cycle) ──────────
-        try:
-            ab_updated = self.capture_delayed_entry_b()
-            if ab_updated:
-                logger.info("🧪 A/B entry: Version B entry_odds captured for %d pick(s)", ab_updated)
-        except Exception as ab_exc:
-            logger.warning("A/B delayed entry capture failed: %s", ab_exc)
+            # ── A/B Version B — delayed entry capture (runs every cycle) ──────────
+            try:
+                ab_updated = self.capture_delayed_entry_b()
+                if ab_updated:
+                    logger.info("🧪 A/B entry: Version B entry_odds captured for %d pick(s)", ab_updated)
+            except Exception as ab_exc:
+                logger.warning("A/B delayed entry capture failed: %s", ab_exc)
+
+            stats['odds_fetches'] = self._snapshot_stats['fetches']
+            stats['odds_reused']  = self._snapshot_stats['reused']
+            logger.info(
+                "📊 CLV odds snapshots: %d fetched, %d reused",
+                stats['odds_fetches'], stats['odds_reused']
+            )
+        finally:
+            self._snapshots = None
 
         return stats
 
@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 import os
 import time
+import heapq
 import math
 import requests
 from itertools import combinations
@@ -252,14 +253,48 @@ def pick_parlays_for_today(
     return selected
 
 
-def build_parlays(picks: List[BasketPick], legs: int = 3, min_parlay_ev: float = 0.02, max_parlay_odds: float = 50.0) -> List[BasketPick]:
+PARLAY_TOP_K = 10
+_BOUND_TOL = 1e-9   # float slack so bounds never prune a combination the full scan would keep
+
+
+def _suffix_products(values: List[float], legs: int, best) -> List[List[float]]:
+    """
+    table[s][r] = best (max or min) product of r values chosen from values[s:].
+    Values must be positive; table[s][0] = 1, infeasible cells are None.
+    """
+    n = len(values)
+    table = [[None] * (legs + 1) for _ in range(n + 1)]
+    for s in range(n, -1, -1):
+        table[s][0] = 1.0
+        if s == n:
+            continue
+        for r in range(1, legs + 1):
+            skip = table[s + 1][r]
+            rest = table[s + 1][r - 1]
+            take = values[s] * rest if rest is not None else None
+            table[s][r] = take if skip is None else (skip if take is None else best(skip, take))
+    return table
+
+
+def build_parlays(
+    picks: List[BasketPick],
+    legs: int = 3,
+    min_parlay_ev: float = 0.02,
+    max_parlay_odds: float = 50.0,
+    top_k: int = PARLAY_TOP_K,
+) -> List[BasketPick]:
     """
-    Builds 3/4-leg multi-game parlays from top singles.
+    Builds 2-6 leg multi-game parlays from top singles.
     Ensures only 1 pick per match inside the parlay.
     Caps parlay odds to max_parlay_odds to avoid unrealistic longshots.
+
+    Branch-and-bound over combinations in the same order as itertools.combinations:
+    a branch is dropped when even its best remaining legs (max prob*odds) cannot
+    beat min_parlay_ev or the current top_k, or its lowest-odds legs already exceed
+    max_parlay_odds. Returns exactly what the exhaustive scan's top_k would.
     """
     parlays: List[BasketPick] = []
-    if len(picks) < legs:
+    if len(picks) < legs or top_k <= 0:
         return parlays
 
     best_by_match: Dict[str, BasketPick] = {}
@@ -268,48 +303,98 @@ def build_parlays(picks: List[BasketPick], legs: int = 3, min_parlay_ev: float =
             best_by_match[p.match] = p
 
     unique_picks = list(best_by_match.values())
+    n = len(unique_picks)
+    if n < legs or any(p.odds <= 0 or p.prob < 0 for p in unique_picks):
+        return _build_parlays_exhaustive(unique_picks, legs, min_parlay_ev, max_parlay_odds, top_k)
+
+    max_value = _suffix_products([p.prob * p.odds for p in unique_picks], legs, max)
+    min_odds = _suffix_products([p.odds for p in unique_picks], legs, min)
+
+    heap: List[Tuple[float, int, Tuple[int, ...], float, float]] = []   # (ev, -seq, combo, odds, prob)
+    seq = 0
+    combo: List[int] = []
+
+    def search(start: int, odds_prod: float, prob_prod: float) -> None:
+        nonlocal seq
+        remaining = legs - len(combo)
+        if remaining == 0:
+            if odds_prod > max_parlay_odds:
+                return
+            parlay_ev = ev_from_prob_odds(prob_prod, odds_prod)
+            if parlay_ev < min_parlay_ev:
+                return
+            entry = (parlay_ev, -seq, tuple(combo), odds_prod, prob_prod)
+            seq += 1
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heappushpop(heap, entry)
+            return
+
+        for i in range(start, n - remaining + 1):
+            p = unique_picks[i]
+            next_odds = odds_prod * p.odds
+            next_prob = prob_prod * p.prob
+            # Cheapest completion already over the odds cap
+            if next_odds * min_odds[i + 1][remaining - 1] > max_parlay_odds * (1 + _BOUND_TOL):
+                continue
+            # Best completion cannot reach the EV floor or the current top_k
+            bound_ev = next_prob * next_odds * max_value[i + 1][remaining - 1] - 1.0 + _BOUND_TOL
+            if bound_ev < min_parlay_ev or (len(heap) == top_k and bound_ev < heap[0][0]):
+                continue
+            combo.append(i)
+            search(i + 1, next_odds, next_prob)
+            combo.pop()
+
+    search(0, 1.0, 1.0)
+
+    for parlay_ev, _, indices, odds_prod, prob_prod in sorted(heap, reverse=True):
+        parlays.append(_parlay_pick([unique_picks[i] for i in indices], legs, odds_prod, prob_prod, parlay_ev))
+    return parlays
+
+
+def _parlay_pick(combo, legs: int, odds_prod: float, prob_prod: float, parlay_ev: float) -> BasketPick:
+    matches = [p.match for p in combo]
+    name = " + ".join([m.split(" vs ")[0] for m in matches])
+    return BasketPick(
+        match=f"PARLAY: {name}",
+        market=f"{legs}-LEG PARLAY",
+        selection=" | ".join(p.selection for p in combo),
+        odds=odds_prod,
+        prob=prob_prod,
+        ev=parlay_ev,
+        confidence=min(p.confidence for p in combo),
+        meta={"legs": legs, "matches": matches, "markets": [p.market for p in combo],
+              "base_evs": [p.ev for p in combo]},
+    )
 
+
+def _build_parlays_exhaustive(
+    unique_picks: List[BasketPick],
+    legs: int,
+    min_parlay_ev: float,
+    max_parlay_odds: float,
+    top_k: int = PARLAY_TOP_K,
+) -> List[BasketPick]:
+    """Every combination scored; used when odds/probabilities are not positive (bounds invalid)."""
+    parlays: List[BasketPick] = []
     for combo in combinations(unique_picks, legs):
         odds_prod = 1.0
         prob_prod = 1.0
-        matches = []
-        selections = []
-        markets = []
-        base_evs = []
-        confs = []
-
         for p in combo:
             odds_prod *= p.odds
             prob_prod *= p.prob
-            matches.append(p.match)
-            markets.append(p.market)
-            selections.append(p.selection)
-            base_evs.append(p.ev)
-            confs.append(p.confidence)
 
         # Skip parlays with unrealistic odds (lottery tickets)
         if odds_prod > max_parlay_odds:
             continue
 
         parlay_ev = ev_from_prob_odds(prob_prod, odds_prod)
-
         if parlay_ev >= min_parlay_ev:
-            name = " + ".join([m.split(" vs ")[0] for m in matches])
-            parlays.append(
-                BasketPick(
-                    match=f"PARLAY: {name}",
-                    market=f"{legs}-LEG PARLAY",
-                    selection=" | ".join(selections),
-                    odds=odds_prod,
-                    prob=prob_prod,
-                    ev=parlay_ev,
-                    confidence=min(confs),
-                    meta={"legs": legs, "matches": matches, "markets": markets, "base_evs": base_evs},
-                )
-            )
+            parlays.append(_parlay_pick(combo, legs, odds_prod, prob_prod, parlay_ev))
 
     parlays.sort(key=lambda x: x.ev, reverse=True)
-    return parlays[:10]
+    return parlays[:top_k]
 
 
 # ----------------------------
@@ -43,15 +43,14 @@ VOLUME CONTROL (Jan 10, 2026):
 """
 
 import logging
-import os
-import numpy as np
-import psycopg2
+from db_connection import DatabaseConnection
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from collections import defaultdict
 
 from bet_filter import BetCandidate
+from count_distribution import CountDistribution, slate_line_probs, line_key, signed_line_key
 from multimarket_config import PRODUCT_CONFIGS, get_market_label, MarketType
 
 CORNERS_GLOBAL_DAILY_CAP = 60  # Apr 2026: raised — EV threshold is the gate, not volume cap
@@ -75,12 +74,7 @@ _DEFAULT_REFEREE_CORNERS = 10.0
 def _get_corners_db_connection():
     """Get database connection for CORNERS volume control."""
     try:
-        conn = psycopg2.connect(
-            os.getenv('DATABASE_URL'),
-            connect_timeout=10,
-            options='-c statement_timeout=30000'
-        )
-        return conn
+        return DatabaseConnection.checkout('corners_volume', statement_timeout_ms=30000)
     except Exception as e:
         logger.error(f"CORNERS DB connection failed: {e}")
         return None
@@ -486,50 +480,54 @@ class SyndicateCornersModel:
         home_lambda: float,
         away_lambda: float
     ) -> Dict[str, Any]:
-        home_corners = np.random.poisson(lam=home_lambda, size=self.num_sims)
-        away_corners = np.random.poisson(lam=away_lambda, size=self.num_sims)
-        total_corners = home_corners + away_corners
-        corner_diff = home_corners - away_corners
-        
-        results = {
-            "home_corners_raw": home_corners,
-            "away_corners_raw": away_corners,
-            "total_corners_raw": total_corners,
-            "corner_diff_raw": corner_diff,
-        }
-        
-        for line in MATCH_CORNER_LINES:
-            over_key = f"CORNERS_OVER_{str(line).replace('.', '_')}"
-            under_key = f"CORNERS_UNDER_{str(line).replace('.', '_')}"
-            results[over_key] = float((total_corners > line).mean())
-            results[under_key] = float((total_corners < line).mean())
-        
-        for line in TEAM_CORNER_LINES:
-            home_over_key = f"HOME_CORNERS_OVER_{str(line).replace('.', '_')}"
-            away_over_key = f"AWAY_CORNERS_OVER_{str(line).replace('.', '_')}"
-            results[home_over_key] = float((home_corners > line).mean())
-            results[away_over_key] = float((away_corners > line).mean())
-        
-        for line in HANDICAP_LINES:
-            if line >= 0:
-                line_str = f"+{str(abs(line)).replace('.', '_')}"
-            else:
-                line_str = f"-{str(abs(line)).replace('.', '_')}"
+        return self.simulate_slate([(home_lambda, away_lambda)])[0]
+    
+    def simulate_slate(
+        self,
+        lambdas: List[Tuple[float, float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Exact corner markets for a list of (home_lambda, away_lambda) fixtures.
+        One PMF per team, every line read off cumulative sums across the slate.
+        """
+        home_dists = [CountDistribution.poisson(h) for h, _ in lambdas]
+        away_dists = [CountDistribution.poisson(a) for _, a in lambdas]
+        total_dists = [h + a for h, a in zip(home_dists, away_dists)]
+        diff_dists = [h - a for h, a in zip(home_dists, away_dists)]
+        
+        total_over, total_under = slate_line_probs(total_dists, MATCH_CORNER_LINES)
+        home_over, _ = slate_line_probs(home_dists, TEAM_CORNER_LINES)
+        away_over, _ = slate_line_probs(away_dists, TEAM_CORNER_LINES)
+        # Home +line wins when diff > -line, away +line wins when diff < line
+        hc_home, _ = slate_line_probs(diff_dists, [-line for line in HANDICAP_LINES])
+        _, hc_away = slate_line_probs(diff_dists, HANDICAP_LINES)
+        most_home, most_away = slate_line_probs(diff_dists, [0.0])
+        
+        slate = []
+        for i, (home, away, total, diff) in enumerate(zip(home_dists, away_dists, total_dists, diff_dists)):
+            results = {"corner_diff_dist": diff}
             
-            home_hc_key = f"CORNERS_HC_HOME_{line_str}"
-            away_hc_key = f"CORNERS_HC_AWAY_{line_str}"
+            for j, line in enumerate(MATCH_CORNER_LINES):
+                results[f"CORNERS_OVER_{line_key(line)}"] = float(total_over[i, j])
+                results[f"CORNERS_UNDER_{line_key(line)}"] = float(total_under[i, j])
             
-            results[home_hc_key] = float(((corner_diff + line) > 0).mean())
-            results[away_hc_key] = float(((-corner_diff + line) > 0).mean())
-        
-        results["home_most_corners"] = float((home_corners > away_corners).mean())
-        results["away_most_corners"] = float((away_corners > home_corners).mean())
-        results["avg_total_corners"] = float(total_corners.mean())
-        results["avg_home_corners"] = float(home_corners.mean())
-        results["avg_away_corners"] = float(away_corners.mean())
-        results["std_total_corners"] = float(total_corners.std())
-        
-        return results
+            for j, line in enumerate(TEAM_CORNER_LINES):
+                results[f"HOME_CORNERS_OVER_{line_key(line)}"] = float(home_over[i, j])
+                results[f"AWAY_CORNERS_OVER_{line_key(line)}"] = float(away_over[i, j])
+            
+            for j, line in enumerate(HANDICAP_LINES):
+                results[f"CORNERS_HC_HOME_{signed_line_key(line)}"] = float(hc_home[i, j])
+                results[f"CORNERS_HC_AWAY_{signed_line_key(line)}"] = float(hc_away[i, j])
+            
+            results["home_most_corners"] = float(most_home[i, 0])
+            results["away_most_corners"] = float(most_away[i, 0])
+            results["avg_total_corners"] = total.mean()
+            results["avg_home_corners"] = home.mean()
+            results["avg_away_corners"] = away.mean()
+            results["std_total_corners"] = total.std()
+            slate.append(results)
+        
+        return slate
 
 
 class CornersEngine:
@@ -758,93 +756,81 @@ class CornersEngine:
             except (ValueError, IndexError):
                 continue
             
-            home_corners = corner_sim.get("home_corners_raw")
-            away_corners = corner_sim.get("away_corners_raw")
-            if home_corners is None or away_corners is None:
+            diff_dist = corner_sim.get("corner_diff_dist")
+            if diff_dist is None:
                 p_model = corner_sim.get(market_key, 0.0)
+            elif is_home:
+                p_model = diff_dist.prob_over(-line)
             else:
-                corner_diff = home_corners - away_corners
-                if is_home:
-                    p_model = float(((corner_diff + line) > 0).mean())
-                else:
-                    p_model = float(((-corner_diff + line) > 0).mean())
-                
-                if not (self.handicap_config.min_odds <= odds <= self.handicap_config.max_odds):
-                    continue
-                
-                if p_model < self.handicap_config.min_confidence:
-                    continue
-                
-                ev = (p_model * odds) - 1.0
-                
-                if ev < self.handicap_config.min_ev:
-                    continue
-                
-                sim_approved = ev >= 0.03
-                tier = self.classify_trust_tier(ev, p_model, self.handicap_config, sim_approved)
-                
-                if tier == "REJECTED":
-                    continue
-                
-                team = home_team if is_home else away_team
-                line_display = f"{int(line)}" if line == int(line) else f"{line}"
-                selection_text = f"{team} Corners {'+' if line >= 0 else ''}{line_display}"
-                
-                metadata = {
-                    "handicap_line": line,
-                    "avg_diff": corner_sim.get("avg_home_corners", 5) - corner_sim.get("avg_away_corners", 5),
-                }
-                if factors:
-                    metadata["factors"] = factors.to_dict()
-                
-                candidate = BetCandidate(
-                    match=match,
-                    market=market_key,
-                    selection=selection_text,
-                    odds=odds,
-                    ev_sim=ev,
-                    ev_model=ev,
-                    confidence=p_model,
-                    disagreement=0.0,
-                    approved=sim_approved,
-                    tier=tier,
-                    market_type="CORNERS_HANDICAP",
-                    product="CORNERS_HANDICAP",
-                    league=league,
-                    home_team=home_team,
-                    away_team=away_team,
-                    match_date=match_date or self.today,
-                    metadata=metadata,
-                    commence_time=commence_time  # CLV tracking
-                )
-                candidates.append(candidate)
+                p_model = diff_dist.prob_under(line)
+            
+            if not (self.handicap_config.min_odds <= odds <= self.handicap_config.max_odds):
+                continue
+            
+            if p_model < self.handicap_config.min_confidence:
+                continue
+            
+            ev = (p_model * odds) - 1.0
+            
+            if ev < self.handicap_config.min_ev:
+                continue
+            
+            sim_approved = ev >= 0.03
+            tier = self.classify_trust_tier(ev, p_model, self.handicap_config, sim_approved)
+            
+            if tier == "REJECTED":
+                continue
+            
+            team = home_team if is_home else away_team
+            line_display = f"{int(line)}" if line == int(line) else f"{line}"
+            selection_text = f"{team} Corners {'+' if line >= 0 else ''}{line_display}"
+            
+            metadata = {
+                "handicap_line": line,
+                "avg_diff": corner_sim.get("avg_home_corners", 5) - corner_sim.get("avg_away_corners", 5),
+            }
+            if factors:
+                metadata["factors"] = factors.to_dict()
+            
+            candidate = BetCandidate(
+                match=match,
+                market=market_key,
+                selection=selection_text,
+                odds=odds,
+                ev_sim=ev,
+                ev_model=ev,
+                confidence=p_model,
+                disagreement=0.0,
+                approved=sim_approved,
+                tier=tier,
+                market_type="CORNERS_HANDICAP",
+                product="CORNERS_HANDICAP",
+                league=league,
+                home_team=home_team,
+                away_team=away_team,
+                match_date=match_date or self.today,
+                metadata=metadata,
+                commence_time=commence_time  # CLV tracking
+            )
+            candidates.append(candidate)
         
         return candidates
     
-    def find_all_corner_value(
+    def expected_corners(
         self,
-        match: str,
-        home_team: str,
-        away_team: str,
         league: str,
         home_xg: float,
         away_xg: float,
-        odds_dict: Dict[str, float],
-        match_date: Optional[str] = None,
         home_form_corners: Optional[float] = None,
         away_form_corners: Optional[float] = None,
         home_stats: Optional[Dict] = None,
         away_stats: Optional[Dict] = None,
         referee_stats: Optional[Dict] = None,
         weather: Optional[Dict] = None,
-        match_importance: float = 1.0,
-        commence_time: Optional[str] = None  # CLV tracking (Jan 2026)
-    ) -> Tuple[List[BetCandidate], List[BetCandidate], List[BetCandidate]]:
-        home_stats = home_stats or {}
-        away_stats = away_stats or {}
-        
+        match_importance: float = 1.0
+    ) -> Tuple[CornerFactors, float, float]:
         factors = self.model.compute_all_factors(
-            home_stats, away_stats,
+            home_stats or {}, away_stats or {},
             referee_stats, weather,
             match_importance
         )
@@ -859,8 +845,43 @@ class CornersEngine:
             league_avg_corners=league_avg,
             factors=factors
         )
+        return factors, home_exp, away_exp
+    
+    def find_all_corner_value(
+        self,
+        match: str,
+        home_team: str,
+        away_team: str,
+        league: str,
+        home_xg: float,
+        away_xg: float,
+        odds_dict: Dict[str, float],
+        match_date: Optional[str] = None,
+        home_form_corners: Optional[float] = None,
+        away_form_corners: Optional[float] = None,
+        home_stats: Optional[Dict] = None,
+        away_stats: Optional[Dict] = None,
+        referee_stats: Optional[Dict] = None,
+        weather: Optional[Dict] = None,
+        match_importance: float = 1.0,
+        commence_time: Optional[str] = None,  # CLV tracking (Jan 2026)
+        corner_sim: Optional[Dict] = None,
+        expectation: Optional[Tuple[CornerFactors, float, float]] = None
+    ) -> Tuple[List[BetCandidate], List[BetCandidate], List[BetCandidate]]:
+        # expectation: (factors, home_exp, away_exp) already returned by
+        # expected_corners() for this fixture, so the factors aren't recomputed
+        if expectation is None:
+            expectation = self.expected_corners(
+                league, home_xg, away_xg,
+                home_form_corners, away_form_corners,
+                home_stats, away_stats,
+                referee_stats, weather,
+                match_importance
+            )
+        factors, home_exp, away_exp = expectation
         
-        corner_sim = self.model.simulate_corners(home_exp, away_exp)
+        if corner_sim is None:
+            corner_sim = self.model.simulate_corners(home_exp, away_exp)
         
         match_bets = self.find_match_corner_value(
             match, home_team, away_team, league, corner_sim, odds_dict, match_date, factors, commence_time
@@ -1009,40 +1030,44 @@ def run_corners_cycle(
     referee_data = referee_data or {}
     weather_data = weather_data or {}
     
+    priced = []
     for fixture in fixtures:
         fixture_id = fixture.get("fixture_id", "")
-        home_team = fixture.get("home_team", "Home")
-        away_team = fixture.get("away_team", "Away")
-        league = fixture.get("league", "Unknown")
-        match_date = fixture.get("match_date", engine.today)
-        commence_time = fixture.get("commence_time", "")  # CLV tracking
-        
-        home_xg = fixture.get("home_xg", 1.5)
-        away_xg = fixture.get("away_xg", 1.2)
-        
         odds_snapshot = odds_data.get(fixture_id, {})
         if not odds_snapshot:
             continue
         
-        home_stats = team_stats.get(home_team, {})
-        away_stats = team_stats.get(away_team, {})
-        referee_stats = referee_data.get(fixture.get("referee_id"), {})
-        weather = weather_data.get(fixture_id, {})
+        home_team = fixture.get("home_team", "Home")
+        away_team = fixture.get("away_team", "Away")
+        context = dict(
+            league=fixture.get("league", "Unknown"),
+            home_xg=fixture.get("home_xg", 1.5),
+            away_xg=fixture.get("away_xg", 1.2),
+            home_stats=team_stats.get(home_team, {}),
+            away_stats=team_stats.get(away_team, {}),
+            referee_stats=referee_data.get(fixture.get("referee_id"), {}),
+            weather=weather_data.get(fixture_id, {}),
+        )
+        expectation = engine.expected_corners(**context)
+        priced.append((fixture, odds_snapshot, context, expectation))
+    
+    # Price the whole slate in one pass, then scan each fixture's lines
+    corner_sims = engine.model.simulate_slate([(home_exp, away_exp) for *_, (_, home_exp, away_exp) in priced])
+    
+    for (fixture, odds_snapshot, context, expectation), corner_sim in zip(priced, corner_sims):
+        home_team = fixture.get("home_team", "Home")
+        away_team = fixture.get("away_team", "Away")
         
         match_bets, team_bets, hc_bets = engine.find_all_corner_value(
             match=f"{home_team} vs {away_team}",
             home_team=home_team,
             away_team=away_team,
-            league=league,
-            home_xg=home_xg,
-            away_xg=away_xg,
             odds_dict=odds_snapshot,
-            match_date=match_date,
-            home_stats=home_stats,
-            away_stats=away_stats,
-            referee_stats=referee_stats,
-            weather=weather,
-            commence_time=commence_time  # CLV tracking
+            match_date=fixture.get("match_date", engine.today),
+            commence_time=fixture.get("commence_time", ""),  # CLV tracking
+            corner_sim=corner_sim,
+            expectation=expectation,
+            **context
         )
         
         all_match.extend(match_bets)
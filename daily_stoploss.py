@@ -8,11 +8,10 @@ Implements a -5 unit daily stop-loss for production betting.
 - All timestamps use UTC (created_at and settled_at are stored as timestamptz)
 """
 
-import os
 import logging
 from datetime import datetime, timezone
 from typing import Tuple
-import psycopg2
+from db_connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +19,8 @@ DAILY_STOPLOSS_UNITS = -5.0  # Single source of truth for stop-loss threshold
 
 
 def get_db_connection():
-    """Get database connection."""
-    return psycopg2.connect(os.environ['DATABASE_URL'])
+    """Get a pooled database connection (close() returns it to the pool)."""
+    return DatabaseConnection.checkout('daily_stoploss')
 
 
 def get_todays_pnl() -> Tuple[float, int, int]:
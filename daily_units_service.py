@@ -7,17 +7,16 @@ import os
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import psycopg2
 from psycopg2.extras import RealDictCursor
+from db_connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
 def get_db_connection():
-    """Get database connection"""
-    db_url = os.environ.get('DATABASE_URL') or os.environ.get('POSTGRES_URL')
-    if not db_url:
+    """Get a pooled database connection (DATABASE_URL or POSTGRES_URL; close() returns it)"""
+    if not (os.environ.get('DATABASE_URL') or os.environ.get('POSTGRES_URL')):
         raise RuntimeError("No DATABASE_URL found")
-    return psycopg2.connect(db_url)
+    return DatabaseConnection.checkout('daily_units')
 
 
 def get_daily_units(days_back: int = 30) -> Dict:
@@ -2,7 +2,13 @@ import psycopg2
 from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 import os
+import sys
+import time
 import logging
+import threading
+import weakref
+import contextlib
+from collections import deque
 from contextlib import contextmanager
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
@@ -36,16 +42,125 @@ def clean_database_url(url):
         logger.warning(f"Could not parse DATABASE_URL, using as-is: {e}")
         return url
 
+
+def resolve_database_url():
+    """The cleaned DSN every connection uses: DATABASE_URL, falling back to POSTGRES_URL"""
+    return clean_database_url(os.environ.get('DATABASE_URL') or os.environ.get('POSTGRES_URL'))
+
+# Pool size per process role (min, max). The API, scheduler worker and Streamlit
+# dashboard are separate processes with separate pools; DB_POOL_ROLE selects the row
+# and DB_POOL_MIN / DB_POOL_MAX override it.
+POOL_ROLE_SIZES = {
+    'api': (2, 16),
+    'scheduler': (1, 10),
+    'dashboard': (1, 4),
+    'script': (1, 3),
+}
+DEFAULT_POOL_ROLE = 'scheduler'
+POOL_CHECKOUT_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))   # seconds to wait for a free connection
+LEAK_WARN_SECONDS = float(os.getenv('DB_LEAK_WARN_SECONDS', '300'))  # held longer than this = reported as suspect
+WAIT_WINDOW = 500  # recent checkout waits kept for percentiles
+
+
+class _Lease:
+    """One checkout: which pool the connection came from, who holds it and since when."""
+    __slots__ = ('conn', 'pool', 'semaphore', 'label', 'where', 'checked_out_at', 'statement_timeout')
+
+    def __init__(self, conn, conn_pool, semaphore, label, where):
+        self.conn = conn
+        self.pool = conn_pool
+        self.semaphore = semaphore
+        self.label = label
+        self.where = where
+        self.checked_out_at = time.monotonic()
+        self.statement_timeout = None
+
+
+class PooledConnection:
+    """
+    Pooled stand-in for a psycopg2 connection (see DatabaseConnection.checkout).
+
+    Behaves like the raw connection, but close() hands it back to the pool instead
+    of disconnecting, so code written around psycopg2.connect()/conn.close() keeps
+    working. `with checkout() as conn:` commits or rolls back and then returns it.
+    A connection dropped without close() is returned when the object is
+    garbage-collected and counted as a leak. Once closed, any further use raises
+    InterfaceError, as it would on a closed psycopg2 connection.
+    """
+
+    def __init__(self, lease, cursor_factory=None):
+        object.__setattr__(self, '_lease', lease)
+        object.__setattr__(self, '_cursor_factory', cursor_factory)
+        finalizer = weakref.finalize(self, DatabaseConnection._reclaim, lease)
+        finalizer.atexit = False
+        object.__setattr__(self, '_finalizer', finalizer)
+
+    def _conn(self):
+        """The leased connection, unless this wrapper has already been closed."""
+        if not self._finalizer.alive:
+            raise psycopg2.InterfaceError("connection already closed")
+        return self._lease.conn
+
+    def cursor(self, *args, **kwargs):
+        if self._cursor_factory is not None and 'cursor_factory' not in kwargs and not args[1:]:
+            kwargs['cursor_factory'] = self._cursor_factory
+        return self._conn().cursor(*args, **kwargs)
+
+    def close(self):
+        if self._finalizer.detach() is not None:
+            DatabaseConnection._release(self._lease)
+
+    @property
+    def closed(self):
+        return self._lease.conn.closed if self._finalizer.alive else 1
+
+    def __getattr__(self, name):
+        return getattr(self._conn(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn(), name, value)
+
+    def __enter__(self):
+        self._conn().__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            return self._lease.conn.__exit__(exc_type, exc, tb)
+        finally:
+            self.close()
+
+
 class DatabaseConnection:
     _connection_pool = None
-    
+    _semaphore = None
+    _pool_size = (0, 0)
+    role = os.getenv('DB_POOL_ROLE', DEFAULT_POOL_ROLE)
+
+    _lock = threading.RLock()   # re-entrant: a leak can be reclaimed by GC while the lock is held
+    _leases = {}
+    _label_stats = {}
+    _waits = deque(maxlen=WAIT_WINDOW)
+
+    @classmethod
+    def configure(cls, role):
+        """Set the process role used to size the pool (call before the first query)."""
+        if cls._connection_pool is not None and role != cls.role:
+            logger.warning(f"⚠️ Pool already initialized as '{cls.role}'; role '{role}' applies after reset_pool()")
+        cls.role = role
+
     @classmethod
-    def initialize_pool(cls, minconn=1, maxconn=10):
+    def initialize_pool(cls, minconn=None, maxconn=None):
         """Initialize connection pool for concurrent access with TCP keepalives"""
-        if cls._connection_pool is None:
+        with cls._lock:
+            if cls._connection_pool is not None:
+                return
+            default_min, default_max = POOL_ROLE_SIZES.get(cls.role, POOL_ROLE_SIZES[DEFAULT_POOL_ROLE])
+            minconn = minconn or int(os.getenv('DB_POOL_MIN', default_min))
+            maxconn = maxconn or int(os.getenv('DB_POOL_MAX', default_max))
             try:
-                db_url = clean_database_url(os.environ.get('DATABASE_URL'))
-                cls._connection_pool = psycopg2.pool.ThreadedConnectionPool(
+                db_url = resolve_database_url()
+                cls._connection_pool = pool.ThreadedConnectionPool(
                     minconn,
                     maxconn,
                     db_url,
@@ -54,23 +169,151 @@ class DatabaseConnection:
                     keepalives_interval=10, # Keepalive interval 10s
                     keepalives_count=3      # Max 3 keepalive probes
                 )
-                logger.info(f"✅ PostgreSQL connection pool initialized ({minconn}-{maxconn} connections, keepalives enabled)")
+                # ThreadedConnectionPool raises when exhausted; the semaphore makes callers queue instead
+                cls._semaphore = threading.BoundedSemaphore(maxconn)
+                cls._pool_size = (minconn, maxconn)
+                logger.info(f"✅ PostgreSQL connection pool initialized ({minconn}-{maxconn} connections, role={cls.role}, keepalives enabled)")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize connection pool: {e}")
                 raise
-    
+
+    # ── Checkout / return ───────────────────────────────────────────────────
+
+    @staticmethod
+    def _caller():
+        """(label, 'file:line') of the first frame outside this module."""
+        frame = sys._getframe(1)
+        while frame and frame.f_code.co_filename in (__file__, contextlib.__file__):
+            frame = frame.f_back
+        if frame is None:
+            return 'unknown', 'unknown'
+        module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+        return f"{module}.{frame.f_code.co_name}", f"{module}.py:{frame.f_lineno}"
+
+    @classmethod
+    def _label_entry(cls, label):
+        entry = cls._label_stats.get(label)
+        if entry is None:
+            entry = cls._label_stats[label] = {
+                "checkouts": 0, "timeouts": 0, "leaks": 0,
+                "wait_total": 0.0, "wait_max": 0.0, "hold_total": 0.0, "hold_max": 0.0,
+            }
+        return entry
+
+    @classmethod
+    def _acquire(cls, label=None):
+        if cls._connection_pool is None:
+            cls.initialize_pool()
+        conn_pool, semaphore = cls._connection_pool, cls._semaphore
+        caller_label, where = cls._caller()
+        label = label or caller_label
+
+        started = time.monotonic()
+        if not semaphore.acquire(timeout=POOL_CHECKOUT_TIMEOUT):
+            with cls._lock:
+                cls._label_entry(label)["timeouts"] += 1
+                holders = sorted({lease.label for lease in cls._leases.values()})
+            raise pool.PoolError(
+                f"Timed out after {POOL_CHECKOUT_TIMEOUT:g}s waiting for a DB connection ({label}); "
+                f"held by: {', '.join(holders)}"
+            )
+        try:
+            conn = conn_pool.getconn()
+        except Exception:
+            semaphore.release()
+            raise
+        waited = time.monotonic() - started
+
+        lease = _Lease(conn, conn_pool, semaphore, label, where)
+        with cls._lock:
+            cls._leases[id(lease)] = lease
+            cls._waits.append(waited)
+            entry = cls._label_entry(label)
+            entry["checkouts"] += 1
+            entry["wait_total"] += waited
+            entry["wait_max"] = max(entry["wait_max"], waited)
+        return lease
+
+    @classmethod
+    def _release(cls, lease, discard=False):
+        conn = lease.conn
+        held = time.monotonic() - lease.checked_out_at
+        with cls._lock:
+            cls._leases.pop(id(lease), None)
+            entry = cls._label_entry(lease.label)
+            entry["hold_total"] += held
+            entry["hold_max"] = max(entry["hold_max"], held)
+        try:
+            if not discard and not conn.closed:
+                # Undo per-checkout session tweaks; putconn rolls back open transactions
+                if lease.statement_timeout is not None:
+                    conn.rollback()
+                    with conn.cursor() as cur:
+                        cur.execute("RESET statement_timeout")
+                    conn.commit()
+                if conn.autocommit:
+                    conn.autocommit = False
+                conn.cursor_factory = None
+        except psycopg2.Error:
+            discard = True
+        try:
+            lease.pool.putconn(conn, close=discard or bool(conn.closed))
+        except Exception as e:
+            # Pool was reset/closed while this connection was out
+            logger.warning(f"⚠️ Could not return connection to pool: {e}")
+            try:
+                conn.close()
+            except Exception:
+                pass
+        finally:
+            lease.semaphore.release()
+
+    @classmethod
+    def _reclaim(cls, lease):
+        """Finalizer for a PooledConnection that was never closed."""
+        with cls._lock:
+            cls._label_entry(lease.label)["leaks"] += 1
+        held = time.monotonic() - lease.checked_out_at
+        logger.warning(f"⚠️ DB connection leaked by {lease.label} ({lease.where}, held {held:.1f}s) - returned to pool")
+        cls._release(lease)
+
+    @classmethod
+    def checkout(cls, label=None, cursor_factory=None, statement_timeout_ms=None):
+        """
+        Borrow a pooled connection for code written against psycopg2.connect().
+
+        Args:
+            label: Name reported in pool stats (defaults to the calling module.function)
+            cursor_factory: Default cursor factory for conn.cursor() (e.g. RealDictCursor)
+            statement_timeout_ms: Session statement_timeout while checked out
+                (replaces options='-c statement_timeout=...' on a dedicated connection)
+
+        Returns:
+            PooledConnection - commit/rollback as usual, close() returns it to the pool
+        """
+        lease = cls._acquire(label)
+        if statement_timeout_ms:
+            try:
+                with lease.conn.cursor() as cur:
+                    cur.execute("SET statement_timeout = %s", (int(statement_timeout_ms),))
+                lease.conn.commit()
+                lease.statement_timeout = int(statement_timeout_ms)
+            except Exception:
+                cls._release(lease, discard=True)
+                raise
+        return PooledConnection(lease, cursor_factory)
+
     @classmethod
     @contextmanager
-    def get_cursor(cls, dict_cursor=False):
+    def get_cursor(cls, dict_cursor=False, label=None):
         """Get a cursor from the connection pool (context manager for auto-cleanup)
         
         Args:
             dict_cursor: If True, returns dict rows. Default False for tuple compatibility.
+            label: Name reported in pool stats (defaults to the calling module.function)
         """
-        if cls._connection_pool is None:
-            cls.initialize_pool()
-        
-        conn = cls._connection_pool.getconn()
+        lease = cls._acquire(label)
+        conn = lease.conn
         cursor = None
         connection_is_bad = False
         
@@ -99,30 +342,16 @@ class DatabaseConnection:
                     pass  # Cursor already closed
             
             # Return connection to pool (or discard if bad)
-            if conn:
-                try:
-                    if connection_is_bad:
-                        # Close broken connection manually, don't return to pool
-                        try:
-                            conn.close()
-                            logger.info("🔄 Closed broken connection")
-                        except Exception:
-                            pass
-                    elif not conn.closed:
-                        # Return healthy connection to pool
-                        cls._connection_pool.putconn(conn)
-                except Exception as e:
-                    # Log but don't crash
-                    logger.warning(f"⚠️ Could not return connection to pool: {e}")
+            cls._release(lease, discard=connection_is_bad)
+            if connection_is_bad:
+                logger.info("🔄 Closed broken connection")
     
     @classmethod
     @contextmanager
-    def get_connection(cls):
+    def get_connection(cls, label=None):
         """Get a connection from the pool (for transactions)"""
-        if cls._connection_pool is None:
-            cls.initialize_pool()
-        
-        conn = cls._connection_pool.getconn()
+        lease = cls._acquire(label)
+        conn = lease.conn
         try:
             yield conn
             conn.commit()
@@ -132,26 +361,21 @@ class DatabaseConnection:
             logger.error(f"Database error: {e}")
             raise
         finally:
-            # Try to return connection to pool, handle errors gracefully
-            try:
-                if conn and not conn.closed:
-                    cls._connection_pool.putconn(conn)
-            except Exception as e:
-                # Connection can't be returned - log and continue
-                logger.warning(f"⚠️ Could not return connection to pool: {e}")
-                # Don't raise - this prevents dashboard crashes
+            cls._release(lease)
     
     @classmethod
     def reset_pool(cls):
         """Reset connection pool by closing and reinitializing (for stale connections)"""
-        if cls._connection_pool:
-            try:
-                cls._connection_pool.closeall()
-                cls._connection_pool = None
-                logger.info("🔄 PostgreSQL connection pool reset")
-            except Exception as e:
-                logger.error(f"❌ Error resetting connection pool: {e}")
-                cls._connection_pool = None
+        with cls._lock:
+            if cls._connection_pool:
+                try:
+                    cls._connection_pool.closeall()
+                    logger.info("🔄 PostgreSQL connection pool reset")
+                except Exception as e:
+                    logger.error(f"❌ Error resetting connection pool: {e}")
+                finally:
+                    cls._connection_pool = None
+                    cls._semaphore = None
     
     @classmethod
     def close_pool(cls):
@@ -163,13 +387,60 @@ class DatabaseConnection:
 db = DatabaseConnection()
 
 
-def get_db_conn():
+def get_db_conn(label=None):
     """
     Backwards-compatible helper for scripts (e.g. settlement.py)
     that expect a plain psycopg2 connection object.
-    Uses the shared DatabaseConnection pool.
+    Uses the shared DatabaseConnection pool; conn.close() returns it.
     """
-    if DatabaseConnection._connection_pool is None:
-        DatabaseConnection.initialize_pool()
+    return DatabaseConnection.checkout(label)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
 
-    return DatabaseConnection._connection_pool.getconn()
+def get_pool_stats():
+    """Pool size and usage, checkout waits, per-label counters and suspected leaks."""
+    cls = DatabaseConnection
+    now = time.monotonic()
+    with cls._lock:
+        conn_pool = cls._connection_pool
+        waits = sorted(cls._waits)
+        leases = list(cls._leases.values())
+        labels = {
+            label: {
+                "checkouts": s["checkouts"],
+                "in_use": sum(1 for lease in leases if lease.label == label),
+                "timeouts": s["timeouts"],
+                "leaks": s["leaks"],
+                "avg_wait_ms": _ms(s["wait_total"] / s["checkouts"]) if s["checkouts"] else 0.0,
+                "max_wait_ms": _ms(s["wait_max"]),
+                "avg_hold_ms": _ms(s["hold_total"] / s["checkouts"]) if s["checkouts"] else 0.0,
+                "max_hold_ms": _ms(s["hold_max"]),
+            }
+            for label, s in cls._label_stats.items()
+        }
+    suspects = sorted(
+        (
+            {"label": lease.label, "where": lease.where, "held_s": round(now - lease.checked_out_at, 1)}
+            for lease in leases
+            if now - lease.checked_out_at > LEAK_WARN_SECONDS
+        ),
+        key=lambda s: -s["held_s"],
+    )
+    return {
+        "role": cls.role,
+        "min": cls._pool_size[0],
+        "max": cls._pool_size[1],
+        "initialized": conn_pool is not None,
+        "in_use": len(leases),
+        "idle": len(conn_pool._pool) if conn_pool is not None else 0,
+        "checkouts": sum(s["checkouts"] for s in labels.values()),
+        "timeouts": sum(s["timeouts"] for s in labels.values()),
+        "leaks": sum(s["leaks"] for s in labels.values()),
+        "wait_p95_ms": _ms(waits[int(0.95 * (len(waits) - 1))]) if waits else 0.0,
+        "wait_max_ms": _ms(waits[-1]) if waits else 0.0,
+        "labels": labels,
+        "suspected_leaks": suspects,
+    }
@@ -1,57 +1,222 @@
 import re
 import os
+import hashlib
 import logging
+import threading
+import weakref
+from collections import OrderedDict
 from db_connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+_SQLITE_TRANSLATIONS = [
+    (re.compile(r'\?'), '%s'),
+    (re.compile(r"datetime\('now'\)", re.IGNORECASE), "NOW()"),
+    (re.compile(r"strftime\('%s',\s*'now'\)", re.IGNORECASE), "EXTRACT(EPOCH FROM NOW())::BIGINT"),
+    (re.compile(r"DATE\('now'\)", re.IGNORECASE), "CURRENT_DATE"),
+    (re.compile(r'AUTOINCREMENT', re.IGNORECASE), 'SERIAL'),
+]
+
+# Raw SQL text -> translated SQL. Callers pass the same literal strings over and
+# over (cache lookups, quota checks), so the regex passes only run once per text.
+TRANSLATION_CACHE_MAX_SIZE = 2048
+_translation_cache: "OrderedDict[str, str]" = OrderedDict()
+_translation_lock = threading.Lock()
+_translation_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+# Server-side prepared statements (opt-in: DB_PREPARED_STATEMENTS=auto).
+# A statement is PREPAREd on a connection once it has run PREPARE_AFTER_EXECUTIONS
+# times in this process; at most PREPARED_STATEMENT_LIMIT distinct statements.
+# Leave off behind a transaction-mode PgBouncer — prepared statements are per session.
+PREPARED_STATEMENTS_MODE = os.getenv('DB_PREPARED_STATEMENTS', 'off').lower()
+PREPARE_AFTER_EXECUTIONS = int(os.getenv('DB_PREPARE_AFTER', '10'))
+PREPARED_STATEMENT_LIMIT = int(os.getenv('DB_PREPARED_STATEMENT_LIMIT', '64'))
+
+# Translated SQL -> {"executions", "prepared_executions", "prepares", "name", "unpreparable"}.
+# LRU like the translation cache, so one-off texts (VALUES lists sized by row
+# count) age out; prepared entries are never evicted so the per-session set of
+# PREPAREd statements stays bounded by PREPARED_STATEMENT_LIMIT.
+_statement_lock = threading.Lock()
+_statement_stats: "OrderedDict[str, dict]" = OrderedDict()
+_prepared_count = 0
+_prepared_on = weakref.WeakKeyDictionary()  # connection -> set of statement names
+
+_QUOTED_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PREPARABLE_VERBS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+
+
+def _statement_name(sql):
+    return "dbh_" + hashlib.blake2b(sql.encode(), digest_size=8).hexdigest()
+
+
+def _to_prepare_body(sql):
+    """%s placeholders -> $1..$n, or None when the statement can't be prepared safely."""
+    stripped = sql.lstrip()
+    if not stripped[:6].upper().startswith(_PREPARABLE_VERBS) or '%(' in sql or ';' in sql.rstrip().rstrip(';'):
+        return None
+    # A %s inside a quoted literal (e.g. INTERVAL '%s hours') is not a bind parameter
+    if '%s' in ''.join(_QUOTED_LITERAL.findall(sql)):
+        return None
+    parts = sql.split('%s')
+    body = parts[0]
+    for i, part in enumerate(parts[1:], start=1):
+        body += f"${i}" + part
+    return body.replace('%%', '%'), len(parts) - 1
+
+
 class DatabaseHelper:
     """Compatibility layer for migrating from SQLite to PostgreSQL with connection pooling"""
-    
+
     @staticmethod
     def translate_sql(sql_query):
-        """Translate SQLite SQL to PostgreSQL SQL"""
+        """Translate SQLite SQL to PostgreSQL SQL (memoized per raw SQL text)"""
+        with _translation_lock:
+            cached = _translation_cache.get(sql_query)
+            if cached is not None:
+                _translation_cache.move_to_end(sql_query)
+                _translation_stats["hits"] += 1
+                return cached
+            _translation_stats["misses"] += 1
+
         query = sql_query
-        
-        query = re.sub(r'\?', '%s', query)
-        
-        query = re.sub(r"datetime\('now'\)", "NOW()", query, flags=re.IGNORECASE)
-        query = re.sub(r"strftime\('%s',\s*'now'\)", "EXTRACT(EPOCH FROM NOW())::BIGINT", query, flags=re.IGNORECASE)
-        query = re.sub(r"DATE\('now'\)", "CURRENT_DATE", query, flags=re.IGNORECASE)
-        
-        query = re.sub(r'AUTOINCREMENT', 'SERIAL', query, flags=re.IGNORECASE)
-        
+        for pattern, replacement in _SQLITE_TRANSLATIONS:
+            query = pattern.sub(replacement, query)
+
+        with _translation_lock:
+            _translation_cache[sql_query] = query
+            if len(_translation_cache) > TRANSLATION_CACHE_MAX_SIZE:
+                _translation_cache.popitem(last=False)
+                _translation_stats["evictions"] += 1
         return query
-    
+
+    @staticmethod
+    def _should_prepare(query, params, prepare):
+        """
+        Count the execution and decide whether to run it as a prepared statement.
+        Returns the statement name to EXECUTE, or None to run it as plain SQL.
+        """
+        global _prepared_count
+        with _statement_lock:
+            stats = _statement_stats.get(query)
+            if stats is None:
+                if len(_statement_stats) >= TRANSLATION_CACHE_MAX_SIZE:
+                    victim = next((sql for sql, s in _statement_stats.items() if s["name"] is None), None)
+                    if victim is None:
+                        return None
+                    del _statement_stats[victim]
+                stats = _statement_stats[query] = {
+                    "executions": 0, "prepared_executions": 0, "prepares": 0,
+                    "name": None, "unpreparable": False,
+                }
+            else:
+                _statement_stats.move_to_end(query)
+            stats["executions"] += 1
+
+            if prepare is False or stats["unpreparable"] or isinstance(params, dict):
+                return None
+            if stats["name"] is not None:
+                return stats["name"]
+            if prepare is None:
+                if PREPARED_STATEMENTS_MODE != 'auto' or stats["executions"] < PREPARE_AFTER_EXECUTIONS:
+                    return None
+            if _prepared_count >= PREPARED_STATEMENT_LIMIT:
+                return None
+            stats["name"] = _statement_name(query)
+            _prepared_count += 1
+            return stats["name"]
+
+    @staticmethod
+    def _record_statement(query, counter=None, unpreparable=False):
+        """Bump a per-statement counter or mark it unpreparable (entry may have been evicted)."""
+        global _prepared_count
+        with _statement_lock:
+            stats = _statement_stats.get(query)
+            if stats is None:
+                return
+            if counter:
+                stats[counter] += 1
+            if unpreparable:
+                stats["unpreparable"] = True
+                if stats["name"] is not None:
+                    stats["name"] = None
+                    _prepared_count -= 1
+
     @staticmethod
-    def execute(query, params=None, fetch=None, max_retries=3):
+    def _execute_prepared(cursor, query, params, name):
+        """
+        Run query as the server-side prepared statement `name` on this cursor's connection.
+        Returns False (after rolling back) when the statement can't be prepared.
+        """
+        import psycopg2
+
+        converted = _to_prepare_body(query)
+        params = tuple(params or ())
+        if converted is None or converted[1] != len(params):
+            DatabaseHelper._record_statement(query, unpreparable=True)
+            return False
+
+        body, n_params = converted
+        conn = cursor.connection
+        prepared = _prepared_on.setdefault(conn, set())
+        try:
+            if name not in prepared:
+                cursor.execute(f"PREPARE {name} AS {body}")
+                prepared.add(name)
+                DatabaseHelper._record_statement(query, "prepares")
+            if n_params:
+                cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * n_params)})", params)
+            else:
+                cursor.execute(f"EXECUTE {name}")
+        except (psycopg2.ProgrammingError, psycopg2.NotSupportedError) as e:
+            # Parameter types the server can't infer, or a cached plan invalidated by DDL
+            conn.rollback()
+            prepared.discard(name)
+            try:
+                cursor.execute(f"DEALLOCATE {name}")
+            except psycopg2.Error:
+                conn.rollback()
+            if e.pgcode != '26000':  # 26000 = statement vanished from the session; re-prepare next time
+                DatabaseHelper._record_statement(query, unpreparable=True)
+                logger.debug(f"Prepared statement disabled for query ({e}): {query[:80]}")
+            return False
+
+        DatabaseHelper._record_statement(query, "prepared_executions")
+        return True
+
+    @staticmethod
+    def execute(query, params=None, fetch=None, max_retries=3, prepare=None):
         """Execute a query using connection pool with automatic SQL translation and retry logic
-        
+
         Args:
             query: SQL query (SQLite or PostgreSQL syntax)
             params: Query parameters (tuple or list)
             fetch: 'one', 'all', or None for execute only
             max_retries: Maximum retry attempts on connection errors
-        
+            prepare: True to run as a server-side prepared statement, False to never
+                prepare, None to follow DB_PREPARED_STATEMENTS
+
         Returns:
             Query result if fetch is specified, None otherwise
         """
         import psycopg2
         import time
-        
+
         translated_query = DatabaseHelper.translate_sql(query)
-        
+        statement_name = DatabaseHelper._should_prepare(translated_query, params, prepare)
+
         for attempt in range(max_retries):
             try:
                 with DatabaseConnection.get_cursor() as cursor:
-                    cursor.execute(translated_query, params or ())
-                    
+                    if not (statement_name and DatabaseHelper._execute_prepared(
+                            cursor, translated_query, params, statement_name)):
+                        cursor.execute(translated_query, params or ())
+
                     if fetch == 'one':
                         return cursor.fetchone()
                     elif fetch == 'all':
                         return cursor.fetchall()
                     return None
-                    
+
             except (psycopg2.OperationalError, psycopg2.InterfaceError, psycopg2.DatabaseError) as e:
                 # Connection dropped - retry (get_cursor will discard the bad connection)
                 error_msg = str(e).lower()
@@ -59,7 +224,7 @@ class DatabaseHelper:
                     # SSL/connection issue - reset pool
                     logger.warning(f"Connection dropped (SSL/termination), resetting pool: {e}")
                     DatabaseConnection.reset_pool()
-                
+
                 if attempt < max_retries - 1:
                     logger.warning(f"Database connection error (attempt {attempt + 1}/{max_retries}): {e}")
                     time.sleep(0.5 * (attempt + 1))  # Exponential backoff
@@ -70,13 +235,41 @@ class DatabaseHelper:
             except Exception as e:
                 logger.error(f"Database error: {e}")
                 raise
-    
+
     @staticmethod
     def execute_many(query, params_list):
         """Execute query multiple times with different parameters using connection pool"""
         translated_query = DatabaseHelper.translate_sql(query)
-        
+
         with DatabaseConnection.get_cursor() as cursor:
             cursor.executemany(translated_query, params_list)
 
+
+def get_sql_cache_stats(top=20):
+    """Translation-cache counters plus the most executed statements and their prepared-plan hits."""
+    with _translation_lock:
+        translation = dict(_translation_stats, size=len(_translation_cache))
+    with _statement_lock:
+        ranked = sorted(_statement_stats.items(), key=lambda kv: kv[1]["executions"], reverse=True)
+        statements = [
+            {
+                "sql": " ".join(sql.split())[:160],
+                "executions": s["executions"],
+                "prepared": s["name"] is not None,
+                "prepared_executions": s["prepared_executions"],
+                "prepares": s["prepares"],
+            }
+            for sql, s in ranked[:top]
+        ]
+        prepared_count = _prepared_count
+        unpreparable = sum(1 for s in _statement_stats.values() if s["unpreparable"])
+    return {
+        "translation": translation,
+        "prepared_mode": PREPARED_STATEMENTS_MODE,
+        "prepared_statements": prepared_count,
+        "unpreparable_statements": unpreparable,
+        "top_statements": statements,
+    }
+
+
 db_helper = DatabaseHelper()
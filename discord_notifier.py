@@ -1,7 +1,7 @@
 import os
 import json
 import logging
-import requests
+from http_transport import http_get, http_post
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -197,7 +197,7 @@ def fetch_live_odds_for_match(home_team: str, away_team: str, selection: str, sp
             'oddsFormat': 'decimal'
         }
 
-        resp = requests.get(url, params=params, timeout=10)
+        resp = http_get(url, params=params, timeout=10)
         if resp.status_code != 200:
             return {}
 
@@ -530,7 +530,7 @@ def send_bet_to_discord(bet, product_type=None):
     }
 
     try:
-        response = requests.post(webhook_url, json=payload, timeout=5)
+        response = http_post(webhook_url, json=payload, timeout=5)
         ok = response.status_code in [200, 204]
         if ok:
             _fire_push_for_bet(bet, product_type)
@@ -578,7 +578,7 @@ def send_custom_message(product_type: str, message: str):
         return False
 
     try:
-        response = requests.post(webhook_url, json={"content": message}, timeout=5)
+        response = http_post(webhook_url, json={"content": message}, timeout=5)
         return response.status_code == 204
     except Exception as e:
         print(f"[DISCORD] Failed to send message: {e}")
@@ -729,7 +729,7 @@ def send_result_to_discord(bet_info: dict, product_type: str = None):
     success = False
     for url in webhooks_to_post:
         try:
-            response = requests.post(url, json=payload, timeout=5)
+            response = http_post(url, json=payload, timeout=5)
             if response.status_code in [200, 204]:
                 success = True
             else:
@@ -773,7 +773,7 @@ _PGR Sports Analytics – AI-powered betting_
 """
     
     try:
-        response = requests.post(webhook_url, json={"content": message}, timeout=5)
+        response = http_post(webhook_url, json={"content": message}, timeout=5)
         return response.status_code == 204
     except Exception as e:
         print(f"[DISCORD] Failed to send daily summary: {e}")
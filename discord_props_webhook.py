@@ -4,7 +4,7 @@ Discord Props Webhook - Sends Corners, Cards, and Shots picks to Discord
 
 import os
 import json
-import requests
+from http_transport import http_post
 import logging
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
@@ -116,7 +116,7 @@ def send_props_picks_to_discord(picks: List[Dict], market_type: str = "PROPS") -
                 "embeds": chunk
             }
             
-            response = requests.post(DISCORD_PROPS_WEBHOOK_URL, json=payload, timeout=10)
+            response = http_post(DISCORD_PROPS_WEBHOOK_URL, json=payload, timeout=10)
             
             if response.status_code not in [200, 204]:
                 logger.error(f"Discord props webhook failed: {response.status_code} - {response.text}")
@@ -279,7 +279,7 @@ def send_manual_props_summary() -> bool:
                 "embeds": [embed]
             }
             
-            response = requests.post(DISCORD_PROPS_WEBHOOK_URL, json=payload, timeout=10)
+            response = http_post(DISCORD_PROPS_WEBHOOK_URL, json=payload, timeout=10)
             
             return response.status_code in [200, 204]
         
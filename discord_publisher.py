@@ -16,7 +16,7 @@ import json
 import time
 import hashlib
 import logging
-import requests
+from http_transport import http_post
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
@@ -557,14 +557,14 @@ def post_to_discord(webhook_url: str, payload: dict) -> bool:
         logger.warning("No webhook URL — skipping post")
         return False
     try:
-        resp = requests.post(webhook_url, json=payload, timeout=10)
+        resp = http_post(webhook_url, json=payload, timeout=10)
         if resp.status_code in (200, 204):
             return True
         elif resp.status_code == 429:
             retry_after = resp.json().get("retry_after", 5)
             logger.warning(f"Rate limited — waiting {retry_after}s")
             time.sleep(retry_after)
-            resp2 = requests.post(webhook_url, json=payload, timeout=10)
+            resp2 = http_post(webhook_url, json=payload, timeout=10)
             return resp2.status_code in (200, 204)
         else:
             logger.error(f"Discord HTTP {resp.status_code}: {resp.text[:200]}")
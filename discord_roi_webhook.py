@@ -4,7 +4,7 @@ Single canonical source: football_opportunities WHERE mode='PROD'
 """
 
 import os
-import requests
+from http_transport import http_post
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
@@ -269,7 +269,7 @@ def send_discord_stats(custom_message: Optional[str] = None) -> bool:
         if custom_message:
             payload["content"] = custom_message
 
-        response = requests.post(
+        response = http_post(
             DISCORD_WEBHOOK_URL,
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -312,7 +312,7 @@ def send_result_notification(match: str, pick: str, odds: float, result: str, pr
             }]
         }
 
-        response = requests.post(
+        response = http_post(
             DISCORD_WEBHOOK_URL,
             json=payload,
             headers={"Content-Type": "application/json"},
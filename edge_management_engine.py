@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
-import psycopg2
+from db_connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
@@ -112,7 +112,7 @@ class EdgeManagementEngine:
         self.db_url = os.getenv("DATABASE_URL")
 
     def _conn(self):
-        return psycopg2.connect(self.db_url, connect_timeout=10)
+        return DatabaseConnection.checkout('edge_management')
 
     # ── DB setup ────────────────────────────────────────────────────────────────
     def ensure_table(self):
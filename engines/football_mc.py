@@ -4,7 +4,6 @@ Uses Poisson distribution to simulate match outcomes.
 """
 from __future__ import annotations
 
-import uuid
 import time
 import numpy as np
 from typing import Any
@@ -19,11 +18,46 @@ def _ev(model_prob: float, odds: float) -> float:
     return (model_prob * odds) - 1
 
 
+def _opportunities(
+    match_id: str,
+    markets: dict[str, float],
+    simulation_meta: dict[str, Any],
+    odds_map: dict[str, float] | None,
+    ts: int,
+) -> list[dict[str, Any]]:
+    odds_map = odds_map or {}
+    results: list[dict[str, Any]] = []
+
+    for market, model_prob in markets.items():
+        odds = odds_map.get(market, 0.0)
+        if odds < MIN_ODDS:
+            continue
+        ev = _ev(model_prob, odds)
+        if ev < MIN_EV:
+            continue
+
+        results.append({
+            "match_id": match_id,
+            "sport": "football",
+            "market": market,
+            "odds": round(odds, 3),
+            "model_prob": round(model_prob, 4),
+            "ev": round(ev, 4),
+            "edge_score": round(ev * 100, 2),
+            "simulation_meta": simulation_meta,
+            "model_version": MODEL_VERSION,
+            "created_at": ts,
+        })
+
+    return results
+
+
 def run(
     match_id: str,
     home_xg: float,
     away_xg: float,
     odds_map: dict[str, float] | None = None,
+    rng: np.random.Generator | None = None,
 ) -> list[dict[str, Any]]:
     """
     Simulate a football match using Poisson-distributed goals.
@@ -40,63 +74,80 @@ def run(
         Bookmaker odds keyed by market name.
         Supported keys: "over_2_5", "btts_yes", "home_win", "draw", "away_win".
         If not provided, EV is computed against implied odds only.
+    rng : numpy Generator, optional
+        Seeded generator for reproducible results.
 
     Returns
     -------
     list of opportunity dicts — only markets where EV >= MIN_EV and odds >= MIN_ODDS.
     """
-    rng = np.random.default_rng()
-    home_goals = rng.poisson(home_xg, N_SIMS)
-    away_goals = rng.poisson(away_xg, N_SIMS)
-
-    total_goals = home_goals + away_goals
-
-    home_win_prob = float(np.mean(home_goals > away_goals))
-    draw_prob = float(np.mean(home_goals == away_goals))
-    away_win_prob = float(np.mean(away_goals > home_goals))
-    over_25_prob = float(np.mean(total_goals > 2.5))
-    btts_prob = float(np.mean((home_goals > 0) & (away_goals > 0)))
-    avg_total = float(np.mean(total_goals))
+    return run_batch([{
+        "match_id": match_id,
+        "home_xg": home_xg,
+        "away_xg": away_xg,
+        "odds_map": odds_map,
+    }], rng=rng)[0]
+
+
+def run_batch(
+    inputs_list: list[dict[str, Any]],
+    rng: np.random.Generator | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Simulate many football matches in one (n_matches x N_SIMS) array pass.
 
-    simulation_meta = {
-        "n_sims": N_SIMS,
-        "avg_total": round(avg_total, 2),
-        "home_win_prob": round(home_win_prob, 4),
-        "away_win_prob": round(away_win_prob, 4),
-    }
+    Parameters
+    ----------
+    inputs_list : list of dict
+        Each dict holds the keyword arguments of run() (without rng).
+    rng : numpy Generator, optional
+        Shared generator; pass a seeded one for reproducible batches.
 
-    odds_map = odds_map or {}
+    Returns
+    -------
+    One opportunity list per input, in input order.
+    """
+    if not inputs_list:
+        return []
+    rng = rng if rng is not None else np.random.default_rng()
 
-    markets = {
-        "over_2_5": over_25_prob,
-        "btts_yes": btts_prob,
-        "home_win": home_win_prob,
-        "draw": draw_prob,
-        "away_win": away_win_prob,
-    }
+    home_xg = np.array([float(i["home_xg"]) for i in inputs_list])[:, None]
+    away_xg = np.array([float(i["away_xg"]) for i in inputs_list])[:, None]
+    n = len(inputs_list)
 
-    results: list[dict[str, Any]] = []
-    ts = int(time.time())
+    home_goals = rng.poisson(home_xg, (n, N_SIMS))
+    away_goals = rng.poisson(away_xg, (n, N_SIMS))
 
-    for market, model_prob in markets.items():
-        odds = odds_map.get(market, 0.0)
-        if odds < MIN_ODDS:
-            continue
-        ev = _ev(model_prob, odds)
-        if ev < MIN_EV:
-            continue
+    total_goals = home_goals + away_goals
 
-        results.append({
-            "match_id": match_id,
-            "sport": "football",
-            "market": market,
-            "odds": round(odds, 3),
-            "model_prob": round(model_prob, 4),
-            "ev": round(ev, 4),
-            "edge_score": round(ev * 100, 2),
-            "simulation_meta": simulation_meta,
-            "model_version": MODEL_VERSION,
-            "created_at": ts,
-        })
+    home_win_prob = np.mean(home_goals > away_goals, axis=1)
+    draw_prob = np.mean(home_goals == away_goals, axis=1)
+    away_win_prob = np.mean(away_goals > home_goals, axis=1)
+    over_25_prob = np.mean(total_goals > 2.5, axis=1)
+    btts_prob = np.mean((home_goals > 0) & (away_goals > 0), axis=1)
+    avg_total = np.mean(total_goals, axis=1)
 
-    return results
+    ts = int(time.time())
+    batch_results: list[list[dict[str, Any]]] = []
+
+    for idx, inputs in enumerate(inputs_list):
+        simulation_meta = {
+            "n_sims": N_SIMS,
+            "avg_total": round(float(avg_total[idx]), 2),
+            "home_win_prob": round(float(home_win_prob[idx]), 4),
+            "away_win_prob": round(float(away_win_prob[idx]), 4),
+        }
+
+        markets = {
+            "over_2_5": float(over_25_prob[idx]),
+            "btts_yes": float(btts_prob[idx]),
+            "home_win": float(home_win_prob[idx]),
+            "draw": float(draw_prob[idx]),
+            "away_win": float(away_win_prob[idx]),
+        }
+
+        batch_results.append(
+            _opportunities(inputs["match_id"], markets, simulation_meta, inputs.get("odds_map"), ts)
+        )
+
+    return batch_results
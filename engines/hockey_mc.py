@@ -20,57 +20,15 @@ def _ev(model_prob: float, odds: float) -> float:
     return (model_prob * odds) - 1
 
 
-def run(
+def _opportunities(
     match_id: str,
-    home_goals_avg: float,
-    away_goals_avg: float,
-    odds_map: dict[str, float] | None = None,
+    markets: dict[str, float],
+    simulation_meta: dict[str, Any],
+    odds_map: dict[str, float] | None,
+    ts: int,
 ) -> list[dict[str, Any]]:
-    """
-    Simulate an NHL game using Poisson-distributed goals.
-    Tied games go to overtime — winner picked with equal probability (50/50 coin flip).
-
-    Parameters
-    ----------
-    match_id : str
-    home_goals_avg : float   Season average goals scored by home team per game.
-    away_goals_avg : float   Season average goals scored by away team per game.
-    odds_map : dict, optional
-        Supported keys: "home_win", "away_win", "over_5_5".
-    """
-    rng = np.random.default_rng()
-    home_goals = rng.poisson(home_goals_avg, N_SIMS)
-    away_goals = rng.poisson(away_goals_avg, N_SIMS)
-    total_goals = home_goals + away_goals
-
-    draws = home_goals == away_goals
-    ot_winner = rng.integers(0, 2, N_SIMS)  # 0 = home, 1 = away
-
-    home_wins = (home_goals > away_goals) | (draws & (ot_winner == 0))
-    away_wins = ~home_wins
-
-    home_win_prob = float(np.mean(home_wins))
-    away_win_prob = float(np.mean(away_wins))
-    over_55_prob = float(np.mean(total_goals > _OT_LINE))
-    avg_total = float(np.mean(total_goals))
-
-    simulation_meta = {
-        "n_sims": N_SIMS,
-        "avg_total": round(avg_total, 2),
-        "home_win_prob": round(home_win_prob, 4),
-        "away_win_prob": round(away_win_prob, 4),
-    }
-
     odds_map = odds_map or {}
-
-    markets = {
-        "home_win": home_win_prob,
-        "away_win": away_win_prob,
-        "over_5_5": over_55_prob,
-    }
-
     results: list[dict[str, Any]] = []
-    ts = int(time.time())
 
     for market, model_prob in markets.items():
         odds = odds_map.get(market, 0.0)
@@ -94,3 +52,95 @@ def run(
         })
 
     return results
+
+
+def run(
+    match_id: str,
+    home_goals_avg: float,
+    away_goals_avg: float,
+    odds_map: dict[str, float] | None = None,
+    rng: np.random.Generator | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Simulate an NHL game using Poisson-distributed goals.
+    Tied games go to overtime — winner picked with equal probability (50/50 coin flip).
+
+    Parameters
+    ----------
+    match_id : str
+    home_goals_avg : float   Season average goals scored by home team per game.
+    away_goals_avg : float   Season average goals scored by away team per game.
+    odds_map : dict, optional
+        Supported keys: "home_win", "away_win", "over_5_5".
+    rng : numpy Generator, optional   Seeded generator for reproducible results.
+    """
+    return run_batch([{
+        "match_id": match_id,
+        "home_goals_avg": home_goals_avg,
+        "away_goals_avg": away_goals_avg,
+        "odds_map": odds_map,
+    }], rng=rng)[0]
+
+
+def run_batch(
+    inputs_list: list[dict[str, Any]],
+    rng: np.random.Generator | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Simulate many NHL games in one (n_games x N_SIMS) array pass.
+
+    Parameters
+    ----------
+    inputs_list : list of dict
+        Each dict holds the keyword arguments of run() (without rng).
+    rng : numpy Generator, optional
+        Shared generator; pass a seeded one for reproducible batches.
+
+    Returns
+    -------
+    One opportunity list per input, in input order.
+    """
+    if not inputs_list:
+        return []
+    rng = rng if rng is not None else np.random.default_rng()
+
+    home_avg = np.array([float(i["home_goals_avg"]) for i in inputs_list])[:, None]
+    away_avg = np.array([float(i["away_goals_avg"]) for i in inputs_list])[:, None]
+    n = len(inputs_list)
+
+    home_goals = rng.poisson(home_avg, (n, N_SIMS))
+    away_goals = rng.poisson(away_avg, (n, N_SIMS))
+    total_goals = home_goals + away_goals
+
+    draws = home_goals == away_goals
+    ot_winner = rng.integers(0, 2, (n, N_SIMS))  # 0 = home, 1 = away
+
+    home_wins = (home_goals > away_goals) | (draws & (ot_winner == 0))
+
+    home_win_prob = np.mean(home_wins, axis=1)
+    away_win_prob = 1.0 - home_win_prob
+    over_55_prob = np.mean(total_goals > _OT_LINE, axis=1)
+    avg_total = np.mean(total_goals, axis=1)
+
+    ts = int(time.time())
+    batch_results: list[list[dict[str, Any]]] = []
+
+    for idx, inputs in enumerate(inputs_list):
+        simulation_meta = {
+            "n_sims": N_SIMS,
+            "avg_total": round(float(avg_total[idx]), 2),
+            "home_win_prob": round(float(home_win_prob[idx]), 4),
+            "away_win_prob": round(float(away_win_prob[idx]), 4),
+        }
+
+        markets = {
+            "home_win": float(home_win_prob[idx]),
+            "away_win": float(away_win_prob[idx]),
+            "over_5_5": float(over_55_prob[idx]),
+        }
+
+        batch_results.append(
+            _opportunities(inputs["match_id"], markets, simulation_meta, inputs.get("odds_map"), ts)
+        )
+
+    return batch_results
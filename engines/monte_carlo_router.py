@@ -12,11 +12,16 @@ results = run_simulation("football", {
     "away_xg": 1.10,
     "odds_map": {"over_2_5": 2.05, "btts_yes": 1.95, "home_win": 2.30},
 })
+
+# Many fixtures in one vectorized pass (reproducible with a seed)
+batch = run_simulation_batch("football", [inputs_a, inputs_b, ...], seed=42)
 """
 from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from engines import football_mc, hockey_mc, nba_mc, nfl_mc
 
 _SPORT_MAP = {
@@ -29,8 +34,27 @@ _SPORT_MAP = {
 MIN_EV = 0.05
 MIN_ODDS = 1.70
 
+# Fixtures per vectorized chunk — bounds peak memory at roughly
+# BATCH_CHUNK_SIZE x N_SIMS x 8 bytes per intermediate array.
+BATCH_CHUNK_SIZE = 256
+
+
+def _get_engine(sport: str):
+    sport = sport.lower().strip()
+    engine = _SPORT_MAP.get(sport)
+    if engine is None:
+        supported = ", ".join(sorted(_SPORT_MAP.keys()))
+        raise ValueError(
+            f"Unsupported sport: '{sport}'. Supported: {supported}"
+        )
+    return engine
+
 
-def run_simulation(sport: str, inputs: dict[str, Any]) -> list[dict[str, Any]]:
+def run_simulation(
+    sport: str,
+    inputs: dict[str, Any],
+    seed: int | None = None,
+) -> list[dict[str, Any]]:
     """
     Route a simulation request to the correct sport engine.
 
@@ -41,6 +65,8 @@ def run_simulation(sport: str, inputs: dict[str, Any]) -> list[dict[str, Any]]:
     inputs : dict
         Keyword arguments forwarded to the engine's run() function.
         Must include "match_id". See each engine module for full parameter docs.
+    seed : int, optional
+        Seed for the engine's random generator (reproducible results).
 
     Returns
     -------
@@ -68,15 +94,45 @@ def run_simulation(sport: str, inputs: dict[str, Any]) -> list[dict[str, Any]]:
     ------
     ValueError if sport is not supported.
     """
-    sport = sport.lower().strip()
-    engine = _SPORT_MAP.get(sport)
-    if engine is None:
-        supported = ", ".join(sorted(_SPORT_MAP.keys()))
-        raise ValueError(
-            f"Unsupported sport: '{sport}'. Supported: {supported}"
-        )
+    engine = _get_engine(sport)
+    return engine.run(**inputs, rng=np.random.default_rng(seed))
+
+
+def run_simulation_batch(
+    sport: str,
+    inputs_list: list[dict[str, Any]],
+    seed: int | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Simulate many fixtures of one sport in vectorized (fixtures x sims) passes.
+
+    Parameters
+    ----------
+    sport : str
+        One of: "football", "hockey", "nba", "nfl".
+    inputs_list : list of dict
+        One run() kwargs dict per fixture (same keys as run_simulation inputs).
+    seed : int, optional
+        Seed for the shared random generator. The same seed and inputs
+        always produce the same output.
+
+    Returns
+    -------
+    list of opportunity lists, one per fixture in input order, each in the
+    run_simulation output format.
+
+    Raises
+    ------
+    ValueError if sport is not supported.
+    """
+    engine = _get_engine(sport)
+    rng = np.random.default_rng(seed)
 
-    return engine.run(**inputs)
+    results: list[list[dict[str, Any]]] = []
+    for start in range(0, len(inputs_list), BATCH_CHUNK_SIZE):
+        chunk = inputs_list[start:start + BATCH_CHUNK_SIZE]
+        results.extend(engine.run_batch(chunk, rng=rng))
+    return results
 
 
 def supported_sports() -> list[str]:
@@ -21,6 +21,40 @@ def _ev(model_prob: float, odds: float) -> float:
     return (model_prob * odds) - 1
 
 
+def _opportunities(
+    match_id: str,
+    markets: dict[str, float],
+    simulation_meta: dict[str, Any],
+    odds_map: dict[str, float] | None,
+    ts: int,
+) -> list[dict[str, Any]]:
+    odds_map = odds_map or {}
+    results: list[dict[str, Any]] = []
+
+    for market, model_prob in markets.items():
+        odds = odds_map.get(market, 0.0)
+        if odds < MIN_ODDS:
+            continue
+        ev = _ev(model_prob, odds)
+        if ev < MIN_EV:
+            continue
+
+        results.append({
+            "match_id": match_id,
+            "sport": "nba",
+            "market": market,
+            "odds": round(odds, 3),
+            "model_prob": round(model_prob, 4),
+            "ev": round(ev, 4),
+            "edge_score": round(ev * 100, 2),
+            "simulation_meta": simulation_meta,
+            "model_version": MODEL_VERSION,
+            "created_at": ts,
+        })
+
+    return results
+
+
 def run(
     match_id: str,
     home_points_avg: float,
@@ -30,6 +64,7 @@ def run(
     spread: float = -3.5,
     total_line: float = 225.5,
     odds_map: dict[str, float] | None = None,
+    rng: np.random.Generator | None = None,
 ) -> list[dict[str, Any]]:
     """
     Simulate an NBA game using Normal-distributed scoring.
@@ -47,71 +82,96 @@ def run(
         Supported keys: "home_win", "away_win",
                         "over_total", "under_total",
                         "home_spread", "away_spread".
+    rng : numpy Generator, optional   Seeded generator for reproducible results.
     """
-    rng = np.random.default_rng()
-    home_pts = rng.normal(home_points_avg, home_std, N_SIMS)
-    away_pts = rng.normal(away_points_avg, away_std, N_SIMS)
+    return run_batch([{
+        "match_id": match_id,
+        "home_points_avg": home_points_avg,
+        "away_points_avg": away_points_avg,
+        "home_std": home_std,
+        "away_std": away_std,
+        "spread": spread,
+        "total_line": total_line,
+        "odds_map": odds_map,
+    }], rng=rng)[0]
+
+
+def run_batch(
+    inputs_list: list[dict[str, Any]],
+    rng: np.random.Generator | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Simulate many NBA games in one (n_games x N_SIMS) array pass.
+
+    Parameters
+    ----------
+    inputs_list : list of dict
+        Each dict holds the keyword arguments of run() (without rng).
+    rng : numpy Generator, optional
+        Shared generator; pass a seeded one for reproducible batches.
+
+    Returns
+    -------
+    One opportunity list per input, in input order.
+    """
+    if not inputs_list:
+        return []
+    rng = rng if rng is not None else np.random.default_rng()
+
+    def _col(key: str, default: float | None = None) -> np.ndarray:
+        return np.array([
+            float(i[key] if default is None else i.get(key, default)) for i in inputs_list
+        ])[:, None]
+
+    n = len(inputs_list)
+    spread = _col("spread", -3.5)
+    total_line = _col("total_line", 225.5)
+
+    home_pts = rng.normal(_col("home_points_avg"), _col("home_std"), (n, N_SIMS))
+    away_pts = rng.normal(_col("away_points_avg"), _col("away_std"), (n, N_SIMS))
 
     tied = np.abs(home_pts - away_pts) < 0.5
 
-    ot_home = rng.normal(_OT_POINTS, _OT_STD, N_SIMS)
-    ot_away = rng.normal(_OT_POINTS, _OT_STD, N_SIMS)
+    ot_home = rng.normal(_OT_POINTS, _OT_STD, (n, N_SIMS))
+    ot_away = rng.normal(_OT_POINTS, _OT_STD, (n, N_SIMS))
 
     final_home = np.where(tied, home_pts + ot_home, home_pts)
     final_away = np.where(tied, away_pts + ot_away, away_pts)
 
-    home_win_prob = float(np.mean(final_home > final_away))
+    home_win_prob = np.mean(final_home > final_away, axis=1)
     away_win_prob = 1.0 - home_win_prob
 
     total = final_home + final_away
-    avg_total = float(np.mean(total))
+    avg_total = np.mean(total, axis=1)
 
-    over_total_prob = float(np.mean(total > total_line))
+    over_total_prob = np.mean(total > total_line, axis=1)
     under_total_prob = 1.0 - over_total_prob
 
-    home_spread_prob = float(np.mean((final_home + spread) > final_away))
+    home_spread_prob = np.mean((final_home + spread) > final_away, axis=1)
     away_spread_prob = 1.0 - home_spread_prob
 
-    simulation_meta = {
-        "n_sims": N_SIMS,
-        "avg_total": round(avg_total, 1),
-        "home_win_prob": round(home_win_prob, 4),
-        "away_win_prob": round(away_win_prob, 4),
-    }
-
-    odds_map = odds_map or {}
-
-    markets = {
-        "home_win": home_win_prob,
-        "away_win": away_win_prob,
-        "over_total": over_total_prob,
-        "under_total": under_total_prob,
-        "home_spread": home_spread_prob,
-        "away_spread": away_spread_prob,
-    }
-
-    results: list[dict[str, Any]] = []
     ts = int(time.time())
-
-    for market, model_prob in markets.items():
-        odds = odds_map.get(market, 0.0)
-        if odds < MIN_ODDS:
-            continue
-        ev = _ev(model_prob, odds)
-        if ev < MIN_EV:
-            continue
-
-        results.append({
-            "match_id": match_id,
-            "sport": "nba",
-            "market": market,
-            "odds": round(odds, 3),
-            "model_prob": round(model_prob, 4),
-            "ev": round(ev, 4),
-            "edge_score": round(ev * 100, 2),
-            "simulation_meta": simulation_meta,
-            "model_version": MODEL_VERSION,
-            "created_at": ts,
-        })
-
-    return results
+    batch_results: list[list[dict[str, Any]]] = []
+
+    for idx, inputs in enumerate(inputs_list):
+        simulation_meta = {
+            "n_sims": N_SIMS,
+            "avg_total": round(float(avg_total[idx]), 1),
+            "home_win_prob": round(float(home_win_prob[idx]), 4),
+            "away_win_prob": round(float(away_win_prob[idx]), 4),
+        }
+
+        markets = {
+            "home_win": float(home_win_prob[idx]),
+            "away_win": float(away_win_prob[idx]),
+            "over_total": float(over_total_prob[idx]),
+            "under_total": float(under_total_prob[idx]),
+            "home_spread": float(home_spread_prob[idx]),
+            "away_spread": float(away_spread_prob[idx]),
+        }
+
+        batch_results.append(
+            _opportunities(inputs["match_id"], markets, simulation_meta, inputs.get("odds_map"), ts)
+        )
+
+    return batch_results
@@ -22,15 +22,50 @@ def _ev(model_prob: float, odds: float) -> float:
     return (model_prob * odds) - 1
 
 
-def _simulate_score(td_rate: float, fg_rate: float, rng: np.random.Generator) -> np.ndarray:
-    """Simulate N_SIMS final scores for one team."""
-    tds = rng.poisson(td_rate, N_SIMS)
-    fgs = rng.poisson(fg_rate, N_SIMS)
-    noise = rng.normal(0, _TURNOVER_NOISE_STD, N_SIMS)
+def _simulate_score(td_rate: np.ndarray | float, fg_rate: np.ndarray | float,
+                    rng: np.random.Generator, size: tuple[int, ...] = (N_SIMS,)) -> np.ndarray:
+    """Simulate final scores for one team (N_SIMS per row when rates are a column vector)."""
+    tds = rng.poisson(td_rate, size)
+    fgs = rng.poisson(fg_rate, size)
+    noise = rng.normal(0, _TURNOVER_NOISE_STD, size)
     raw = (tds * _TD_PTS) + (fgs * _FG_PTS) + noise
     return np.maximum(raw, 0)
 
 
+def _opportunities(
+    match_id: str,
+    markets: dict[str, float],
+    simulation_meta: dict[str, Any],
+    odds_map: dict[str, float] | None,
+    ts: int,
+) -> list[dict[str, Any]]:
+    odds_map = odds_map or {}
+    results: list[dict[str, Any]] = []
+
+    for market, model_prob in markets.items():
+        odds = odds_map.get(market, 0.0)
+        if odds < MIN_ODDS:
+            continue
+        ev = _ev(model_prob, odds)
+        if ev < MIN_EV:
+            continue
+
+        results.append({
+            "match_id": match_id,
+            "sport": "nfl",
+            "market": market,
+            "odds": round(odds, 3),
+            "model_prob": round(model_prob, 4),
+            "ev": round(ev, 4),
+            "edge_score": round(ev * 100, 2),
+            "simulation_meta": simulation_meta,
+            "model_version": MODEL_VERSION,
+            "created_at": ts,
+        })
+
+    return results
+
+
 def run(
     match_id: str,
     home_td_rate: float,
@@ -40,6 +75,7 @@ def run(
     spread: float = -3.5,
     total_line: float = 45.5,
     odds_map: dict[str, float] | None = None,
+    rng: np.random.Generator | None = None,
 ) -> list[dict[str, Any]]:
     """
     Simulate an NFL game.
@@ -57,63 +93,87 @@ def run(
         Supported keys: "home_win", "away_win",
                         "over_total", "under_total",
                         "home_spread", "away_spread".
+    rng : numpy Generator, optional   Seeded generator for reproducible results.
+    """
+    return run_batch([{
+        "match_id": match_id,
+        "home_td_rate": home_td_rate,
+        "home_fg_rate": home_fg_rate,
+        "away_td_rate": away_td_rate,
+        "away_fg_rate": away_fg_rate,
+        "spread": spread,
+        "total_line": total_line,
+        "odds_map": odds_map,
+    }], rng=rng)[0]
+
+
+def run_batch(
+    inputs_list: list[dict[str, Any]],
+    rng: np.random.Generator | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Simulate many NFL games in one (n_games x N_SIMS) array pass.
+
+    Parameters
+    ----------
+    inputs_list : list of dict
+        Each dict holds the keyword arguments of run() (without rng).
+    rng : numpy Generator, optional
+        Shared generator; pass a seeded one for reproducible batches.
+
+    Returns
+    -------
+    One opportunity list per input, in input order.
     """
-    rng = np.random.default_rng()
+    if not inputs_list:
+        return []
+    rng = rng if rng is not None else np.random.default_rng()
+
+    def _col(key: str, default: float | None = None) -> np.ndarray:
+        return np.array([
+            float(i[key] if default is None else i.get(key, default)) for i in inputs_list
+        ])[:, None]
+
+    size = (len(inputs_list), N_SIMS)
+    spread = _col("spread", -3.5)
+    total_line = _col("total_line", 45.5)
 
-    home_score = _simulate_score(home_td_rate, home_fg_rate, rng)
-    away_score = _simulate_score(away_td_rate, away_fg_rate, rng)
+    home_score = _simulate_score(_col("home_td_rate"), _col("home_fg_rate"), rng, size)
+    away_score = _simulate_score(_col("away_td_rate"), _col("away_fg_rate"), rng, size)
 
-    home_win_prob = float(np.mean(home_score > away_score))
-    away_win_prob = float(np.mean(away_score >= home_score))
+    home_win_prob = np.mean(home_score > away_score, axis=1)
+    away_win_prob = np.mean(away_score >= home_score, axis=1)
 
     total = home_score + away_score
-    avg_total = float(np.mean(total))
-    over_total_prob = float(np.mean(total > total_line))
+    avg_total = np.mean(total, axis=1)
+    over_total_prob = np.mean(total > total_line, axis=1)
     under_total_prob = 1.0 - over_total_prob
 
-    home_spread_prob = float(np.mean((home_score + spread) > away_score))
+    home_spread_prob = np.mean((home_score + spread) > away_score, axis=1)
     away_spread_prob = 1.0 - home_spread_prob
 
-    simulation_meta = {
-        "n_sims": N_SIMS,
-        "avg_total": round(avg_total, 1),
-        "home_win_prob": round(home_win_prob, 4),
-        "away_win_prob": round(away_win_prob, 4),
-    }
-
-    odds_map = odds_map or {}
-
-    markets = {
-        "home_win": home_win_prob,
-        "away_win": away_win_prob,
-        "over_total": over_total_prob,
-        "under_total": under_total_prob,
-        "home_spread": home_spread_prob,
-        "away_spread": away_spread_prob,
-    }
-
-    results: list[dict[str, Any]] = []
     ts = int(time.time())
-
-    for market, model_prob in markets.items():
-        odds = odds_map.get(market, 0.0)
-        if odds < MIN_ODDS:
-            continue
-        ev = _ev(model_prob, odds)
-        if ev < MIN_EV:
-            continue
-
-        results.append({
-            "match_id": match_id,
-            "sport": "nfl",
-            "market": market,
-            "odds": round(odds, 3),
-            "model_prob": round(model_prob, 4),
-            "ev": round(ev, 4),
-            "edge_score": round(ev * 100, 2),
-            "simulation_meta": simulation_meta,
-            "model_version": MODEL_VERSION,
-            "created_at": ts,
-        })
-
-    return results
+    batch_results: list[list[dict[str, Any]]] = []
+
+    for idx, inputs in enumerate(inputs_list):
+        simulation_meta = {
+            "n_sims": N_SIMS,
+            "avg_total": round(float(avg_total[idx]), 1),
+            "home_win_prob": round(float(home_win_prob[idx]), 4),
+            "away_win_prob": round(float(away_win_prob[idx]), 4),
+        }
+
+        markets = {
+            "home_win": float(home_win_prob[idx]),
+            "away_win": float(away_win_prob[idx]),
+            "over_total": float(over_total_prob[idx]),
+            "under_total": float(under_total_prob[idx]),
+            "home_spread": float(home_spread_prob[idx]),
+            "away_spread": float(away_spread_prob[idx]),
+        }
+
+        batch_results.append(
+            _opportunities(inputs["match_id"], markets, simulation_meta, inputs.get("odds_map"), ts)
+        )
+
+    return batch_results
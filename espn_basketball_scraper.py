@@ -8,7 +8,8 @@ import logging
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from difflib import SequenceMatcher
+
+from team_resolver import ratio
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -172,8 +173,7 @@ class ESPNBasketballScraper:
         if name1 in name2 or name2 in name1:
             return True
         
-        ratio = SequenceMatcher(None, name1, name2).ratio()
-        return ratio >= threshold
+        return ratio(name1, name2) >= threshold
     
     def get_game_result(self, match_string: str) -> Optional[Tuple[int, int, str, str]]:
         """
@@ -130,10 +130,10 @@ class ManualResultsManager:
         operator: str = 'system'
     ) -> bool:
         """Add a manual result entry."""
-        import psycopg2
+        from db_connection import DatabaseConnection
         
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('flashscore_stats')
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -159,11 +159,11 @@ class ManualResultsManager:
     
     def get_manual_result(self, bet_id: int, bet_table: str) -> Optional[Dict]:
         """Check if there's a manual result for a bet."""
-        import psycopg2
+        from db_connection import DatabaseConnection
         from psycopg2.extras import RealDictCursor
         
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('flashscore_stats')
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cursor.execute("""
@@ -184,11 +184,11 @@ class ManualResultsManager:
     
     def get_pending_manual_review(self, market: str = None, limit: int = 50) -> list:
         """Get bets that need manual review."""
-        import psycopg2
+        from db_connection import DatabaseConnection
         from psycopg2.extras import RealDictCursor
         
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('flashscore_stats')
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             query = """
@@ -236,11 +236,11 @@ class VerificationMetrics:
         attempt_number: int = 1
     ):
         """Log a verification attempt."""
-        import psycopg2
+        from db_connection import DatabaseConnection
         import json
         
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('flashscore_stats')
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -259,11 +259,11 @@ class VerificationMetrics:
     
     def get_success_rates(self, days: int = 7) -> Dict:
         """Get verification success rates by market and source."""
-        import psycopg2
+        from db_connection import DatabaseConnection
         from psycopg2.extras import RealDictCursor
         
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('flashscore_stats')
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cursor.execute("""
@@ -305,12 +305,10 @@ def settle_bet_manually(bet_id: int, result: str, corners: Tuple[int, int] = Non
         reason: Reason for manual settlement
         operator: Who performed the settlement
     """
-    import psycopg2
-    
-    database_url = os.environ.get("DATABASE_URL") or os.environ.get("POSTGRES_URL")
+    from db_connection import DatabaseConnection
     
     try:
-        conn = psycopg2.connect(database_url)
+        conn = DatabaseConnection.checkout('flashscore_stats')
         cursor = conn.cursor()
         
         cursor.execute("""
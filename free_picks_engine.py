@@ -8,8 +8,8 @@ import json
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
-import psycopg2
 from psycopg2.extras import RealDictCursor
+from db_connection import DatabaseConnection
 
 DISCORD_FREE_PICKS_WEBHOOK_URL = os.getenv("DISCORD_FREE_PICKS_WEBHOOK_URL")
 
@@ -35,21 +35,8 @@ MIN_CONFIDENCE = 0.60
 
 
 def get_db_connection():
-    """Get database connection."""
-    import time
-    for attempt in range(3):
-        try:
-            conn = psycopg2.connect(
-                os.getenv('DATABASE_URL'),
-                connect_timeout=10,
-                options='-c statement_timeout=30000'
-            )
-            return conn
-        except Exception as e:
-            if attempt < 2:
-                time.sleep(2)
-            else:
-                raise e
+    """Get a pooled database connection (close() returns it to the pool)."""
+    return DatabaseConnection.checkout('free_picks', statement_timeout_ms=30000)
 
 
 def ensure_free_pick_sent_column():
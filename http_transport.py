@@ -0,0 +1,335 @@
+"""
+Shared HTTP Transport
+Pooled keep-alive sessions for every outbound data provider.
+
+- One requests.Session per host, so repeated calls reuse TCP/TLS connections
+- Per-provider concurrency caps and request-rate limits
+- Retries with exponential backoff + jitter (idempotent requests by default)
+- Latency / status metrics per provider (get_http_stats)
+- Async variant (async_request / gather_requests) for fan-out over httpx
+
+Usage:
+    from http_transport import http_get, http_post
+
+    resp = http_get(url, params=params, timeout=10)   # drop-in for requests.get
+    resp = http_post(webhook_url, json=payload, timeout=5)
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderConfig:
+    """Limits for one upstream provider."""
+    name: str
+    max_concurrency: int = 8
+    max_per_second: Optional[float] = None   # None = no rate limit
+    retries: int = 2                         # extra attempts for idempotent requests
+    backoff_base: float = 0.5                # seconds, doubled per attempt (+ jitter)
+
+
+# Host suffix → provider. Anything unlisted uses the "default" provider.
+PROVIDER_HOSTS = {
+    "api-sports.io": "api_football",
+    "the-odds-api.com": "odds_api",
+    "sofascore.com": "sofascore",
+    "discord.com": "discord",
+    "discordapp.com": "discord",
+    "api.telegram.org": "telegram",
+    "nba.com": "nba",
+    "espn.com": "espn",
+}
+
+# Quota-metered APIs don't auto-retry: every upstream attempt must go through
+# APICacheManager's quota accounting.
+PROVIDERS: Dict[str, ProviderConfig] = {
+    "api_football": ProviderConfig("api_football", max_concurrency=4, retries=0),
+    "odds_api": ProviderConfig("odds_api", max_concurrency=4, retries=0),
+    "sofascore": ProviderConfig("sofascore", max_concurrency=2, max_per_second=2.0),
+    "discord": ProviderConfig("discord", max_concurrency=2, max_per_second=5.0),
+    "telegram": ProviderConfig("telegram", max_concurrency=2, max_per_second=20.0),
+    "nba": ProviderConfig("nba", max_concurrency=2, max_per_second=1.0),
+    "espn": ProviderConfig("espn", max_concurrency=4),
+    "default": ProviderConfig("default", max_concurrency=8),
+}
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+POOL_MAXSIZE = 16
+LATENCY_WINDOW = 500  # recent samples kept per provider for percentiles
+
+
+class _ProviderState:
+    def __init__(self, config: ProviderConfig):
+        self.config = config
+        self.semaphore = threading.BoundedSemaphore(config.max_concurrency)
+        self.rate_lock = threading.Lock()
+        self.next_slot = 0.0
+        self.stats_lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_counts: Dict[int, int] = {}
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+    def wait_for_rate_slot(self) -> float:
+        """Reserve the next start slot under max_per_second; returns seconds to sleep."""
+        rate = self.config.max_per_second
+        if not rate:
+            return 0.0
+        with self.rate_lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + 1.0 / rate
+            return slot - now
+
+    def record(self, latency: float, status: Optional[int], error: bool) -> None:
+        with self.stats_lock:
+            self.requests += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.latencies.append(latency)
+            if error:
+                self.errors += 1
+            if status is not None:
+                self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_provider_states: Dict[str, _ProviderState] = {}
+_provider_lock = threading.Lock()
+
+
+def provider_for_url(url: str) -> str:
+    """Map a URL to its provider name via PROVIDER_HOSTS."""
+    host = (urlparse(url).hostname or "").lower()
+    for suffix, provider in PROVIDER_HOSTS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return provider
+    return "default"
+
+
+def configure_provider(name: str, **overrides) -> None:
+    """Override limits for a provider (e.g. configure_provider('odds_api', max_concurrency=8))."""
+    with _provider_lock:
+        base = PROVIDERS.get(name, ProviderConfig(name))
+        PROVIDERS[name] = ProviderConfig(**{**base.__dict__, **overrides, "name": name})
+        _provider_states.pop(name, None)
+
+
+def _get_state(provider: str) -> _ProviderState:
+    with _provider_lock:
+        state = _provider_states.get(provider)
+        if state is None:
+            config = PROVIDERS.get(provider) or PROVIDERS["default"]
+            state = _provider_states[provider] = _ProviderState(config)
+        return state
+
+
+def get_session(url: str) -> requests.Session:
+    """Keep-alive session shared by every caller talking to the URL's host."""
+    parsed = urlparse(url)
+    host_key = f"{parsed.scheme}://{parsed.netloc}".lower()
+    with _sessions_lock:
+        session = _sessions.get(host_key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host_key] = session
+        return session
+
+
+def _backoff(config: ProviderConfig, attempt: int, response: Optional[requests.Response] = None) -> float:
+    """Exponential backoff with full jitter; honours Retry-After when present."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), 30.0)
+            except ValueError:
+                pass
+    return random.uniform(0, config.backoff_base * (2 ** attempt))
+
+
+def http_request(method: str, url: str, retries: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    Send a request through the pooled session for url's host.
+
+    Args:
+        method: HTTP method
+        url: Absolute URL
+        retries: Extra attempts on connection errors / 429 / 5xx. Defaults to the
+            provider's setting for idempotent methods and 0 otherwise.
+        **kwargs: Passed to requests.Session.request (params, json, headers, timeout...)
+
+    Returns:
+        The final requests.Response (callers check status_code as before)
+
+    Raises:
+        requests.RequestException when every attempt fails at the transport level
+    """
+    method = method.upper()
+    provider = provider_for_url(url)
+    state = _get_state(provider)
+    config = state.config
+    if retries is None:
+        retries = config.retries if method in IDEMPOTENT_METHODS else 0
+    kwargs.setdefault("timeout", 15)
+    session = get_session(url)
+
+    attempt = 0
+    while True:
+        delay = state.wait_for_rate_slot()
+        if delay > 0:
+            time.sleep(delay)
+
+        started = time.perf_counter()
+        response = None
+        try:
+            with state.semaphore:
+                response = session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            state.record(time.perf_counter() - started, None, error=True)
+            if attempt >= retries:
+                raise
+            logger.debug(f"🔁 {provider} {method} retry {attempt + 1}/{retries} after {type(e).__name__}")
+        else:
+            failed = response.status_code in RETRY_STATUS_CODES
+            state.record(time.perf_counter() - started, response.status_code, error=failed)
+            if not failed or attempt >= retries:
+                return response
+            logger.debug(f"🔁 {provider} {method} retry {attempt + 1}/{retries} after HTTP {response.status_code}")
+
+        with state.stats_lock:
+            state.retries += 1
+        time.sleep(_backoff(config, attempt, response))
+        attempt += 1
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """Pooled drop-in for requests.get."""
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """Pooled drop-in for requests.post (no automatic retries unless retries= is given)."""
+    return http_request("POST", url, **kwargs)
+
+
+# ── Async fan-out ────────────────────────────────────────────────────────────
+
+async def async_request(client, method: str, url: str, retries: Optional[int] = None,
+                        semaphores: Optional[Dict[str, asyncio.Semaphore]] = None, **kwargs):
+    """
+    Async counterpart of http_request on a shared httpx.AsyncClient.
+    Same provider concurrency caps (per event loop), rate limits, retries and metrics.
+    """
+    import httpx
+
+    method = method.upper()
+    provider = provider_for_url(url)
+    state = _get_state(provider)
+    config = state.config
+    if retries is None:
+        retries = config.retries if method in IDEMPOTENT_METHODS else 0
+    if semaphores is None:
+        semaphores = {}
+    semaphore = semaphores.setdefault(provider, asyncio.Semaphore(config.max_concurrency))
+
+    attempt = 0
+    while True:
+        delay = state.wait_for_rate_slot()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        started = time.perf_counter()
+        response = None
+        try:
+            async with semaphore:
+                response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            state.record(time.perf_counter() - started, None, error=True)
+            if attempt >= retries:
+                raise
+        else:
+            failed = response.status_code in RETRY_STATUS_CODES
+            state.record(time.perf_counter() - started, response.status_code, error=failed)
+            if not failed or attempt >= retries:
+                return response
+
+        with state.stats_lock:
+            state.retries += 1
+        await asyncio.sleep(_backoff(config, attempt, response))
+        attempt += 1
+
+
+async def _gather(specs: List[Dict[str, Any]], timeout: float) -> List[Any]:
+    import httpx
+
+    limits = httpx.Limits(max_keepalive_connections=POOL_MAXSIZE, max_connections=POOL_MAXSIZE * 4)
+    semaphores: Dict[str, asyncio.Semaphore] = {}
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        tasks = [
+            async_request(client, spec.get("method", "GET"), spec["url"], semaphores=semaphores,
+                          **{k: v for k, v in spec.items() if k not in ("method", "url")})
+            for spec in specs
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def gather_requests(specs: List[Dict[str, Any]], timeout: float = 15) -> List[Any]:
+    """
+    Run many requests concurrently from synchronous code.
+
+    Args:
+        specs: [{"url": ..., "method": "GET", "params": {...}, "headers": {...}}, ...]
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        httpx.Response or the raised exception for each spec, in input order
+    """
+    if not specs:
+        return []
+    return asyncio.run(_gather(specs, timeout))
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────────
+
+def get_http_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-provider request counts, errors, retries and latency (ms)."""
+    with _provider_lock:
+        states = dict(_provider_states)
+
+    stats = {}
+    for provider, state in states.items():
+        with state.stats_lock:
+            samples = sorted(state.latencies)
+            count = state.requests
+            stats[provider] = {
+                "requests": count,
+                "errors": state.errors,
+                "retries": state.retries,
+                "status_counts": dict(state.status_counts),
+                "avg_ms": round(state.total_latency / count * 1000, 1) if count else 0.0,
+                "p95_ms": round(samples[int(0.95 * (len(samples) - 1))] * 1000, 1) if samples else 0.0,
+                "max_ms": round(state.max_latency * 1000, 1),
+            }
+    return stats
@@ -12,13 +12,14 @@ from typing import Optional, List, Dict, Tuple
 from datetime import datetime, date
 import psycopg2
 import psycopg2.extras
+from db_connection import DatabaseConnection
 
 
 def get_db_connection():
     db_url = os.getenv("DATABASE_URL")
     if not db_url:
         raise RuntimeError("DATABASE_URL saknas i environment vars.")
-    return psycopg2.connect(db_url)
+    return DatabaseConnection.checkout('learn_from_history')
 
 
 @dataclass
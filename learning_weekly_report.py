@@ -7,8 +7,8 @@ Runs every Sunday alongside the weekly recap.
 import os
 import logging
 import requests
-import psycopg2
 from psycopg2.extras import RealDictCursor
+from db_connection import DatabaseConnection
 from datetime import datetime, timedelta, date
 
 logger = logging.getLogger(__name__)
@@ -43,7 +43,7 @@ BASKETBALL_MARKETS = {
 def _get_db():
     if not DATABASE_URL:
         return None
-    return psycopg2.connect(DATABASE_URL)
+    return DatabaseConnection.checkout('learning_weekly_report')
 
 
 def _query_market_stats(cursor, market_filter, table='football_opportunities', 
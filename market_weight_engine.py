@@ -184,14 +184,14 @@ class MarketWeightEngine:
     def _query_market_stats(self, market_key: str) -> Optional[MarketStats]:
         """Query database for market statistics."""
         try:
-            import psycopg2
             from psycopg2.extras import RealDictCursor
+            from db_connection import DatabaseConnection
             
             database_url = os.environ.get("DATABASE_URL")
             if not database_url:
                 return None
             
-            conn = psycopg2.connect(database_url)
+            conn = DatabaseConnection.checkout('market_weight_engine')
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cutoff_date = datetime.now() - timedelta(days=self.config.rolling_window_days)
@@ -241,8 +241,8 @@ class MarketWeightEngine:
     def _query_group_stats(self, market_group: str) -> Optional[MarketStats]:
         """Query database for aggregated group statistics."""
         try:
-            import psycopg2
             from psycopg2.extras import RealDictCursor
+            from db_connection import DatabaseConnection
             
             database_url = os.environ.get("DATABASE_URL")
             if not database_url:
@@ -252,7 +252,7 @@ class MarketWeightEngine:
             if not group_markets:
                 return None
             
-            conn = psycopg2.connect(database_url)
+            conn = DatabaseConnection.checkout('market_weight_engine')
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cutoff_date = datetime.now() - timedelta(days=self.config.rolling_window_days)
@@ -13,6 +13,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
 
+from . import system_engine
+
 # =========================
 # CONFIG (change these)
 # =========================
@@ -217,6 +219,8 @@ class SystemGenerateIn(BaseModel):
     include_draws_policy: Literal["high", "normal", "low"] = "high"
     min_outcome_prob: float = Field(0.10, ge=0.01, le=0.30)
     alpha_public_bias: float = Field(0.25, ge=0.0, le=0.7)  # bias away from popular outcomes
+    # exact hit-tier probabilities (0.5-2 s for large systems; also via /hit_distribution)
+    evaluate: bool = False
 
 
 class SettleIn(BaseModel):
@@ -576,76 +580,33 @@ def generate_system(
     target_rows = payload.target_rows
     candidate_count = min(max(target_rows * 50, 5000), 200000)
 
-    candidates = {}
     alpha = payload.alpha_public_bias
-
-    for _ in range(candidate_count):
-        row_chars: List[str] = []
-        for no in range(1, 14):
-            choices = allowed[no]
-            # build weights
-            weights = []
-            for o in choices:
-                mp = probs_by_no[no][o]  # type: ignore[index]
-                pub = public_prob_for_outcome(matches_by_no[no], o)
-                weights.append(outcome_weight(mp, pub, alpha))
-            # random.choices supports weights
-            chosen: Outcome = random.choices(choices, weights=weights, k=1)[0]  # type: ignore[assignment]
-            row_chars.append(chosen)
-        row = "".join(row_chars)
-        candidates[row] = 1  # dedupe
-
-    candidate_rows = list(candidates.keys())
-
-    # score candidates by row_prob and a small diversity bonus via Hamming distance later
-    # For speed: take top by row_prob first
-    scored: List[Tuple[str, float]] = []
-    for row in candidate_rows:
-        rp = row_prob_product(probs_by_no, row)
-        scored.append((row, rp))
-    scored.sort(key=lambda t: t[1], reverse=True)
-
-    # take a manageable pool for greedy selection
-    pool = scored[: min(len(scored), max(target_rows * 10, 2000))]
-
-    selected: List[str] = []
-    selected_set = set()
-
-    def min_hamming(row: str, others: List[str]) -> int:
-        if not others:
-            return 13
-        best = 13
-        for r in others[-100:]:  # only compare last 100 for speed
-            d = sum(1 for i in range(13) if row[i] != r[i])
-            if d < best:
-                best = d
-        return best
-
-    for row, rp in pool:
-        if row in selected_set:
-            continue
-        # prefer diversity: require a minimum distance for early picks
-        if len(selected) < target_rows:
-            md = min_hamming(row, selected)
-            if len(selected) < 30 and md < 4:
-                continue
-            if len(selected) < 200 and md < 3:
-                continue
-        selected.append(row)
-        selected_set.add(row)
-        if len(selected) >= target_rows:
-            break
-
-    # if we still don't have enough, fill with best remaining
-    if len(selected) < target_rows:
-        for row, _rp in pool:
-            if row not in selected_set:
-                selected.append(row)
-                selected_set.add(row)
-                if len(selected) >= target_rows:
-                    break
-
-    final_rows = selected[:target_rows]
+    pool_size = max(target_rows * 10, 2000)
+
+    # weights[match, outcome] = model prob biased away from the public
+    weights = system_engine.outcome_matrix({
+        no: {
+            o: outcome_weight(probs_by_no[no][o], public_prob_for_outcome(matches_by_no[no], o), alpha)  # type: ignore[index]
+            for o in system_engine.OUTCOMES
+        }
+        for no in range(1, 14)
+    })
+
+    # Exact enumeration when the full system fits in the candidate budget, otherwise
+    # weighted sampling; top pool by row_prob, then Hamming-diverse greedy pick
+    # against all selected rows
+    system_rows = system_engine.build_system(
+        allowed,
+        system_engine.outcome_matrix(probs_by_no),  # type: ignore[arg-type]
+        weights,
+        target_rows=target_rows,
+        candidate_count=candidate_count,
+        pool_size=pool_size,
+    )
+    final_rows = system_engine.decode_rows(system_rows)
+    evaluation = None
+    if payload.evaluate:
+        evaluation = system_engine.evaluate_system(system_rows, system_engine.outcome_matrix(probs_by_no))  # type: ignore[arg-type]
 
     # store system
     system = StrykSystem(
@@ -663,6 +624,10 @@ def generate_system(
             "alpha_public_bias": alpha,
             "min_outcome_prob": payload.min_outcome_prob,
             "include_draws_policy": payload.include_draws_policy,
+            **({
+                "hit_probabilities": evaluation["tiers"],
+                "expected_best": evaluation["expected_best"],
+            } if evaluation else {}),
         },
         system_summary=f"jackpot_aggressive reduced {len(final_rows)} rows | spikes={spik_count} half={half_count} full={full_count} | theoretical={theoretical_rows}"
     )
@@ -696,10 +661,45 @@ def generate_system(
         "half_guards": system.half_count,
         "full_guards": system.full_count,
         "theoretical_rows": theoretical_rows,
+        "hit_probabilities": evaluation["tiers"] if evaluation else None,
         "summary": system.system_summary,
     }
 
 
+@router.get("/coupons/{coupon_id}/systems/{system_id}/hit_distribution")
+def system_hit_distribution(
+    coupon_id: int,
+    system_id: int,
+    db: Session = Depends(get_db),
+    x_admin_secret: Optional[str] = Header(default=None),
+):
+    require_admin(x_admin_secret)
+
+    system = db.get(StrykSystem, system_id)
+    if not system or system.coupon_id != coupon_id:
+        raise HTTPException(404, "System not found for coupon")
+
+    probs = (
+        db.query(StrykProb, StrykMatch.match_no)
+        .join(StrykMatch, StrykProb.match_id == StrykMatch.id)
+        .filter(StrykProb.coupon_id == coupon_id)
+        .all()
+    )
+    if len(probs) != 13:
+        raise HTTPException(400, "Run /predict first so we have p1/px/p2 for all matches")
+    probs_by_no = {match_no: {"1": prob.p1, "X": prob.px, "2": prob.p2} for prob, match_no in probs}
+
+    rows = db.query(StrykRow).filter(StrykRow.system_id == system_id).order_by(StrykRow.row_no).all()
+    if not rows:
+        raise HTTPException(400, "No rows stored for this system")
+
+    evaluation = system_engine.evaluate_system(
+        system_engine.encode_rows([r.row_string for r in rows]),
+        system_engine.outcome_matrix(probs_by_no),
+    )
+    return {"coupon_id": coupon_id, "system_id": system_id, **evaluation}
+
+
 @router.post("/coupons/{coupon_id}/settle")
 def settle_coupon(
     coupon_id: int,
@@ -0,0 +1,313 @@
+"""
+Vectorized row engine for Stryktipset reduced systems.
+
+Rows are (n, 13) arrays of outcome indices (0="1", 1="X", 2="2"), keyed by their
+base-3 code for dedupe and packed into 39-bit one-hot masks so the Hamming
+distance between two rows is popcount(a ^ b) // 2.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+OUTCOMES = ("1", "X", "2")
+OUTCOME_INDEX = {o: i for i, o in enumerate(OUTCOMES)}
+N_MATCHES = 13
+
+_BIT_OFFSETS = 3 * np.arange(N_MATCHES, dtype=np.uint64)
+
+# Early picks must differ from every already selected row in at least this many
+# matches: (selected so far below, minimum distance)
+DIVERSITY_RULES = ((30, 4), (200, 3))
+
+
+# =========================
+# Encoding
+# =========================
+
+def encode_rows(rows: Sequence[str]) -> np.ndarray:
+    """Row strings -> (n, 13) uint8 outcome indices."""
+    lookup = np.zeros(128, dtype=np.uint8)
+    for o, i in OUTCOME_INDEX.items():
+        lookup[ord(o)] = i
+    raw = np.frombuffer("".join(rows).encode("ascii"), dtype=np.uint8)
+    return lookup[raw].reshape(-1, N_MATCHES)
+
+
+def decode_rows(rows: np.ndarray) -> List[str]:
+    """(n, 13) outcome indices -> row strings."""
+    chars = np.array([ord(o) for o in OUTCOMES], dtype=np.uint8)[rows]
+    return [bytes(r).decode("ascii") for r in chars]
+
+
+def row_codes(rows: np.ndarray) -> np.ndarray:
+    """Base-3 integer per row (unique per row, < 3**13); also works on a block of matches."""
+    return rows.astype(np.int64) @ (3 ** np.arange(rows.shape[1] - 1, -1, -1, dtype=np.int64))
+
+
+def row_masks(rows: np.ndarray) -> np.ndarray:
+    """39-bit one-hot mask per row: bit 3*match + outcome."""
+    bits = np.left_shift(np.uint64(1), _BIT_OFFSETS + rows.astype(np.uint64))
+    return np.bitwise_or.reduce(bits, axis=1)
+
+
+def hamming_to(masks: np.ndarray, mask: np.uint64) -> np.ndarray:
+    """Hamming distance from every row in masks to one row."""
+    return (np.bitwise_count(masks ^ mask) // 2).astype(np.int8)
+
+
+# =========================
+# Candidates
+# =========================
+
+def outcome_matrix(values_by_no: Dict[int, Dict[str, float]]) -> np.ndarray:
+    """{match_no: {"1": v, "X": v, "2": v}} -> (13, 3) array."""
+    return np.array(
+        [[values_by_no[no][o] for o in OUTCOMES] for no in range(1, N_MATCHES + 1)],
+        dtype=np.float64,
+    )
+
+
+def enumerate_rows(allowed: Dict[int, List[str]]) -> np.ndarray:
+    """Every row of the full system (product of allowed outcomes), as (n, 13)."""
+    axes = [np.array([OUTCOME_INDEX[o] for o in allowed[no]], dtype=np.uint8)
+            for no in range(1, N_MATCHES + 1)]
+    grids = np.meshgrid(*axes, indexing="ij")
+    return np.stack([g.ravel() for g in grids], axis=1)
+
+
+def sample_rows(
+    allowed: Dict[int, List[str]],
+    weights: np.ndarray,
+    n: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    n rows drawn independently per match from the allowed outcomes, weighted by
+    weights[match, outcome]. Duplicates are dropped (first occurrence order kept).
+    """
+    rows = np.empty((n, N_MATCHES), dtype=np.uint8)
+    for col, no in enumerate(range(1, N_MATCHES + 1)):
+        choices = np.array([OUTCOME_INDEX[o] for o in allowed[no]], dtype=np.uint8)
+        w = weights[col, choices]
+        if len(choices) == 1:
+            rows[:, col] = choices[0]
+        else:
+            rows[:, col] = rng.choice(choices, size=n, p=w / w.sum())
+    _, first = np.unique(row_codes(rows), return_index=True)
+    return rows[np.sort(first)]
+
+
+def log_row_probs(rows: np.ndarray, probs: np.ndarray) -> np.ndarray:
+    """Sum of log outcome probabilities per row (log of the row_prob product)."""
+    logp = np.log(np.clip(probs, 1e-300, None))
+    return logp[np.arange(N_MATCHES), rows].sum(axis=1)
+
+
+# =========================
+# Diverse selection
+# =========================
+
+def select_diverse(
+    pool: np.ndarray,
+    target_rows: int,
+    rules: Sequence[tuple] = DIVERSITY_RULES,
+) -> np.ndarray:
+    """
+    Greedy pick from pool (already in preference order): while fewer than a rule's
+    count are selected, a row must be at least that rule's distance from EVERY
+    selected row. Then the remaining pool rows follow in order, and rows skipped
+    for diversity fill up to target_rows. Returns pool indices.
+    """
+    n = len(pool)
+    if n == 0 or target_rows <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    masks = row_masks(pool)
+    min_dist = np.full(n, N_MATCHES, dtype=np.int8)   # distance to nearest selected row
+    taken = np.zeros(n, dtype=bool)
+    selected: List[int] = []
+    guarded = max((count for count, _ in rules), default=0)
+
+    cursor = 0
+    while cursor < n and len(selected) < min(target_rows, guarded):
+        required = next((dist for count, dist in rules if len(selected) < count), 0)
+        ok = np.flatnonzero(min_dist[cursor:] >= required)
+        if len(ok) == 0:
+            cursor = n
+            break
+        pick = cursor + int(ok[0])
+        selected.append(pick)
+        taken[pick] = True
+        np.minimum(min_dist, hamming_to(masks, masks[pick]), out=min_dist)
+        cursor = pick + 1
+
+    picks = np.array(selected, dtype=np.int64)
+    need = target_rows - len(picks)
+    if need > 0 and cursor < n:
+        rest = np.arange(cursor, min(n, cursor + need), dtype=np.int64)
+        taken[rest] = True
+        picks = np.concatenate([picks, rest])
+        need -= len(rest)
+    if need > 0:
+        skipped = np.flatnonzero(~taken)[:need]
+        picks = np.concatenate([picks, skipped])
+    return picks
+
+
+def build_system(
+    allowed: Dict[int, List[str]],
+    probs: np.ndarray,
+    weights: np.ndarray,
+    target_rows: int,
+    candidate_count: int,
+    pool_size: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Reduced system rows (n, 13): candidates (exact enumeration when the full
+    system is no larger than candidate_count, weighted sampling otherwise),
+    top pool_size by row probability, then diverse greedy selection.
+    """
+    theoretical_rows = 1
+    for no in range(1, N_MATCHES + 1):
+        theoretical_rows *= len(allowed[no])
+
+    if theoretical_rows <= candidate_count:
+        candidates = enumerate_rows(allowed)
+    else:
+        candidates = sample_rows(allowed, weights, candidate_count, rng or np.random.default_rng())
+
+    order = np.argsort(-log_row_probs(candidates, probs), kind="stable")
+    pool = candidates[order[:pool_size]]
+    return pool[select_diverse(pool, target_rows)]
+
+
+# =========================
+# Exact evaluation
+# =========================
+
+PRIZE_TIERS = (10, 11, 12, 13)
+_SPLIT = 6   # matches 1..6 | 7..13 for the meet-in-the-middle best-row distribution
+
+
+def _one_hot(rows: np.ndarray) -> np.ndarray:
+    """(n, k) outcome indices -> (n, 3k) float32 one-hot."""
+    n, k = rows.shape
+    out = np.zeros((n, 3 * k), dtype=np.float32)
+    out[np.arange(n)[:, None], 3 * np.arange(k) + rows] = 1.0
+    return out
+
+
+def _half_outcomes(probs: np.ndarray) -> tuple:
+    """Every outcome combination for the given matches and its probability."""
+    k = len(probs)
+    grids = np.meshgrid(*([np.arange(3, dtype=np.uint8)] * k), indexing="ij")
+    combos = np.stack([g.ravel() for g in grids], axis=1)
+    p = np.prod(probs[np.arange(k), combos], axis=1)
+    return combos, p
+
+
+def _collapse(hits: np.ndarray, p: np.ndarray) -> tuple:
+    """Merge outcome combinations that give every row group the same hit counts."""
+    unique, inverse = np.unique(hits, axis=0, return_inverse=True)
+    return unique, np.bincount(inverse.ravel(), weights=p, minlength=len(unique))
+
+
+def row_hit_distributions(rows: np.ndarray, probs: np.ndarray) -> np.ndarray:
+    """
+    (n, 14): P(row has exactly k correct) for every row, by DP over the 13 matches
+    (Poisson-binomial on each row's per-match hit probabilities).
+    """
+    hit_p = probs[np.arange(N_MATCHES), rows]            # (n, 13)
+    dist = np.zeros((len(rows), N_MATCHES + 1))
+    dist[:, 0] = 1.0
+    for m in range(N_MATCHES):
+        p = hit_p[:, m:m + 1]
+        shifted = dist[:, :-1] * p
+        dist *= 1.0 - p
+        dist[:, 1:] += shifted
+    return dist
+
+
+def best_hit_distribution(rows: np.ndarray, probs: np.ndarray, chunk: int = 64) -> np.ndarray:
+    """
+    (14,): P(the system's best row has exactly k correct), exact.
+
+    Outcomes of matches 1..6 and 7..13 are enumerated separately (729 x 2187 instead
+    of 3**13); rows are grouped by their first-half pattern, and outcome halves that
+    give identical hit counts per group are merged before the halves are combined.
+    """
+    first, second = rows[:, :_SPLIT], rows[:, _SPLIT:]
+    _, group_first_idx, group_of_row = np.unique(row_codes(first), return_index=True, return_inverse=True)
+    group_of_row = group_of_row.ravel()
+    n_groups = len(group_first_idx)
+
+    a_out, a_p = _half_outcomes(probs[:_SPLIT])
+    b_out, b_p = _half_outcomes(probs[_SPLIT:])
+
+    # hits on the first half per row group, on the second half per row
+    hits_a = (_one_hot(a_out) @ _one_hot(first[group_first_idx]).T).astype(np.int8)     # (729, G)
+    hits_b_rows = (_one_hot(b_out) @ _one_hot(second).T).astype(np.int8)              # (2187, N)
+    # best second-half hits within each group (rows sharing a first half only compete there)
+    order = np.argsort(group_of_row, kind="stable")
+    starts = np.searchsorted(group_of_row[order], np.arange(n_groups))
+    hits_b = np.maximum.reduceat(hits_b_rows[:, order], starts, axis=1)              # (2187, G)
+
+    hits_a, w_a = _collapse(hits_a, a_p)
+    hits_b, w_b = _collapse(hits_b, b_p)
+
+    dist = np.zeros(N_MATCHES + 1)
+    for lo in range(0, len(hits_a), chunk):
+        best = (hits_a[lo:lo + chunk, None, :] + hits_b[None, :, :]).max(axis=2)     # (chunk, B)
+        weights = np.outer(w_a[lo:lo + chunk], w_b)
+        dist += np.bincount(best.ravel(), weights=weights.ravel(), minlength=N_MATCHES + 1)
+    return dist
+
+
+def evaluate_system(
+    rows: np.ndarray,
+    probs: np.ndarray,
+    prizes: Optional[Dict[int, float]] = None,
+) -> Dict[str, object]:
+    """
+    Exact prize-tier odds for one system: P(best row >= k correct) per tier,
+    expected number of rows with exactly k correct, and the expected payout if
+    prizes ({hits: amount per winning row}) are given.
+    """
+    best = best_hit_distribution(rows, probs)
+    expected_rows = row_hit_distributions(rows, probs).sum(axis=0)
+    reach = np.cumsum(best[::-1])[::-1]     # P(best >= k)
+    result: Dict[str, object] = {
+        "rows": int(len(rows)),
+        "p_best": {str(k): float(best[k]) for k in range(N_MATCHES + 1)},
+        "tiers": {(f"ge{k}" if k < N_MATCHES else "eq13"): float(reach[k]) for k in PRIZE_TIERS},
+        "expected_rows": {str(k): float(expected_rows[k]) for k in PRIZE_TIERS},
+        "expected_best": float(best @ np.arange(N_MATCHES + 1)),
+    }
+    if prizes:
+        result["expected_payout"] = float(sum(expected_rows[k] * amount for k, amount in prizes.items()))
+    return result
+
+
+def expected_payouts(
+    systems: Sequence[np.ndarray],
+    probs: np.ndarray,
+    prizes: Dict[int, float],
+) -> np.ndarray:
+    """
+    Expected payout of many candidate systems at once (one DP over all their rows).
+    Payout is linear in winning rows, so it only needs per-row hit distributions.
+    """
+    if not systems:
+        return np.zeros(0)
+    sizes = np.array([len(s) for s in systems])
+    all_rows = np.concatenate(systems)
+    prize_vec = np.zeros(N_MATCHES + 1)
+    for k, amount in prizes.items():
+        prize_vec[k] = amount
+    per_row = row_hit_distributions(all_rows, probs) @ prize_vec
+    # Sum per system by owner index (empty systems get 0, wherever they sit)
+    owner = np.repeat(np.arange(len(sizes)), sizes)
+    return np.bincount(owner, weights=per_row, minlength=len(sizes))
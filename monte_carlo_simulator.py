@@ -1,109 +1,291 @@
 """
 Monte Carlo Match Simulator
-Uses Poisson distribution to simulate thousands of matches
-and calculate probabilities for all betting markets.
+Uses Poisson distribution to price every betting market for a match.
+Probabilities come from an exact score matrix by default; the original
+sampling path is still available via method="sample".
 """
 
+import functools
+import math
+import threading
 import numpy as np
-from collections import Counter
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
-def simulate_match(lambda_home: float, lambda_away: float, n_sim: int = 10000, max_goals: int = 8) -> Dict:
+AH_LINES = (-1.5, -1.0, -0.5, 0.5, 1.0, 1.5)
+TOTAL_LINES = (0.5, 1.5, 2.5, 3.5, 4.5)
+TEAM_TOTAL_LINES = (0.5, 1.5, 2.5)
+
+
+# ── Shared market-probability cache ──────────────────────────────────────────
+# Every goal-market caller in the process (value singles, exact score,
+# corners/cards proxies, /api/simulate) prices the same handful of xG pairs
+# on each scan, so results are memoized on xG rounded to XG_QUANTUM.
+XG_QUANTUM = 0.01
+MARKET_CACHE_MAX_SIZE = 4096
+
+_market_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_market_cache_lock = threading.Lock()
+_market_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_MISS = object()
+
+
+def quantize_xg(xg: float) -> float:
+    """Round an xG value to the cache grid (XG_QUANTUM)."""
+    return round(round(float(xg) / XG_QUANTUM) * XG_QUANTUM, 6)
+
+
+def _cache_get(key: tuple) -> Any:
+    with _market_cache_lock:
+        if key in _market_cache:
+            _market_cache.move_to_end(key)
+            _market_cache_stats["hits"] += 1
+            return _market_cache[key]
+        _market_cache_stats["misses"] += 1
+        return _MISS
+
+
+def _cache_set(key: tuple, value: Any) -> None:
+    with _market_cache_lock:
+        _market_cache[key] = value
+        _market_cache.move_to_end(key)
+        while len(_market_cache) > MARKET_CACHE_MAX_SIZE:
+            _market_cache.popitem(last=False)
+            _market_cache_stats["evictions"] += 1
+
+
+def cached_market(name: str) -> Callable:
+    """
+    Memoize a pure f(lambda_home, lambda_away, *args) market function.
+    The two rates are quantized before both the lookup and the computation,
+    so a cached value is exactly what the function returns for that key.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(lambda_home: float, lambda_away: float, *args, **kwargs):
+            qh, qa = quantize_xg(lambda_home), quantize_xg(lambda_away)
+            key = (name, qh, qa, args, tuple(sorted(kwargs.items())))
+            value = _cache_get(key)
+            if value is _MISS:
+                value = func(qh, qa, *args, **kwargs)
+                _cache_set(key, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def get_market_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters and current size of the shared market cache."""
+    with _market_cache_lock:
+        stats = dict(_market_cache_stats)
+        stats["size"] = len(_market_cache)
+    lookups = stats["hits"] + stats["misses"]
+    stats["max_size"] = MARKET_CACHE_MAX_SIZE
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+def clear_market_cache() -> None:
+    """Drop all cached entries and reset counters."""
+    with _market_cache_lock:
+        _market_cache.clear()
+        for k in _market_cache_stats:
+            _market_cache_stats[k] = 0
+
+
+def _line_key(line: float) -> str:
+    """2.5 -> '25', 0.5 -> '05' (matches the over_XX / under_XX result keys)."""
+    return f"{line:.1f}".replace(".", "")
+
+
+def poisson_vector(lam: float, max_goals: int = 8) -> np.ndarray:
+    """
+    Poisson PMF for 0..max_goals with the tail P(X >= max_goals) folded into
+    the last bucket, i.e. the exact distribution of clip(Poisson(lam), 0, max_goals).
+    """
+    lam = max(float(lam), 0.0)
+    pmf = np.empty(max_goals + 1)
+    pmf[0] = math.exp(-lam)
+    for k in range(1, max_goals + 1):
+        pmf[k] = pmf[k - 1] * lam / k
+    pmf[max_goals] = max(0.0, 1.0 - pmf[:max_goals].sum())
+    return pmf
+
+
+@cached_market("score_matrix")
+def score_matrix(lambda_home: float, lambda_away: float, max_goals: int = 8) -> np.ndarray:
+    """
+    Exact score probability grid: grid[h, a] = P(home = h, away = a).
+    Independent Poisson goals, clipped at max_goals like the sampler.
+    The returned array is cached and read-only.
+    """
+    grid = np.outer(poisson_vector(lambda_home, max_goals), poisson_vector(lambda_away, max_goals))
+    grid.setflags(write=False)
+    return grid
+
+
+def _goal_index(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    n = grid.shape[0]
+    h_idx, a_idx = np.indices((n, n))
+    return h_idx, a_idx
+
+
+def grid_total_distribution(grid: np.ndarray) -> np.ndarray:
+    """P(total goals = t) for t = 0..2*max_goals, summed along the grid anti-diagonals."""
+    h_idx, a_idx = _goal_index(grid)
+    return np.bincount((h_idx + a_idx).ravel(), weights=grid.ravel(), minlength=2 * grid.shape[0] - 1)
+
+
+def grid_margin_distribution(grid: np.ndarray) -> np.ndarray:
+    """P(home - away = d) for d = -max_goals..max_goals (index d + max_goals)."""
+    h_idx, a_idx = _goal_index(grid)
+    n = grid.shape[0]
+    return np.bincount((h_idx - a_idx + n - 1).ravel(), weights=grid.ravel(), minlength=2 * n - 1)
+
+
+def prob_total_over_line(grid: np.ndarray, line: float) -> float:
+    """P(home + away > line) for any line (0.5, 2.25, 3.0 ...)."""
+    totals = grid_total_distribution(grid)
+    return float(totals[np.arange(totals.size) > line].sum())
+
+
+def prob_team_over_line(grid: np.ndarray, side: str, line: float) -> float:
+    """P(team goals > line) for side 'home' or 'away'."""
+    marginal = grid.sum(axis=1) if side == "home" else grid.sum(axis=0)
+    return float(marginal[np.arange(marginal.size) > line].sum())
+
+
+def prob_margin_over(grid: np.ndarray, side: str, threshold: float) -> float:
+    """
+    P(team goals - opponent goals > threshold) for side 'home' or 'away'.
+    Same convention as the home_ah_X / away_ah_X keys of simulate_match.
+    """
+    margins = grid_margin_distribution(grid)
+    n = grid.shape[0]
+    diffs = np.arange(-(n - 1), n)
+    if side == "away":
+        diffs = -diffs
+    return float(margins[diffs > threshold].sum())
+
+
+def markets_from_grid(grid: np.ndarray, n_sim: int = 10000, score_floor: float = 0.0) -> Dict:
     """
-    Simulate a football match using Monte Carlo simulation with Poisson distribution.
+    Derive every market probability from one score grid.
+
+    Args:
+        grid: Output from score_matrix() (or an empirical grid of frequencies)
+        n_sim: Reported in the "simulations" field for backwards compatibility
+        score_floor: Drop exact scores with probability <= floor from "scores"
+
+    Returns:
+        Dictionary in the simulate_match() format
+    """
+    h_idx, a_idx = _goal_index(grid)
+    n = grid.shape[0]
+
+    home_wins = float(grid[h_idx > a_idx].sum())
+    draws = float(np.trace(grid))
+    away_wins = float(grid[h_idx < a_idx].sum())
+    btts_yes = float(grid[1:, 1:].sum())
+
+    totals = grid_total_distribution(grid)
+    total_values = np.arange(totals.size)
+    margins = grid_margin_distribution(grid)
+    margin_values = np.arange(-(n - 1), n)
+    home_marginal = grid.sum(axis=1)
+    away_marginal = grid.sum(axis=0)
+    goal_values = np.arange(n)
+
+    result = {
+        "scores": {
+            f"{h}-{a}": float(grid[h, a])
+            for h in range(n) for a in range(n)
+            if grid[h, a] > score_floor
+        },
+        "one_x_two": {"1": home_wins, "X": draws, "2": away_wins},
+        "btts_yes": btts_yes,
+        "btts_no": 1.0 - btts_yes,
+    }
+
+    for line in TOTAL_LINES:
+        over = float(totals[total_values > line].sum())
+        result[f"over_{_line_key(line)}"] = over
+        result[f"under_{_line_key(line)}"] = float(totals[total_values < line].sum())
+
+    result["avg_total_goals"] = float((totals * total_values).sum())
+
+    for line in AH_LINES:
+        label = f"{line:+.1f}"
+        result[f"home_ah_{label}"] = float(margins[margin_values > line].sum())
+        result[f"away_ah_{label}"] = float(margins[-margin_values > line].sum())
+
+    for line in TEAM_TOTAL_LINES:
+        result[f"home_over_{_line_key(line)}"] = float(home_marginal[goal_values > line].sum())
+        result[f"away_over_{_line_key(line)}"] = float(away_marginal[goal_values > line].sum())
+
+    result["double_chance_1X"] = home_wins + draws
+    result["double_chance_12"] = home_wins + away_wins
+    result["double_chance_X2"] = draws + away_wins
+    result["simulations"] = n_sim
+    return result
+
+
+def _sample_score_grid(lambda_home: float, lambda_away: float, n_sim: int, max_goals: int,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Empirical score grid from n_sim Poisson draws (sampling mode, kept for parity checks)."""
+    rng = rng if rng is not None else np.random.default_rng()
+    home_goals = np.clip(rng.poisson(lam=lambda_home, size=n_sim), 0, max_goals)
+    away_goals = np.clip(rng.poisson(lam=lambda_away, size=n_sim), 0, max_goals)
+    counts = np.zeros((max_goals + 1, max_goals + 1))
+    np.add.at(counts, (home_goals, away_goals), 1)
+    return counts / n_sim
+
+
+def simulate_match(lambda_home: float, lambda_away: float, n_sim: int = 10000, max_goals: int = 8,
+                   method: str = "exact", rng: Optional[np.random.Generator] = None) -> Dict:
+    """
+    Price a football match from an independent Poisson score grid.
+
+    The default "exact" method builds the full score matrix in closed form,
+    so results are deterministic and cost a single outer product (memoized
+    on xG quantized to XG_QUANTUM, see get_market_cache_stats). The
+    "sample" method draws n_sim matches and derives the same markets from
+    the empirical grid; it is kept for parity checks and the simulation lab.
     
     Args:
         lambda_home: Expected goals for home team (xG)
         lambda_away: Expected goals for away team (xG)
-        n_sim: Number of simulations (default 10,000)
+        n_sim: Number of simulations (sample mode; reported as-is in exact mode)
         max_goals: Maximum goals to consider per team
+        method: "exact" (default) or "sample"
+        rng: Optional numpy Generator for reproducible sampling
     
     Returns:
         Dictionary with probabilities for all markets
     """
-    home_goals = np.random.poisson(lam=lambda_home, size=n_sim)
-    away_goals = np.random.poisson(lam=lambda_away, size=n_sim)
-
-    home_goals = np.clip(home_goals, 0, max_goals)
-    away_goals = np.clip(away_goals, 0, max_goals)
-
-    score_counts = Counter(zip(home_goals, away_goals))
+    if method == "sample":
+        grid = _sample_score_grid(lambda_home, lambda_away, n_sim, max_goals, rng)
+        result = markets_from_grid(grid, n_sim=n_sim)
+        result["method"] = method
+        return result
+    if method != "exact":
+        raise ValueError(f"Unknown simulation method: {method}")
 
-    score_probs = {
-        f"{h}-{a}": count / n_sim
-        for (h, a), count in score_counts.items()
+    result = _exact_markets(lambda_home, lambda_away, max_goals, n_sim)
+    # Shallow copies so callers can't mutate the cached entry
+    return {
+        **result,
+        "scores": dict(result["scores"]),
+        "one_x_two": dict(result["one_x_two"]),
     }
 
-    home_wins = float((home_goals > away_goals).mean())
-    draws     = float((home_goals == away_goals).mean())
-    away_wins = float((home_goals < away_goals).mean())
-
-    btts_yes = float(((home_goals > 0) & (away_goals > 0)).mean())
-    over_15  = float(((home_goals + away_goals) > 1.5).mean())
-    over_25  = float(((home_goals + away_goals) > 2.5).mean())
-    over_35  = float(((home_goals + away_goals) > 3.5).mean())
-    under_25 = float(((home_goals + away_goals) < 2.5).mean())
-    under_35 = float(((home_goals + away_goals) < 3.5).mean())
-
-    total_goals = home_goals + away_goals
-    
-    over_05 = float((total_goals > 0.5).mean())
-    over_45 = float((total_goals > 4.5).mean())
-    under_15 = float((total_goals < 1.5).mean())
-    under_45 = float((total_goals < 4.5).mean())
-    
-    home_ah_minus05 = float((home_goals - away_goals > -0.5).mean())
-    home_ah_minus10 = float((home_goals - away_goals > -1.0).mean())
-    home_ah_minus15 = float((home_goals - away_goals > -1.5).mean())
-    home_ah_plus05 = float((home_goals - away_goals > 0.5).mean())
-    home_ah_plus10 = float((home_goals - away_goals > 1.0).mean())
-    home_ah_plus15 = float((home_goals - away_goals > 1.5).mean())
-    
-    away_ah_minus05 = float((away_goals - home_goals > -0.5).mean())
-    away_ah_minus10 = float((away_goals - home_goals > -1.0).mean())
-    away_ah_minus15 = float((away_goals - home_goals > -1.5).mean())
-    away_ah_plus05 = float((away_goals - home_goals > 0.5).mean())
-    away_ah_plus10 = float((away_goals - home_goals > 1.0).mean())
-    away_ah_plus15 = float((away_goals - home_goals > 1.5).mean())
-    
-    dc_1x = home_wins + draws
-    dc_12 = home_wins + away_wins
-    dc_x2 = draws + away_wins
 
-    return {
-        "scores": score_probs,
-        "one_x_two": {"1": home_wins, "X": draws, "2": away_wins},
-        "btts_yes": btts_yes,
-        "btts_no": 1.0 - btts_yes,
-        "over_05": over_05,
-        "over_15": over_15,
-        "over_25": over_25,
-        "over_35": over_35,
-        "over_45": over_45,
-        "under_05": 1.0 - over_05,
-        "under_15": under_15,
-        "under_25": under_25,
-        "under_35": under_35,
-        "under_45": under_45,
-        "avg_total_goals": float(total_goals.mean()),
-        "home_ah_-0.5": home_ah_minus05,
-        "home_ah_-1.0": home_ah_minus10,
-        "home_ah_-1.5": home_ah_minus15,
-        "home_ah_+0.5": home_ah_plus05,
-        "home_ah_+1.0": home_ah_plus10,
-        "home_ah_+1.5": home_ah_plus15,
-        "away_ah_-0.5": away_ah_minus05,
-        "away_ah_-1.0": away_ah_minus10,
-        "away_ah_-1.5": away_ah_minus15,
-        "away_ah_+0.5": away_ah_plus05,
-        "away_ah_+1.0": away_ah_plus10,
-        "away_ah_+1.5": away_ah_plus15,
-        "double_chance_1X": dc_1x,
-        "double_chance_12": dc_12,
-        "double_chance_X2": dc_x2,
-        "simulations": n_sim
-    }
+@cached_market("markets")
+def _exact_markets(lambda_home: float, lambda_away: float, max_goals: int, n_sim: int) -> Dict:
+    result = markets_from_grid(score_matrix(lambda_home, lambda_away, max_goals), n_sim=n_sim)
+    result["method"] = "exact"
+    return result
 
 
 def implied_prob(odds: float) -> float:
@@ -216,7 +398,7 @@ def get_top_exact_scores(simulation_result: Dict, top_n: int = 5) -> list:
 if __name__ == "__main__":
     result = simulate_match(lambda_home=1.8, lambda_away=1.2)
     
-    print("=== MONTE CARLO SIMULATION (10,000 matches) ===")
+    print("=== POISSON SCORE GRID ===")
     print(f"\n1X2 Probabilities:")
     print(f"  Home Win: {result['one_x_two']['1']:.1%}")
     print(f"  Draw:     {result['one_x_two']['X']:.1%}")
@@ -1,7 +1,7 @@
 import os
 import datetime as dt
-import psycopg2
 from psycopg2.extras import DictCursor
+from db_connection import DatabaseConnection
 
 # ==========================================
 # DB-CONNECTION
@@ -9,7 +9,7 @@ from psycopg2.extras import DictCursor
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
 def get_conn():
-    return psycopg2.connect(DATABASE_URL, sslmode="require", cursor_factory=DictCursor)
+    return DatabaseConnection.checkout('multi_backtest_runner', cursor_factory=DictCursor)
 
 
 # ==========================================
@@ -4,15 +4,21 @@ Tracks odds movement and calculates drift scores for bet filtering
 """
 
 import logging
+import threading
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from datetime import datetime, timedelta
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from db_connection import DatabaseConnection
 import os
 
 logger = logging.getLogger(__name__)
 
+# (fixture_id, market_key, odds, bookmaker, match_date)
+OddsObservation = Tuple[str, str, float, str, Optional[str]]
+
+MAX_INDEX_SIZE = 200000
+
 
 @dataclass
 class OddsDriftInfo:
@@ -38,6 +44,11 @@ class OddsDriftTracker:
     
     def __init__(self):
         self.db_url = os.environ.get("DATABASE_URL")
+        # (fixture_id, market_key, bookmaker) -> odds_snapshots row (open/last odds, drift)
+        self._index: Dict[Tuple[str, str, str], Dict] = {}
+        self._indexed_fixtures = set()   # fixtures whose rows are all in _index
+        self._index_lock = threading.Lock()
+        self._upsert_ready: Optional[bool] = None
         logger.info("✅ OddsDriftTracker initialized")
     
     def get_connection(self):
@@ -45,7 +56,7 @@ class OddsDriftTracker:
         if not self.db_url:
             return None
         try:
-            return psycopg2.connect(self.db_url, cursor_factory=RealDictCursor)
+            return DatabaseConnection.checkout('odds_drift', cursor_factory=RealDictCursor)
         except Exception as e:
             logger.error(f"Database connection error: {e}")
             return None
@@ -62,6 +73,150 @@ class OddsDriftTracker:
         Record a new odds snapshot or update existing.
         Uses upsert to track open and last odds.
         """
+        return self.record_odds_batch([(fixture_id, market_key, odds, bookmaker, match_date)]) == 1
+    
+    def _ensure_upsert_index(self, conn) -> bool:
+        """ON CONFLICT needs a unique index on the snapshot key; create it once."""
+        if self._upsert_ready is None:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        CREATE UNIQUE INDEX IF NOT EXISTS odds_snapshots_key_uidx
+                        ON odds_snapshots (fixture_id, market_key, bookmaker)
+                    """)
+                conn.commit()
+                self._upsert_ready = True
+            except Exception as e:
+                # Duplicate legacy rows: keep the row-by-row path
+                conn.rollback()
+                logger.warning(f"⚠️ odds_snapshots unique key unavailable, using row-by-row upserts: {e}")
+                self._upsert_ready = False
+        return self._upsert_ready
+    
+    def record_odds_batch(self, observations: Iterable[OddsObservation]) -> int:
+        """
+        Upsert many (fixture_id, market_key, odds, bookmaker, match_date) observations
+        with one INSERT ... ON CONFLICT on a pooled connection. The first observation
+        of a new key sets its open odds. Returns the number of keys written.
+        """
+        merged: Dict[Tuple[str, str, str], list] = {}
+        for fixture_id, market_key, odds, bookmaker, match_date in observations:
+            key = (fixture_id, market_key, bookmaker or "generic")
+            if key in merged:
+                merged[key][1] = odds
+            else:
+                merged[key] = [odds, odds, match_date]
+        if not merged:
+            return 0
+        
+        conn = self.get_connection()
+        if not conn:
+            return 0
+        
+        try:
+            if not self._ensure_upsert_index(conn):
+                conn.close()
+                conn = None
+                count = 0
+                for (fixture_id, market_key, bookmaker), (first, last, match_date) in merged.items():
+                    ok = self._record_odds_snapshot_rowwise(fixture_id, market_key, first, bookmaker, match_date)
+                    if ok and last != first:
+                        ok = self._record_odds_snapshot_rowwise(fixture_id, market_key, last, bookmaker, match_date)
+                    count += ok
+                return count
+            
+            now = datetime.utcnow()
+            values = [
+                (fixture_id, market_key, bookmaker, first, last, now, now,
+                 (last - first) / first if first > 0 else 0, match_date)
+                for (fixture_id, market_key, bookmaker), (first, last, match_date) in merged.items()
+            ]
+            with conn.cursor() as cur:
+                rows = execute_values(cur, """
+                    INSERT INTO odds_snapshots 
+                    (fixture_id, market_key, bookmaker, open_odds, last_odds, 
+                     open_timestamp, last_update, drift_pct, match_date)
+                    VALUES %s
+                    ON CONFLICT (fixture_id, market_key, bookmaker) DO UPDATE
+                    SET last_odds = EXCLUDED.last_odds,
+                        last_update = EXCLUDED.last_update,
+                        drift_pct = CASE WHEN odds_snapshots.open_odds > 0
+                                         THEN (EXCLUDED.last_odds - odds_snapshots.open_odds) / odds_snapshots.open_odds
+                                         ELSE 0 END
+                    RETURNING fixture_id, market_key, bookmaker, open_odds, last_odds,
+                              drift_pct, open_timestamp, last_update
+                """, values, page_size=500, fetch=True)
+            conn.commit()
+            self._index_rows(rows)
+            return len(values)
+            
+        except Exception as e:
+            logger.error(f"Error recording odds batch: {e}")
+            if conn:
+                conn.rollback()
+            return 0
+        finally:
+            if conn:
+                conn.close()
+    
+    def _index_rows(self, rows) -> None:
+        with self._index_lock:
+            if len(self._index) + len(rows) > MAX_INDEX_SIZE:
+                self._index.clear()
+                self._indexed_fixtures.clear()
+            for row in rows:
+                self._index[(str(row['fixture_id']), row['market_key'], row['bookmaker'])] = {
+                    'open_odds': row['open_odds'],
+                    'last_odds': row['last_odds'],
+                    'drift_pct': row['drift_pct'],
+                    'open_timestamp': row['open_timestamp'],
+                    'last_update': row['last_update'],
+                }
+    
+    def load_index(self, fixture_ids: Iterable[str]) -> int:
+        """
+        Load (refresh) every snapshot row for these fixtures in one query, so drift
+        lookups during a scan are served from memory. Returns rows loaded.
+        """
+        fixture_ids = sorted({str(f) for f in fixture_ids if f is not None})
+        if not fixture_ids:
+            return 0
+        conn = self.get_connection()
+        if not conn:
+            return 0
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT fixture_id, market_key, bookmaker, open_odds, last_odds,
+                           drift_pct, open_timestamp, last_update
+                    FROM odds_snapshots
+                    WHERE fixture_id = ANY(%s)
+                """, (fixture_ids,))
+                rows = cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error loading odds drift index: {e}")
+            return 0
+        finally:
+            conn.close()
+        
+        loaded = set(fixture_ids)
+        with self._index_lock:
+            for key in [k for k in self._index if k[0] in loaded]:
+                del self._index[key]
+        self._index_rows(rows)
+        with self._index_lock:
+            self._indexed_fixtures.update(fixture_ids)
+        return len(rows)
+    
+    def _record_odds_snapshot_rowwise(
+        self,
+        fixture_id: str,
+        market_key: str,
+        odds: float,
+        bookmaker: str = "generic",
+        match_date: Optional[str] = None
+    ) -> bool:
+        """SELECT then UPDATE or INSERT one observation (no unique key on the table)."""
         conn = self.get_connection()
         if not conn:
             return False
@@ -113,7 +268,14 @@ class OddsDriftTracker:
         market_key: str,
         bookmaker: str = "generic"
     ) -> Optional[Dict]:
-        """Get current odds drift info for a market."""
+        """Get current odds drift info for a market (from the in-memory index when loaded)."""
+        key = (str(fixture_id), market_key, bookmaker)
+        with self._index_lock:
+            if key in self._index:
+                return dict(self._index[key])
+            if key[0] in self._indexed_fixtures:
+                return None
+        
         conn = self.get_connection()
         if not conn:
             return None
@@ -275,6 +437,10 @@ class OddsDriftTracker:
                 deleted = cur.rowcount
                 conn.commit()
                 
+                with self._index_lock:
+                    self._index.clear()
+                    self._indexed_fixtures.clear()
+                
                 if deleted > 0:
                     logger.info(f"🧹 Cleaned up {deleted} old odds snapshots")
                 
@@ -298,12 +464,11 @@ def record_batch_odds(
     Record a batch of odds for a fixture.
     Returns count of successfully recorded odds.
     """
-    count = 0
-    for market_key, odds in odds_snapshot.items():
-        if odds and odds > 1:
-            if tracker.record_odds_snapshot(fixture_id, market_key, odds, match_date=match_date):
-                count += 1
-    return count
+    return tracker.record_odds_batch([
+        (fixture_id, market_key, odds, "generic", match_date)
+        for market_key, odds in odds_snapshot.items()
+        if odds and odds > 1
+    ])
 
 
 if __name__ == "__main__":
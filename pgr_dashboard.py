@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 import plotly.graph_objects as go
 import plotly.express as px
 from db_connection import DatabaseConnection
+DatabaseConnection.configure('dashboard')
 st.set_page_config(
     page_title="PGR Sports Analytics",
     page_icon="🏆",
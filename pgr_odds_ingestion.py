@@ -7,14 +7,20 @@ stores snapshots for CLV tracking, computes market state.
 Decimal odds only. Football first, scalable.
 """
 
+import io
 import os
+import json
 import logging
 import statistics
+import threading
 import time
-import requests
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.extras import execute_values
+from db_connection import DatabaseConnection
 from db_helper import db_helper
+from http_transport import http_get
 from pgr_models import OddsSnapshot, MarketState
 
 logger = logging.getLogger(__name__)
@@ -78,16 +84,58 @@ PRIORITY_SPORT_KEYS = {
 
 STALE_THRESHOLD_MINUTES = 30
 
+INGESTION_CONCURRENCY = int(os.getenv('PGR_INGESTION_CONCURRENCY', '4'))
+# Odds API requests one cycle may spend (unset = one per league)
+INGESTION_REQUEST_BUDGET = int(os.getenv('PGR_INGESTION_REQUEST_BUDGET', '0')) or None
+ODDS_API_MIN_REMAINING = int(os.getenv('PGR_ODDS_API_MIN_REMAINING', '50'))
 
-def _api_get(endpoint: str, params: Dict = None) -> Optional[Any]:
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 3600
+HISTORY_LOOKBACK_DAYS = 30  # snapshots for an event are taken at most this long before kickoff
+_last_partition_maintenance = 0.0
+
+
+class RequestBudget:
+    """
+    Odds API requests a cycle may spend, shared by every league worker.
+    Also stops early once the account's x-requests-remaining drops to min_remaining.
+    """
+
+    def __init__(self, max_requests: Optional[int] = None, min_remaining: int = ODDS_API_MIN_REMAINING):
+        self.max_requests = max_requests
+        self.min_remaining = min_remaining
+        self.used = 0
+        self.remaining: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.max_requests is not None and self.used >= self.max_requests:
+                return False
+            if self.remaining is not None and self.remaining <= self.min_remaining:
+                return False
+            self.used += 1
+            return True
+
+    def observe_remaining(self, header_value: Optional[str]) -> None:
+        try:
+            remaining = int(float(header_value))
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self.remaining = remaining if self.remaining is None else min(self.remaining, remaining)
+
+
+def _api_get(endpoint: str, params: Dict = None, budget: Optional[RequestBudget] = None) -> Optional[Any]:
     if not ODDS_API_KEY:
         logger.warning("THE_ODDS_API_KEY not set")
         return None
     params = params or {}
     params['apiKey'] = ODDS_API_KEY
     try:
-        resp = requests.get(f"{ODDS_API_BASE}{endpoint}", params=params, timeout=30)
+        resp = http_get(f"{ODDS_API_BASE}{endpoint}", params=params, timeout=30)
         remaining = resp.headers.get('x-requests-remaining', '?')
+        if budget is not None:
+            budget.observe_remaining(remaining)
         logger.info(f"Odds API {endpoint}: {resp.status_code} | remaining: {remaining}")
         if resp.status_code == 200:
             return resp.json()
@@ -125,12 +173,13 @@ def _normalize_selection(market_key: str, outcome: Dict, point: float = None) ->
 
 
 def ingest_sport_odds(sport_key: str, markets: str = 'h2h,totals,spreads',
-                      regions: str = 'uk,eu,us,au') -> List[OddsSnapshot]:
+                      regions: str = 'uk,eu,us,au',
+                      budget: Optional[RequestBudget] = None) -> List[OddsSnapshot]:
     data = _api_get(f"/sports/{sport_key}/odds", {
         'regions': regions,
         'markets': markets,
         'oddsFormat': 'decimal',
-    })
+    }, budget=budget)
     if not data:
         return []
 
@@ -187,34 +236,76 @@ def ingest_sport_odds(sport_key: str, markets: str = 'h2h,totals,spreads',
     return snapshots
 
 
+SNAPSHOT_COLUMNS = (
+    'event_id', 'sport', 'league_id', 'league_name', 'start_time_utc',
+    'home_team', 'away_team', 'market_type', 'selection', 'line',
+    'bookmaker', 'odds_decimal', 'timestamp_utc', 'fixture_id',
+)
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _snapshot_row(s: OddsSnapshot) -> tuple:
+    return (
+        s.event_id, s.sport, s.league_id, s.league_name,
+        _naive_utc(s.start_time_utc), s.home_team, s.away_team,
+        s.market_type, s.selection, s.line,
+        s.bookmaker, s.odds_decimal, _naive_utc(s.timestamp_utc), s.fixture_id,
+    )
+
+
+def _naive_utc(ts: datetime) -> datetime:
+    """Snapshot columns are TIMESTAMP (no tz) holding UTC."""
+    if ts is not None and ts.tzinfo:
+        return ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+def _copy_field(value: Any) -> str:
+    """Encode one value for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _insert_snapshots(rows: List[tuple]) -> int:
+    """Multi-row INSERT fallback for when COPY is unavailable."""
+    with DatabaseConnection.get_cursor() as cursor:
+        execute_values(
+            cursor,
+            f"INSERT INTO pgr_odds_snapshots ({', '.join(SNAPSHOT_COLUMNS)}) VALUES %s",
+            rows,
+            page_size=1000,
+        )
+    return len(rows)
+
+
 def store_snapshots(snapshots: List[OddsSnapshot]) -> int:
+    """Bulk-load snapshots with COPY FROM STDIN (falls back to a multi-row INSERT)."""
     if not snapshots:
         return 0
 
+    rows = [_snapshot_row(s) for s in snapshots]
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_field(v) for v in row))
+        buffer.write('\n')
+    buffer.seek(0)
+
     stored = 0
-    batch = []
-    for s in snapshots:
-        batch.append((
-            s.event_id, s.sport, s.league_id, s.league_name,
-            s.start_time_utc, s.home_team, s.away_team,
-            s.market_type, s.selection, s.line,
-            s.bookmaker, s.odds_decimal, s.timestamp_utc, s.fixture_id,
-        ))
-
-    chunk_size = 200
-    for i in range(0, len(batch), chunk_size):
-        chunk = batch[i:i+chunk_size]
-        placeholders = ','.join(['(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)'] * len(chunk))
-        flat = [v for row in chunk for v in row]
+    try:
+        with DatabaseConnection.get_cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY pgr_odds_snapshots ({', '.join(SNAPSHOT_COLUMNS)}) FROM STDIN",
+                buffer,
+            )
+        stored = len(rows)
+    except Exception as e:
+        logger.warning(f"COPY snapshots failed, falling back to INSERT: {e}")
         try:
-            db_helper.execute(f"""
-                INSERT INTO pgr_odds_snapshots
-                (event_id, sport, league_id, league_name, start_time_utc,
-                 home_team, away_team, market_type, selection, line,
-                 bookmaker, odds_decimal, timestamp_utc, fixture_id)
-                VALUES {placeholders}
-            """, tuple(flat))
-            stored += len(chunk)
+            stored = _insert_snapshots(rows)
         except Exception as e:
             logger.error(f"Store snapshots error: {e}")
 
@@ -222,38 +313,94 @@ def store_snapshots(snapshots: List[OddsSnapshot]) -> int:
     return stored
 
 
-def compute_market_state(event_id: str) -> List[MarketState]:
+# Latest quote per (market_type, selection, line, bookmaker) for every event
+# ingested by this process. Equivalent to the DISTINCT ON read of
+# pgr_odds_snapshots, but kept in memory so market state can be derived from
+# each batch without re-reading the rows that were just inserted.
+QuoteKey = Tuple[str, str, Optional[float], str]
+
+_quote_book: Dict[str, Dict[QuoteKey, Tuple[float, datetime]]] = {}
+_event_kickoffs: Dict[str, datetime] = {}
+_quote_book_lock = threading.Lock()
+QUOTE_BOOK_RETENTION_HOURS = 6  # drop events this long after kickoff
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _latest_quotes_from_db(event_ids: List[str]) -> Dict[str, Dict[QuoteKey, Tuple[float, datetime]]]:
+    """One DISTINCT ON read for every event not yet in the quote book."""
     rows = db_helper.execute("""
-        SELECT DISTINCT ON (market_type, selection, line, bookmaker)
-            market_type, selection, line, bookmaker, odds_decimal, timestamp_utc
+        SELECT DISTINCT ON (event_id, market_type, selection, line, bookmaker)
+            event_id, market_type, selection, line, bookmaker, odds_decimal, timestamp_utc
         FROM pgr_odds_snapshots
-        WHERE event_id = %s
-        ORDER BY market_type, selection, line, bookmaker, timestamp_utc DESC
-    """, (event_id,), fetch='all') or []
+        WHERE event_id = ANY(%s)
+        ORDER BY event_id, market_type, selection, line, bookmaker, timestamp_utc DESC
+    """, (list(event_ids),), fetch='all') or []
 
-    groups: Dict[str, List] = {}
+    quotes: Dict[str, Dict[QuoteKey, Tuple[float, datetime]]] = {}
     for r in rows:
-        mkt = r[0]
-        sel = r[1]
-        line_val = r[2]
-        key = f"{mkt}|{sel}|{line_val}"
-        if key not in groups:
-            groups[key] = []
-        groups[key].append({
-            'bookmaker': r[3],
-            'odds': float(r[4]),
-            'ts': r[5],
-        })
+        line_val = float(r[3]) if r[3] is not None else None
+        quotes.setdefault(r[0], {})[(r[1], r[2], line_val, r[4])] = (float(r[5]), r[6])
+    return quotes
+
+
+def update_quote_book(snapshots: List[OddsSnapshot]) -> Dict[str, Dict[QuoteKey, Tuple[float, datetime]]]:
+    """
+    Merge a snapshot batch into the in-memory quote book.
+
+    Events seen for the first time in this process are seeded from
+    pgr_odds_snapshots (one query for all of them) so books that stopped
+    quoting still count towards staleness.
+
+    Returns:
+        event_id -> latest quotes, for every event in the batch
+    """
+    event_ids = {s.event_id for s in snapshots}
+    with _quote_book_lock:
+        unseen = [e for e in event_ids if e not in _quote_book]
+    seeded = {}
+    if unseen:
+        try:
+            seeded = _latest_quotes_from_db(unseen)
+        except Exception as e:
+            logger.warning(f"Quote book seed failed ({len(unseen)} events): {e}")
 
     now = datetime.now(timezone.utc)
-    states = []
+    with _quote_book_lock:
+        for event_id in unseen:
+            _quote_book.setdefault(event_id, seeded.get(event_id, {}))
+
+        for s in snapshots:
+            quotes = _quote_book[s.event_id]
+            key = (s.market_type, s.selection, s.line, s.bookmaker)
+            previous = quotes.get(key)
+            if previous is None or _as_utc(previous[1]) <= _as_utc(s.timestamp_utc):
+                quotes[key] = (s.odds_decimal, s.timestamp_utc)
+            _event_kickoffs[s.event_id] = s.start_time_utc
+
+        cutoff = now.timestamp() - QUOTE_BOOK_RETENTION_HOURS * 3600
+        for event_id, kickoff in list(_event_kickoffs.items()):
+            if event_id not in event_ids and _as_utc(kickoff).timestamp() < cutoff:
+                _event_kickoffs.pop(event_id, None)
+                _quote_book.pop(event_id, None)
+
+        return {event_id: dict(_quote_book[event_id]) for event_id in event_ids}
 
-    for key, entries in groups.items():
-        parts = key.split('|')
-        mkt, sel = parts[0], parts[1]
-        line_val = float(parts[2]) if parts[2] != 'None' else None
 
-        prices = {e['bookmaker']: e['odds'] for e in entries}
+def market_states_from_quotes(event_id: str, quotes: Dict[QuoteKey, Tuple[float, datetime]],
+                              now: Optional[datetime] = None) -> List[MarketState]:
+    """Best price, average/median, dispersion and stale books per market line."""
+    now = now or datetime.now(timezone.utc)
+
+    groups: Dict[Tuple[str, str, Optional[float]], List[Tuple[str, float, datetime]]] = {}
+    for (mkt, sel, line_val, bookmaker), (odds, ts) in quotes.items():
+        groups.setdefault((mkt, sel, line_val), []).append((bookmaker, odds, ts))
+
+    states = []
+    for (mkt, sel, line_val), entries in groups.items():
+        prices = {bk: odds for bk, odds, _ in entries}
         odds_vals = list(prices.values())
 
         if not odds_vals:
@@ -266,11 +413,11 @@ def compute_market_state(event_id: str) -> List[MarketState]:
         disp = statistics.stdev(odds_vals) if len(odds_vals) > 1 else 0
 
         stale_books = []
-        for e in entries:
-            if hasattr(e['ts'], 'timestamp'):
-                age_min = (now - e['ts'].replace(tzinfo=timezone.utc)).total_seconds() / 60
+        for bk, _, ts in entries:
+            if hasattr(ts, 'timestamp'):
+                age_min = (now - _as_utc(ts)).total_seconds() / 60
                 if age_min > STALE_THRESHOLD_MINUTES:
-                    stale_books.append(e['bookmaker'])
+                    stale_books.append(bk)
 
         state = MarketState(
             event_id=event_id,
@@ -293,17 +440,34 @@ def compute_market_state(event_id: str) -> List[MarketState]:
     return states
 
 
+def compute_market_state(event_id: str) -> List[MarketState]:
+    """Market state for one event straight from pgr_odds_snapshots (ad-hoc use)."""
+    quotes = _latest_quotes_from_db([event_id]).get(event_id, {})
+    return market_states_from_quotes(event_id, quotes)
+
+
 def persist_market_states(states: List[MarketState]) -> int:
-    saved = 0
-    for s in states:
-        try:
-            import json
-            db_helper.execute("""
+    """Upsert every market state in one multi-row INSERT ... ON CONFLICT."""
+    if not states:
+        return 0
+
+    rows = [
+        (
+            s.event_id, s.market_type, s.selection, s.line,
+            s.best_price, s.best_bookmaker,
+            s.market_avg, s.market_median, s.dispersion, s.book_count,
+            json.dumps(s.prices), s.is_stale, s.stale_books, s.timestamp_utc,
+        )
+        for s in states
+    ]
+    try:
+        with DatabaseConnection.get_cursor() as cursor:
+            execute_values(cursor, """
                 INSERT INTO pgr_market_state
                 (event_id, market_type, selection, line, best_price, best_bookmaker,
                  market_avg, market_median, dispersion, book_count, prices,
                  is_stale, stale_books, timestamp_utc)
-                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                VALUES %s
                 ON CONFLICT (event_id, market_type, selection, line)
                 DO UPDATE SET
                     best_price = EXCLUDED.best_price,
@@ -316,59 +480,110 @@ def persist_market_states(states: List[MarketState]) -> int:
                     is_stale = EXCLUDED.is_stale,
                     stale_books = EXCLUDED.stale_books,
                     timestamp_utc = EXCLUDED.timestamp_utc
-            """, (
-                s.event_id, s.market_type, s.selection, s.line,
-                s.best_price, s.best_bookmaker,
-                s.market_avg, s.market_median, s.dispersion, s.book_count,
-                json.dumps(s.prices), s.is_stale, s.stale_books, s.timestamp_utc,
-            ))
-            saved += 1
-        except Exception as e:
-            logger.error(f"Persist market state error: {e}")
-    return saved
+            """, rows, page_size=len(rows))
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Persist market state error ({len(rows)} rows): {e}")
+        return 0
+
+
+def _maybe_maintain_partitions() -> None:
+    """Create upcoming snapshot partitions and apply retention, at most hourly."""
+    global _last_partition_maintenance
+    if time.time() - _last_partition_maintenance < PARTITION_MAINTENANCE_INTERVAL_SECONDS:
+        return
+    _last_partition_maintenance = time.time()
+    from pgr_schema import maintain_snapshot_partitions
+    maintain_snapshot_partitions()
+
+
+def _ingest_league(sport_key: str, markets: str, budget: RequestBudget) -> Dict[str, Any]:
+    """Fetch + store one league; returns its timing/outcome record."""
+    record: Dict[str, Any] = {'status': 'ok', 'snapshots': 0, 'stored': 0,
+                              'fetch_ms': 0.0, 'store_ms': 0.0, 'snapshot_list': []}
+    if not budget.try_acquire():
+        record['status'] = 'skipped_budget'
+        return record
 
+    use_markets = markets
+    if sport_key in PRIORITY_SPORT_KEYS:
+        use_markets = 'h2h,totals,spreads,alternate_totals,alternate_spreads'
 
-def run_ingestion_cycle(sport_keys: List[str] = None, markets: str = 'h2h,totals,spreads') -> Dict:
+    started = time.perf_counter()
+    try:
+        snapshots = ingest_sport_odds(sport_key, markets=use_markets, budget=budget)
+        fetched = time.perf_counter()
+        record['fetch_ms'] = round((fetched - started) * 1000, 1)
+        if snapshots:
+            record['stored'] = store_snapshots(snapshots)
+            record['store_ms'] = round((time.perf_counter() - fetched) * 1000, 1)
+        record['snapshots'] = len(snapshots)
+        record['snapshot_list'] = snapshots
+    except Exception as e:
+        logger.error(f"Ingestion error for {sport_key}: {e}")
+        record['status'] = 'error'
+        record['error'] = str(e)
+    return record
+
+
+def run_ingestion_cycle(sport_keys: List[str] = None, markets: str = 'h2h,totals,spreads',
+                        max_workers: int = INGESTION_CONCURRENCY,
+                        max_requests: Optional[int] = INGESTION_REQUEST_BUDGET) -> Dict:
     if sport_keys is None:
         sport_keys = SPORT_KEYS
 
-    total_snapshots = 0
-    total_states = 0
-    events_seen = set()
+    _maybe_maintain_partitions()
 
-    for sport_key in sport_keys:
-        try:
-            use_markets = markets
-            if sport_key in PRIORITY_SPORT_KEYS:
-                use_markets = 'h2h,totals,spreads,alternate_totals,alternate_spreads'
-            snapshots = ingest_sport_odds(sport_key, markets=use_markets)
-            if snapshots:
-                stored = store_snapshots(snapshots)
-                total_snapshots += stored
-
-                for s in snapshots:
-                    events_seen.add(s.event_id)
-
-            time.sleep(0.5)
-        except Exception as e:
-            logger.error(f"Ingestion error for {sport_key}: {e}")
+    # Priority leagues are queued first so they claim workers and budget first
+    ordered = sorted(sport_keys, key=lambda k: k not in PRIORITY_SPORT_KEYS)
+    budget = RequestBudget(max_requests)
 
-    for event_id in events_seen:
-        try:
-            states = compute_market_state(event_id)
-            saved = persist_market_states(states)
-            total_states += saved
-        except Exception as e:
-            logger.error(f"Market state error for {event_id}: {e}")
+    cycle_started = time.perf_counter()
+    total_snapshots = 0
+    total_states = 0
+    cycle_snapshots: List[OddsSnapshot] = []
+    league_timings: Dict[str, Dict[str, Any]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {key: pool.submit(_ingest_league, key, markets, budget) for key in ordered}
+        for sport_key in ordered:
+            record = futures[sport_key].result()
+            snapshots = record.pop('snapshot_list')
+            total_snapshots += record['stored']
+            cycle_snapshots.extend(snapshots)
+            league_timings[sport_key] = record
+
+    events_quotes = {}
+    try:
+        events_quotes = update_quote_book(cycle_snapshots)
+        now = datetime.now(timezone.utc)
+        states = [
+            state
+            for event_id, quotes in events_quotes.items()
+            for state in market_states_from_quotes(event_id, quotes, now)
+        ]
+        total_states = persist_market_states(states)
+    except Exception as e:
+        logger.error(f"Market state error: {e}")
 
+    skipped = [k for k, r in league_timings.items() if r['status'] == 'skipped_budget']
     result = {
-        'sports_processed': len(sport_keys),
+        'sports_processed': len(sport_keys) - len(skipped),
         'snapshots_stored': total_snapshots,
-        'events_processed': len(events_seen),
+        'events_processed': len(events_quotes),
         'market_states_computed': total_states,
+        'requests_used': budget.used,
+        'requests_remaining': budget.remaining,
+        'skipped_budget': skipped,
+        'league_timings': league_timings,
+        'wall_ms': round((time.perf_counter() - cycle_started) * 1000, 1),
         'timestamp': datetime.now(timezone.utc).isoformat(),
     }
-    logger.info(f"Ingestion cycle: {result}")
+    logger.info(
+        f"Ingestion cycle: {result['sports_processed']} leagues, {total_snapshots} snapshots, "
+        f"{total_states} market states, {budget.used} requests in {result['wall_ms']:.0f}ms"
+        + (f" | skipped (budget): {', '.join(skipped)}" if skipped else "")
+    )
     return result
 
 
@@ -384,7 +599,6 @@ def get_latest_market_state(event_id: str) -> List[Dict]:
 
     results = []
     for r in rows:
-        import json
         prices = r[10] if isinstance(r[10], dict) else json.loads(r[10]) if r[10] else {}
         stale = r[12] if isinstance(r[12], list) else []
         results.append({
@@ -405,6 +619,12 @@ def get_odds_history(event_id: str, market_type: str = None, selection: str = No
         WHERE event_id = %s
     """
     params = [event_id]
+    kickoff = _event_kickoffs.get(event_id)
+    if kickoff is not None:
+        # Bound timestamp_utc so only the partitions around kickoff are scanned
+        kickoff = _naive_utc(kickoff)
+        query += " AND timestamp_utc >= %s AND timestamp_utc < %s"
+        params.extend([kickoff - timedelta(days=HISTORY_LOOKBACK_DAYS), kickoff + timedelta(days=1)])
     if market_type:
         query += " AND market_type = %s"
         params.append(market_type)
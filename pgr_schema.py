@@ -6,14 +6,23 @@ Preserves existing tables (football_opportunities, odds_snapshots, etc).
 """
 
 import logging
+import os
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from db_connection import DatabaseConnection
 from db_helper import db_helper
 
 logger = logging.getLogger(__name__)
 
-SCHEMA_SQL = [
-    """
+# Odds snapshots are range-partitioned by day on timestamp_utc so old history
+# can be dropped a partition at a time (see maintain_snapshot_partitions).
+# No primary key: a partitioned table's PK would have to include timestamp_utc.
+SNAPSHOTS_TABLE_SQL = """
     CREATE TABLE IF NOT EXISTS pgr_odds_snapshots (
-        id SERIAL PRIMARY KEY,
+        id INTEGER NOT NULL DEFAULT nextval('pgr_odds_snapshots_id_seq'),
         event_id VARCHAR(200) NOT NULL,
         sport VARCHAR(30) DEFAULT 'football',
         league_id VARCHAR(100) NOT NULL,
@@ -28,12 +37,23 @@ SCHEMA_SQL = [
         odds_decimal REAL NOT NULL,
         timestamp_utc TIMESTAMP NOT NULL DEFAULT NOW(),
         fixture_id INTEGER
-    )
-    """,
-    "CREATE INDEX IF NOT EXISTS idx_pgr_odds_event ON pgr_odds_snapshots(event_id)",
-    "CREATE INDEX IF NOT EXISTS idx_pgr_odds_time ON pgr_odds_snapshots(timestamp_utc)",
-    "CREATE INDEX IF NOT EXISTS idx_pgr_odds_market ON pgr_odds_snapshots(market_type, selection)",
-    "CREATE INDEX IF NOT EXISTS idx_pgr_odds_kickoff ON pgr_odds_snapshots(start_time_utc)",
+    ) PARTITION BY RANGE (timestamp_utc)
+"""
+
+SNAPSHOT_INDEXES = {
+    "idx_pgr_odds_event": "event_id",
+    "idx_pgr_odds_time": "timestamp_utc",
+    "idx_pgr_odds_market": "market_type, selection",
+    "idx_pgr_odds_kickoff": "start_time_utc",
+}
+
+SNAPSHOT_RETENTION_DAYS = int(os.getenv('PGR_SNAPSHOT_RETENTION_DAYS', '90'))
+SNAPSHOT_PARTITION_DAYS_AHEAD = 7
+
+SCHEMA_SQL = [
+    "CREATE SEQUENCE IF NOT EXISTS pgr_odds_snapshots_id_seq",
+    SNAPSHOTS_TABLE_SQL,
+    *[f"CREATE INDEX IF NOT EXISTS {name} ON pgr_odds_snapshots({cols})" for name, cols in SNAPSHOT_INDEXES.items()],
     """
     CREATE TABLE IF NOT EXISTS pgr_market_state (
         id SERIAL PRIMARY KEY,
@@ -196,7 +216,167 @@ def create_pgr_schema():
     return success, errors
 
 
+# ── Snapshot partitions ──────────────────────────────────────────────────────
+
+def _snapshots_partitioned() -> bool:
+    row = db_helper.execute("""
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = to_regclass('pgr_odds_snapshots')
+    """, fetch='one')
+    return bool(row)
+
+
+def _partition_name(day: datetime) -> str:
+    return f"pgr_odds_snapshots_p{day:%Y%m%d}"
+
+
+def _create_day_partition(name: str, day: datetime) -> int:
+    """
+    Create and attach one daily partition, first moving any rows for that day
+    out of the default partition (attaching fails while the default holds them).
+    Returns the number of rows moved.
+    """
+    lower, upper = f"{day:%Y-%m-%d}", f"{day + timedelta(days=1):%Y-%m-%d}"
+    with DatabaseConnection.get_cursor() as cursor:
+        # Block writes to the default partition so no row for the day lands there mid-move
+        cursor.execute("LOCK TABLE pgr_odds_snapshots_default IN EXCLUSIVE MODE")
+        cursor.execute(f"CREATE TABLE {name} (LIKE pgr_odds_snapshots INCLUDING DEFAULTS)")
+        cursor.execute(f"""
+            WITH moved AS (
+                DELETE FROM pgr_odds_snapshots_default
+                WHERE timestamp_utc >= %s AND timestamp_utc < %s
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+        """, (lower, upper))
+        moved = cursor.rowcount
+        cursor.execute(f"""
+            ALTER TABLE pgr_odds_snapshots ATTACH PARTITION {name}
+            FOR VALUES FROM ('{lower}') TO ('{upper}')
+        """)
+    return moved
+
+
+def ensure_snapshot_partitions(days_ahead: int = SNAPSHOT_PARTITION_DAYS_AHEAD) -> int:
+    """Create daily partitions from today through days_ahead (plus the default partition)."""
+    if not _snapshots_partitioned():
+        return 0
+
+    db_helper.execute(
+        "CREATE TABLE IF NOT EXISTS pgr_odds_snapshots_default PARTITION OF pgr_odds_snapshots DEFAULT"
+    )
+    existing = {
+        r[0] for r in db_helper.execute("""
+            SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'pgr_odds_snapshots'::regclass
+        """, fetch='all') or []
+    }
+
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+    created = 0
+    for offset in range(days_ahead + 1):
+        day = today + timedelta(days=offset)
+        name = _partition_name(day)
+        if name in existing:
+            continue
+        try:
+            moved = _create_day_partition(name, day)
+            created += 1
+            if moved:
+                logger.info(f"PGR snapshots: moved {moved} row(s) from the default partition into {name}")
+        except Exception as e:
+            # e.g. range already covered by the legacy partition after migration
+            logger.warning(f"Snapshot partition {name} not created: {e}")
+    if created:
+        logger.info(f"PGR snapshots: created {created} daily partition(s)")
+    return created
+
+
+def drop_expired_snapshot_partitions(retention_days: int = SNAPSHOT_RETENTION_DAYS) -> List[str]:
+    """
+    Drop partitions whose whole range is older than retention_days, and delete
+    expired rows from the default partition (it has no range to drop by).
+    """
+    if not _snapshots_partitioned():
+        return []
+
+    rows = db_helper.execute("""
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'pgr_odds_snapshots'::regclass
+    """, fetch='all') or []
+
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=retention_days)
+    dropped = []
+    for name, bound in rows:
+        match = re.search(r"TO \('([^']+)'\)", bound or '')
+        if not match:
+            continue  # DEFAULT partition or MAXVALUE upper bound
+        upper = datetime.fromisoformat(match.group(1))
+        if upper <= cutoff:
+            db_helper.execute(f"DROP TABLE IF EXISTS {name}")
+            dropped.append(name)
+    if dropped:
+        logger.info(f"PGR snapshots: dropped {len(dropped)} partition(s) older than {retention_days}d")
+
+    with DatabaseConnection.get_cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM pgr_odds_snapshots_default WHERE timestamp_utc < %s", (cutoff,)
+        )
+        purged = cursor.rowcount
+    if purged:
+        logger.info(f"PGR snapshots: deleted {purged} default-partition row(s) older than {retention_days}d")
+    return dropped
+
+
+def maintain_snapshot_partitions(retention_days: int = SNAPSHOT_RETENTION_DAYS) -> dict:
+    """Create upcoming partitions and drop expired ones (safe to call every cycle)."""
+    try:
+        created = ensure_snapshot_partitions()
+        dropped = drop_expired_snapshot_partitions(retention_days)
+        return {'created': created, 'dropped': dropped}
+    except Exception as e:
+        logger.error(f"Snapshot partition maintenance failed: {e}")
+        return {'created': 0, 'dropped': [], 'error': str(e)}
+
+
+def migrate_snapshots_to_partitioned() -> bool:
+    """
+    One-off conversion of an existing unpartitioned pgr_odds_snapshots.
+
+    The old table is renamed and attached as a single partition covering
+    everything before tomorrow, so no rows are copied; it is dropped by
+    retention once its newest day ages out. New rows land in daily partitions.
+    """
+    if _snapshots_partitioned():
+        logger.info("pgr_odds_snapshots is already partitioned")
+        return False
+
+    cutover = (datetime.now(timezone.utc) + timedelta(days=1)).strftime('%Y-%m-%d')
+    with DatabaseConnection.get_cursor() as cursor:
+        cursor.execute("LOCK TABLE pgr_odds_snapshots IN ACCESS EXCLUSIVE MODE")
+        cursor.execute("ALTER TABLE pgr_odds_snapshots RENAME TO pgr_odds_snapshots_legacy")
+        for index_name in SNAPSHOT_INDEXES:
+            cursor.execute(f"ALTER INDEX IF EXISTS {index_name} RENAME TO {index_name}_legacy")
+        cursor.execute("ALTER TABLE pgr_odds_snapshots_legacy ALTER COLUMN id DROP DEFAULT")
+        cursor.execute("ALTER SEQUENCE IF EXISTS pgr_odds_snapshots_id_seq OWNED BY NONE")
+        cursor.execute(SNAPSHOTS_TABLE_SQL)
+        cursor.execute(f"""
+            ALTER TABLE pgr_odds_snapshots ATTACH PARTITION pgr_odds_snapshots_legacy
+            FOR VALUES FROM (MINVALUE) TO ('{cutover}')
+        """)
+        for index_name, columns in SNAPSHOT_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON pgr_odds_snapshots({columns})")
+
+    logger.info(f"pgr_odds_snapshots partitioned (legacy rows before {cutover})")
+    ensure_snapshot_partitions()
+    return True
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     s, e = create_pgr_schema()
     print(f"Schema created: {s} OK, {e} errors")
+    if "--partition-snapshots" in sys.argv:
+        migrate_snapshots_to_partitioned()
+    print(f"Snapshot partitions: {maintain_snapshot_partitions()}")
@@ -4,13 +4,14 @@ Sophisticated real football betting with xG, recent form, and H2H analysis
 """
 
 import os
-import requests
+from http_transport import http_get
 import time
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import statistics
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from results_scraper import ResultsScraper
 from football_learning_system import FootballLearningSystem
@@ -25,6 +26,7 @@ from referee_analyzer import RefereeAnalyzer
 from referee_stats_service import get_referee_stats as get_real_referee_stats
 from team_name_mapper import TeamNameMapper
 from db_helper import db_helper
+from response_cache import notify_data_changed
 from value_singles_engine import ValueSinglesEngine
 from bankroll_manager import get_bankroll_manager
 from data_collector import get_collector
@@ -102,6 +104,9 @@ class RealFootballChampion:
         if not self.odds_api_key:
             raise Exception("❌ THE_ODDS_API_KEY required for real betting")
         
+        # Per-cycle memo for team IDs / form / H2H (set only while run_analysis_cycle runs)
+        self._cycle_cache: Optional[Dict[str, Dict]] = None
+        
         # Initialize learning system
         try:
             self.learning_system = FootballLearningSystem()
@@ -575,7 +580,7 @@ class RealFootballChampion:
                     'dateFormat': 'iso'
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = http_get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -1065,7 +1070,22 @@ class RealFootballChampion:
         
         return fixtures
     
+    def _cycle_memo(self, bucket: str, key, compute):
+        """Return compute() memoized for the current analysis cycle (no-op outside a cycle)."""
+        cache = self._cycle_cache
+        if cache is None:
+            return compute()
+        store = cache.setdefault(bucket, {})
+        if key not in store:
+            store[key] = compute()
+        return store[key]
+    
     def get_team_last_5_games(self, team_name: str, team_id: int, venue: str = 'all') -> List[Dict]:
+        """Last 5 games for a team (memoized per analysis cycle)"""
+        return self._cycle_memo('last_5', (team_id, venue),
+                                lambda: self._fetch_team_last_5_games(team_name, team_id, venue))
+    
+    def _fetch_team_last_5_games(self, team_name: str, team_id: int, venue: str = 'all') -> List[Dict]:
         """
         Get last 5 games for a team using API-Football
         
@@ -1097,7 +1117,7 @@ class RealFootballChampion:
                 'status': 'FT'  # Only finished games
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = http_get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1204,6 +1224,10 @@ class RealFootballChampion:
         )
     
     def get_team_id_by_name(self, team_name: str) -> Optional[int]:
+        """Team ID lookup (memoized per analysis cycle)"""
+        return self._cycle_memo('team_id', team_name, lambda: self._fetch_team_id_by_name(team_name))
+    
+    def _fetch_team_id_by_name(self, team_name: str) -> Optional[int]:
         """Get team ID from team name using API-Football"""
         if not self.api_football_key:
             return None
@@ -1216,7 +1240,7 @@ class RealFootballChampion:
             url = f"{self.api_football_base_url}/teams"
             params = {'search': team_name}
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = http_get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1238,6 +1262,11 @@ class RealFootballChampion:
             return None
     
     def get_head_to_head(self, home_team: str, away_team: str) -> HeadToHead:
+        """Head-to-head statistics (memoized per analysis cycle)"""
+        return self._cycle_memo('h2h', (home_team, away_team),
+                                lambda: self._fetch_head_to_head(home_team, away_team))
+    
+    def _fetch_head_to_head(self, home_team: str, away_team: str) -> HeadToHead:
         """Get head-to-head statistics between two teams"""
         if not self.api_football_key:
             # Return mock data if no API key
@@ -1279,7 +1308,7 @@ class RealFootballChampion:
             url = f"{self.api_football_base_url}/fixtures/headtohead"
             params = {'h2h': f"{home_id}-{away_id}"}
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = http_get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -2244,7 +2273,7 @@ class RealFootballChampion:
                     'oddsFormat': 'decimal',
                     'dateFormat': 'iso'
                 }
-                resp = requests.get(url, params=params, timeout=8)
+                resp = http_get(url, params=params, timeout=8)
                 if resp.status_code == 200:
                     for event in resp.json():
                         event_id = event.get('id')
@@ -2306,7 +2335,7 @@ class RealFootballChampion:
                 }
                 
                 try:
-                    response = requests.get(url, params=params, timeout=8)
+                    response = http_get(url, params=params, timeout=8)
                     if response.status_code == 200:
                         data = response.json()
                         for event in data:
@@ -2325,7 +2354,7 @@ class RealFootballChampion:
 
                                 # Also fetch Pinnacle separately for this event
                                 try:
-                                    p_resp = requests.get(url, params={
+                                    p_resp = http_get(url, params={
                                         'apiKey': self.odds_api_key,
                                         'bookmakers': 'pinnacle',
                                         'markets': market_param,
@@ -2680,6 +2709,38 @@ class RealFootballChampion:
         
         print(f"🏆 Ranked {len(opportunities)} opportunities: {tier_counts['premium']} premium, {tier_counts['standard']} standard, {tier_counts['value']} value, {tier_counts['backup']} backup")
     
+    # Bounded parallelism for the analysis cycle (API-Football calls are I/O bound)
+    CYCLE_PREFETCH_WORKERS = 8
+    CYCLE_ANALYSIS_WORKERS = 4
+    
+    def _prefetch_cycle_data(self, matches: List[Dict]) -> None:
+        """
+        Stage 1: warm the cycle memo with team IDs, then form and H2H, concurrently.
+        find_balanced_opportunities() then runs without any blocking API-Football calls.
+        """
+        teams = sorted({m['home_team'] for m in matches} | {m['away_team'] for m in matches})
+        if not teams:
+            return
+        
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=self.CYCLE_PREFETCH_WORKERS) as pool:
+            team_ids = dict(zip(teams, pool.map(self.get_team_id_by_name, teams)))
+            
+            # Same ID fallbacks as find_balanced_opportunities (home → 1, away → 2)
+            form_keys = set()
+            for m in matches:
+                form_keys.add((m['home_team'], team_ids.get(m['home_team']) or 1))
+                form_keys.add((m['away_team'], team_ids.get(m['away_team']) or 2))
+            h2h_keys = {(m['home_team'], m['away_team']) for m in matches}
+            
+            futures = [pool.submit(self.get_team_last_5_games, name, team_id) for name, team_id in form_keys]
+            futures += [pool.submit(self.get_head_to_head, home, away) for home, away in h2h_keys]
+            for future in futures:
+                future.result()
+        
+        print(f"⚡ Prefetched {len(teams)} teams, {len(form_keys)} forms, {len(h2h_keys)} H2H "
+              f"in {time.time() - started:.1f}s")
+    
     def run_analysis_cycle(self):
         """Run complete analysis cycle (MAX 10 high-quality bets per day across all markets)"""
         print("🏆 REAL FOOTBALL CHAMPION - ANALYSIS CYCLE")
@@ -2700,37 +2761,54 @@ class RealFootballChampion:
         print(f"⚽ Analyzing {len(matches)} football matches...")
         
         total_opportunities = 0
-        
-        for match in matches:
-            # Check if we've reached daily limit
-            if self.get_todays_count() >= DAILY_LIMIT:
-                print(f"\n⚠️ DAILY LIMIT REACHED: {DAILY_LIMIT} bets generated")
-                break
-            
-            print(f"\n🔍 ANALYZING: {match['home_team']} vs {match['away_team']}")
+        self._cycle_cache = {}
+        try:
+            # Stage 1: concurrent prefetch of form / H2H / team IDs
+            self._prefetch_cycle_data(matches)
             
-            opportunities = self.find_balanced_opportunities(match)
+            # Stage 2: analyze all matches in a worker pool (served from the cycle memo)
+            with ThreadPoolExecutor(max_workers=self.CYCLE_ANALYSIS_WORKERS) as pool:
+                analyzed = list(pool.map(self.find_balanced_opportunities, matches))
             
-            for opp in opportunities:
-                # Check limit before each save
-                if self.get_todays_count() >= DAILY_LIMIT:
-                    print(f"⚠️ DAILY LIMIT REACHED: {DAILY_LIMIT} bets generated")
+            # Stage 3: save sequentially in slate order against an in-memory counter,
+            # read once here so saves made by other processes during analysis count
+            daily_count = self.get_todays_count()
+            today_date = datetime.now().strftime('%Y-%m-%d')
+            for match, opportunities in zip(matches, analyzed):
+                if daily_count >= DAILY_LIMIT:
+                    print(f"\n⚠️ DAILY LIMIT REACHED: {DAILY_LIMIT} bets generated")
                     break
                 
-                print(f"🎯 OPPORTUNITY FOUND:")
-                print(f"   📊 {opp.selection} @ {opp.odds}")
-                print(f"   📈 Edge: {opp.edge_percentage:.1f}%")
-                print(f"   🎯 Confidence: {opp.confidence}/100")
-                print(f"   💰 Stake: ${opp.stake:.2f}")
-                print(f"   🧠 xG Analysis: Home {opp.analysis['xg_prediction']['home_xg']:.1f}, Away {opp.analysis['xg_prediction']['away_xg']:.1f}")
+                print(f"\n🔍 ANALYZING: {match['home_team']} vs {match['away_team']}")
                 
-                saved = self.save_exact_score_opportunity(opp)
-                if saved:
-                    total_opportunities += 1
-            
-            # Break outer loop if limit reached
-            if self.get_todays_count() >= DAILY_LIMIT:
-                break
+                for opp in opportunities:
+                    # Check limit before each save
+                    if daily_count >= DAILY_LIMIT:
+                        print(f"⚠️ DAILY LIMIT REACHED: {DAILY_LIMIT} bets generated")
+                        break
+                    
+                    print(f"🎯 OPPORTUNITY FOUND:")
+                    print(f"   📊 {opp.selection} @ {opp.odds}")
+                    print(f"   📈 Edge: {opp.edge_percentage:.1f}%")
+                    print(f"   🎯 Confidence: {opp.confidence}/100")
+                    print(f"   💰 Stake: ${opp.stake:.2f}")
+                    print(f"   🧠 xG Analysis: Home {opp.analysis['xg_prediction']['home_xg']:.1f}, Away {opp.analysis['xg_prediction']['away_xg']:.1f}")
+                    
+                    saved = self.save_exact_score_opportunity(opp)
+                    if saved:
+                        total_opportunities += 1
+                        # Only rows get_todays_count() measures move the counter
+                        # (exact-score saves do not count toward the cap)
+                        if opp.market == 'Value Single' and (opp.match_date or '')[:10] == today_date:
+                            daily_count += 1
+        finally:
+            self._cycle_cache = None
+        
+        # Reconcile the in-memory counter with the database once per cycle
+        db_count = self.get_todays_count()
+        if db_count != daily_count:
+            print(f"📊 Daily count reconciled: {daily_count} → {db_count} (other processes saved meanwhile)")
+        print(f"📊 Daily count after cycle: {db_count}/{DAILY_LIMIT}")
         
         print(f"\n🏆 ANALYSIS COMPLETE: {total_opportunities} opportunities found")
         
@@ -4269,6 +4347,7 @@ class RealFootballChampion:
             """, (_ab, _ab_delay, _ab_entry_odds, _ab_entry_ts, result[0]))
             print(f"🧪 A/B timing: version={_ab} | delay={_ab_delay}min | pick_id={result[0]}")
             # ─────────────────────────────────────────────────────────────────
+            notify_data_changed('picks')
 
             try:
                 from bet_distribution_controller import send_instant_pick
@@ -4,7 +4,7 @@ Connects to The Odds API using your actual API key for REAL e-soccer odds
 """
 
 import os
-import requests
+from http_transport import http_get
 import json
 import time
 from typing import Dict, List, Optional
@@ -24,8 +24,7 @@ class RealOddsAPI:
             raise ValueError("THE_ODDS_API_KEY environment variable not found!")
         
         self.base_url = "https://api.the-odds-api.com/v4"
-        self.session = requests.Session()
-        self.session.params['apiKey'] = self.api_key
+        self.auth_params = {'apiKey': self.api_key}
         
         self.cache_manager = APICacheManager('odds_api', quota_limit=6000000)
         
@@ -50,7 +49,7 @@ class RealOddsAPI:
         
         try:
             logger.info("🔍 FETCHING AVAILABLE SPORTS FROM THE ODDS API...")
-            response = self.session.get(url)
+            response = http_get(url, params=self.auth_params)
             response.raise_for_status()
             
             self.cache_manager.increment_request_count()
@@ -124,7 +123,7 @@ class RealOddsAPI:
         
         try:
             logger.info(f"🔍 FETCHING LIVE ODDS FOR {sport_key}...")
-            response = self.session.get(url, params=params)
+            response = http_get(url, params={**self.auth_params, **params})
             response.raise_for_status()
             
             self.cache_manager.increment_request_count()
@@ -169,7 +168,7 @@ class RealOddsAPI:
         }
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = http_get(url, params={**self.auth_params, **params}, timeout=10)
             response.raise_for_status()
             
             self.cache_manager.increment_request_count()
@@ -8,8 +8,8 @@ import json
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
-import psycopg2
 from psycopg2.extras import RealDictCursor
+from db_connection import DatabaseConnection
 
 DISCORD_REDDIT_WEBHOOK_URL = os.getenv("DISCORD_REDDIT_WEBHOOK_URL")
 
@@ -22,21 +22,8 @@ HIGH_VISIBILITY_LEAGUES = [
 
 
 def get_db_connection():
-    """Get database connection."""
-    import time
-    for attempt in range(3):
-        try:
-            conn = psycopg2.connect(
-                os.getenv('DATABASE_URL'),
-                connect_timeout=10,
-                options='-c statement_timeout=30000'
-            )
-            return conn
-        except Exception as e:
-            if attempt < 2:
-                time.sleep(2)
-            else:
-                raise e
+    """Get a pooled database connection (close() returns it to the pool)."""
+    return DatabaseConnection.checkout('reddit_analytics', statement_timeout_ms=30000)
 
 
 def get_upcoming_matches(hours_ahead: int = 48, limit: int = 5) -> List[Dict]:
@@ -0,0 +1,217 @@
+"""
+API Response Cache
+Event-invalidated cache for read-heavy API endpoints.
+
+- Writers (save_opportunity, ResultsEngine, CLVService) call notify_data_changed(topic)
+  which sends a Postgres NOTIFY on CHANNEL
+- Each API process LISTENs on CHANNEL and bumps the topic's generation; cached
+  responses built under an older generation are recomputed on the next request
+- Concurrent misses for the same key share one computation (no stampede at kickoff)
+- A TTL still bounds every entry; it drops to LISTENER_DOWN_TTL while the
+  listener is disconnected, since events may be missed
+
+Usage:
+    from response_cache import cached_endpoint, notify_data_changed
+
+    @app.get("/api/stats/roi")
+    @cached_endpoint("stats_roi", topics=("results",))
+    async def get_roi_stats_endpoint():
+        ...
+
+    notify_data_changed("results")    # after settling bets
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import select
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "pgr_data_changed"
+TOPICS = ("picks", "results", "clv")
+DEFAULT_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "300"))   # seconds, upper bound even without events
+LISTENER_DOWN_TTL = 30
+MAX_ENTRIES = 512
+
+_lock = threading.Lock()
+_generations: Dict[str, int] = {topic: 0 for topic in TOPICS}
+_entries: Dict[Hashable, Tuple[Any, Tuple[int, ...], float]] = {}   # key -> (value, generations, stored_at)
+_inflight: Dict[Hashable, asyncio.Future] = {}
+_stats = {"hits": 0, "misses": 0, "shared": 0, "invalidations": 0, "events": 0}
+
+_listener_thread: Optional[threading.Thread] = None
+_listener_stop = threading.Event()
+_listener_connected = False
+
+
+# ── Invalidation ─────────────────────────────────────────────────────────────
+
+def invalidate(topic: Optional[str] = None) -> None:
+    """Mark every response depending on topic (or on anything, if None) as stale."""
+    with _lock:
+        for name in ([topic] if topic else list(_generations)):
+            _generations[name] = _generations.get(name, 0) + 1
+        _stats["invalidations"] += 1
+
+
+def notify_data_changed(topic: str) -> None:
+    """
+    Announce that data behind `topic` changed (picks saved, bets settled, CLV written).
+    Never raises: a missed event only means the TTL expires the entry instead.
+    """
+    invalidate(topic)
+    try:
+        from db_helper import db_helper
+        db_helper.execute("SELECT pg_notify(%s, %s)", (CHANNEL, topic))
+    except Exception as e:
+        logger.debug(f"Response cache notify failed for {topic}: {e}")
+
+
+def _listen_forever() -> None:
+    """Hold a dedicated LISTEN session (not a pool slot) and apply incoming events."""
+    global _listener_connected
+    import psycopg2
+    from db_connection import resolve_database_url
+
+    backoff = 1.0
+    while not _listener_stop.is_set():
+        conn = None
+        try:
+            conn = psycopg2.connect(
+                resolve_database_url(),
+                keepalives=1, keepalives_idle=30, keepalives_interval=10, keepalives_count=3,
+            )
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {CHANNEL}")
+            # Anything may have changed while we were disconnected
+            invalidate()
+            _listener_connected = True
+            backoff = 1.0
+            logger.info(f"✅ Response cache listening on '{CHANNEL}'")
+
+            while not _listener_stop.is_set():
+                if select.select([conn], [], [], 5.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    event = conn.notifies.pop(0)
+                    with _lock:
+                        _stats["events"] += 1
+                    invalidate(event.payload if event.payload in _generations else None)
+        except Exception as e:
+            logger.warning(f"⚠️ Response cache listener error, reconnecting in {backoff:.0f}s: {e}")
+        finally:
+            _listener_connected = False
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        _listener_stop.wait(backoff)
+        backoff = min(backoff * 2, 60.0)
+
+
+def start_listener() -> None:
+    """Start the LISTEN thread once per process (API startup)."""
+    global _listener_thread
+    from db_connection import resolve_database_url
+
+    if not resolve_database_url():
+        return
+    with _lock:
+        if _listener_thread is not None and _listener_thread.is_alive():
+            return
+        _listener_stop.clear()
+        _listener_thread = threading.Thread(target=_listen_forever, name="response-cache-listener", daemon=True)
+        _listener_thread.start()
+
+
+def stop_listener() -> None:
+    _listener_stop.set()
+
+
+# ── Lookup ───────────────────────────────────────────────────────────────────
+
+def _current(topics: Iterable[str]) -> Tuple[int, ...]:
+    return tuple(_generations.get(topic, 0) for topic in topics)
+
+
+async def get_or_compute(key: Hashable, topics: Tuple[str, ...], ttl: int,
+                         compute: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Cached value for key, or run compute() once for all concurrent callers.
+    Exceptions are propagated to every waiter and never cached.
+    """
+    max_age = ttl if _listener_connected else min(ttl, LISTENER_DOWN_TTL)
+    with _lock:
+        generations = _current(topics)
+        entry = _entries.get(key)
+        if entry is not None and entry[1] == generations and time.monotonic() - entry[2] < max_age:
+            _stats["hits"] += 1
+            return entry[0]
+        pending = _inflight.get(key)
+        if pending is not None:
+            _stats["shared"] += 1
+        else:
+            _stats["misses"] += 1
+
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    with _lock:
+        _inflight[key] = future
+    try:
+        value = await compute()
+    except BaseException as e:
+        if not isinstance(e, asyncio.CancelledError):
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; don't warn if there were none
+        else:
+            future.cancel()
+        raise
+    else:
+        future.set_result(value)
+        with _lock:
+            # Stored under the generations seen before computing: an event that
+            # arrived meanwhile already makes this entry stale
+            _entries[key] = (value, generations, time.monotonic())
+            if len(_entries) > MAX_ENTRIES:
+                oldest = min(_entries, key=lambda k: _entries[k][2])
+                _entries.pop(oldest, None)
+        return value
+    finally:
+        with _lock:
+            if _inflight.get(key) is future:
+                del _inflight[key]
+
+
+def cached_endpoint(name: str, topics: Tuple[str, ...], ttl: int = DEFAULT_TTL):
+    """
+    Cache an async FastAPI endpoint's return value per query-parameter set.
+    Place below @app.get so the route registers the cached wrapper.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return await get_or_compute(key, topics, ttl, lambda: fn(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/shared counts, current generations and listener state."""
+    with _lock:
+        stats = dict(_stats)
+        stats["entries"] = len(_entries)
+        stats["inflight"] = len(_inflight)
+        stats["generations"] = dict(_generations)
+    stats["listener_connected"] = _listener_connected
+    return stats
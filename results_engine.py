@@ -15,13 +15,14 @@ import logging
 import os
 import re
 import time
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import requests
+from http_transport import http_get
 from discord_notifier import send_result_to_discord
 from db_connection import clean_database_url, DatabaseConnection
+from response_cache import notify_data_changed
+from team_resolver import TeamIndex, settlement_match
 
 logging.basicConfig(
     level=logging.INFO,
@@ -46,6 +47,9 @@ class ResultsEngine:
             'fallback_used': 0
         }
         self._match_cache = {}
+        self._fixtures_by_date = {}   # api date -> API-Football fixtures (all statuses), per cycle
+        self._fixture_index_by_date = {}  # api date -> (home TeamIndex, away TeamIndex), per cycle
+        self._db_results = {}         # (home, away, date) -> settled result or None, per cycle
         self._manual_results = None
         self._verification_metrics = None
         self._roi_sent_date = None
@@ -77,6 +81,9 @@ class ResultsEngine:
         logger.info("="*60)
         
         self.stats = {'settled': 0, 'voided': 0, 'failed': 0, 'api_calls': 0, 'manual_applied': 0, 'fallback_used': 0}
+        self._fixtures_by_date = {}
+        self._fixture_index_by_date = {}
+        self._db_results = {}
         
         try:
             self._auto_void_old_bets()
@@ -87,6 +94,9 @@ class ResultsEngine:
             logger.info(f"✅ RESULTS ENGINE COMPLETE: {self.stats['settled']} settled, {self.stats['voided']} voided, {self.stats['failed']} failed")
             logger.info("="*60)
             
+            if self.stats['settled'] > 0 or self.stats['voided'] > 0:
+                notify_data_changed('results')
+            
             if self.stats['settled'] > 0:
                 self._send_discord_update()
             
@@ -102,7 +112,7 @@ class ResultsEngine:
             return
         
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = self._get_db_connection()
             cursor = conn.cursor()
             now_ts = int(datetime.now().timestamp())
             
@@ -154,18 +164,10 @@ class ResultsEngine:
             logger.error(f"❌ Auto-void error: {e}")
     
     def _get_db_connection(self):
-        """Get a fresh database connection with retry logic."""
+        """Get a pooled database connection with retry logic (close() returns it to the pool)."""
         for attempt in range(3):
             try:
-                conn = psycopg2.connect(
-                    self.database_url,
-                    connect_timeout=30,
-                    keepalives=1,
-                    keepalives_idle=30,
-                    keepalives_interval=10,
-                    keepalives_count=5
-                )
-                return conn
+                return DatabaseConnection.checkout('results_engine')
             except Exception as e:
                 if attempt < 2:
                     logger.warning(f"DB connection attempt {attempt+1} failed: {e}, retrying...")
@@ -201,61 +203,69 @@ class ResultsEngine:
             
             logger.info(f"📋 Found {len(pending)} pending football bets to settle")
             
-            matches_processed = {}
+            # One result lookup per fixture (and per stats market), not per bet
+            fixtures = {}
+            for bet in pending:
+                fixture_key = (bet['home_team'], bet['away_team'], str(bet['match_date'])[:10])
+                fixtures.setdefault(fixture_key, []).append(bet)
+            self._prefetch_database_results(list(fixtures))
+            
             bets_to_update = []
             
-            for bet in pending:
-                try:
-                    manual_mgr = self._get_manual_results_manager()
-                    if manual_mgr:
-                        manual_result = manual_mgr.get_manual_result(bet['id'], 'football_opportunities')
-                        if manual_result:
-                            outcome = manual_result['result'].lower()
-                            if outcome in ['won', 'lost', 'void']:
-                                bets_to_update.append((bet['id'], outcome, {'source': 'manual'}, None, dict(bet)))
-                                self.stats['settled'] += 1
-                                self.stats['manual_applied'] += 1
-                                logger.info(f"📋 Applied manual result for bet #{bet['id']}: {outcome}")
-                                continue
-                    
-                    match_key = f"{bet['home_team']}_{bet['away_team']}_{bet['match_date']}"
-                    market = (bet.get('market') or '').lower()
-                    
-                    if match_key not in matches_processed:
-                        result = self._get_match_result_with_fallbacks(
-                            bet['home_team'], bet['away_team'], bet['match_date'], 
-                            bet.get('match_id'), market, bet['id']
-                        )
-                        matches_processed[match_key] = result
-                        time.sleep(0.3)
-                    else:
-                        result = matches_processed[match_key]
-                    
-                    if not result:
-                        logger.warning(f"⏳ No result yet for: {bet['home_team']} vs {bet['away_team']} ({bet['match_date']}, market={market})")
-                        continue
-                    
-                    if result.get('void'):
-                        bets_to_update.append((bet['id'], 'void', result, None, dict(bet)))
-                        self.stats['voided'] += 1
-                        logger.info(f"🚫 Voiding bet #{bet['id']} - match was {result.get('status', 'postponed')}")
-                        continue
-                    
-                    outcome = self._calculate_outcome(bet, result)
-                    if outcome == 'void':
-                        bets_to_update.append((bet['id'], 'void', result, None, dict(bet)))
-                        self.stats['voided'] += 1
-                        logger.info(f"🔄 AH push/void bet #{bet['id']}")
-                    elif outcome in ['won', 'lost']:
-                        training_key = bet.get('match_id', match_key)
-                        bets_to_update.append((bet['id'], outcome, result, training_key, dict(bet)))
-                        self.stats['settled'] += 1
-                        if result.get('source') not in ['api-football', 'database']:
-                            self.stats['fallback_used'] += 1
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️ Error processing bet {bet['id']}: {e}")
-                    self.stats['failed'] += 1
+            for fixture_key, fixture_bets in fixtures.items():
+                results_by_kind = {}
+                for bet in fixture_bets:
+                    try:
+                        manual_mgr = self._get_manual_results_manager()
+                        if manual_mgr:
+                            manual_result = manual_mgr.get_manual_result(bet['id'], 'football_opportunities')
+                            if manual_result:
+                                outcome = manual_result['result'].lower()
+                                if outcome in ['won', 'lost', 'void']:
+                                    bets_to_update.append((bet['id'], outcome, {'source': 'manual'}, None, dict(bet)))
+                                    self.stats['settled'] += 1
+                                    self.stats['manual_applied'] += 1
+                                    logger.info(f"📋 Applied manual result for bet #{bet['id']}: {outcome}")
+                                    continue
+                        
+                        market = (bet.get('market') or '').lower()
+                        kind = market if market in ['corners', 'cards'] else 'goals'
+                        
+                        if kind not in results_by_kind:
+                            api_calls_before = self.stats['api_calls']
+                            results_by_kind[kind] = self._get_match_result_with_fallbacks(
+                                bet['home_team'], bet['away_team'], bet['match_date'], 
+                                bet.get('match_id'), market, bet['id']
+                            )
+                            if self.stats['api_calls'] > api_calls_before:
+                                time.sleep(0.3)
+                        result = results_by_kind[kind]
+                        
+                        if not result:
+                            logger.warning(f"⏳ No result yet for: {bet['home_team']} vs {bet['away_team']} ({bet['match_date']}, market={market})")
+                            continue
+                        
+                        if result.get('void'):
+                            bets_to_update.append((bet['id'], 'void', result, None, dict(bet)))
+                            self.stats['voided'] += 1
+                            logger.info(f"🚫 Voiding bet #{bet['id']} - match was {result.get('status', 'postponed')}")
+                            continue
+                        
+                        outcome = self._calculate_outcome(bet, result)
+                        if outcome == 'void':
+                            bets_to_update.append((bet['id'], 'void', result, None, dict(bet)))
+                            self.stats['voided'] += 1
+                            logger.info(f"🔄 AH push/void bet #{bet['id']}")
+                        elif outcome in ['won', 'lost']:
+                            training_key = bet.get('match_id', f"{bet['home_team']}_{bet['away_team']}_{bet['match_date']}")
+                            bets_to_update.append((bet['id'], outcome, result, training_key, dict(bet)))
+                            self.stats['settled'] += 1
+                            if result.get('source') not in ['api-football', 'database']:
+                                self.stats['fallback_used'] += 1
+                        
+                    except Exception as e:
+                        logger.warning(f"⚠️ Error processing bet {bet['id']}: {e}")
+                        self.stats['failed'] += 1
             
             if bets_to_update:
                 update_conn = self._get_db_connection()
@@ -263,16 +273,34 @@ class ResultsEngine:
                 
                 settled_for_discord = []
                 
-                for bet_id, outcome, result, training_key, bet_data in bets_to_update:
-                    try:
-                        self._update_football_bet(update_cursor, bet_id, outcome, result)
-                        if training_key and result.get('home_goals') is not None:
-                            self._update_training_data(update_cursor, training_key, result['home_goals'], result['away_goals'])
-                        logger.info(f"✅ Settled football #{bet_id}: {outcome.upper()}")
-                        if outcome in ['won', 'lost', 'void']:
+                try:
+                    self._update_football_bets(update_cursor, [
+                        (bet_id, outcome, bet_data.get('odds')) for bet_id, outcome, _, _, bet_data in bets_to_update
+                    ])
+                    update_conn.commit()
+                    settled_for_discord = [
+                        (bet_id, bet_data, outcome, result) for bet_id, outcome, result, _, bet_data in bets_to_update
+                    ]
+                except Exception as e:
+                    # Fall back to row-by-row so one bad row doesn't block the rest
+                    logger.warning(f"⚠️ Batched settlement update failed, retrying per bet: {e}")
+                    update_conn.rollback()
+                    for bet_id, outcome, result, training_key, bet_data in bets_to_update:
+                        try:
+                            self._update_football_bet(update_cursor, bet_id, outcome, result)
+                            update_conn.commit()
                             settled_for_discord.append((bet_id, bet_data, outcome, result))
-                    except Exception as e:
-                        logger.warning(f"⚠️ Error updating bet {bet_id}: {e}")
+                        except Exception as e:
+                            update_conn.rollback()
+                            logger.warning(f"⚠️ Error updating bet {bet_id}: {e}")
+                
+                # Each fixture's training row only needs the score once
+                training_scores = {}
+                for bet_id, outcome, result, training_key, bet_data in bets_to_update:
+                    if training_key and result.get('home_goals') is not None:
+                        training_scores[training_key] = (result['home_goals'], result['away_goals'])
+                for training_key, (home_goals, away_goals) in training_scores.items():
+                    self._update_training_data(update_cursor, training_key, home_goals, away_goals)
                 
                 update_conn.commit()
                 update_cursor.close()
@@ -577,10 +605,74 @@ class ResultsEngine:
             except Exception as e:
                 logger.warning(f"Metrics log error: {e}")
     
+    @staticmethod
+    def _result_from_settled_row(row: Dict) -> Optional[Dict]:
+        """Goals/corners/cards dict from an already settled football_opportunities row."""
+        result = {}
+        if row.get('actual_score'):
+            score_parts = row['actual_score'].split('-')
+            if len(score_parts) == 2:
+                result['home_goals'] = int(score_parts[0])
+                result['away_goals'] = int(score_parts[1])
+        
+        if row.get('home_corners') is not None:
+            result['home_corners'] = row['home_corners']
+            result['away_corners'] = row.get('away_corners', 0)
+            result['total_corners'] = result['home_corners'] + result['away_corners']
+        
+        if row.get('home_cards') is not None:
+            result['home_cards'] = row['home_cards']
+            result['away_cards'] = row.get('away_cards', 0)
+            result['total_cards'] = result['home_cards'] + result['away_cards']
+        
+        if result:
+            result['source'] = 'database'
+            return result
+        return None
+    
+    def _prefetch_database_results(self, fixture_keys: List[tuple]):
+        """Load already settled results for many (home, away, date) fixtures in one query."""
+        wanted = [key for key in fixture_keys if key not in self._db_results]
+        if not wanted:
+            return
+        try:
+            conn = self._get_db_connection()
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute("""
+                SELECT home_team, away_team, DATE(match_date)::text AS match_day,
+                       home_corners, away_corners, home_cards, away_cards, actual_score
+                FROM football_opportunities 
+                WHERE home_team = ANY(%s) AND away_team = ANY(%s)
+                AND DATE(match_date) = ANY(%s::date[])
+                AND outcome IN ('won', 'lost')
+                AND (home_corners IS NOT NULL OR actual_score IS NOT NULL)
+            """, (
+                list({key[0] for key in wanted}),
+                list({key[1] for key in wanted}),
+                list({key[2] for key in wanted}),
+            ))
+            rows = cursor.fetchall()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            logger.warning(f"Database result prefetch error: {e}")
+            return
+        
+        for key in wanted:
+            self._db_results[key] = None
+        for row in rows:
+            key = (row['home_team'], row['away_team'], row['match_day'])
+            if key in self._db_results and self._db_results[key] is None:
+                self._db_results[key] = self._result_from_settled_row(row)
+    
     def _check_database_for_result(self, home_team: str, away_team: str, match_date: str) -> Optional[Dict]:
         """Check if we already have settled results in database for this match."""
+        fixture_key = (home_team, away_team, str(match_date)[:10])
+        if fixture_key in self._db_results:
+            return self._db_results[fixture_key]
+        
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = self._get_db_connection()
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cursor.execute("""
@@ -597,101 +689,101 @@ class ResultsEngine:
             cursor.close()
             conn.close()
             
-            if row:
-                result = {}
-                if row.get('actual_score'):
-                    score_parts = row['actual_score'].split('-')
-                    if len(score_parts) == 2:
-                        result['home_goals'] = int(score_parts[0])
-                        result['away_goals'] = int(score_parts[1])
-                
-                if row.get('home_corners') is not None:
-                    result['home_corners'] = row['home_corners']
-                    result['away_corners'] = row.get('away_corners', 0)
-                    result['total_corners'] = result['home_corners'] + result['away_corners']
-                
-                if row.get('home_cards') is not None:
-                    result['home_cards'] = row['home_cards']
-                    result['away_cards'] = row.get('away_cards', 0)
-                    result['total_cards'] = result['home_cards'] + result['away_cards']
-                
-                if result:
-                    result['source'] = 'database'
-                    return result
-            
-            return None
+            return self._result_from_settled_row(row) if row else None
             
         except Exception as e:
             logger.warning(f"Database result check error: {e}")
             return None
     
+    def _get_fixtures_for_date(self, api_date: str) -> Optional[List[Dict]]:
+        """All API-Football fixtures (any status) for a date, fetched once per cycle."""
+        if api_date in self._fixtures_by_date:
+            return self._fixtures_by_date[api_date]
+        
+        url = "https://v3.football.api-sports.io/fixtures"
+        headers = {
+            'X-RapidAPI-Key': self.api_football_key,
+            'X-RapidAPI-Host': 'v3.football.api-sports.io'
+        }
+        response = http_get(url, headers=headers, params={'date': api_date}, timeout=20)
+        self.stats['api_calls'] += 1
+        
+        if response.status_code != 200:
+            return None
+        fixtures = response.json().get('response', [])
+        self._fixtures_by_date[api_date] = fixtures
+        logger.info(f"📅 Loaded {len(fixtures)} API-Football fixtures for {api_date}")
+        return fixtures
+    
+    def _candidate_fixtures(self, api_date: str, fixtures: List[Dict], home_team: str, away_team: str) -> List[Dict]:
+        """Fixtures (in API order) whose teams could pass _fuzzy_match, via a per-date TeamIndex."""
+        indexes = self._fixture_index_by_date.get(api_date)
+        if indexes is None:
+            home_names, away_names = [], []
+            for fixture in fixtures:
+                teams = fixture.get('teams', {})
+                home_names.append(self._normalize_team_name(teams.get('home', {}).get('name', '').lower()))
+                away_names.append(self._normalize_team_name(teams.get('away', {}).get('name', '').lower()))
+            indexes = self._fixture_index_by_date[api_date] = (TeamIndex(home_names), TeamIndex(away_names))
+        home_index, away_index = indexes
+        positions = set(home_index.candidates(self._normalize_team_name(home_team)))
+        positions.intersection_update(away_index.candidates(self._normalize_team_name(away_team)))
+        return [fixtures[p] for p in sorted(positions)]
+    
     def _get_api_football_result(self, home_team: str, away_team: str, match_date: str, match_id: Optional[int]) -> Optional[Dict]:
         """Get result from API-Football."""
         try:
             api_date = match_date.split('T')[0] if 'T' in str(match_date) else str(match_date)[:10]
             
-            url = "https://v3.football.api-sports.io/fixtures"
-            headers = {
-                'X-RapidAPI-Key': self.api_football_key,
-                'X-RapidAPI-Host': 'v3.football.api-sports.io'
-            }
+            fixtures = self._get_fixtures_for_date(api_date)
+            if fixtures is None:
+                return None
+            fixtures = self._candidate_fixtures(api_date, fixtures, home_team, away_team)
             
             # First check for finished matches
-            params = {'date': api_date, 'status': 'FT'}
-            response = requests.get(url, headers=headers, params=params, timeout=20)
-            self.stats['api_calls'] += 1
-            
-            if response.status_code == 200:
-                fixtures = response.json().get('response', [])
+            for fixture in fixtures:
+                if fixture.get('fixture', {}).get('status', {}).get('short', '') != 'FT':
+                    continue
+                teams = fixture.get('teams', {})
+                home_api = teams.get('home', {}).get('name', '').lower()
+                away_api = teams.get('away', {}).get('name', '').lower()
                 
-                for fixture in fixtures:
-                    teams = fixture.get('teams', {})
-                    home_api = teams.get('home', {}).get('name', '').lower()
-                    away_api = teams.get('away', {}).get('name', '').lower()
+                if self._fuzzy_match(home_team, home_api) and self._fuzzy_match(away_team, away_api):
+                    goals = fixture.get('goals', {})
+                    home_goals = goals.get('home')
+                    away_goals = goals.get('away')
                     
-                    if self._fuzzy_match(home_team, home_api) and self._fuzzy_match(away_team, away_api):
-                        goals = fixture.get('goals', {})
-                        home_goals = goals.get('home')
-                        away_goals = goals.get('away')
+                    if home_goals is not None and away_goals is not None:
+                        result = {
+                            'home_goals': int(home_goals),
+                            'away_goals': int(away_goals),
+                            'source': 'api-football'
+                        }
+                        
+                        fixture_id = fixture.get('fixture', {}).get('id')
+                        if fixture_id:
+                            stats = self._get_fixture_stats(fixture_id)
+                            if stats:
+                                result.update(stats)
                         
-                        if home_goals is not None and away_goals is not None:
-                            result = {
-                                'home_goals': int(home_goals),
-                                'away_goals': int(away_goals),
-                                'source': 'api-football'
-                            }
-                            
-                            fixture_id = fixture.get('fixture', {}).get('id')
-                            if fixture_id:
-                                stats = self._get_fixture_stats(fixture_id)
-                                if stats:
-                                    result.update(stats)
-                            
-                            return result
+                        return result
             
             # Check for postponed/cancelled matches (should be voided)
-            params_all = {'date': api_date}
-            response_all = requests.get(url, headers=headers, params=params_all, timeout=20)
-            self.stats['api_calls'] += 1
-            
-            if response_all.status_code == 200:
-                all_fixtures = response_all.json().get('response', [])
+            for fixture in fixtures:
+                teams = fixture.get('teams', {})
+                home_api = teams.get('home', {}).get('name', '').lower()
+                away_api = teams.get('away', {}).get('name', '').lower()
                 
-                for fixture in all_fixtures:
-                    teams = fixture.get('teams', {})
-                    home_api = teams.get('home', {}).get('name', '').lower()
-                    away_api = teams.get('away', {}).get('name', '').lower()
-                    
-                    if self._fuzzy_match(home_team, home_api) and self._fuzzy_match(away_team, away_api):
-                        status = fixture.get('fixture', {}).get('status', {}).get('short', '')
-                        # PST=Postponed, CANC=Cancelled, ABD=Abandoned
-                        if status in ['PST', 'CANC', 'ABD']:
-                            logger.info(f"🚫 Match {home_team} vs {away_team} was {status} - marking for void")
-                            return {
-                                'status': status,
-                                'void': True,
-                                'source': 'api-football'
-                            }
+                if self._fuzzy_match(home_team, home_api) and self._fuzzy_match(away_team, away_api):
+                    status = fixture.get('fixture', {}).get('status', {}).get('short', '')
+                    # PST=Postponed, CANC=Cancelled, ABD=Abandoned
+                    if status in ['PST', 'CANC', 'ABD']:
+                        logger.info(f"🚫 Match {home_team} vs {away_team} was {status} - marking for void")
+                        return {
+                            'status': status,
+                            'void': True,
+                            'source': 'api-football'
+                        }
             
             return None
             
@@ -709,7 +801,7 @@ class ResultsEngine:
             }
             params = {'fixture': fixture_id}
             
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = http_get(url, headers=headers, params=params, timeout=15)
             self.stats['api_calls'] += 1
             
             if response.status_code != 200:
@@ -760,51 +852,8 @@ class ResultsEngine:
         return normalized
     
     def _fuzzy_match(self, team1: str, team2: str) -> bool:
-        """Fuzzy match team names with common abbreviations."""
-        TEAM_ALIASES = {
-            'qpr': ['queens park rangers', 'queens park'],
-            'man utd': ['manchester united', 'man united'],
-            'man city': ['manchester city'],
-            'spurs': ['tottenham', 'tottenham hotspur'],
-            'wolves': ['wolverhampton', 'wolverhampton wanderers'],
-            'brighton': ['brighton & hove albion', 'brighton hove'],
-            'west ham': ['west ham united'],
-            'newcastle': ['newcastle united'],
-            'norwich': ['norwich city'],
-            'leeds': ['leeds united'],
-            'sheff utd': ['sheffield united', 'sheffield utd'],
-            'sheff wed': ['sheffield wednesday'],
-            'nottm forest': ['nottingham forest'],
-            'west brom': ['west bromwich albion', 'west bromwich'],
-            'psg': ['paris saint-germain', 'paris saint germain', 'paris sg'],
-            'atletico': ['atletico madrid', 'atletico de madrid'],
-            'real': ['real madrid'],
-            'inter': ['inter milan', 'internazionale'],
-            'ac milan': ['milan'],
-            'bayern': ['bayern munich', 'bayern munchen'],
-            'dortmund': ['borussia dortmund'],
-            'rb leipzig': ['rasenballsport leipzig', 'leipzig'],
-            'leverkusen': ['bayer leverkusen', 'bayer 04 leverkusen'],
-        }
-        
-        t1 = self._normalize_team_name(team1)
-        t2 = self._normalize_team_name(team2)
-        
-        if t1 == t2:
-            return True
-        if t1 in t2 or t2 in t1:
-            return True
-        if t1.split()[0] == t2.split()[0]:
-            return True
-        
-        for abbrev, full_names in TEAM_ALIASES.items():
-            names_set = set([abbrev] + full_names)
-            if t1 in names_set and t2 in names_set:
-                return True
-            if any(t1 in name or name in t1 for name in names_set) and any(t2 in name or name in t2 for name in names_set):
-                return True
-        
-        return False
+        """Fuzzy match team names with common abbreviations (memoized, see team_resolver)."""
+        return settlement_match(self._normalize_team_name(team1), self._normalize_team_name(team2))
     
     def _calculate_outcome(self, bet: Dict, result: Dict) -> str:
         """Calculate bet outcome based on match result."""
@@ -966,19 +1015,22 @@ class ResultsEngine:
         
         return 'unknown'
     
+    @staticmethod
+    def _profit_loss(outcome: str, odds) -> float:
+        """Level-stake P/L in units for a settled outcome."""
+        if outcome == 'won':
+            return float(odds or 1) - 1
+        if outcome == 'void':
+            return 0.0
+        return -1.0
+    
     def _update_football_bet(self, cursor, bet_id: int, outcome: str, result: Dict):
         """Update football bet with outcome."""
         profit_loss = 0
         cursor.execute("SELECT odds FROM football_opportunities WHERE id = %s", (bet_id,))
         row = cursor.fetchone()
         if row:
-            odds = float(row['odds'] or 1)
-            if outcome == 'won':
-                profit_loss = (odds - 1)
-            elif outcome == 'void':
-                profit_loss = 0.0
-            else:
-                profit_loss = -1.0
+            profit_loss = self._profit_loss(outcome, row['odds'])
         
         now_ts = int(datetime.now().timestamp())
         cursor.execute("""
@@ -993,6 +1045,27 @@ class ResultsEngine:
         
         logger.info(f"✅ Settled football #{bet_id}: {outcome.upper()}")
     
+    def _update_football_bets(self, cursor, settlements: List[tuple]):
+        """Settle many football bets in one statement. settlements: (bet_id, outcome, odds)"""
+        now_ts = int(datetime.now().timestamp())
+        rows = [
+            (bet_id, outcome, outcome.upper(), self._profit_loss(outcome, odds), now_ts)
+            for bet_id, outcome, odds in settlements
+        ]
+        execute_values(cursor, """
+            UPDATE football_opportunities AS f
+            SET outcome = v.outcome,
+                result = v.result,
+                profit_loss = v.profit_loss,
+                status = 'settled',
+                settled_timestamp = v.settled_timestamp
+            FROM (VALUES %s) AS v(id, outcome, result, profit_loss, settled_timestamp)
+            WHERE f.id = v.id
+        """, rows, template="(%s, %s, %s, %s::double precision, %s::bigint)", page_size=500)
+        
+        for bet_id, outcome, _, _, _ in rows:
+            logger.info(f"✅ Settled football #{bet_id}: {outcome.upper()}")
+    
     def _update_sgp_bet(self, cursor, bet_id: int, outcome: str):
         """Update SGP bet with outcome."""
         now_ts = int(datetime.now().timestamp())
@@ -10,6 +10,7 @@ import logging
 from typing import Optional, List
 from db_helper import db_helper
 from team_name_mapper import TeamNameMapper
+from team_resolver import get_team_resolver
 from telegram_sender import TelegramBroadcaster
 from discord_notifier import send_result_to_discord
 from selenium import webdriver
@@ -66,6 +67,7 @@ class ResultsScraper:
     def __init__(self, db_path='data/real_football.db'):
         self.db_path = db_path
         self.team_mapper = TeamNameMapper()
+        self.team_resolver = get_team_resolver()
         self._init_cache_db()
         self._init_verification_tracking()
         self._init_telegram()
@@ -1033,6 +1035,10 @@ class ResultsScraper:
         if std_scraped.lower() == std_bet.lower():
             return True
         
+        # Known aliases of the same club (shared resolver index)
+        if self.team_resolver.canonical(scraped_team) == self.team_resolver.canonical(bet_team):
+            return True
+        
         # Normalize both teams - remove special chars, extra spaces, common prefixes
         def normalize(team):
             team = team.lower()
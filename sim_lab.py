@@ -57,7 +57,7 @@ st.divider()
 if run_btn or "sim_result" in st.session_state:
     if run_btn:
         with st.spinner(f"Simulerar {n_sim:,} matcher..."):
-            result = simulate_match(xg_home, xg_away, n_sim=n_sim)
+            result = simulate_match(xg_home, xg_away, n_sim=n_sim, method="sample")
         st.session_state["sim_result"] = result
         st.session_state["sim_params"] = (home_team, away_team, xg_home, xg_away, n_sim)
     else:
@@ -14,8 +14,12 @@ football_opportunities or any production engine path.
 
 import logging
 import time
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Set, Tuple
 
+from psycopg2.extras import execute_values
+
+from db_connection import DatabaseConnection
 from db_helper import db_helper
 from clv_service import (
     CLVService, _sport_key, _market_type, SHARP_BOOKS, PROOF_BOOKS, FALLBACK_BOOKS,
@@ -56,70 +60,75 @@ class SnapshotWriter:
             })
         return picks
 
-    def _recently_logged(self, event_id: str, mtype: str, sel: str, book: str) -> bool:
-        from datetime import datetime, timedelta
+    def _recent_keys(self, event_ids: List[str]) -> Set[Tuple[str, str, str, str]]:
+        """(event_id, market_type, selection, bookmaker) snapshotted in the last
+        MIN_INTERVAL_MIN minutes, for all events in one query."""
+        if not event_ids:
+            return set()
         cutoff = datetime.utcnow() - timedelta(minutes=MIN_INTERVAL_MIN)
-        row = db_helper.execute("""
-            SELECT 1 FROM pgr_odds_snapshots
-            WHERE event_id=%s AND market_type=%s AND selection=%s
-              AND bookmaker=%s AND timestamp_utc > %s
-            LIMIT 1
-        """, (event_id, mtype, sel, book, cutoff), fetch='one')
-        return bool(row)
-
-    def _write_snapshot(self, pick: Dict, mtype: str, sel: str,
-                        book: str, odds: float, line: Optional[float] = None):
-        from datetime import datetime
+        rows = db_helper.execute("""
+            SELECT DISTINCT event_id, market_type, selection, bookmaker
+            FROM pgr_odds_snapshots
+            WHERE event_id = ANY(%s) AND timestamp_utc > %s
+        """, (list(event_ids), cutoff), fetch='all') or []
+        return {(r[0], r[1], r[2], r[3]) for r in rows}
+
+    def _write_snapshots(self, rows: List[Tuple]) -> int:
+        """Bulk INSERT snapshot rows (see _snapshot_rows_for_pick). Returns rows written."""
+        if not rows:
+            return 0
         try:
-            event_id = f"{pick['fixture_id'] or pick['match_id'] or pick['id']}"
-            db_helper.execute("""
-                INSERT INTO pgr_odds_snapshots
-                  (event_id, sport, league_id, league_name, start_time_utc,
-                   home_team, away_team, market_type, selection, line,
-                   bookmaker, odds_decimal, timestamp_utc, fixture_id)
-                VALUES (%s, 'football', %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, NOW(), %s)
-            """, (
-                event_id, str(pick.get('league') or ''), pick.get('league') or '',
-                datetime.utcfromtimestamp(pick['kickoff_epoch']),
-                pick['home_team'], pick['away_team'], mtype, sel, line,
-                book, odds, pick.get('fixture_id'),
-            ))
+            with DatabaseConnection.get_cursor() as cursor:
+                execute_values(cursor, """
+                    INSERT INTO pgr_odds_snapshots
+                      (event_id, sport, league_id, league_name, start_time_utc,
+                       home_team, away_team, market_type, selection, line,
+                       bookmaker, odds_decimal, timestamp_utc, fixture_id)
+                    VALUES %s
+                """, rows,
+                    template="(%s, 'football', %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s)",
+                    page_size=500)
+            return len(rows)
         except Exception as e:
-            logger.debug("snapshot insert failed pick=%s book=%s: %s",
-                         pick['id'], book, e)
+            logger.warning("snapshot bulk insert failed (%d rows): %s", len(rows), e)
+            return 0
 
-    def capture_for_pick(self, pick: Dict) -> int:
-        """Fetch current sharp+fallback odds for one pick and write snapshots.
-        Returns # of snapshot rows written."""
+    def _event_for_pick(self, pick: Dict, sport: str, mtype: str,
+                        events_cache: Dict[Tuple[str, str], List[Dict]]) -> Optional[Dict]:
+        key = (sport, mtype)
+        if key not in events_cache:
+            try:
+                events_cache[key] = self.clv.odds_api.get_live_odds(
+                    sport, regions=['eu', 'uk'], markets=[mtype]
+                ) or []
+            except Exception as e:
+                logger.debug("snapshot odds fetch failed sport=%s market=%s: %s", sport, mtype, e)
+                events_cache[key] = []
+        for ev in events_cache[key]:
+            if self.clv._teams_match(ev, pick['home_team'], pick['away_team']):
+                return ev
+        return None
+
+    def _snapshot_rows_for_pick(self, pick: Dict,
+                                events_cache: Dict[Tuple[str, str], List[Dict]]) -> List[Tuple]:
+        """Current sharp+fallback odds for one pick as INSERT rows (no DB access).
+        Row = (event_id, league_id, league_name, start_time, home, away,
+               market_type, selection, line, bookmaker, odds, fixture_id)."""
         if not self.clv.odds_api:
-            return 0
+            return []
 
         sport = _sport_key(pick.get('league', ''))
         mtype = _market_type(pick['market'], pick['selection'])
         if not sport or not mtype:
-            return 0
-
-        try:
-            events = self.clv.odds_api.get_live_odds(
-                sport, regions=['eu', 'uk'], markets=[mtype]
-            )
-        except Exception as e:
-            logger.debug("snapshot odds fetch failed pick=%s: %s", pick['id'], e)
-            return 0
-        if not events:
-            return 0
+            return []
 
-        # Find this pick's event in returned data
-        event = None
-        for ev in events:
-            if self.clv._teams_match(ev, pick['home_team'], pick['away_team']):
-                event = ev; break
+        event = self._event_for_pick(pick, sport, mtype, events_cache)
         if not event:
-            return 0
+            return []
 
-        written = 0
+        rows = []
         event_id = str(pick.get('fixture_id') or pick.get('match_id') or pick['id'])
+        start_time = datetime.utcfromtimestamp(pick['kickoff_epoch'])
 
         for bk in event.get('bookmakers', []) or []:
             book = (bk.get('key') or '').lower()
@@ -135,12 +144,40 @@ class SnapshotWriter:
                         continue
                     line = outcome.get('point')
                     sel_key = f"{name}{(' '+str(line)) if line is not None else ''}"
-                    if self._recently_logged(event_id, mtype, sel_key, book):
-                        continue
-                    self._write_snapshot(pick, mtype, sel_key, book,
-                                         float(price), line)
-                    written += 1
-        return written
+                    rows.append((
+                        event_id, str(pick.get('league') or ''), pick.get('league') or '',
+                        start_time, pick['home_team'], pick['away_team'], mtype, sel_key, line,
+                        book, float(price), pick.get('fixture_id'),
+                    ))
+        return rows
+
+    def capture_for_pick(self, pick: Dict) -> int:
+        """Fetch current sharp+fallback odds for one pick and write snapshots.
+        Returns # of snapshot rows written."""
+        return self._capture([pick])
+
+    def _capture(self, picks: List[Dict]) -> int:
+        """Collect rows for all picks, drop (event, market, selection, book) keys
+        logged within MIN_INTERVAL_MIN, and write the rest in one statement."""
+        events_cache: Dict[Tuple[str, str], List[Dict]] = {}
+        candidates = []
+        for p in picks:
+            try:
+                candidates.extend(self._snapshot_rows_for_pick(p, events_cache))
+            except Exception as e:
+                logger.debug("snapshot pick=%s err: %s", p['id'], e)
+        if not candidates:
+            return 0
+
+        seen = self._recent_keys(sorted({row[0] for row in candidates}))
+        fresh = []
+        for row in candidates:
+            key = (row[0], row[6], row[7], row[9])
+            if key in seen:
+                continue
+            seen.add(key)
+            fresh.append(row)
+        return self._write_snapshots(fresh)
 
     def run_cycle(self) -> Dict:
         picks = self.get_active_picks()
@@ -148,17 +185,16 @@ class SnapshotWriter:
             logger.info("📸 Snapshot writer: no active picks in next %dh", WINDOW_HOURS)
             return {'picks': 0, 'snapshots': 0}
 
-        total_writes = 0
+        unique_picks = []
         seen_events = set()
         for p in picks:
             ev_key = f"{p.get('fixture_id') or p.get('match_id')}::{p['market']}"
             if ev_key in seen_events:
                 continue
             seen_events.add(ev_key)
-            try:
-                total_writes += self.capture_for_pick(p)
-            except Exception as e:
-                logger.debug("snapshot pick=%s err: %s", p['id'], e)
+            unique_picks.append(p)
+
+        total_writes = self._capture(unique_picks)
 
         logger.info("📸 Snapshot writer: %d picks scanned, %d snapshots written",
                     len(picks), total_writes)
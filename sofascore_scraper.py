@@ -3,11 +3,12 @@ SofaScore Web Scraper for H2H and Recent Form Data
 Provides fallback when API-Football is unavailable
 """
 
-import requests
+from http_transport import http_get
 import sqlite3
 import logging
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
@@ -87,6 +88,7 @@ class SofaScoreScraper:
         logger.info("✅ SofaScore cache database initialized")
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _name_matches(team_lower: str, event_team: str) -> bool:
         """
         Robust team name matching that handles:
@@ -150,7 +152,7 @@ class SofaScoreScraper:
         for attempt in range(retry_count):
             try:
                 self._rate_limit()
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = http_get(url, headers=self.headers, timeout=10, retries=0)
                 
                 if response.status_code == 200:
                     return response.json()
@@ -2,6 +2,7 @@
 Team ID mappings for API-Football
 Maps common team names from The Odds API to API-Football team IDs
 """
+from functools import lru_cache
 
 # Premier League team IDs (season 2024/2025)
 PREMIER_LEAGUE_TEAMS = {
@@ -44,7 +45,7 @@ LA_LIGA_TEAMS = {
     'Espanyol': 540,
     'Getafe': 546,
     'Girona': 547,
-    'Las Palmas': 728,
+    'Las Palmas': 534,
     'Mallorca': 798,
     'Osasuna': 727,
     'CA Osasuna': 727,
@@ -408,7 +409,7 @@ ADDITIONAL_TEAMS = {
     'FC Zurich': 256,
     'Servette': 255,
     # Czech First League
-    'Slavia Prague': 540,
+    'Slavia Prague': 560,
     'Sparta Prague': 539,
     'Viktoria Plzen': 542,
     # Polish Ekstraklasa
@@ -433,6 +434,13 @@ ALL_TEAM_MAPPINGS.update(EREDIVISIE_TEAMS)
 ALL_TEAM_MAPPINGS.update(ADDITIONAL_TEAMS)
 
 
+# Lower-cased name -> team ID (first spelling wins, as the old linear scan did)
+_LOWER_TEAM_MAPPINGS = {}
+for _name, _team_id in ALL_TEAM_MAPPINGS.items():
+    _LOWER_TEAM_MAPPINGS.setdefault(_name.lower(), _team_id)
+
+
+@lru_cache(maxsize=4096)
 def get_team_id_from_mapping(team_name: str) -> int:
     """Get team ID from hardcoded mappings"""
     # Try exact match first
@@ -440,14 +448,13 @@ def get_team_id_from_mapping(team_name: str) -> int:
         return ALL_TEAM_MAPPINGS[team_name]
     
     # Try case-insensitive match
-    for mapped_name, team_id in ALL_TEAM_MAPPINGS.items():
-        if mapped_name.lower() == team_name.lower():
-            return team_id
+    team_lower = team_name.lower()
+    if team_lower in _LOWER_TEAM_MAPPINGS:
+        return _LOWER_TEAM_MAPPINGS[team_lower]
     
     # Try partial match
-    team_lower = team_name.lower()
-    for mapped_name, team_id in ALL_TEAM_MAPPINGS.items():
-        if team_lower in mapped_name.lower() or mapped_name.lower() in team_lower:
+    for mapped_name, team_id in _LOWER_TEAM_MAPPINGS.items():
+        if team_lower in mapped_name or mapped_name in team_lower:
             return team_id
     
     return None
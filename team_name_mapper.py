@@ -6,6 +6,8 @@ Critical for combining FBref, Understat, Odds API data
 from typing import Dict, Optional
 import logging
 
+from team_resolver import get_team_resolver
+
 logger = logging.getLogger(__name__)
 
 class TeamNameMapper:
@@ -15,6 +17,9 @@ class TeamNameMapper:
     """
     
     def __init__(self):
+        self._lowered: Optional[Dict[str, str]] = None
+        self._unmapped = set()
+        
         # Mapping: Odds API name -> Standard name
         # NOTE: Keep canonical names simple to avoid breaking Understat/FBref integrations
         self.standardized_names = {
@@ -322,14 +327,25 @@ class TeamNameMapper:
             return self.standardized_names[team_name]
         
         # Try case-insensitive lookup
-        for key, value in self.standardized_names.items():
-            if key.lower() == team_name.lower():
-                return value
+        lowered = self._lowered_names()
+        if team_name.lower() in lowered:
+            return lowered[team_name.lower()]
         
-        # Return as-is if no mapping found
-        logger.warning(f"No standardization found for: {team_name}")
+        # Return as-is if no mapping found (warn once per name, this runs per fixture)
+        if team_name not in self._unmapped:
+            self._unmapped.add(team_name)
+            logger.warning(f"No standardization found for: {team_name}")
         return team_name
     
+    def _lowered_names(self) -> Dict[str, str]:
+        """Lower-cased key -> standard name, built on first use (first spelling wins)"""
+        if self._lowered is None:
+            lowered = {}
+            for key, value in self.standardized_names.items():
+                lowered.setdefault(key.lower(), value)
+            self._lowered = lowered
+        return self._lowered
+    
     def to_fbref(self, team_name: str) -> str:
         """Convert to FBref format"""
         standard = self.standardize(team_name)
@@ -350,6 +366,9 @@ class TeamNameMapper:
     def add_mapping(self, team_name: str, standard_name: str):
         """Add custom team mapping"""
         self.standardized_names[team_name] = standard_name
+        self._lowered = None
+        self._unmapped.discard(team_name)
+        get_team_resolver().learn(team_name, standard_name)
         logger.info(f"Added mapping: {team_name} -> {standard_name}")
 
 
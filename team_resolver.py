@@ -0,0 +1,332 @@
+"""
+Team Name Resolver
+One precompiled team-name index shared by settlement, CLV and the scrapers.
+
+- normalize(): accent-folded, lower-case, punctuation-free, club affixes (FC, AFC, SC...) dropped
+- Canonical index built once from TeamNameMapper, team_id_mappings (names sharing an
+  API-Football id, when the spellings are also similar), the settlement alias table
+  and learned matches
+- same_team(): canonical lookup, then trigram similarity - memoized per pair
+- TeamIndex: first-word/alias/trigram inverted index over a fixture list, so a bet
+  is only run through settlement_match() against fixtures that could match it
+
+Usage:
+    from team_resolver import get_team_resolver, settlement_match, TeamIndex
+
+    resolver = get_team_resolver()
+    resolver.canonical("Man Utd") == resolver.canonical("Manchester United")   # True
+    resolver.same_team("Wolves", "Wolverhampton Wanderers")                    # True
+
+    index = TeamIndex(normalized_fixture_home_names)
+    [p for p in index.candidates("bayern munchen")
+     if settlement_match("bayern munchen", index.names[p])]
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tokens that carry no identity ("FC Porto" == "Porto")
+CLUB_AFFIXES = frozenset({
+    'fc', 'afc', 'cf', 'sc', 'ac', 'as', 'cd', 'sd', 'ssc', 'sv', 'fk', 'sk', 'nk', 'bk', 'if', 'ik',
+})
+
+# Settlement alias groups: abbreviation -> full names
+TEAM_ALIASES = {
+    'qpr': ['queens park rangers', 'queens park'],
+    'man utd': ['manchester united', 'man united'],
+    'man city': ['manchester city'],
+    'spurs': ['tottenham', 'tottenham hotspur'],
+    'wolves': ['wolverhampton', 'wolverhampton wanderers'],
+    'brighton': ['brighton & hove albion', 'brighton hove'],
+    'west ham': ['west ham united'],
+    'newcastle': ['newcastle united'],
+    'norwich': ['norwich city'],
+    'leeds': ['leeds united'],
+    'sheff utd': ['sheffield united', 'sheffield utd'],
+    'sheff wed': ['sheffield wednesday'],
+    'nottm forest': ['nottingham forest'],
+    'west brom': ['west bromwich albion', 'west bromwich'],
+    'psg': ['paris saint-germain', 'paris saint germain', 'paris sg'],
+    'atletico': ['atletico madrid', 'atletico de madrid'],
+    'real': ['real madrid'],
+    'inter': ['inter milan', 'internazionale'],
+    'ac milan': ['milan'],
+    'bayern': ['bayern munich', 'bayern munchen'],
+    'dortmund': ['borussia dortmund'],
+    'rb leipzig': ['rasenballsport leipzig', 'leipzig'],
+    'leverkusen': ['bayer leverkusen', 'bayer 04 leverkusen'],
+}
+_ALIAS_GROUPS: Tuple[frozenset, ...] = tuple(
+    frozenset([abbrev] + full_names) for abbrev, full_names in TEAM_ALIASES.items()
+)
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+MEMO_SIZE = 65536
+# team_id_mappings has had wrong duplicate ids (Espanyol/Slavia Prague); an id
+# group is only merged when its spellings also look alike
+ID_ALIAS_MIN_SIMILARITY = 0.5
+
+
+# ── String-level helpers (pure, memoized) ────────────────────────────────────
+
+@lru_cache(maxsize=MEMO_SIZE)
+def fold(name: str) -> str:
+    """ASCII, lower-case, punctuation replaced by single spaces."""
+    ascii_name = unicodedata.normalize('NFKD', name or '').encode('ASCII', 'ignore').decode('ASCII')
+    return _NON_ALNUM.sub(' ', ascii_name.lower()).strip()
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def normalize(name: str) -> str:
+    """fold() without club affixes; falls back to the folded name if nothing else is left."""
+    folded = fold(name)
+    tokens = [t for t in folded.split() if t not in CLUB_AFFIXES]
+    return ' '.join(tokens) if tokens else folded
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def trigrams(name: str) -> frozenset:
+    """Character trigrams of the normalized name (padded so short names still index)."""
+    padded = f"  {normalize(name)} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _substring_trigrams(name: str) -> frozenset:
+    """Unpadded 3-character substrings (a substring's set is a subset of its container's)."""
+    return frozenset(name[i:i + 3] for i in range(len(name) - 2))
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Dice coefficient of the two names' trigram sets (0..1)."""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return 2.0 * len(ta & tb) / (len(ta) + len(tb))
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def ratio(a: str, b: str) -> float:
+    """Memoized difflib ratio for matchers that threshold on SequenceMatcher."""
+    return SequenceMatcher(None, a, b).ratio()
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _alias_groups(name: str) -> Tuple[frozenset, frozenset]:
+    """(groups containing name exactly, groups with a name overlapping it as a substring)"""
+    exact = frozenset(i for i, group in enumerate(_ALIAS_GROUPS) if name in group)
+    touching = frozenset(
+        i for i, group in enumerate(_ALIAS_GROUPS) if any(name in alias or alias in name for alias in group)
+    )
+    return exact, touching
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def settlement_match(t1: str, t2: str) -> bool:
+    """
+    The settlement engine's lenient rule on pre-normalized names: equality,
+    containment, same first word, or both names inside one alias group.
+    """
+    if t1 == t2:
+        return True
+    if t1 in t2 or t2 in t1:
+        return True
+    if t1.split()[0] == t2.split()[0]:
+        return True
+    exact1, touching1 = _alias_groups(t1)
+    exact2, touching2 = _alias_groups(t2)
+    return bool(exact1 & exact2) or bool(touching1 & touching2)
+
+
+def _plausible_alias(a: str, b: str) -> bool:
+    """Spellings that could name one club: containment or trigram similarity."""
+    ka, kb = normalize(a), normalize(b)
+    return ka in kb or kb in ka or trigram_similarity(a, b) >= ID_ALIAS_MIN_SIMILARITY
+
+
+# ── Canonical index ──────────────────────────────────────────────────────────
+
+class TeamResolver:
+    """
+    Canonical team-name index. Every known spelling maps (after normalize()) to one
+    canonical key; unknown names are their own key.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._parent: Dict[str, str] = {}
+        self._canonical_memo: Dict[str, str] = {}
+        self._same_memo: Dict[Tuple[str, str, float], bool] = {}
+        self._build()
+
+    def _find(self, key: str) -> str:
+        parent = self._parent
+        root = key
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while parent.get(key, key) != root:   # path compression
+            parent[key], key = root, parent[key]
+        return root
+
+    def _union(self, a: str, b: str) -> None:
+        ka, kb = normalize(a), normalize(b)
+        if not ka or not kb:
+            return
+        self._parent.setdefault(ka, ka)
+        self._parent.setdefault(kb, kb)
+        ra, rb = self._find(ka), self._find(kb)
+        if ra != rb:
+            # Keep the shorter spelling as the representative (stable, readable keys)
+            if (len(rb), rb) < (len(ra), ra):
+                ra, rb = rb, ra
+            self._parent[rb] = ra
+
+    def _build(self) -> None:
+        try:
+            from team_name_mapper import TeamNameMapper
+            for alias, standard in TeamNameMapper().standardized_names.items():
+                self._union(alias, standard)
+        except Exception as e:
+            logger.warning(f"⚠️ TeamResolver: TeamNameMapper unavailable: {e}")
+
+        try:
+            from team_id_mappings import ALL_TEAM_MAPPINGS
+            by_id: Dict[int, List[str]] = defaultdict(list)
+            for name, team_id in ALL_TEAM_MAPPINGS.items():
+                self._union(name, name)
+                for other in by_id[team_id]:
+                    if _plausible_alias(name, other):
+                        self._union(other, name)
+                    else:
+                        logger.debug(f"TeamResolver: not merging '{other}' / '{name}' (shared id {team_id})")
+                by_id[team_id].append(name)
+        except Exception as e:
+            logger.warning(f"⚠️ TeamResolver: team_id_mappings unavailable: {e}")
+
+        for abbrev, full_names in TEAM_ALIASES.items():
+            for full_name in full_names:
+                self._union(abbrev, full_name)
+
+        logger.info(f"✅ TeamResolver index built ({len(self._parent)} spellings)")
+
+    def learn(self, alias: str, canonical_name: str) -> None:
+        """Record a confirmed match (e.g. TeamNameMapper.add_mapping) for every matcher."""
+        with self._lock:
+            self._union(alias, canonical_name)
+            self._canonical_memo.clear()
+            self._same_memo.clear()
+
+    def canonical(self, name: str) -> str:
+        """Canonical key for name (its normalized form when the name is unknown)."""
+        cached = self._canonical_memo.get(name)
+        if cached is not None:
+            return cached
+        key = normalize(name)
+        with self._lock:
+            canonical_key = self._find(key) if key in self._parent else key
+            if len(self._canonical_memo) >= MEMO_SIZE:
+                self._canonical_memo.clear()
+            self._canonical_memo[name] = canonical_key
+        return canonical_key
+
+    def is_known(self, name: str) -> bool:
+        return normalize(name) in self._parent
+
+    def same_team(self, a: str, b: str, threshold: float = 0.8) -> bool:
+        """Same canonical key, or trigram similarity >= threshold."""
+        memo_key = (a, b, threshold)
+        cached = self._same_memo.get(memo_key)
+        if cached is not None:
+            return cached
+        result = self.canonical(a) == self.canonical(b) or trigram_similarity(a, b) >= threshold
+        with self._lock:
+            if len(self._same_memo) >= MEMO_SIZE:
+                self._same_memo.clear()
+            self._same_memo[memo_key] = result
+        return result
+
+    def cache_info(self) -> Dict[str, int]:
+        return {
+            "spellings": len(self._parent),
+            "canonical_memo": len(self._canonical_memo),
+            "pair_memo": len(self._same_memo),
+            "normalize_hits": normalize.cache_info().hits,
+            "ratio_hits": ratio.cache_info().hits,
+        }
+
+
+class TeamIndex:
+    """
+    Candidate lookup for settlement_match() against a fixed list of pre-normalized
+    names (e.g. one day's fixtures). candidates() returns, in list order, a superset
+    of the positions settlement_match() accepts, so the caller's first match is
+    unchanged while most non-matching fixtures are never compared:
+
+    - equality / same first word    -> first-word bucket
+    - both names in one alias group -> alias-group bucket
+    - containment                   -> every trigram of the query occurs in the
+                                       indexed name, or every trigram of the
+                                       indexed name occurs in the query (the
+                                       shorter name's set is a subset of the
+                                       longer one's); names under 3 characters
+                                       are always candidates
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(names)
+        self._short: List[int] = []
+        self._by_first_word: Dict[str, List[int]] = defaultdict(list)
+        self._by_alias: Dict[int, List[int]] = defaultdict(list)
+        self._by_gram: Dict[str, List[int]] = defaultdict(list)
+        self._gram_count: Dict[int, int] = {}
+        for position, name in enumerate(self.names):
+            if len(name) < 3:
+                self._short.append(position)
+                continue
+            self._by_first_word[name.split()[0]].append(position)
+            for group in _alias_groups(name)[1]:
+                self._by_alias[group].append(position)
+            grams = _substring_trigrams(name)
+            self._gram_count[position] = len(grams)
+            for gram in grams:
+                self._by_gram[gram].append(position)
+
+    def candidates(self, name: str) -> List[int]:
+        """Positions worth running settlement_match(name, names[p]) on, ascending."""
+        if len(name) < 3:
+            return list(range(len(self.names)))
+        found: Set[int] = set(self._short)
+        found.update(self._by_first_word.get(name.split()[0], ()))
+        for group in _alias_groups(name)[1]:
+            found.update(self._by_alias.get(group, ()))
+        grams = _substring_trigrams(name)
+        hits: Counter = Counter()
+        for gram in grams:
+            hits.update(self._by_gram.get(gram, ()))
+        found.update(
+            position for position, count in hits.items()
+            if count == len(grams) or count == self._gram_count[position]
+        )
+        return sorted(found)
+
+
+_resolver: Optional[TeamResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_team_resolver() -> TeamResolver:
+    """Process-wide resolver, built on first use."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = TeamResolver()
+    return _resolver
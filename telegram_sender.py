@@ -5,7 +5,7 @@ Sends predictions directly via Telegram Bot API
 """
 
 import os
-import requests
+from http_transport import http_post
 import sqlite3
 import logging
 from datetime import datetime
@@ -35,7 +35,7 @@ class TelegramBroadcaster:
                 'chat_id': chat_id,
                 'text': text
             }
-            response = requests.post(url, json=payload, timeout=10)
+            response = http_post(url, json=payload, timeout=10)
             response.raise_for_status()
             return True
         except Exception as e:
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Quota blocks, hit-count flushing and single-flight advisory locks against fake DB sessions.
+
+Usage:
+    python -m pytest test_api_cache_manager.py -q
+"""
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import api_cache_manager
+from api_cache_manager import APICacheManager, QUOTA_BLOCK_SIZE, reconcile_quota_buckets
+
+
+class _FakeCounter:
+    """One api_request_counter row whose CURRENT_DATE is db_today"""
+
+    def __init__(self, db_today, quota_limit=1000):
+        self.db_today = db_today
+        self.row = {"request_count": 0, "quota_limit": quota_limit, "last_reset_date": db_today}
+        self.reservations = 0
+        self.released = []
+
+    # db_helper.execute
+    def execute(self, query, params=None, fetch=None):
+        if "INSERT INTO api_request_counter" in query:
+            return None
+        if "GREATEST" in query:
+            tokens, _, day = params
+            if self.row["last_reset_date"] == day:
+                self.row["request_count"] = max(0, self.row["request_count"] - tokens)
+                self.released.append((day, tokens))
+            return None
+        if "request_count + 1" in query:
+            self.row["request_count"] += 1
+            return None
+        raise AssertionError(f"unexpected query: {query}")
+
+    # DatabaseConnection.get_connection
+    @contextmanager
+    def get_connection(self):
+        yield _FakeConn(self)
+
+
+class _FakeConn:
+    def __init__(self, counter):
+        self.counter = counter
+
+    @contextmanager
+    def cursor(self):
+        yield _FakeCursor(self.counter)
+
+
+class _FakeCursor:
+    def __init__(self, counter):
+        self.counter = counter
+        self._result = None
+
+    def execute(self, query, params=None):
+        assert "CURRENT_DATE" not in query
+        row = self.counter.row
+        if "FOR UPDATE" in query:
+            self._result = (row["request_count"], row["quota_limit"], row["last_reset_date"])
+        else:
+            row["request_count"], row["last_reset_date"], _ = params
+            self.counter.reservations += 1
+
+    def fetchone(self):
+        return self._result
+
+
+def _manager(monkeypatch, counter, api_name):
+    monkeypatch.setattr(api_cache_manager, "db_helper", counter)
+    monkeypatch.setattr(api_cache_manager, "DatabaseConnection", counter)
+    monkeypatch.setattr(api_cache_manager, "_ensure_maintenance_thread", lambda table: None)
+    return APICacheManager(api_name, quota_limit=counter.row["quota_limit"])
+
+
+def _fixed_date(day):
+    class _Date(date):
+        @classmethod
+        def today(cls):
+            return day
+    return _Date
+
+
+def test_db_date_ahead_of_local_date_reserves_blocks_not_per_call(monkeypatch):
+    counter = _FakeCounter(db_today=date.today() + timedelta(days=1))
+    manager = _manager(monkeypatch, counter, "quota_test_tz")
+
+    calls = QUOTA_BLOCK_SIZE * 2 + 10
+    for _ in range(calls):
+        assert manager.check_quota_available()
+        manager.increment_request_count()
+    reconcile_quota_buckets(force=True)
+
+    assert counter.reservations == 3
+    assert counter.row["request_count"] == calls
+    assert counter.row["last_reset_date"] == date.today()
+
+
+def test_day_rollover_releases_unspent_tokens(monkeypatch):
+    day = date(2026, 3, 1)
+    counter = _FakeCounter(db_today=day)
+    monkeypatch.setattr(api_cache_manager, "date", _fixed_date(day))
+    manager = _manager(monkeypatch, counter, "quota_test_rollover")
+
+    for _ in range(5):
+        assert manager.check_quota_available()
+        manager.increment_request_count()
+    assert counter.row["request_count"] == QUOTA_BLOCK_SIZE
+
+    monkeypatch.setattr(api_cache_manager, "date", _fixed_date(day + timedelta(days=1)))
+    assert manager.check_quota_available()
+
+    assert counter.released == [(day, QUOTA_BLOCK_SIZE - 5)]
+    assert counter.row["last_reset_date"] == day + timedelta(days=1)
+    assert counter.row["request_count"] == QUOTA_BLOCK_SIZE
+
+
+class _FakeLockSession:
+    """Dedicated advisory-lock connection; unlock fails when fail_unlock is set"""
+
+    def __init__(self, fail_unlock=False):
+        self.fail_unlock = fail_unlock
+        self.closed = 0
+        self.autocommit = False
+        self.held = set()
+        self._result = None
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    def execute(self, query, params):
+        (lock_id,) = params
+        if "pg_advisory_unlock" in query:
+            if self.fail_unlock:
+                raise api_cache_manager.psycopg2.OperationalError("connection lost")
+            self._result = (lock_id in self.held,)
+            self.held.discard(lock_id)
+        else:
+            self._result = (lock_id not in self.held,)
+            self.held.add(lock_id)
+
+    def fetchone(self):
+        return self._result
+
+    def close(self):
+        self.closed = 1
+
+
+def _lock_session(monkeypatch, session):
+    monkeypatch.setattr(api_cache_manager, "_lock_conn", None)
+    monkeypatch.setattr(api_cache_manager.psycopg2, "connect", lambda *a, **k: session)
+
+
+def test_advisory_lock_uses_dedicated_session_not_the_pool(monkeypatch):
+    counter = _FakeCounter(db_today=date.today())
+    manager = _manager(monkeypatch, counter, "lock_test_pool")
+    session = _FakeLockSession()
+    _lock_session(monkeypatch, session)
+
+    def fetch():
+        assert len(session.held) == 1
+        return {"ok": True}
+
+    assert manager.single_flight("key", "/fixtures", fetch) == {"ok": True}
+    assert session.autocommit and not session.held and not session.closed
+
+
+def test_failed_unlock_discards_the_lock_session(monkeypatch):
+    counter = _FakeCounter(db_today=date.today())
+    manager = _manager(monkeypatch, counter, "lock_test_unlock")
+    session = _FakeLockSession(fail_unlock=True)
+    _lock_session(monkeypatch, session)
+
+    assert manager.single_flight("key", "/fixtures", lambda: [1]) == [1]
+    assert session.closed
+    assert api_cache_manager._lock_conn is None
+
+
+def test_failed_hit_flush_is_requeued(monkeypatch):
+    class _FailingDB:
+        def __init__(self):
+            self.fail = True
+            self.flushed = []
+
+        def execute(self, query, params=None, fetch=None):
+            if self.fail:
+                raise RuntimeError("db down")
+            self.flushed.append(params)
+
+    fake_db = _FailingDB()
+    monkeypatch.setattr(api_cache_manager, "db_helper", fake_db)
+    monkeypatch.setattr(api_cache_manager, "_pending_hits", defaultdict(Counter))
+    api_cache_manager._pending_hits["hits_test_cache"].update({"a": 2, "b": 1})
+
+    assert api_cache_manager.flush_pending_hits() == 0
+    api_cache_manager._pending_hits["hits_test_cache"]["a"] += 1
+    assert api_cache_manager._pending_hits["hits_test_cache"] == Counter({"a": 3, "b": 1})
+
+    fake_db.fail = False
+    assert api_cache_manager.flush_pending_hits() == 2
+    assert sorted(zip(fake_db.flushed[0][::2], fake_db.flushed[0][1::2])) == [("a", 3), ("b", 1)]
+    assert not api_cache_manager._pending_hits
+
+
+def test_lock_session_uses_the_pool_dsn(monkeypatch):
+    counter = _FakeCounter(db_today=date.today())
+    manager = _manager(monkeypatch, counter, "lock_test_dsn")
+    session = _FakeLockSession()
+    dsns = []
+    monkeypatch.setattr(api_cache_manager, "_lock_conn", None)
+    monkeypatch.setattr(api_cache_manager.psycopg2, "connect", lambda dsn, **k: dsns.append(dsn) or session)
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.setenv("POSTGRES_URL", "postgresql://fallback/db")
+
+    assert manager.single_flight("key", "/fixtures", lambda: [1]) == [1]
+    assert dsns == ["postgresql://fallback/db"]
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Vectorized day replay vs a bet-by-bet replay of the same cap/stop-loss rules.
+
+Usage:
+    python -m pytest test_backtest_engine.py -q
+"""
+
+import numpy as np
+import pandas as pd
+
+from backtest_engine import DayReplay, run_backtest_grid
+
+
+def _bets(n=600, seed=4):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'id': np.arange(n),
+        'market_type': rng.choice(['CARDS', 'CORNERS'], n),
+        'odds': rng.uniform(1.5, 3.5, n).round(2),
+        'won': rng.random(n) < 0.45,
+        'bet_date': pd.to_datetime('2025-12-11') + pd.to_timedelta(rng.integers(0, 20, n), unit='D'),
+        'ev': rng.random(n),
+    })
+
+
+def _reference(df, cap, stop_loss):
+    total, placed, skipped_volume, skipped_stoploss, daily = 0.0, 0, 0, 0, {}
+    for date in sorted(df['bet_date'].unique()):
+        day = df[df['bet_date'] == date].sort_values('ev', ascending=False)
+        units, count = 0.0, 0
+        for _, bet in day.iterrows():
+            if count >= cap:
+                skipped_volume += 1
+                continue
+            if stop_loss is not None and units <= stop_loss:
+                skipped_stoploss += 1
+                continue
+            profit = bet['odds'] - 1 if bet['won'] else -1.0
+            units += profit
+            total += profit
+            placed += 1
+            count += 1
+        daily[str(pd.Timestamp(date).date())] = round(units, 2)
+    return round(total, 2), placed, skipped_volume, skipped_stoploss, daily
+
+
+def test_replay_matches_bet_by_bet_loop():
+    df = _bets()
+    scenarios = [(cap, stop) for cap in (3, 10, 40) for stop in (-2, -5, None)]
+    for result, (cap, stop) in zip(DayReplay(df).run(scenarios), scenarios):
+        total, placed, skipped_volume, skipped_stoploss, daily = _reference(df, cap, stop)
+        assert result['total_units'] == total
+        assert result['bets_placed'] == placed
+        assert result['skipped_volume'] == skipped_volume
+        assert result['skipped_stoploss'] == skipped_stoploss
+        assert result['daily_pnl'] == daily
+        assert len(result['equity_curve']) == placed
+
+
+def test_grid_filters_match_prefiltered_replay():
+    df = _bets()
+    grid = run_backtest_grid(df, [10], [-5], min_evs=[0.5], market_sets=[['CARDS']])
+    subset = df[(df['market_type'] == 'CARDS') & (df['ev'] >= 0.5)]
+    expected = DayReplay(subset).run([(10, -5)], include_curves=False)[0]
+    assert grid[0]['total_units'] == expected['total_units']
+    assert grid[0]['market_stats']['CORNERS']['bets'] == 0
+    assert grid[0]['min_ev'] == 0.5 and grid[0]['markets'] == ['CARDS']
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Branch-and-bound parlay builder vs the exhaustive combinations scan.
+
+Usage:
+    python -m pytest test_college_basket_parlays.py -q
+"""
+
+import random
+import time
+
+from college_basket_value_engine import BasketPick, _build_parlays_exhaustive, build_parlays
+
+
+def _slate(rng, n_matches, picks_per_match=2):
+    picks = []
+    for m in range(n_matches):
+        for k in range(picks_per_match):
+            odds = round(rng.uniform(1.3, 3.5), 2)
+            prob = min(0.95, max(0.05, 1.0 / odds + rng.uniform(-0.08, 0.08)))
+            picks.append(BasketPick(
+                match=f"Team {m} vs Opp {m}",
+                market="h2h" if k == 0 else "totals",
+                selection=f"sel {m}-{k}",
+                odds=odds,
+                prob=prob,
+                ev=prob * odds - 1.0,
+                confidence=rng.random(),
+            ))
+    return picks
+
+
+def _reference(picks, legs, min_parlay_ev, max_parlay_odds):
+    best_by_match = {}
+    for p in picks:
+        if p.match not in best_by_match or p.ev > best_by_match[p.match].ev:
+            best_by_match[p.match] = p
+    return _build_parlays_exhaustive(list(best_by_match.values()), legs, min_parlay_ev, max_parlay_odds)
+
+
+def test_pruned_search_matches_exhaustive():
+    rng = random.Random(11)
+    for n_matches in (3, 8, 15, 22):
+        picks = _slate(rng, n_matches)
+        for legs in range(2, 7):
+            for min_ev, max_odds in ((0.02, 50.0), (-0.05, 50.0), (-1.0, 8.0), (0.3, 400.0)):
+                got = build_parlays(picks, legs=legs, min_parlay_ev=min_ev, max_parlay_odds=max_odds)
+                want = _reference(picks, legs, min_ev, max_odds)
+                assert got == want, (n_matches, legs, min_ev, max_odds)
+
+
+def test_ties_keep_combination_order():
+    picks = [
+        BasketPick(match=f"T{m} vs O{m}", market="h2h", selection=str(m), odds=2.0, prob=0.55, ev=0.1, confidence=0.5)
+        for m in range(9)
+    ]
+    assert build_parlays(picks, legs=3, min_parlay_ev=0.0) == _reference(picks, 3, 0.0, 50.0)
+
+
+def test_large_slate_is_pruned():
+    picks = _slate(random.Random(5), 60, picks_per_match=1)
+    start = time.perf_counter()
+    parlays = build_parlays(picks, legs=5, min_parlay_ev=0.0, max_parlay_odds=50.0)
+    assert time.perf_counter() - start < 5.0
+    assert len(parlays) == 10
+    assert all(p.odds <= 50.0 and p.ev >= 0.0 for p in parlays)
+    assert [p.ev for p in parlays] == sorted((p.ev for p in parlays), reverse=True)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Exact corners/cards PMFs vs Poisson sampling.
+
+Usage:
+    python -m pytest test_count_distribution.py -q
+"""
+
+import numpy as np
+
+from count_distribution import CountDistribution, slate_line_probs
+from corners_engine import SyndicateCornersModel, HANDICAP_LINES
+from cards_engine import CardsEngine
+
+
+def test_lines_match_sampling():
+    rng = np.random.default_rng(11)
+    home = rng.poisson(5.4, 400000)
+    away = rng.poisson(4.6, 400000)
+    total = CountDistribution.poisson(5.4) + CountDistribution.poisson(4.6)
+    diff = CountDistribution.poisson(5.4) - CountDistribution.poisson(4.6)
+    for line in (8.5, 10.0, 11.5):
+        assert abs(total.prob_over(line) - ((home + away) > line).mean()) < 0.005
+        assert abs(total.prob_under(line) - ((home + away) < line).mean()) < 0.005
+    for line in (-1.5, 0.0, 2.5):
+        assert abs(diff.prob_over(line) - ((home - away) > line).mean()) < 0.005
+    assert abs(total.mean() - 10.0) < 1e-9
+    assert abs(total.std() - np.sqrt(10.0)) < 1e-9
+
+
+def test_slate_matrix_matches_single_fixture():
+    dists = [CountDistribution.poisson(lam) for lam in (3.2, 9.8, 12.5)]
+    over, under = slate_line_probs(dists, [8.5, 9.0, 11.5])
+    for row, dist in enumerate(dists):
+        assert np.allclose(over[row], dist.over_probs([8.5, 9.0, 11.5]))
+        assert np.allclose(under[row], dist.under_probs([8.5, 9.0, 11.5]))
+
+
+def test_corner_markets_have_no_raw_arrays():
+    model = SyndicateCornersModel()
+    sim = model.simulate_corners(5.6, 4.1)
+    assert not any(key.endswith("_raw") for key in sim)
+    assert abs(sim["CORNERS_OVER_9_5"] + sim["CORNERS_UNDER_9_5"] - 1.0) < 1e-12
+    for line in HANDICAP_LINES:
+        home = sim[f"CORNERS_HC_HOME_{'+' if line >= 0 else '-'}{str(abs(line)).replace('.', '_')}"]
+        assert abs(home - sim["corner_diff_dist"].prob_over(-line)) < 1e-12
+
+
+def test_booking_points_support():
+    sims = CardsEngine().estimate_cards_distribution({"cards_pg": 2.2}, {"cards_pg": 2.0})
+    points = sims["total_booking_pts"]
+    assert abs(points.pmf.sum() - 1.0) < 1e-12
+    # Only combinations of 10 (yellow) and 25 (red) points carry mass
+    assert points.pmf[5] == 0.0 and points.pmf[25] > 0.0
+    assert abs(points.mean() - (10 * 0.95 * 4.2 + 25 * 0.1)) < 1e-9
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+PooledConnection lifecycle against a fake pool.
+
+Usage:
+    python -m pytest test_db_connection.py -q
+"""
+
+import threading
+
+import psycopg2
+import pytest
+
+from db_connection import PooledConnection, _Lease
+
+
+class _FakeConn:
+    closed = 0
+    autocommit = False
+    cursor_factory = None
+
+    def cursor(self, *args, **kwargs):
+        return "cursor"
+
+    def commit(self):
+        pass
+
+
+class _FakePool:
+    def __init__(self):
+        self.returned = []
+
+    def putconn(self, conn, close=False):
+        self.returned.append((conn, close))
+
+
+def test_pooled_connection_is_unusable_after_close():
+    conn, conn_pool, semaphore = _FakeConn(), _FakePool(), threading.BoundedSemaphore(1)
+    semaphore.acquire()
+    pooled = PooledConnection(_Lease(conn, conn_pool, semaphore, "test", "test.py:1"))
+
+    assert pooled.cursor() == "cursor"
+    pooled.commit()
+    pooled.close()
+    pooled.close()  # idempotent
+
+    assert conn_pool.returned == [(conn, False)]
+    assert pooled.closed
+    with pytest.raises(psycopg2.InterfaceError):
+        pooled.cursor()
+    with pytest.raises(psycopg2.InterfaceError):
+        pooled.commit()
+    with pytest.raises(psycopg2.InterfaceError):
+        pooled.autocommit = True
+    assert conn.autocommit is False
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 import logging
+from collections import OrderedDict
+
+import db_helper as db_helper_module
 from db_helper import db_helper
 
 logging.basicConfig(level=logging.INFO)
@@ -69,6 +72,60 @@ def test_nov8_predictions():
         logger.error(f"❌ Query failed: {e}")
         return False
 
+def test_translation_cache_is_lru():
+    """Repeated SQL text is translated once; the oldest text is evicted first"""
+    db_helper_module._translation_cache.clear()
+    query = "SELECT * FROM bets WHERE id = ? AND day = DATE('now')"
+    hits = db_helper_module._translation_stats["hits"]
+    first = db_helper.translate_sql(query)
+    assert db_helper.translate_sql(query) == first == "SELECT * FROM bets WHERE id = %s AND day = CURRENT_DATE"
+    assert db_helper_module._translation_stats["hits"] == hits + 1
+
+    for i in range(db_helper_module.TRANSLATION_CACHE_MAX_SIZE):
+        db_helper.translate_sql(f"SELECT {i}")
+    assert query not in db_helper_module._translation_cache
+    assert len(db_helper_module._translation_cache) == db_helper_module.TRANSLATION_CACHE_MAX_SIZE
+
+
+def test_prepare_body():
+    """%s -> $n, %% unescaped; quoted %s, named params and multi-statement SQL are refused"""
+    to_body = db_helper_module._to_prepare_body
+    assert to_body("SELECT * FROM t WHERE a = %s AND b LIKE 'x%%' AND c = %s") == (
+        "SELECT * FROM t WHERE a = $1 AND b LIKE 'x%' AND c = $2", 2)
+    assert to_body("  with x AS (SELECT 1) SELECT * FROM x;") == ("  with x AS (SELECT 1) SELECT * FROM x;", 0)
+    assert to_body("SELECT * FROM t WHERE ts > NOW() - INTERVAL '%s hours'") is None
+    assert to_body("SELECT * FROM t WHERE a = %(a)s") is None
+    assert to_body("UPDATE t SET a = %s; DELETE FROM t") is None
+    assert to_body("CREATE TABLE t (a INT)") is None
+
+
+def test_prepare_threshold_and_lru(monkeypatch):
+    """Statements prepare after PREPARE_AFTER_EXECUTIONS runs; one-off texts age out of the stats"""
+    monkeypatch.setattr(db_helper_module, "PREPARED_STATEMENTS_MODE", "auto")
+    monkeypatch.setattr(db_helper_module, "_statement_stats", OrderedDict())
+    monkeypatch.setattr(db_helper_module, "_prepared_count", 0)
+    hot = "SELECT * FROM bets WHERE id = %s"
+
+    names = [db_helper._should_prepare(hot, (1,), None) for _ in range(db_helper_module.PREPARE_AFTER_EXECUTIONS)]
+    assert names[:-1] == [None] * (len(names) - 1)
+    assert names[-1] == db_helper_module._statement_name(hot)
+    assert db_helper._should_prepare(hot, (1,), False) is None
+    assert db_helper._should_prepare(hot, {"id": 1}, None) is None
+
+    for i in range(db_helper_module.TRANSLATION_CACHE_MAX_SIZE * 2):
+        db_helper._should_prepare(f"UPDATE t SET hits = hits + v.n FROM (VALUES {'(%s), ' * i}(%s)) v", (), None)
+    assert len(db_helper_module._statement_stats) == db_helper_module.TRANSLATION_CACHE_MAX_SIZE
+    assert hot in db_helper_module._statement_stats  # prepared entries are never evicted
+
+    fresh = "SELECT * FROM bets WHERE status = %s"
+    counted = [db_helper._should_prepare(fresh, ("won",), None) for _ in range(db_helper_module.PREPARE_AFTER_EXECUTIONS)]
+    assert counted[-1] == db_helper_module._statement_name(fresh)
+
+    db_helper._record_statement(fresh, unpreparable=True)
+    assert db_helper._should_prepare(fresh, ("won",), True) is None
+    assert db_helper_module._prepared_count == 1
+
+
 if __name__ == "__main__":
     logger.info("Testing PostgreSQL compatibility layer...")
     logger.info("")
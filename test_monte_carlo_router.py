@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo router: seeded batch reproducibility and run_batch parity with run().
+
+Usage:
+    python -m pytest test_monte_carlo_router.py -q
+"""
+
+import pytest
+
+from engines import monte_carlo_router
+from engines.monte_carlo_router import run_simulation, run_simulation_batch, supported_sports
+
+# Long odds on every market so each one clears the EV / odds filters and
+# both paths return the full market set for comparison
+LONG_ODDS = 20.0
+
+MARKETS = {
+    "football": ["over_2_5", "btts_yes", "home_win", "draw", "away_win"],
+    "hockey": ["home_win", "away_win", "over_5_5"],
+    "nba": ["home_win", "away_win", "over_total", "under_total", "home_spread", "away_spread"],
+    "nfl": ["home_win", "away_win", "over_total", "under_total", "home_spread", "away_spread"],
+}
+
+FIXTURE_PARAMS = {
+    "football": [
+        {"home_xg": 1.45, "away_xg": 1.10},
+        {"home_xg": 2.10, "away_xg": 0.80},
+        {"home_xg": 1.20, "away_xg": 1.30},
+    ],
+    "hockey": [
+        {"home_goals_avg": 3.2, "away_goals_avg": 2.8},
+        {"home_goals_avg": 2.6, "away_goals_avg": 3.1},
+        {"home_goals_avg": 3.5, "away_goals_avg": 3.0},
+    ],
+    "nba": [
+        {"home_points_avg": 115.0, "away_points_avg": 110.0, "home_std": 12.0, "away_std": 12.0},
+        {"home_points_avg": 108.0, "away_points_avg": 112.0, "home_std": 11.0, "away_std": 13.0,
+         "spread": 2.5, "total_line": 219.5},
+        {"home_points_avg": 120.0, "away_points_avg": 118.0, "home_std": 10.0, "away_std": 14.0},
+    ],
+    "nfl": [
+        {"home_td_rate": 2.8, "home_fg_rate": 1.6, "away_td_rate": 2.3, "away_fg_rate": 1.4},
+        {"home_td_rate": 2.1, "home_fg_rate": 1.9, "away_td_rate": 2.6, "away_fg_rate": 1.5,
+         "spread": 3.5, "total_line": 42.5},
+        {"home_td_rate": 3.0, "home_fg_rate": 1.2, "away_td_rate": 2.9, "away_fg_rate": 1.8},
+    ],
+}
+
+
+def _inputs(sport):
+    return [
+        {"match_id": f"{sport}-{idx}", **params,
+         "odds_map": {market: LONG_ODDS for market in MARKETS[sport]}}
+        for idx, params in enumerate(FIXTURE_PARAMS[sport])
+    ]
+
+
+def _without_timestamps(batch):
+    return [[{k: v for k, v in opp.items() if k != "created_at"} for opp in opps] for opps in batch]
+
+
+@pytest.mark.parametrize("sport", sorted(MARKETS))
+def test_same_seed_and_inputs_give_identical_output(sport, monkeypatch):
+    # Small chunks so the shared generator is carried across run_batch calls
+    monkeypatch.setattr(monte_carlo_router, "BATCH_CHUNK_SIZE", 2)
+    inputs = _inputs(sport) * 2
+
+    first = run_simulation_batch(sport, inputs, seed=42)
+    second = run_simulation_batch(sport, inputs, seed=42)
+    other = run_simulation_batch(sport, inputs, seed=43)
+
+    assert len(first) == len(inputs)
+    assert _without_timestamps(first) == _without_timestamps(second)
+    assert _without_timestamps(first) != _without_timestamps(other)
+
+
+@pytest.mark.parametrize("sport", sorted(MARKETS))
+def test_run_batch_matches_single_fixture_runs(sport):
+    inputs = _inputs(sport)
+    batch = run_simulation_batch(sport, inputs, seed=7)
+
+    assert [opps[0]["match_id"] for opps in batch] == [i["match_id"] for i in inputs]
+    for idx, fixture in enumerate(inputs):
+        single = run_simulation(sport, fixture, seed=1000 + idx)
+        batched = batch[idx]
+
+        assert [opp["market"] for opp in batched] == [opp["market"] for opp in single] == MARKETS[sport]
+        for b_opp, s_opp in zip(batched, single):
+            assert b_opp.keys() == s_opp.keys()
+            assert b_opp["simulation_meta"].keys() == s_opp["simulation_meta"].keys()
+            assert b_opp["sport"] == s_opp["sport"]
+            assert b_opp["odds"] == s_opp["odds"]
+            # Independent 10k-sim estimates of the same probability
+            assert b_opp["model_prob"] == pytest.approx(s_opp["model_prob"], abs=0.03)
+            assert b_opp["simulation_meta"]["home_win_prob"] == pytest.approx(
+                s_opp["simulation_meta"]["home_win_prob"], abs=0.03)
+
+
+def test_every_supported_sport_is_covered():
+    assert sorted(supported_sports()) == sorted(MARKETS)
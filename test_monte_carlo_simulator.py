@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Parity checks: exact Poisson score grid vs the sampling simulator.
+
+Usage:
+    python -m pytest test_monte_carlo_simulator.py -q
+"""
+
+import numpy as np
+
+from monte_carlo_simulator import (
+    simulate_match,
+    score_matrix,
+    prob_total_over_line,
+    prob_team_over_line,
+    prob_margin_over,
+    get_market_cache_stats,
+    clear_market_cache,
+)
+
+
+def test_grid_is_a_distribution():
+    grid = score_matrix(1.8, 1.2)
+    assert abs(grid.sum() - 1.0) < 1e-12
+    result = simulate_match(1.8, 1.2)
+    one_x_two = result["one_x_two"]
+    assert abs(one_x_two["1"] + one_x_two["X"] + one_x_two["2"] - 1.0) < 1e-12
+    assert abs(result["over_25"] + result["under_25"] - 1.0) < 1e-12
+
+
+def test_sample_mode_matches_exact():
+    exact = simulate_match(1.6, 1.1)
+    sampled = simulate_match(1.6, 1.1, n_sim=200000, method="sample",
+                             rng=np.random.default_rng(7))
+    for key, value in exact.items():
+        if key in ("scores", "simulations", "method"):
+            continue
+        if isinstance(value, dict):
+            for sel, p in value.items():
+                assert abs(p - sampled[key][sel]) < 0.01, (key, sel)
+        else:
+            assert abs(value - sampled[key]) < 0.01 * max(1.0, value), key
+
+
+def test_arbitrary_lines_agree_with_fixed_keys():
+    grid = score_matrix(2.1, 0.9)
+    result = simulate_match(2.1, 0.9)
+    assert abs(prob_total_over_line(grid, 2.5) - result["over_25"]) < 1e-12
+    assert abs(prob_team_over_line(grid, "away", 0.5) - result["away_over_05"]) < 1e-12
+    assert abs(prob_margin_over(grid, "home", -1.5) - result["home_ah_-1.5"]) < 1e-12
+    assert abs(prob_margin_over(grid, "away", 0.5) - result["away_ah_+0.5"]) < 1e-12
+    # Whole lines: > 3.0 is the same event as > 3.5 for integer totals
+    assert abs(prob_total_over_line(grid, 3.0) - result["over_35"]) < 1e-12
+
+
+def test_market_cache_quantizes_and_counts():
+    clear_market_cache()
+    first = simulate_match(1.501, 1.199)
+    first["one_x_two"]["1"] = 0.0  # mutating a result must not leak into the cache
+    second = simulate_match(1.5, 1.2)
+    stats = get_market_cache_stats()
+    assert stats["hits"] == 1
+    assert second["one_x_two"]["1"] > 0.0
+    assert second["over_25"] == first["over_25"]
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Football settlement: one result lookup per fixture, batched UPDATE, per-bet fallback.
+
+Usage:
+    python -m pytest test_results_engine.py -q
+"""
+
+import pytest
+
+import results_engine
+from results_engine import ResultsEngine
+
+MATCH_DAY = '2026-03-01'
+
+FIXTURES = [
+    {'fixture': {'id': 101, 'status': {'short': 'FT'}},
+     'teams': {'home': {'name': 'Arsenal'}, 'away': {'name': 'Chelsea'}},
+     'goals': {'home': 2, 'away': 1}},
+    {'fixture': {'id': 102, 'status': {'short': 'FT'}},
+     'teams': {'home': {'name': 'Everton'}, 'away': {'name': 'Fulham'}},
+     'goals': {'home': 0, 'away': 0}},
+]
+
+STATISTICS = [
+    {'statistics': [{'type': 'Corner Kicks', 'value': 6}, {'type': 'Yellow Cards', 'value': 2}]},
+    {'statistics': [{'type': 'Corner Kicks', 'value': 5}, {'type': 'Yellow Cards', 'value': 3}]},
+]
+
+
+def _bet(bet_id, home, away, market, selection, odds):
+    return {
+        'id': bet_id, 'home_team': home, 'away_team': away, 'match_date': MATCH_DAY,
+        'market': market, 'selection': selection, 'odds': odds, 'stake': 1.0,
+        'match_id': None, 'league': 'Premier League', 'kickoff_epoch': None, 'mode': 'TEST',
+    }
+
+
+PENDING = [
+    _bet(1, 'Arsenal', 'Chelsea', 'Value Single', 'Over 2.5 Goals', 2.0),
+    _bet(2, 'Arsenal', 'Chelsea', 'Value Single', 'BTTS Yes', 1.8),
+    _bet(3, 'Arsenal', 'Chelsea', 'corners', 'Over 9.5 Corners', 1.9),
+    _bet(4, 'Arsenal', 'Chelsea', 'corners', 'Under 10.5 Corners', 1.9),
+    _bet(5, 'Everton', 'Fulham', 'Value Single', 'Over 0.5 Goals', 1.3),
+]
+
+
+class _FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._one = None
+
+    def execute(self, query, params=None):
+        self.db.statements.append((" ".join(query.split()), params))
+        self._one = {'odds': 2.0} if "SELECT odds" in query else None
+
+    def fetchall(self):
+        last = self.db.statements[-1][0]
+        return [dict(bet) for bet in PENDING] if last.startswith("SELECT id, home_team") else []
+
+    def fetchone(self):
+        return self._one
+
+    def close(self):
+        pass
+
+
+class _FakeConn:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, *args, **kwargs):
+        return _FakeCursor(self.db)
+
+    def commit(self):
+        self.db.commits += 1
+
+    def rollback(self):
+        self.db.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+class _FakeDB:
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return {'response': self._payload}
+
+
+class _NoManualResults:
+    def get_manual_result(self, bet_id, table):
+        return None
+
+
+class _NoMetrics:
+    def log_attempt(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', 'postgresql://test/test')
+    monkeypatch.setenv('API_FOOTBALL_KEY', 'test-key')
+    db = _FakeDB()
+    calls = []
+
+    def fake_http_get(url, params=None, **kwargs):
+        calls.append((url.rsplit('/', 1)[-1], params))
+        return _Response(STATISTICS if url.endswith('/statistics') else FIXTURES)
+
+    monkeypatch.setattr(results_engine, 'http_get', fake_http_get)
+    monkeypatch.setattr(results_engine.time, 'sleep', lambda seconds: None)
+    engine = ResultsEngine()
+    engine._manual_results = _NoManualResults()
+    engine._verification_metrics = _NoMetrics()
+    monkeypatch.setattr(engine, '_get_db_connection', lambda: _FakeConn(db))
+    return engine, db, calls
+
+
+def test_settlement_groups_fixtures_and_batches_the_update(engine, monkeypatch):
+    engine, db, calls = engine
+    batches = []
+
+    def recording_execute_values(cursor, sql, rows, template=None, page_size=100):
+        assert "FROM (VALUES %s) AS v(id, outcome, result, profit_loss, settled_timestamp)" in " ".join(sql.split())
+        assert template.count("%s") == 5
+        batches.append(rows)
+
+    monkeypatch.setattr(results_engine, 'execute_values', recording_execute_values)
+
+    engine._settle_football_opportunities()
+
+    # One fixtures call for the date, one statistics call per fixture; the corners
+    # bets reuse the goals lookup's result (it already carries corner counts)
+    assert calls == [
+        ('fixtures', {'date': MATCH_DAY}),
+        ('statistics', {'fixture': 101}),
+        ('statistics', {'fixture': 102}),
+    ]
+    assert len(batches) == 1
+    outcomes = {row[0]: row[1] for row in batches[0]}
+    assert outcomes == {1: 'won', 2: 'won', 3: 'won', 4: 'lost', 5: 'lost'}
+    assert {row[0]: row[2] for row in batches[0]}[4] == 'LOST'
+    assert {row[0]: row[3] for row in batches[0]}[1] == pytest.approx(1.0)
+    assert engine.stats['settled'] == 5
+    assert not any(sql.startswith("UPDATE football_opportunities SET") for sql, _ in db.statements)
+
+
+def test_failed_batch_falls_back_to_per_bet_updates(engine, monkeypatch):
+    engine, db, calls = engine
+
+    def failing_execute_values(cursor, sql, rows, **kwargs):
+        raise RuntimeError("batch rejected")
+
+    monkeypatch.setattr(results_engine, 'execute_values', failing_execute_values)
+
+    engine._settle_football_opportunities()
+
+    updates = [params for sql, params in db.statements if sql.startswith("UPDATE football_opportunities SET")]
+    assert db.rollbacks == 1
+    assert sorted((params[4], params[0]) for params in updates) == [
+        (1, 'won'), (2, 'won'), (3, 'won'), (4, 'lost'), (5, 'lost'),
+    ]
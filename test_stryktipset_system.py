@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Stryktipset system engine vs the original string-based row selection and
+brute-force evaluation over all 3**13 outcomes.
+
+Usage:
+    python -m pytest test_stryktipset_system.py -q
+"""
+
+import numpy as np
+
+from modules.stryktipset import system_engine as se
+
+
+def _reference_select(rows, target_rows):
+    """Greedy diverse pick with per-row string comparisons against all selected rows."""
+    selected = []
+    for row in rows:
+        if len(selected) < target_rows:
+            md = min((sum(a != b for a, b in zip(row, other)) for other in selected), default=13)
+            if len(selected) < 30 and md < 4:
+                continue
+            if len(selected) < 200 and md < 3:
+                continue
+        selected.append(row)
+        if len(selected) >= target_rows:
+            break
+    for row in rows:
+        if len(selected) >= target_rows:
+            break
+        if row not in selected:
+            selected.append(row)
+    return selected
+
+
+def test_diverse_selection_matches_reference():
+    rng = np.random.default_rng(3)
+    probs = rng.dirichlet([3, 2, 2.5], size=13)
+    allowed = {no: ["1", "X", "2"] for no in range(1, 14)}
+    pool = se.sample_rows(allowed, probs, 5000, rng)[:1200]
+    rows = se.decode_rows(pool)
+    for target in (40, 256, 900):
+        picked = se.decode_rows(pool[se.select_diverse(pool, target)])
+        assert picked == _reference_select(rows, target)
+
+
+def test_small_system_is_enumerated_exactly():
+    rng = np.random.default_rng(5)
+    probs = rng.dirichlet([3, 2, 2.5], size=13)
+    allowed = {no: (["1", "X"] if no <= 6 else ["2"]) for no in range(1, 14)}
+    rows = se.build_system(allowed, probs, probs, target_rows=64, candidate_count=5000, pool_size=2000)
+    assert len(rows) == 64
+    assert len(set(se.row_codes(rows))) == 64
+    assert all(row[6:] == "2" * 7 for row in se.decode_rows(rows))
+    # Full system has exactly 64 rows, so every one of them is returned
+    assert sorted(se.decode_rows(rows)) == sorted(se.decode_rows(se.enumerate_rows(allowed)))
+
+
+def test_hit_distribution_matches_brute_force():
+    rng = np.random.default_rng(7)
+    probs = rng.dirichlet([3, 2, 2.5], size=13)
+    rows = rng.integers(0, 3, size=(30, 13)).astype(np.uint8)
+
+    outcomes = se.enumerate_rows({no: list(se.OUTCOMES) for no in range(1, 14)})
+    p_outcome = np.prod(probs[np.arange(13), outcomes], axis=1)
+    hits = np.stack([(outcomes == row).sum(axis=1) for row in rows])       # (rows, 3**13)
+    best = np.bincount(hits.max(axis=0), weights=p_outcome, minlength=14)
+    expected_rows = np.stack([np.bincount(h, weights=p_outcome, minlength=14) for h in hits]).sum(axis=0)
+
+    assert np.allclose(se.best_hit_distribution(rows, probs), best, atol=1e-12)
+    assert np.allclose(se.row_hit_distributions(rows, probs).sum(axis=0), expected_rows, atol=1e-12)
+
+    prizes = {13: 1e6, 12: 1e4, 11: 500.0, 10: 50.0}
+    evaluation = se.evaluate_system(rows, probs, prizes)
+    assert abs(evaluation["tiers"]["ge10"] - best[10:].sum()) < 1e-12
+    payouts = se.expected_payouts([rows, rows[:5]], probs, prizes)
+    assert abs(payouts[0] - evaluation["expected_payout"]) < 1e-6
+    assert abs(payouts[1] - se.evaluate_system(rows[:5], probs, prizes)["expected_payout"]) < 1e-6
+
+
+def test_expected_payouts_handles_empty_systems():
+    rng = np.random.default_rng(3)
+    probs = rng.dirichlet([3, 2, 2.5], size=13)
+    rows = rng.integers(0, 3, size=(12, 13)).astype(np.uint8)
+    empty = rows[:0]
+    prizes = {13: 1e6, 12: 1e4, 11: 500.0, 10: 50.0}
+
+    payouts = se.expected_payouts([empty, rows, empty, rows[:4], empty], probs, prizes)
+    assert payouts.shape == (5,)
+    assert payouts[0] == payouts[2] == payouts[4] == 0.0
+    assert abs(payouts[1] - se.evaluate_system(rows, probs, prizes)["expected_payout"]) < 1e-6
+    assert abs(payouts[3] - se.evaluate_system(rows[:4], probs, prizes)["expected_payout"]) < 1e-6
+    assert np.array_equal(se.expected_payouts([empty], probs, prizes), [0.0])
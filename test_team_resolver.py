@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Shared team resolver: normalization, canonical keys, settlement rule and TeamIndex.
+
+Usage:
+    python -m pytest test_team_resolver.py -q
+"""
+
+import random
+
+from results_engine import ResultsEngine
+from team_id_mappings import ALL_TEAM_MAPPINGS
+from team_resolver import TEAM_ALIASES, TeamIndex, get_team_resolver, normalize, settlement_match
+
+
+def _reference_fuzzy_match(t1, t2):
+    """ResultsEngine._fuzzy_match as it was before the shared resolver (pre-normalized names)."""
+    if t1 == t2:
+        return True
+    if t1 in t2 or t2 in t1:
+        return True
+    if t1.split()[0] == t2.split()[0]:
+        return True
+    for abbrev, full_names in TEAM_ALIASES.items():
+        names_set = set([abbrev] + full_names)
+        if t1 in names_set and t2 in names_set:
+            return True
+        if any(t1 in name or name in t1 for name in names_set) and any(t2 in name or name in t2 for name in names_set):
+            return True
+    return False
+
+
+def _settlement_names():
+    raw = list(ALL_TEAM_MAPPINGS) + [n for names in TEAM_ALIASES.values() for n in names] + list(TEAM_ALIASES)
+    raw += ['', 'AZ', 'FC Porto', 'Porto', 'Real', 'Man Utd', 'Queens Park Rangers', 'Internazionale']
+    return sorted({ResultsEngine._normalize_team_name(None, name.lower()) for name in raw})
+
+
+def test_normalize():
+    assert normalize('FC Bayern München') == 'bayern munchen'
+    assert normalize('Atlético-Madrid') == 'atletico madrid'
+    assert normalize('  AFC  Bournemouth ') == 'bournemouth'
+    assert normalize('FC') == 'fc'
+    assert normalize('') == ''
+
+
+def test_canonical_joins_known_aliases():
+    resolver = get_team_resolver()
+    assert resolver.canonical('Man Utd') == resolver.canonical('Manchester United')
+    assert resolver.canonical('Leeds') == resolver.canonical('Leeds United')
+    assert resolver.canonical('PSG') == resolver.canonical('Paris Saint-Germain')
+    assert resolver.same_team('Wolves', 'Wolverhampton Wanderers')
+
+
+def test_distinct_clubs_stay_distinct():
+    resolver = get_team_resolver()
+    for a, b in [
+        ('Las Palmas', 'Rayo Vallecano'),
+        ('Espanyol', 'Slavia Prague'),
+        ('Manchester City', 'Manchester United'),
+        ('Sheffield United', 'Sheffield Wednesday'),
+        ('Real Madrid', 'Real Betis'),
+        ('Sparta Prague', 'Slavia Prague'),
+    ]:
+        assert resolver.canonical(a) != resolver.canonical(b), (a, b)
+
+
+def test_settlement_match_equals_reference():
+    names = _settlement_names()
+    rng = random.Random(3)
+    pairs = [(a, b) for a in names[:80] for b in names[:80]]
+    pairs += [(rng.choice(names), rng.choice(names)) for _ in range(20000)]
+    for a, b in pairs:
+        assert settlement_match(a, b) == _reference_fuzzy_match(a, b), (a, b)
+
+
+def test_team_index_candidates_cover_every_match():
+    names = _settlement_names()
+    index = TeamIndex(names)
+    for query in names:
+        candidates = index.candidates(query)
+        assert candidates == sorted(candidates)
+        expected = [p for p, name in enumerate(names) if settlement_match(query, name)]
+        assert set(expected) <= set(candidates), query
+        assert len(candidates) < len(names) or len(query) < 3
+
+
+def test_results_engine_candidate_fixtures_keep_first_match():
+    engine = ResultsEngine.__new__(ResultsEngine)
+    engine._fixture_index_by_date = {}
+    rng = random.Random(7)
+    teams = list(ALL_TEAM_MAPPINGS)
+    fixtures = [
+        {'teams': {'home': {'name': rng.choice(teams)}, 'away': {'name': rng.choice(teams)}}}
+        for _ in range(400)
+    ]
+    for _ in range(300):
+        home, away = rng.choice(teams), rng.choice(teams)
+        full_scan = [
+            f for f in fixtures
+            if engine._fuzzy_match(home, f['teams']['home']['name'].lower())
+            and engine._fuzzy_match(away, f['teams']['away']['name'].lower())
+        ]
+        pruned = [
+            f for f in engine._candidate_fixtures('2026-03-01', fixtures, home, away)
+            if engine._fuzzy_match(home, f['teams']['home']['name'].lower())
+            and engine._fuzzy_match(away, f['teams']['away']['name'].lower())
+        ]
+        assert pruned == full_scan
+
+
+def test_team_index_skips_partial_trigram_overlap():
+    index = TeamIndex(['manchester city', 'chester', 'leicester city', 'west ham'])
+    # 'chester' is contained in 'manchester city'; 'leicester city' only shares 'ester'
+    assert index.candidates('chester') == [0, 1]
+    # Indexed 'chester' is contained in the query, 'west ham' only shares 'est'
+    assert index.candidates('manchester') == [0, 1]
+    assert index.candidates('sunderland') == []
@@ -15,7 +15,8 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple, Set
 from bankroll_manager import get_bankroll_manager
 from data_collector import get_collector
-from monte_carlo_integration import run_monte_carlo, classify_trust_level, analyze_bet_with_monte_carlo
+from monte_carlo_integration import classify_trust_level, analyze_bet_with_monte_carlo
+from monte_carlo_simulator import simulate_match, cached_market
 from discord_notifier import send_bet_to_discord
 from datetime_utils import normalize_kickoff, to_iso_utc, now_utc
 from probability_calibrator import calibrate_and_ev, log_calibration_batch
@@ -225,6 +226,7 @@ def poisson_pmf(lmb: float, k: int) -> float:
     return math.exp(-lmb) * (lmb ** k) / math.factorial(k)
 
 
+@cached_market("prob_total_over")
 def prob_total_over(lh: float, la: float, line: float, max_goals: int = 8) -> float:
     """
     Probability(total goals > line) using Poisson independence for home/away goals.
@@ -245,6 +247,7 @@ def prob_total_over(lh: float, la: float, line: float, max_goals: int = 8) -> fl
     return sum(p_total[t] for t in range(threshold + 1, max_goals + 1))
 
 
+@cached_market("prob_btts")
 def prob_btts(lh: float, la: float, max_goals: int = 8) -> float:
     """P(home>=1 and away>=1)"""
     p_home_0 = poisson_pmf(lh, 0)
@@ -253,6 +256,7 @@ def prob_btts(lh: float, la: float, max_goals: int = 8) -> float:
     return 1.0 - p_home_0 - p_away_0 + p_both_0
 
 
+@cached_market("prob_1x2")
 def prob_1x2(lh: float, la: float, max_goals: int = 8) -> Tuple[float, float, float]:
     """
     Returns (P(home win), P(draw), P(away win))
@@ -317,20 +321,21 @@ class ValueSinglesEngine:
         Returns model probabilities for ALL single-bet markets.
         Uses Monte Carlo simulation for more accurate probabilities (Dec 2025).
         """
+        sim = None
         if use_monte_carlo:
-            # Run Monte Carlo simulation (10,000 iterations)
-            mc = run_monte_carlo(lh, la, n_sim=10000)
-            
-            # Use simulation probabilities
-            p_hw = mc.home_win_prob
-            p_d = mc.draw_prob
-            p_aw = mc.away_win_prob
-            p_btts_yes = mc.btts_yes_prob
-            p_over25 = mc.over_25_prob
-            p_over35 = mc.over_35_prob
+            # One exact score grid prices every goal market (1X2, totals, BTTS, AH, team totals)
+            sim = simulate_match(lh, la, n_sim=10000)
             
-            # Derive other markets from simulation
-            p_btts_no = 1 - p_btts_yes
+            p_hw = sim["one_x_two"]["1"]
+            p_d = sim["one_x_two"]["X"]
+            p_aw = sim["one_x_two"]["2"]
+            p_btts_yes = sim["btts_yes"]
+            p_over25 = sim["over_25"]
+            p_over35 = sim["over_35"]
+            p_btts_no = sim["btts_no"]
+            p_over05 = sim["over_05"]
+            p_over15 = sim["over_15"]
+            p_over45 = sim["over_45"]
             
             print(f"🎲 Monte Carlo: HW={p_hw:.1%} D={p_d:.1%} AW={p_aw:.1%} O2.5={p_over25:.1%} BTTS={p_btts_yes:.1%}")
         else:
@@ -340,11 +345,11 @@ class ValueSinglesEngine:
             p_over25 = prob_total_over(lh, la, 2.5)
             p_over35 = prob_total_over(lh, la, 3.5)
             p_btts_no = 1 - p_btts_yes
-        
-        # Over Goals (0.5 - 4.5) - keep Poisson for less common lines
-        p_over05 = prob_total_over(lh, la, 0.5)
-        p_over15 = prob_total_over(lh, la, 1.5)
-        p_over45 = prob_total_over(lh, la, 4.5)
+            
+            # Over Goals (0.5 - 4.5)
+            p_over05 = prob_total_over(lh, la, 0.5)
+            p_over15 = prob_total_over(lh, la, 1.5)
+            p_over45 = prob_total_over(lh, la, 4.5)
         
         # 1H Over/Under
         p_over05_1h = prob_total_over(lh * 0.45, la * 0.45, 0.5)
@@ -375,15 +380,19 @@ class ValueSinglesEngine:
         p_cards_over55 = prob_total_over(cards_lambda / 2, cards_lambda / 2, 5.5)
         
         # Team Totals (individual team over/under)
-        p_home_over05 = prob_total_over(lh, 0, 0.5)
-        p_home_over15 = prob_total_over(lh, 0, 1.5)
-        p_away_over05 = prob_total_over(0, la, 0.5)
-        p_away_over15 = prob_total_over(0, la, 1.5)
+        if sim is not None:
+            p_home_over05 = sim["home_over_05"]
+            p_home_over15 = sim["home_over_15"]
+            p_away_over05 = sim["away_over_05"]
+            p_away_over15 = sim["away_over_15"]
+        else:
+            p_home_over05 = prob_total_over(lh, 0, 0.5)
+            p_home_over15 = prob_total_over(lh, 0, 1.5)
+            p_away_over05 = prob_total_over(0, la, 0.5)
+            p_away_over15 = prob_total_over(0, la, 1.5)
         
-        # Asian Handicap (from Monte Carlo simulation if available)
-        if use_monte_carlo:
-            from monte_carlo_simulator import simulate_match
-            sim = simulate_match(lh, la, n_sim=10000)
+        # Asian Handicap (from the same score grid)
+        if sim is not None:
             p_ah_home_m05 = sim.get("home_ah_-0.5", p_hw)
             p_ah_home_m10 = sim.get("home_ah_-1.0", 0.30)
             p_ah_home_m15 = sim.get("home_ah_-1.5", 0.20)
@@ -20,8 +20,9 @@ import re
 import os
 import unicodedata
 import json
-import psycopg2
 from psycopg2.extras import RealDictCursor
+from db_connection import DatabaseConnection
+from team_resolver import get_team_resolver
 from datetime import datetime, timedelta, date
 import time
 import sys
@@ -104,7 +105,7 @@ class RealResultVerifier:
                 logger.warning("No DATABASE_URL found, skipping verification")
                 return []
             
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('verify_results')
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cursor.execute("""
@@ -564,6 +565,11 @@ class RealResultVerifier:
     def _team_similarity_match(self, team1: str, team2: str) -> bool:
         """Check if team names are similar enough to be considered a match"""
         try:
+            # Same club under a known alias ("Man Utd" / "Manchester United")
+            resolver = get_team_resolver()
+            if resolver.canonical(team1) == resolver.canonical(team2):
+                return True
+            
             # Quick check: first word match (most distinctive part of team name)
             words1 = team1.split()
             words2 = team2.split()
@@ -1093,7 +1099,7 @@ class RealResultVerifier:
                 logger.warning("No DATABASE_URL found, skipping update")
                 return
             
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('verify_results')
             cursor = conn.cursor()
             
             # Get tip details before updating
@@ -1166,7 +1172,7 @@ class RealResultVerifier:
                 logger.warning("No DATABASE_URL found, skipping all_bets verification")
                 return {"verified": 0, "failed": 0}
             
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('verify_results')
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cursor.execute("""
@@ -1227,7 +1233,7 @@ class RealResultVerifier:
         - Basketball: 3 days
         """
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = DatabaseConnection.checkout('verify_results')
             cursor = conn.cursor()
             
             # Void Corners bets older than 2 days (API coverage is limited for corner stats)